@@ -6,48 +6,16 @@ Klasör veya tek dosya analizi yapabilir
 """
 
 import os
-import re
 import argparse
 import time
 import glob
 from typing import Dict, Set, List, Tuple
 
-def temizle_ve_parcala(metin: str, sayilari_atla: bool = True) -> Set[str]:
-    """Metni temizler ve tekil sözcüklere ayırır"""
-    # Noktalama işaretlerini temizle
-    temiz_metin = re.sub(r'[^\w\s]', ' ', metin)
-    
-    # Sözcüklere ayır ve küçük harfe çevir
-    if sayilari_atla:
-        # Sayı içermeyen sözcükleri seç
-        sozcukler = {s.lower() for s in temiz_metin.split() 
-                    if s and len(s) > 1 and not s.isdigit() and not re.match(r'^\d+[a-zA-Z]*$', s)}
-    else:
-        # Tüm sözcükleri seç
-        sozcukler = {s.lower() for s in temiz_metin.split() if s and len(s) > 1}
-    
-    return sozcukler
+# temizle_ve_parcala adı bu modülden içe aktaranlar için korunuyor
+from sozcuk_ayirici import dosya_sozcuk_kumesi, metin_sozcuk_kumesi as temizle_ve_parcala
 
-def dosya_oku(dosya_yolu: str) -> str:
-    """Metin dosyasını okur, farklı kodlamaları dener"""
-    kodlamalar = ['utf-8', 'latin-1', 'windows-1254', 'iso-8859-9']
-    
-    for kodlama in kodlamalar:
-        try:
-            with open(dosya_yolu, 'r', encoding=kodlama) as f:
-                return f.read()
-        except UnicodeDecodeError:
-            continue
-    
-    # Hiçbir kodlama çalışmazsa, binary olarak oku ve decode edebileceğimiz karakterleri al
-    try:
-        with open(dosya_yolu, 'rb') as f:
-            return f.read().decode('utf-8', errors='ignore')
-    except Exception as e:
-        print(f"HATA: {dosya_yolu} dosyası okunamadı: {e}")
-        return ""
-
-def analiz_et(sozcukler: Set[str], veritabani_yolu: str, zemberek_aktif: bool = False) -> Dict:
+def analiz_et(sozcukler: Set[str], veritabani_yolu: str, zemberek_aktif: bool = False,
+              parti_boyutu: int = 1000) -> Dict:
     """Sözcükleri analiz et"""
     from turkce_morfologik_analiz import TurkceMorfologikAnaliz
     
@@ -64,17 +32,21 @@ def analiz_et(sozcukler: Set[str], veritabani_yolu: str, zemberek_aktif: bool =
     sonuclar = {}
     islenecek_toplam = len(sozcukler)
     
+    sirali_sozcukler = sorted(sozcukler)
+    
+    # Sözcükleri partiler halinde çözümle (kayıtlı analizler tek sorguda gelir)
     baslangic = time.time()
-    for i, sozcuk in enumerate(sorted(sozcukler)):
-        sonuclar[sozcuk] = analizci.parcala(sozcuk)
+    for bas in range(0, islenecek_toplam, parti_boyutu):
+        parti = sirali_sozcukler[bas:bas + parti_boyutu]
+        sonuclar.update(analizci.parcala_toplu(parti))
+        islenen = bas + len(parti)
         
         # İlerleme göster
-        if (i+1) % 100 == 0 or i+1 == islenecek_toplam:
-            gecen_sure = time.time() - baslangic
-            hiz = (i+1) / gecen_sure if gecen_sure > 0 else 0
-            kalan_sure = (islenecek_toplam - (i+1)) / hiz if hiz > 0 else 0
-            print(f"\rİlerleme: {i+1}/{islenecek_toplam} sözcük ({(i+1)/islenecek_toplam*100:.1f}%) | "
-                  f"Hız: {hiz:.1f} sözcük/sn | Kalan: {kalan_sure:.1f} sn", end="")
+        gecen_sure = time.time() - baslangic
+        hiz = islenen / gecen_sure if gecen_sure > 0 else 0
+        kalan_sure = (islenecek_toplam - islenen) / hiz if hiz > 0 else 0
+        print(f"\rİlerleme: {islenen}/{islenecek_toplam} sözcük ({islenen/islenecek_toplam*100:.1f}%) | "
+              f"Hız: {hiz:.1f} sözcük/sn | Kalan: {kalan_sure:.1f} sn", end="")
     
     print()  # Yeni satır
     
@@ -120,12 +92,14 @@ def dosyalari_analiz_et(dosya_yollari: List[str], veritabani_yolu: str,
     
     tum_sozcukler = set()
     dosya_analiz_sonuclari = {}
+    dosya_kodlamalari = {}  # {dosya_yolu: kodlama}
     
     # Tüm dosyaları oku ve sözcükleri topla
     for i, dosya_yolu in enumerate(dosya_yollari):
         print(f"\n[{i+1}/{len(dosya_yollari)}] Dosya okunuyor: {dosya_yolu}")
-        metin = dosya_oku(dosya_yolu)
-        sozcukler = temizle_ve_parcala(metin, sayilari_atla)
+        kodlama_bilgisi = {}
+        sozcukler = dosya_sozcuk_kumesi(dosya_yolu, sayilari_atla, bilgi=kodlama_bilgisi)
+        dosya_kodlamalari[dosya_yolu] = kodlama_bilgisi['kodlama']
         
         # Sözcükleri genel havuza ekle
         tum_sozcukler.update(sozcukler)
@@ -133,7 +107,7 @@ def dosyalari_analiz_et(dosya_yollari: List[str], veritabani_yolu: str,
         # Dosya bazında sözcük listesini kaydet
         dosya_analiz_sonuclari[dosya_yolu] = sozcukler
         
-        print(f"  Dosyadan {len(sozcukler)} benzersiz sözcük çıkarıldı.")
+        print(f"  Dosyadan {len(sozcukler)} benzersiz sözcük çıkarıldı (kodlama: {dosya_kodlamalari[dosya_yolu]}).")
     
     print(f"\nToplam {len(tum_sozcukler)} benzersiz sözcük bulundu.")
     
@@ -147,6 +121,7 @@ def dosyalari_analiz_et(dosya_yollari: List[str], veritabani_yolu: str,
         
         with open(cikti_dosyasi, 'w', encoding='utf-8') as f:
             f.write(f"# Dosya: {dosya_yolu}\n")
+            f.write(f"# Kodlama: {dosya_kodlamalari[dosya_yolu]}\n")
             f.write(f"# Toplam sözcük sayısı: {len(sozcukler)}\n\n")
             
             for sozcuk in sorted(sozcukler):
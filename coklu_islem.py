@@ -6,28 +6,14 @@ Sayıları Filtreleyen Versiyon
 """
 
 import os
-import re
 import argparse
 import time
 from typing import Dict, Set
 
-def temizle_ve_parcala(metin: str, sayilari_atla: bool = True) -> Set[str]:
-    """Metni temizler ve tekil sözcüklere ayırır"""
-    # Noktalama işaretlerini temizle
-    temiz_metin = re.sub(r'[^\w\s]', ' ', metin)
-    
-    # Sözcüklere ayır ve küçük harfe çevir
-    if sayilari_atla:
-        # Sayı içermeyen sözcükleri seç
-        sozcukler = {s.lower() for s in temiz_metin.split() 
-                    if s and len(s) > 1 and not s.isdigit() and not re.match(r'^\d+[a-zA-Z]*$', s)}
-    else:
-        # Tüm sözcükleri seç
-        sozcukler = {s.lower() for s in temiz_metin.split() if s and len(s) > 1}
-    
-    return sozcukler
+# temizle_ve_parcala adı bu modülden içe aktaranlar için korunuyor
+from sozcuk_ayirici import dosya_sozcuk_kumesi, metin_sozcuk_kumesi as temizle_ve_parcala
 
-def analiz_et(sozcukler, veritabani_yolu, zemberek_aktif=False):
+def analiz_et(sozcukler, veritabani_yolu, zemberek_aktif=False, parti_boyutu=1000):
     """Sözcükleri analiz et"""
     from turkce_morfologik_analiz import TurkceMorfologikAnaliz
     
@@ -44,17 +30,21 @@ def analiz_et(sozcukler, veritabani_yolu, zemberek_aktif=False):
     sonuclar = {}
     islenecek_toplam = len(sozcukler)
     
+    sirali_sozcukler = sorted(sozcukler)
+    
+    # Sözcükleri partiler halinde çözümle (kayıtlı analizler tek sorguda gelir)
     baslangic = time.time()
-    for i, sozcuk in enumerate(sorted(sozcukler)):
-        sonuclar[sozcuk] = analizci.parcala(sozcuk)
+    for bas in range(0, islenecek_toplam, parti_boyutu):
+        parti = sirali_sozcukler[bas:bas + parti_boyutu]
+        sonuclar.update(analizci.parcala_toplu(parti))
+        islenen = bas + len(parti)
         
         # İlerleme göster
-        if (i+1) % 100 == 0 or i+1 == islenecek_toplam:
-            gecen_sure = time.time() - baslangic
-            hiz = (i+1) / gecen_sure if gecen_sure > 0 else 0
-            kalan_sure = (islenecek_toplam - (i+1)) / hiz if hiz > 0 else 0
-            print(f"\rİlerleme: {i+1}/{islenecek_toplam} sözcük ({(i+1)/islenecek_toplam*100:.1f}%) | "
-                  f"Hız: {hiz:.1f} sözcük/sn | Kalan: {kalan_sure:.1f} sn", end="")
+        gecen_sure = time.time() - baslangic
+        hiz = islenen / gecen_sure if gecen_sure > 0 else 0
+        kalan_sure = (islenecek_toplam - islenen) / hiz if hiz > 0 else 0
+        print(f"\rİlerleme: {islenen}/{islenecek_toplam} sözcük ({islenen/islenecek_toplam*100:.1f}%) | "
+              f"Hız: {hiz:.1f} sözcük/sn | Kalan: {kalan_sure:.1f} sn", end="")
     
     print()  # Yeni satır
     
@@ -69,21 +59,11 @@ def analiz_et(sozcukler, veritabani_yolu, zemberek_aktif=False):
 
 def dosyadan_analiz_et(dosya_yolu, veritabani_yolu, zemberek_aktif=False, cikti_dosyasi=None, sayilari_atla=True):
     """Dosyadan okuyarak analiz yapar"""
+    # Dosyayı parça parça okuyup sözcüklere ayır
     start_time = time.time()
-    try:
-        with open(dosya_yolu, 'r', encoding='utf-8') as f:
-            metin = f.read()
-    except UnicodeDecodeError:
-        # UTF-8 ile açılmazsa Latin-1 dene
-        with open(dosya_yolu, 'r', encoding='latin-1') as f:
-            metin = f.read()
-    
-    print(f"Dosya okuma: {time.time() - start_time:.2f} saniye")
-    
-    # Metni temizle ve sözcüklere ayır
-    start_time = time.time()
-    sozcukler = temizle_ve_parcala(metin, sayilari_atla)
-    print(f"Metin temizleme: {time.time() - start_time:.2f} saniye")
+    kodlama_bilgisi = {}
+    sozcukler = dosya_sozcuk_kumesi(dosya_yolu, sayilari_atla, bilgi=kodlama_bilgisi)
+    print(f"Dosya okuma ve temizleme: {time.time() - start_time:.2f} saniye (kodlama: {kodlama_bilgisi['kodlama']})")
     
     # Analiz et
     sonuclar = analiz_et(sozcukler, veritabani_yolu, zemberek_aktif)
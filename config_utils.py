@@ -24,7 +24,10 @@ def config_yukle(config_dosya_yolu='config.ini'):
             'max_derinlik': '5',
             'unlu_uyumu_kontrol': 'True',
             'unsuz_yumusama_kontrol': 'True',
-            'zemberek_oncelikli': 'True'
+            'zemberek_oncelikli': 'True',
+            'onbellek_boyutu': '10000',
+            'onbellek_isitma': '0',
+            'yazma_tamponu': '0'
         }
     }
     
@@ -75,7 +78,10 @@ def ornek_config_olustur():
         'max_derinlik': '5',  # Özyinelemeli analiz maksimum derinliği
         'unlu_uyumu_kontrol': 'True',
         'unsuz_yumusama_kontrol': 'True',
-        'zemberek_oncelikli': 'True'
+        'zemberek_oncelikli': 'True',
+        'onbellek_boyutu': '10000',  # Analiz önbelleği kapasitesi (0: kapalı)
+        'onbellek_isitma': '0',  # Başlangıçta önbelleğe yüklenecek en sık analiz sayısı
+        'yazma_tamponu': '0'  # Tek seferde kaydedilecek bekleyen yazma sayısı (0: her yazma hemen kaydedilir)
     }
     
     with open('ornek_config.ini', 'w', encoding='utf-8') as configfile:
@@ -112,5 +118,11 @@ unlu_uyumu_kontrol = True
 unsuz_yumusama_kontrol = True
 # Zemberek öncelikli çalışma modu
 zemberek_oncelikli = True
+# Analiz önbelleği kapasitesi (0: önbellek kapalı)
+onbellek_boyutu = 10000
+# Başlangıçta önbelleğe yüklenecek en sık analiz sayısı
+onbellek_isitma = 0
+# Tek seferde kaydedilecek bekleyen yazma sayısı (0: her yazma hemen kaydedilir)
+yazma_tamponu = 0
 """)
     print("Açıklamalı örnek yapılandırma dosyası oluşturuldu: ornek_config_aciklamali.ini")
@@ -0,0 +1,295 @@
+"""
+Türkçe Morfolojik Analiz - Artımlı Derlem Çalışmaları İçin Dosya Manifestosu
+
+Her dosyanın yolu, boyutu, değişiklik zamanı, içerik özeti ve sözcük sayımları
+bir SQLite veritabanında tutulur. Sonraki çalışmalarda değişmemiş dosyalar
+yeniden okunmaz; sayımları manifestodan alınır. Manifesto bir kez çözümlenmiş
+sözcüklerin analizlerini de saklar, böylece yalnızca yeni sözcükler analiz edilir.
+Çözümlenemeyen sözcüklerin varsayılan analizleri saklanmaz.
+
+Bir dosya, boyutu ve değişiklik zamanı (ns) kayıtla aynıysa değişmemiş sayılır.
+Yalnızca değişiklik zamanı farklıysa içerik özeti karşılaştırılır; özet aynıysa
+kayıt güncellenip sayımlar yine kullanılır.
+
+Manifesto okuyucu iş parçacıklarından da kullanılabilir: veritabanı işlemleri
+bir kilitle sıraya konur, dosya durumu ve özeti kilit dışında okunur.
+"""
+
+import os
+import json
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Optional, Tuple
+
+from sozcuk_ayirici import PARCA_BOYUTU
+from veritabani import SORGU_PARAMETRE_SINIRI, parcalara_bol
+
+logger = logging.getLogger("TurkceMorfAnaliz")
+
+# Çözümlenemeyen sözcüklerin analiz kaynakları; bunlar manifestoda saklanmaz,
+# sözlüğe kök ya da ek eklendikten sonraki çalışmada yeniden analiz edilir
+SAKLANMAYAN_KAYNAKLAR = frozenset({'varsayilan', 'max_derinlik_asildi'})
+
+
+def dosya_ozeti(dosya_yolu: str, parca_boyutu: int = PARCA_BOYUTU) -> str:
+    """Dosya içeriğinin BLAKE2b özetini parça parça okuyarak hesaplar"""
+    ozet = hashlib.blake2b(digest_size=20)
+    with open(dosya_yolu, 'rb') as f:
+        for parca in iter(lambda: f.read(parca_boyutu), b''):
+            ozet.update(parca)
+    return ozet.hexdigest()
+
+
+class DosyaManifestosu:
+    """Dosya imzalarını, dosya başına sözcük sayımlarını ve analizleri saklayan manifesto"""
+
+    def __init__(self, db_path: str, sayilari_atla: bool = True):
+        self.db_path = db_path
+        self.sayilari_atla = sayilari_atla
+        # Okumadan önce alınan dosya imzaları: {mutlak_yol: (boyut, mtime_ns, ozet)}
+        self._imzalar: Dict[str, Tuple[int, int, Optional[str]]] = {}
+
+        self._kilit = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        cursor = self.conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS ayarlar (
+            anahtar TEXT PRIMARY KEY,
+            deger TEXT
+        )
+        ''')
+
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS dosyalar (
+            id INTEGER PRIMARY KEY,
+            yol TEXT UNIQUE,
+            boyut INTEGER,
+            mtime_ns INTEGER,
+            ozet TEXT,
+            kodlama TEXT,
+            toplam_sozcuk INTEGER,
+            benzersiz_sozcuk INTEGER,
+            son_islenme TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
+
+        # Sözcükler bir kez kaydedilir; analiz_json ilk çözümlemede doldurulur
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS sozcukler (
+            id INTEGER PRIMARY KEY,
+            sozcuk TEXT UNIQUE,
+            analiz_json TEXT
+        )
+        ''')
+
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS dosya_sozcukleri (
+            dosya_id INTEGER,
+            sozcuk_id INTEGER,
+            sayi INTEGER,
+            FOREIGN KEY (dosya_id) REFERENCES dosyalar (id),
+            FOREIGN KEY (sozcuk_id) REFERENCES sozcukler (id)
+        )
+        ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_dosya_sozcukleri_dosya ON dosya_sozcukleri (dosya_id)")
+
+        cursor.execute("CREATE TEMP TABLE IF NOT EXISTS aranan_sozcukler (sozcuk TEXT PRIMARY KEY)")
+
+        # Sayımlar sayıların atlanıp atlanmamasına bağlıdır; ayar değiştiyse dosya kayıtları geçersizdir
+        ayar = '1' if sayilari_atla else '0'
+        cursor.execute("SELECT deger FROM ayarlar WHERE anahtar = 'sayilari_atla'")
+        satir = cursor.fetchone()
+        if satir and satir[0] != ayar:
+            logger.warning(f"Manifesto farklı sayı ayarıyla oluşturulmuş, dosya kayıtları sıfırlanıyor: {db_path}")
+            cursor.execute("DELETE FROM dosya_sozcukleri")
+            cursor.execute("DELETE FROM dosyalar")
+        cursor.execute("INSERT OR REPLACE INTO ayarlar (anahtar, deger) VALUES ('sayilari_atla', ?)", (ayar,))
+
+        self.conn.commit()
+
+    def kapat(self):
+        """Manifestoyu kaydeder ve bağlantıyı kapatır"""
+        with self._kilit:
+            if self.conn:
+                self.conn.commit()
+                self.conn.close()
+                self.conn = None
+
+    def degismemis_kayit(self, dosya_yolu: str) -> Optional[Dict]:
+        """Dosya son kayıttan beri değişmediyse kaydını, aksi halde None döndürür
+
+        Dosyanın o anki imzası saklanır ve dosya yeniden okunursa
+        dosya_kaydet tarafından kullanılır.
+        """
+        yol = os.path.abspath(dosya_yolu)
+        durum = os.stat(yol)
+        boyut, mtime_ns = durum.st_size, durum.st_mtime_ns
+        self._imzalar[yol] = (boyut, mtime_ns, None)
+
+        with self._kilit:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "SELECT id, boyut, mtime_ns, ozet, kodlama, toplam_sozcuk, benzersiz_sozcuk "
+                "FROM dosyalar WHERE yol = ?", (yol,)
+            )
+            satir = cursor.fetchone()
+        if not satir:
+            return None
+
+        dosya_id, kayitli_boyut, kayitli_mtime, kayitli_ozet, kodlama, toplam, benzersiz = satir
+        if kayitli_boyut != boyut:
+            return None
+
+        if kayitli_mtime != mtime_ns:
+            # Dosyaya dokunulmuş ama içerik aynı olabilir
+            ozet = dosya_ozeti(yol)
+            self._imzalar[yol] = (boyut, mtime_ns, ozet)
+            if ozet != kayitli_ozet:
+                return None
+            with self._kilit:
+                self.conn.execute("UPDATE dosyalar SET mtime_ns = ? WHERE id = ?", (mtime_ns, dosya_id))
+                self.conn.commit()
+
+        return {
+            'id': dosya_id,
+            'kodlama': kodlama,
+            'toplam_sozcuk': toplam,
+            'benzersiz_sozcuk': benzersiz
+        }
+
+    def frekanslari_getir(self, dosya_id: int) -> Counter:
+        """Kayıtlı dosyanın sözcük sayımlarını kaydedildikleri sırayla döndürür"""
+        with self._kilit:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "SELECT s.sozcuk, ds.sayi FROM dosya_sozcukleri ds "
+                "JOIN sozcukler s ON s.id = ds.sozcuk_id "
+                "WHERE ds.dosya_id = ? ORDER BY ds.rowid", (dosya_id,)
+            )
+            return Counter(dict(cursor.fetchall()))
+
+    def dosya_kaydet(self, dosya_yolu: str, frekanslar: Dict[str, int], kodlama: str):
+        """Okunan dosyanın imzasını ve sözcük sayımlarını kaydeder (eski kaydın yerine)"""
+        yol = os.path.abspath(dosya_yolu)
+        imza = self._imzalar.pop(yol, None)
+        if imza is None:
+            durum = os.stat(yol)
+            imza = (durum.st_size, durum.st_mtime_ns, None)
+        boyut, mtime_ns, ozet = imza
+        if ozet is None:
+            ozet = dosya_ozeti(yol)
+
+        with self._kilit:
+            self._dosya_kaydet(yol, frekanslar, kodlama, boyut, mtime_ns, ozet)
+
+    def _dosya_kaydet(self, yol: str, frekanslar: Dict[str, int], kodlama: str,
+                      boyut: int, mtime_ns: int, ozet: str):
+        """dosya_kaydet'in veritabanı kısmı (kilit tutulurken)"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute("SELECT id FROM dosyalar WHERE yol = ?", (yol,))
+            satir = cursor.fetchone()
+            if satir:
+                dosya_id = satir[0]
+                cursor.execute("DELETE FROM dosya_sozcukleri WHERE dosya_id = ?", (dosya_id,))
+                cursor.execute(
+                    "UPDATE dosyalar SET boyut = ?, mtime_ns = ?, ozet = ?, kodlama = ?, "
+                    "toplam_sozcuk = ?, benzersiz_sozcuk = ?, son_islenme = CURRENT_TIMESTAMP WHERE id = ?",
+                    (boyut, mtime_ns, ozet, kodlama, sum(frekanslar.values()), len(frekanslar), dosya_id)
+                )
+            else:
+                cursor.execute(
+                    "INSERT INTO dosyalar (yol, boyut, mtime_ns, ozet, kodlama, toplam_sozcuk, benzersiz_sozcuk) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (yol, boyut, mtime_ns, ozet, kodlama, sum(frekanslar.values()), len(frekanslar))
+                )
+                dosya_id = cursor.lastrowid
+
+            cursor.executemany(
+                "INSERT OR IGNORE INTO sozcukler (sozcuk) VALUES (?)",
+                ((sozcuk,) for sozcuk in frekanslar)
+            )
+            sozcuk_kimlikleri = self._sozcuk_kimlikleri(frekanslar)
+            cursor.executemany(
+                "INSERT INTO dosya_sozcukleri (dosya_id, sozcuk_id, sayi) VALUES (?, ?, ?)",
+                ((dosya_id, sozcuk_kimlikleri[sozcuk], sayi) for sozcuk, sayi in frekanslar.items())
+            )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logger.error(f"Manifesto kayıt hatası: {yol} - {e}")
+
+    def _sozcuk_kimlikleri(self, sozcukler: Iterable[str]) -> Dict[str, int]:
+        """Sözcüklerin manifestodaki kimliklerini geçici tablo ile tek sorguda getirir (kilit tutulurken)"""
+        cursor = self.conn.cursor()
+        cursor.execute("DELETE FROM aranan_sozcukler")
+        cursor.executemany(
+            "INSERT OR IGNORE INTO aranan_sozcukler (sozcuk) VALUES (?)",
+            ((sozcuk,) for sozcuk in sozcukler)
+        )
+        cursor.execute(
+            "SELECT s.sozcuk, s.id FROM aranan_sozcukler a JOIN sozcukler s ON s.sozcuk = a.sozcuk"
+        )
+        kimlikler = dict(cursor.fetchall())
+        cursor.execute("DELETE FROM aranan_sozcukler")
+        return kimlikler
+
+    def analizleri_getir(self, sozcukler: Iterable[str]) -> Dict[str, Dict]:
+        """Daha önce çözümlenmiş sözcüklerin manifestodaki analizlerini getirir
+
+        Sözcükler parçalar halinde WHERE sozcuk IN (...) ile aranır. Eski
+        manifestolarda kalmış varsayılan analizler döndürülmez.
+        """
+        satirlar = []
+        with self._kilit:
+            cursor = self.conn.cursor()
+            for parca in parcalara_bol(list(sozcukler), SORGU_PARAMETRE_SINIRI):
+                cursor.execute(
+                    "SELECT sozcuk, analiz_json FROM sozcukler "
+                    f"WHERE sozcuk IN ({', '.join('?' * len(parca))}) AND analiz_json IS NOT NULL",
+                    parca
+                )
+                satirlar.extend(cursor.fetchall())
+
+        analizler = {}
+        for sozcuk, analiz_json in satirlar:
+            try:
+                analiz = json.loads(analiz_json)
+            except ValueError:
+                continue
+            if analiz.get('source') not in SAKLANMAYAN_KAYNAKLAR:
+                analizler[sozcuk] = analiz
+        return analizler
+
+    def analizleri_kaydet(self, analizler: Dict[str, Dict]):
+        """Yeni çözümlenen sözcüklerin analizlerini manifestoya yazar (varsayılan analizler hariç)"""
+        satirlar = [(sozcuk, json.dumps(analiz, ensure_ascii=False)) for sozcuk, analiz in analizler.items()
+                    if analiz.get('source') not in SAKLANMAYAN_KAYNAKLAR]
+        if not satirlar:
+            return
+        with self._kilit:
+            self.conn.executemany(
+                "INSERT INTO sozcukler (sozcuk, analiz_json) VALUES (?, ?) "
+                "ON CONFLICT(sozcuk) DO UPDATE SET analiz_json = excluded.analiz_json",
+                satirlar
+            )
+            self.conn.commit()
+
+    def eksik_dosyalari_temizle(self) -> int:
+        """Diskte artık bulunmayan dosyaların kayıtlarını siler, silinen kayıt sayısını döndürür"""
+        with self._kilit:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT id, yol FROM dosyalar")
+            eksikler = [(dosya_id,) for dosya_id, yol in cursor.fetchall() if not os.path.exists(yol)]
+            if eksikler:
+                cursor.executemany("DELETE FROM dosya_sozcukleri WHERE dosya_id = ?", eksikler)
+                cursor.executemany("DELETE FROM dosyalar WHERE id = ?", eksikler)
+                self.conn.commit()
+        return len(eksikler)
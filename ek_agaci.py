@@ -0,0 +1,70 @@
+"""
+Türkçe Morfolojik Analiz - Ters Ek Ağacı (Suffix Trie)
+"""
+
+from typing import Dict, List, Tuple
+
+
+class EkAgaci:
+    """Ekleri sondan başa doğru tutan ağaç yapısı
+
+    Her düğüm bir harfe karşılık gelir; kökten bir düğüme giden yol, bir ekin
+    tersine çevrilmiş halidir. Sözcüğün sonundan başlayarak ağaçta yürümek,
+    sözcüğün sonuyla eşleşen tüm ekleri tek geçişte verir.
+    """
+
+    _EKLER = None  # Düğümde biten eklerin tutulduğu anahtar (harflerle çakışmaz)
+
+    def __init__(self, ekler: Dict[str, List[str]] = None):
+        self.agac_koku = {}
+        self.ek_sayisi = 0
+        if ekler:
+            self.yukle(ekler)
+
+    def yukle(self, ekler: Dict[str, List[str]]):
+        """Kategorilere göre gruplanmış ekleri ağaca ekler"""
+        for kategori, ek_listesi in ekler.items():
+            for ek in ek_listesi:
+                self.ekle(ek, kategori)
+
+    def ekle(self, ek: str, kategori: str):
+        """Ağaca tek bir ek ekler"""
+        if not ek:
+            return
+
+        dugum = self.agac_koku
+        for harf in reversed(ek):
+            dugum = dugum.setdefault(harf, {})
+
+        biten_ekler = dugum.setdefault(self._EKLER, [])
+        if (ek, kategori) not in biten_ekler:
+            biten_ekler.append((ek, kategori))
+            self.ek_sayisi += 1
+
+    def eslesenler(self, sozcuk: str, kok_uzunlugu: int = 1) -> List[Tuple[str, str]]:
+        """Sözcüğün sonuyla eşleşen (ek, kategori) çiftlerini uzundan kısaya döndürür
+
+        Geriye en az kok_uzunlugu harf kalmalıdır; varsayılan olarak sözcüğün
+        tamamını kaplayan ekler döndürülmez.
+        """
+        bulunanlar = []
+        dugum = self.agac_koku
+
+        # İlk kok_uzunlugu harf kökte kalmalı, bu yüzden onlara kadar yürümüyoruz
+        for i in range(len(sozcuk) - 1, kok_uzunlugu - 1, -1):
+            dugum = dugum.get(sozcuk[i])
+            if dugum is None:
+                break
+            biten_ekler = dugum.get(self._EKLER)
+            if biten_ekler:
+                bulunanlar.append(biten_ekler)
+
+        # Derinlik arttıkça ek uzar; en uzun ekler önce gelsin
+        sonuc = []
+        for biten_ekler in reversed(bulunanlar):
+            sonuc.extend(biten_ekler)
+        return sonuc
+
+    def __len__(self) -> int:
+        return self.ek_sayisi
+
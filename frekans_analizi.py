@@ -6,101 +6,51 @@ Klasör veya tek dosya analizi yapabilir ve sözcük frekanslarını hesaplar
 """
 
 import os
-import re
 import argparse
 import time
 import glob
 import csv
 from collections import Counter, defaultdict
-from typing import Dict, Set, List, Tuple, Counter as CounterType
+from typing import Dict, Set, List, Optional, Tuple, Counter as CounterType
 
-class FrekansBilgisi:
-    """Sözcük frekans bilgisi sınıfı"""
-    def __init__(self, sozcuk: str):
-        self.sozcuk = sozcuk
-        self.toplam_frekans = 0  # Tüm metinlerdeki toplam görülme sayısı
-        self.belge_frekansi = 0  # Sözcüğün göründüğü belge sayısı
-        self.belgeler = {}  # Belge başına frekans: {dosya_yolu: sayı}
-        self.morfolojik_analiz = None  # Morfolojik analiz sonucu
-        
-    def belgeye_ekle(self, dosya_yolu: str, sayi: int = 1):
-        """Sözcüğün belgedeki frekansını günceller"""
-        self.toplam_frekans += sayi
-        
-        if dosya_yolu not in self.belgeler:
-            self.belge_frekansi += 1
-            self.belgeler[dosya_yolu] = sayi
-        else:
-            self.belgeler[dosya_yolu] += sayi
-    
-    def analiz_ekle(self, analiz_sonucu: dict):
-        """Morfolojik analiz sonucunu ekler"""
-        self.morfolojik_analiz = analiz_sonucu
-        
-    def get_kok(self) -> str:
-        """Sözcüğün kökünü döndürür"""
-        if self.morfolojik_analiz and 'kok' in self.morfolojik_analiz:
-            return self.morfolojik_analiz['kok']
-        return self.sozcuk
-    
-    def get_ekler(self) -> List[Tuple[str, str]]:
-        """Sözcüğün eklerini döndürür"""
-        if self.morfolojik_analiz and 'ekler' in self.morfolojik_analiz:
-            return self.morfolojik_analiz['ekler']
-        return []
-    
-    def get_kaynak(self) -> str:
-        """Analiz kaynağını döndürür"""
-        if self.morfolojik_analiz and 'source' in self.morfolojik_analiz:
-            return self.morfolojik_analiz['source']
-        return 'bilinmiyor'
+from frekans_deposu import FrekansDeposu, FrekansGorunumu
+from harici_sayac import HariciSayac, harici_analiz_et
+from yaklasik_sayim import YaklasikSayac
+from metrikler import Metrikler, olc, olcerek_uret
+from sutunlu_cikti import SUTUNLU_DOSYA_ADI, sutunlu_yaz
+# temizle_ve_parcala adı bu modülden içe aktaranlar için korunuyor
+from sozcuk_ayirici import dosya_frekanslari, dosyalari_sirali_isle, metin_frekanslari as temizle_ve_parcala
 
-def temizle_ve_parcala(metin: str, sayilari_atla: bool = True) -> Dict[str, int]:
-    """Metni temizler ve sözcük frekanslarını döndürür"""
-    # Noktalama işaretlerini temizle
-    temiz_metin = re.sub(r'[^\w\s]', ' ', metin)
-    
-    # Sözcükleri ayır ve küçük harfe çevir
-    sozcukler = temiz_metin.lower().split()
+class FrekansBilgisi(FrekansGorunumu):
+    """Sözcük frekans bilgisi (FrekansDeposu içindeki bir sözcüğün görünümü)"""
+    __slots__ = ()
+
+def analiz_et(frekans_verileri: FrekansDeposu, veritabani_yolu: str, zemberek_aktif: bool = False,
+              parti_boyutu: int = 1000, isci_sayisi: int = 1, manifesto=None,
+              metrikler: Optional[Metrikler] = None) -> None:
+    """Sözcükleri analiz et ve frekans verilerine ekle
     
-    # Sözcük frekanslarını sayar
-    frekanslar = Counter()
+    manifesto verilirse daha önce çözümlenmiş sözcüklerin analizleri oradan
+    alınır, yalnızca yeni sözcükler analiz edilip manifestoya yazılır.
     
-    for sozcuk in sozcukler:
-        if len(sozcuk) <= 1:  # Çok kısa sözcükleri atla
-            continue
-            
-        if sayilari_atla and (sozcuk.isdigit() or re.match(r'^\d+[a-zA-Z]*$', sozcuk)):
-            continue  # Sayıları atla
-            
-        frekanslar[sozcuk] += 1
-        
-    return frekanslar
-
-def dosya_oku(dosya_yolu: str) -> str:
-    """Metin dosyasını okur, farklı kodlamaları dener"""
-    kodlamalar = ['utf-8', 'latin-1', 'windows-1254', 'iso-8859-9']
-    
-    for kodlama in kodlamalar:
-        try:
-            with open(dosya_yolu, 'r', encoding=kodlama) as f:
-                return f.read()
-        except UnicodeDecodeError:
-            continue
-    
-    # Hiçbir kodlama çalışmazsa, binary olarak oku ve decode edebileceğimiz karakterleri al
-    try:
-        with open(dosya_yolu, 'rb') as f:
-            return f.read().decode('utf-8', errors='ignore')
-    except Exception as e:
-        print(f"HATA: {dosya_yolu} dosyası okunamadı: {e}")
-        return ""
-
-def analiz_et(frekans_verileri: Dict[str, FrekansBilgisi], veritabani_yolu: str, zemberek_aktif: bool = False) -> None:
-    """Sözcükleri analiz et ve frekans verilerine ekle"""
+    metrikler verilirse analiz ve kayıt aşamaları ölçülür ve metrikler her
+    partiden sonra (aralığı dolduysa) yazılır.
+    """
     from turkce_morfologik_analiz import TurkceMorfologikAnaliz
+    from paralel_analiz import partiler_halinde_coz
     
     sozcukler = list(frekans_verileri.keys())
+    
+    if manifesto is not None:
+        kayitli_analizler = manifesto.analizleri_getir(sozcukler)
+        for sozcuk, analiz_sonuc in kayitli_analizler.items():
+            frekans_verileri[sozcuk].analiz_ekle(analiz_sonuc)
+        sozcukler = [sozcuk for sozcuk in sozcukler if sozcuk not in kayitli_analizler]
+        print(f"{len(kayitli_analizler)} sözcüğün analizi manifestodan alındı.")
+        if not sozcukler:
+            print("Analiz edilecek yeni sözcük yok.")
+            return
+    
     print(f"Toplam {len(sozcukler)} benzersiz sözcük analiz edilecek.")
     
     # Analizci oluştur
@@ -108,27 +58,42 @@ def analiz_et(frekans_verileri: Dict[str, FrekansBilgisi], veritabani_yolu: str,
         veritabani_path=veritabani_yolu,
         zemberek_jar_path="zemberek-full.jar" if zemberek_aktif else "non-existent.jar",
         interaktif=False,
-        zemberek_oncelikli=zemberek_aktif
+        zemberek_oncelikli=zemberek_aktif,
+        metrikler=metrikler
     )
     
     islenecek_toplam = len(sozcukler)
     
+    sirali_sozcukler = sorted(sozcukler)
+    
+    # Sözcükleri partiler halinde çözümle (kayıtlı analizler tek sorguda gelir)
     baslangic = time.time()
-    for i, sozcuk in enumerate(sorted(sozcukler)):
-        analiz_sonuc = analizci.parcala(sozcuk)
-        frekans_verileri[sozcuk].analiz_ekle(analiz_sonuc)
+    islenen = 0
+    partiler = partiler_halinde_coz(analizci, sirali_sozcukler, parti_boyutu, isci_sayisi)
+    for parti_sonuclari in olcerek_uret(metrikler, 'analiz', partiler, len):
+        for sozcuk, analiz_sonuc in parti_sonuclari.items():
+            frekans_verileri[sozcuk].analiz_ekle(analiz_sonuc)
+        if manifesto is not None:
+            with olc(metrikler, 'kayit', len(parti_sonuclari)):
+                manifesto.analizleri_kaydet(parti_sonuclari)
+        islenen += len(parti_sonuclari)
+        if metrikler is not None:
+            metrikler.bolum_ekle('analizci', analizci.istatistikler())
+            metrikler.gerekirse_yaz()
         
         # İlerleme göster
-        if (i+1) % 100 == 0 or i+1 == islenecek_toplam:
-            gecen_sure = time.time() - baslangic
-            hiz = (i+1) / gecen_sure if gecen_sure > 0 else 0
-            kalan_sure = (islenecek_toplam - (i+1)) / hiz if hiz > 0 else 0
-            print(f"\rİlerleme: {i+1}/{islenecek_toplam} sözcük ({(i+1)/islenecek_toplam*100:.1f}%) | "
-                  f"Hız: {hiz:.1f} sözcük/sn | Kalan: {kalan_sure:.1f} sn", end="")
+        gecen_sure = time.time() - baslangic
+        hiz = islenen / gecen_sure if gecen_sure > 0 else 0
+        kalan_sure = (islenecek_toplam - islenen) / hiz if hiz > 0 else 0
+        print(f"\rİlerleme: {islenen}/{islenecek_toplam} sözcük ({islenen/islenecek_toplam*100:.1f}%) | "
+              f"Hız: {hiz:.1f} sözcük/sn | Kalan: {kalan_sure:.1f} sn", end="")
     
     print()  # Yeni satır
     
-    analizci.kapat()
+    if metrikler is not None:
+        metrikler.bolum_ekle('analizci', analizci.istatistikler())
+    with olc(metrikler, 'kayit'):
+        analizci.kapat()
     
     bitis = time.time()
     toplam_sure = bitis - baslangic
@@ -153,104 +118,324 @@ def klasordeki_dosyalari_bul(klasor_yolu: str, uzanti: str = ".txt") -> List[str
     print(f"{len(dosya_yollari)} adet {uzanti} dosyası bulundu.")
     return dosya_yollari
 
+def ozet_yaz(frekans_verileri: FrekansDeposu, ozet_dosyasi: str) -> None:
+    """Tüm sonuçları frekansa göre sıralı özet dosyasına yazar"""
+    with open(ozet_dosyasi, 'w', encoding='utf-8') as f:
+        f.write(f"# Toplam {frekans_verileri.belge_sayisi} dosya analiz edildi\n")
+        f.write(f"# Toplam {len(frekans_verileri)} benzersiz sözcük bulundu\n\n")
+        f.write("# Sözcük\tToplam_Frekans\tBelge_Frekansı\tKök\tEkler\tKaynak\n")
+        
+        # Frekansa göre sırala (en yüksekten en düşüğe)
+        for sozcuk, veri in frekans_verileri.frekansa_gore_sirali():
+            ekler_str = ", ".join([f"{ek} ({kategori})" for ek, kategori in veri.get_ekler()])
+            
+            f.write(f"{sozcuk}\t{veri.toplam_frekans}\t{veri.belge_frekansi}\t{veri.get_kok()}\t"
+                   f"{ekler_str if ekler_str else 'Yok'}\t{veri.get_kaynak()}\n")
+    
+    print(f"Özet sonuçlar kaydedildi: {ozet_dosyasi}")
+
+def csv_yaz(frekans_verileri: FrekansDeposu, csv_dosyasi: str) -> None:
+    """Tüm sonuçları frekansa göre sıralı CSV dosyasına yazar"""
+    with open(csv_dosyasi, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Sözcük", "Toplam_Frekans", "Belge_Frekansı", "Kök", "Ekler", "Kaynak"])
+        
+        # Frekansa göre sırala (en yüksekten en düşüğe)
+        for sozcuk, veri in frekans_verileri.frekansa_gore_sirali():
+            ekler_str = ", ".join([f"{ek} ({kategori})" for ek, kategori in veri.get_ekler()])
+            
+            writer.writerow([
+                sozcuk, 
+                veri.toplam_frekans, 
+                veri.belge_frekansi, 
+                veri.get_kok(),
+                ekler_str if ekler_str else 'Yok',
+                veri.get_kaynak()
+            ])
+    
+    print(f"CSV sonuçlar kaydedildi: {csv_dosyasi}")
+
 def dosyalari_analiz_et(dosya_yollari: List[str], veritabani_yolu: str, 
                        cikti_klasoru: str, ozet_dosyasi: str, csv_dosyasi: str,
-                       zemberek_aktif: bool = False, sayilari_atla: bool = True) -> Dict[str, FrekansBilgisi]:
-    """Birden fazla dosyayı analiz eder, frekans bilgilerini toplar"""
+                       zemberek_aktif: bool = False, sayilari_atla: bool = True,
+                       isci_sayisi: int = 1, manifesto_yolu: Optional[str] = None,
+                       okuyucu_sayisi: int = 1, cikti_bicimi: str = 'metin',
+                       kismi_sonuc_yolu: Optional[str] = None,
+                       bellek_siniri_mb: Optional[float] = None,
+                       metrikler: Optional[Metrikler] = None) -> FrekansDeposu:
+    """Birden fazla dosyayı analiz eder, frekans bilgilerini toplar
+    
+    manifesto_yolu verilirse son çalışmadan beri değişmemiş dosyalar yeniden
+    okunmaz; sayımları ve sözcük analizleri manifestodan alınır. Özet ve CSV
+    yine tüm dosyaları kapsar, dosya başına çıktılar ise yalnızca okunan
+    (ya da çıktısı bulunmayan) dosyalar için yazılır.
+    
+    okuyucu_sayisi > 1 ise dosyalar iş parçacıklarında eşzamanlı okunur;
+    sayımlar yine dosya listesinin sırasıyla birleştirilir.
+    
+    cikti_bicimi 'sutunlu' ise dosya başına *_analiz.txt yerine tüm dosyaların
+    sonuçları cikti_klasoru içinde tek bir sütunlu dosyaya yazılır (bkz. sutunlu_cikti).
+    
+    kismi_sonuc_yolu verilirse sayımlar, belge başına sayımlar ve analizler
+    bu yola birleştirilebilir kısmi sonuç olarak da yazılır (bkz. frekans_birlestir).
+    
+    bellek_siniri_mb verilirse sayımlar bu sınırı aşınca geçici dosyalara
+    taşar ve dış birleştirmeyle toplanır (bkz. harici_sayac); çıktılar aynıdır.
+    
+    metrikler verilirse okuma, çözme, ayırma, sayım, analiz, kayıt ve çıktı
+    aşamalarının süreleri ölçülür ve metrikler çalışma boyunca belirli
+    aralıklarla yazılır (bkz. metrikler). Son yazma çağıranındır.
+    """
     if not dosya_yollari:
         print("İşlenecek dosya bulunamadı.")
         return {}
     
+    if bellek_siniri_mb and (cikti_bicimi == 'sutunlu' or kismi_sonuc_yolu):
+        print("HATA: Bellek sınırlı sayımda sütunlu çıktı ve kısmi sonuç desteklenmiyor.")
+        return {}
+    
     # Çıktı klasörünü oluştur
     if not os.path.exists(cikti_klasoru):
         os.makedirs(cikti_klasoru)
         print(f"Çıktı klasörü oluşturuldu: {cikti_klasoru}")
     
     # Frekans verilerini topla
-    frekans_verileri = {}  # {sozcuk: FrekansBilgisi}
-    dosya_analiz_sonuclari = {}  # {dosya_yolu: {sozcuk: frekans}}
+    if bellek_siniri_mb:
+        # Sayımlar bellek sınırını aşınca diske taşar
+        frekans_verileri = HariciSayac(FrekansBilgisi, bellek_siniri_mb)
+    else:
+        frekans_verileri = FrekansDeposu(FrekansBilgisi)  # {sozcuk: FrekansBilgisi}
+    dosya_kodlamalari = {}  # {dosya_yolu: kodlama}
+    degismemis_dosyalar = set()
+    
+    manifesto = None
+    if manifesto_yolu:
+        from dosya_manifestosu import DosyaManifestosu
+        manifesto = DosyaManifestosu(manifesto_yolu, sayilari_atla)
+        silinen = manifesto.eksik_dosyalari_temizle()
+        if silinen:
+            print(f"Manifestodan artık bulunmayan {silinen} dosyanın kaydı silindi.")
+    
+    def dosyayi_oku(dosya_yolu: str) -> Tuple[CounterType[str], str, bool]:
+        """Dosyanın sayımlarını (değişmemişse manifestodan) alır; okuyucu iş parçacığında çalışır"""
+        kayit = manifesto.degismemis_kayit(dosya_yolu) if manifesto else None
+        if kayit:
+            with olc(metrikler, 'okuma'):
+                return manifesto.frekanslari_getir(kayit['id']), kayit['kodlama'], True
+        
+        kodlama_bilgisi = {}
+        frekanslar = dosya_frekanslari(dosya_yolu, sayilari_atla, bilgi=kodlama_bilgisi, metrikler=metrikler)
+        if manifesto:
+            with olc(metrikler, 'kayit'):
+                manifesto.dosya_kaydet(dosya_yolu, frekanslar, kodlama_bilgisi['kodlama'])
+        return frekanslar, kodlama_bilgisi['kodlama'], False
     
     # Tüm dosyaları oku ve frekans bilgilerini topla
-    for i, dosya_yolu in enumerate(dosya_yollari):
-        print(f"\n[{i+1}/{len(dosya_yollari)}] Dosya okunuyor: {dosya_yolu}")
-        metin = dosya_oku(dosya_yolu)
-        frekanslar = temizle_ve_parcala(metin, sayilari_atla)
+    okunanlar = dosyalari_sirali_isle(dosyayi_oku, dosya_yollari, okuyucu_sayisi)
+    for i, (dosya_yolu, (frekanslar, kodlama, degismemis)) in enumerate(okunanlar):
+        dosya_kodlamalari[dosya_yolu] = kodlama
+        if degismemis:
+            print(f"\n[{i+1}/{len(dosya_yollari)}] Değişmemiş dosya, manifestodan alındı: {dosya_yolu}")
+            degismemis_dosyalar.add(dosya_yolu)
+        else:
+            print(f"\n[{i+1}/{len(dosya_yollari)}] Dosya okundu: {dosya_yolu}")
         
-        # Frekans verilerini güncelle
-        for sozcuk, frekans in frekanslar.items():
-            if sozcuk not in frekans_verileri:
-                frekans_verileri[sozcuk] = FrekansBilgisi(sozcuk)
-            
-            frekans_verileri[sozcuk].belgeye_ekle(dosya_yolu, frekans)
+        # Frekans verilerini güncelle (dosya bazında frekanslar da depoda tutulur)
+        with olc(metrikler, 'sayim', 1):
+            frekans_verileri.belge_ekle(dosya_yolu, frekanslar)
         
-        # Dosya bazında frekansları kaydet
-        dosya_analiz_sonuclari[dosya_yolu] = frekanslar
+        print(f"  Dosyadan {len(frekanslar)} benzersiz sözcük çıkarıldı (toplam kullanım: {sum(frekanslar.values())}, kodlama: {dosya_kodlamalari[dosya_yolu]})")
         
-        print(f"  Dosyadan {len(frekanslar)} benzersiz sözcük çıkarıldı (toplam kullanım: {sum(frekanslar.values())})")
+        if metrikler is not None:
+            metrikler.sayac_ekle('degismemis_dosya' if degismemis else 'okunan_dosya')
+            metrikler.gerekirse_yaz()
+    
+    if bellek_siniri_mb:
+        with olc(metrikler, 'sayim'):
+            kosu_sayisi = frekans_verileri.birlestir()
+        print(f"\nSayımlar {kosu_sayisi} koşudan birleştirildi.")
     
     print(f"\nToplam {len(frekans_verileri)} benzersiz sözcük bulundu.")
+    if manifesto:
+        print(f"{len(degismemis_dosyalar)} dosya değişmemiş, {len(dosya_yollari) - len(degismemis_dosyalar)} dosya okundu.")
     
     # Tüm sözcükleri analiz et
-    analiz_et(frekans_verileri, veritabani_yolu, zemberek_aktif)
-    
-    # Her dosya için ayrı analiz sonucu dosyası oluştur
-    for dosya_yolu, frekanslar in dosya_analiz_sonuclari.items():
-        dosya_adi = os.path.basename(dosya_yolu)
-        cikti_dosyasi = os.path.join(cikti_klasoru, f"{os.path.splitext(dosya_adi)[0]}_analiz.txt")
-        
-        with open(cikti_dosyasi, 'w', encoding='utf-8') as f:
-            f.write(f"# Dosya: {dosya_yolu}\n")
-            f.write(f"# Toplam sözcük sayısı: {sum(frekanslar.values())}\n")
-            f.write(f"# Benzersiz sözcük sayısı: {len(frekanslar)}\n\n")
-            f.write("# Sözcük\tFrekans\tKök\tEkler\tKaynak\n")
+    if bellek_siniri_mb:
+        harici_analiz_et(frekans_verileri, veritabani_yolu, zemberek_aktif, isci_sayisi=isci_sayisi, manifesto=manifesto,
+                         metrikler=metrikler)
+    else:
+        analiz_et(frekans_verileri, veritabani_yolu, zemberek_aktif, isci_sayisi=isci_sayisi, manifesto=manifesto,
+                  metrikler=metrikler)
+    
+    if manifesto:
+        manifesto.kapat()
+    
+    if cikti_bicimi == 'sutunlu':
+        # Tüm dosyaların sonuçları tek bir sözlükle kodlanmış sütunlu dosyada
+        with olc(metrikler, 'cikti', 1):
+            cikti_dosyasi = sutunlu_yaz(frekans_verileri, dosya_kodlamalari,
+                                        os.path.join(cikti_klasoru, SUTUNLU_DOSYA_ADI))
+        print(f"Sütunlu sonuçlar kaydedildi: {cikti_dosyasi}")
+    else:
+        # Her dosya için ayrı analiz sonucu dosyası oluştur
+        for dosya_yolu in frekans_verileri.belge_yollari:
+            dosya_adi = os.path.basename(dosya_yolu)
+            cikti_dosyasi = os.path.join(cikti_klasoru, f"{os.path.splitext(dosya_adi)[0]}_analiz.txt")
+            
+            # Değişmemiş dosyanın çıktısı (sözcük analizleri de manifestodan geldiği için) güncel
+            if dosya_yolu in degismemis_dosyalar and os.path.exists(cikti_dosyasi):
+                continue
             
-            # Frekansa göre sırala (en yüksekten en düşüğe)
-            for sozcuk, frekans in sorted(frekanslar.items(), key=lambda x: x[1], reverse=True):
-                veri = frekans_verileri[sozcuk]
-                ekler_str = ", ".join([f"{ek} ({kategori})" for ek, kategori in veri.get_ekler()])
+            frekanslar = frekans_verileri.belge_frekanslari_getir(dosya_yolu)
+            
+            with olc(metrikler, 'cikti', 1), open(cikti_dosyasi, 'w', encoding='utf-8') as f:
+                f.write(f"# Dosya: {dosya_yolu}\n")
+                f.write(f"# Kodlama: {dosya_kodlamalari[dosya_yolu]}\n")
+                f.write(f"# Toplam sözcük sayısı: {sum(frekanslar.values())}\n")
+                f.write(f"# Benzersiz sözcük sayısı: {len(frekanslar)}\n\n")
+                f.write("# Sözcük\tFrekans\tKök\tEkler\tKaynak\n")
                 
-                f.write(f"{sozcuk}\t{frekans}\t{veri.get_kok()}\t{ekler_str if ekler_str else 'Yok'}\t{veri.get_kaynak()}\n")
-        
-        print(f"Dosya analizi kaydedildi: {cikti_dosyasi}")
+                # Frekansa göre sırala (en yüksekten en düşüğe)
+                for sozcuk, frekans in sorted(frekanslar.items(), key=lambda x: x[1], reverse=True):
+                    veri = frekans_verileri[sozcuk]
+                    ekler_str = ", ".join([f"{ek} ({kategori})" for ek, kategori in veri.get_ekler()])
+                    
+                    f.write(f"{sozcuk}\t{frekans}\t{veri.get_kok()}\t{ekler_str if ekler_str else 'Yok'}\t{veri.get_kaynak()}\n")
+            
+            print(f"Dosya analizi kaydedildi: {cikti_dosyasi}")
+    
+    # Başka makinelerdeki çalışmalarla birleştirilecek kısmi sonuç
+    if kismi_sonuc_yolu:
+        with olc(metrikler, 'cikti', 1):
+            sutunlu_yaz(frekans_verileri, dosya_kodlamalari, kismi_sonuc_yolu)
+        print(f"Kısmi sonuç kaydedildi: {kismi_sonuc_yolu}")
     
     # Tüm sonuçları özet dosyasına yaz
     if ozet_dosyasi:
-        with open(ozet_dosyasi, 'w', encoding='utf-8') as f:
-            f.write(f"# Toplam {len(dosya_yollari)} dosya analiz edildi\n")
-            f.write(f"# Toplam {len(frekans_verileri)} benzersiz sözcük bulundu\n\n")
-            f.write("# Sözcük\tToplam_Frekans\tBelge_Frekansı\tKök\tEkler\tKaynak\n")
+        with olc(metrikler, 'cikti', 1):
+            ozet_yaz(frekans_verileri, ozet_dosyasi)
+    
+    # CSV formatında kaydet
+    if csv_dosyasi:
+        with olc(metrikler, 'cikti', 1):
+            csv_yaz(frekans_verileri, csv_dosyasi)
+    
+    if bellek_siniri_mb:
+        frekans_verileri.kapat()
+    
+    return frekans_verileri
+
+def yaklasik_analiz_et(dosya_yollari: List[str], veritabani_yolu: str, ozet_dosyasi: str, csv_dosyasi: str,
+                       zemberek_aktif: bool = False, sayilari_atla: bool = True, isci_sayisi: int = 1,
+                       okuyucu_sayisi: int = 1, ilk_k: int = 1000, orneklem_boyutu: int = 1000,
+                       hata_payi: float = 1e-4, parti_boyutu: int = 1000,
+                       metrikler: Optional[Metrikler] = None) -> Optional[YaklasikSayac]:
+    """Derlemi sabit bellekle yaklaşık olarak sayar (bkz. yaklasik_sayim)
+    
+    Yalnızca en sık ilk_k sözcük ile benzersiz sözcüklerden alınan
+    orneklem_boyutu sözcüklük örneklem analiz edilir. Özet ve CSV bu
+    sözcükleri tahmini frekanslar ve hata sınırlarıyla birlikte içerir;
+    dosya başına çıktı yazılmaz. hata_payi, frekans tahminlerinin toplam
+    sözcük sayısına oranla en büyük hatasıdır. İşlenecek dosya yoksa None
+    döndürür.
+    """
+    from turkce_morfologik_analiz import TurkceMorfologikAnaliz
+    from paralel_analiz import partiler_halinde_coz
+    
+    if not dosya_yollari:
+        print("İşlenecek dosya bulunamadı.")
+        return None
+    
+    sayac = YaklasikSayac(ilk_k, orneklem_boyutu, hata_payi)
+    baslangic = time.time()
+    
+    def dosyayi_oku(dosya_yolu: str) -> Tuple[CounterType[str], str]:
+        """Dosyanın sözcük sayımlarını ve kodlamasını döndürür (okuyucu iş parçacığında çalışır)"""
+        kodlama_bilgisi = {}
+        frekanslar = dosya_frekanslari(dosya_yolu, sayilari_atla, bilgi=kodlama_bilgisi, metrikler=metrikler)
+        return frekanslar, kodlama_bilgisi['kodlama']
+    
+    okunanlar = dosyalari_sirali_isle(dosyayi_oku, dosya_yollari, okuyucu_sayisi)
+    for i, (dosya_yolu, (frekanslar, kodlama)) in enumerate(okunanlar):
+        print(f"\n[{i+1}/{len(dosya_yollari)}] Dosya okundu: {dosya_yolu}")
+        with olc(metrikler, 'sayim', 1):
+            sayac.belge_ekle(dosya_yolu, frekanslar)
+        print(f"  Dosyadan {len(frekanslar)} benzersiz sözcük çıkarıldı (toplam kullanım: {sum(frekanslar.values())}, kodlama: {kodlama})")
+        if metrikler is not None:
+            metrikler.gerekirse_yaz()
+    
+    print(f"\nToplam {sayac.toplam_sozcuk} sözcük, yaklaşık {sayac.benzersiz.tahmin()} benzersiz sözcük "
+          f"({time.time() - baslangic:.2f} saniyede sayıldı).")
+    for satir in sayac.hata_sinirlari():
+        print(f"  {satir}")
+    
+    # Yalnızca en sık sözcükler ve örneklem analiz edilir
+    en_sikler = sayac.en_sikler()
+    orneklem = sayac.orneklem.sozcukler()
+    sozcukler = sorted({sozcuk for sozcuk, _, _ in en_sikler} | set(orneklem))
+    print(f"\n{len(en_sikler)} en sık sözcük ve {len(orneklem)} örneklem sözcüğü ({len(sozcukler)} benzersiz) analiz edilecek.")
+    
+    analizci = TurkceMorfologikAnaliz(
+        veritabani_path=veritabani_yolu,
+        zemberek_jar_path="zemberek-full.jar" if zemberek_aktif else "non-existent.jar",
+        interaktif=False,
+        zemberek_oncelikli=zemberek_aktif,
+        metrikler=metrikler
+    )
+    analizler = {}
+    try:
+        partiler = partiler_halinde_coz(analizci, sozcukler, parti_boyutu, isci_sayisi)
+        for parti_sonuclari in olcerek_uret(metrikler, 'analiz', partiler, len):
+            analizler.update(parti_sonuclari)
+    finally:
+        with olc(metrikler, 'kayit'):
+            analizci.kapat()
+    
+    # (grup, sözcük, tahmini frekans, frekans alt sınırı) satırları
+    satirlar = [('ilk_k', sozcuk, tahmin, alt_sinir) for sozcuk, tahmin, alt_sinir in en_sikler]
+    satirlar += [('orneklem', sozcuk, sayac.frekans_tahmini(sozcuk), None) for sozcuk in orneklem]
+    
+    if ozet_dosyasi:
+        with olc(metrikler, 'cikti', 1), open(ozet_dosyasi, 'w', encoding='utf-8') as f:
+            f.write(f"# Yaklaşık sayım: {sayac.belge_sayisi} dosya, {sayac.toplam_sozcuk} sözcük, "
+                    f"yaklaşık {sayac.benzersiz.tahmin()} benzersiz sözcük\n")
+            for satir in sayac.hata_sinirlari():
+                f.write(f"# {satir}\n")
+            f.write("\n# Grup\tSözcük\tTahmini_Frekans\tFrekans_Alt_Sınırı\tTahmini_Belge_Frekansı\tKök\tEkler\tKaynak\n")
             
-            # Frekansa göre sırala (en yüksekten en düşüğe)
-            for sozcuk, veri in sorted(frekans_verileri.items(), key=lambda x: x[1].toplam_frekans, reverse=True):
-                ekler_str = ", ".join([f"{ek} ({kategori})" for ek, kategori in veri.get_ekler()])
-                
-                f.write(f"{sozcuk}\t{veri.toplam_frekans}\t{veri.belge_frekansi}\t{veri.get_kok()}\t"
-                       f"{ekler_str if ekler_str else 'Yok'}\t{veri.get_kaynak()}\n")
+            for grup, sozcuk, tahmin, alt_sinir in satirlar:
+                veri = analizler.get(sozcuk) or {}
+                ekler_str = ", ".join([f"{ek} ({kategori})" for ek, kategori in veri.get('ekler', [])])
+                f.write(f"{grup}\t{sozcuk}\t{tahmin}\t{'' if alt_sinir is None else alt_sinir}\t"
+                        f"{sayac.belge_frekansi_tahmini(sozcuk)}\t{veri.get('kok', sozcuk)}\t"
+                        f"{ekler_str if ekler_str else 'Yok'}\t{veri.get('source', 'bilinmiyor')}\n")
         
         print(f"Özet sonuçlar kaydedildi: {ozet_dosyasi}")
     
-    # CSV formatında kaydet
     if csv_dosyasi:
-        with open(csv_dosyasi, 'w', encoding='utf-8', newline='') as f:
+        with olc(metrikler, 'cikti', 1), open(csv_dosyasi, 'w', encoding='utf-8', newline='') as f:
             writer = csv.writer(f)
-            writer.writerow(["Sözcük", "Toplam_Frekans", "Belge_Frekansı", "Kök", "Ekler", "Kaynak"])
+            writer.writerow(["Grup", "Sözcük", "Tahmini_Frekans", "Frekans_Alt_Sınırı", "Tahmini_Belge_Frekansı",
+                             "Kök", "Ekler", "Kaynak"])
             
-            # Frekansa göre sırala (en yüksekten en düşüğe)
-            for sozcuk, veri in sorted(frekans_verileri.items(), key=lambda x: x[1].toplam_frekans, reverse=True):
-                ekler_str = ", ".join([f"{ek} ({kategori})" for ek, kategori in veri.get_ekler()])
-                
+            for grup, sozcuk, tahmin, alt_sinir in satirlar:
+                veri = analizler.get(sozcuk) or {}
+                ekler_str = ", ".join([f"{ek} ({kategori})" for ek, kategori in veri.get('ekler', [])])
                 writer.writerow([
-                    sozcuk, 
-                    veri.toplam_frekans, 
-                    veri.belge_frekansi, 
-                    veri.get_kok(),
+                    grup,
+                    sozcuk,
+                    tahmin,
+                    '' if alt_sinir is None else alt_sinir,
+                    sayac.belge_frekansi_tahmini(sozcuk),
+                    veri.get('kok', sozcuk),
                     ekler_str if ekler_str else 'Yok',
-                    veri.get_kaynak()
+                    veri.get('source', 'bilinmiyor')
                 ])
         
         print(f"CSV sonuçlar kaydedildi: {csv_dosyasi}")
     
-    return frekans_verileri
+    print(f"\nYaklaşık analiz {time.time() - baslangic:.2f} saniyede tamamlandı.")
+    return sayac
 
 def main():
     """Ana program fonksiyonu"""
@@ -264,9 +449,46 @@ def main():
     parser.add_argument('--csv', '-csv', default='frekans_analizi.csv', help='CSV format özet dosyası')
     parser.add_argument('--zemberek', '-z', action='store_true', help='Zemberek kullan')
     parser.add_argument('--sayilari-dahil-et', '-s', action='store_true', help='Sayıları analize dahil et')
+    parser.add_argument('--isci', '--workers', '-w', type=int, default=1,
+                        help='Analiz için kullanılacak işçi süreç sayısı (varsayılan: 1)')
+    parser.add_argument('--okuyucu', '--readers', '-r', type=int, default=1,
+                        help='Dosyaları eşzamanlı okuyup sözcüklere ayıracak iş parçacığı sayısı (varsayılan: 1)')
+    parser.add_argument('--cikti-bicimi', '-b', choices=['metin', 'sutunlu'],
+                        help='Dosya başına çıktı biçimi: her dosya için *_analiz.txt (metin) ya da '
+                             'tek bir sütunlu zip dosyası (sutunlu) (varsayılan: metin)')
+    parser.add_argument('--manifest', '-m', help='Değişmemiş dosyaları atlamak için kullanılacak manifesto veritabanı')
+    parser.add_argument('--bellek-siniri', '-bs', type=float,
+                        help='Sayımlar için bellek sınırı (MB); aşılınca sayımlar geçici dosyalara taşar '
+                             '(geçici klasör TMPDIR ile seçilir)')
+    parser.add_argument('--yaklasik', '-y', action='store_true',
+                        help='Sabit bellekli yaklaşık sayım: yalnızca en sık sözcükler ve bir örneklem analiz edilir, '
+                             'özet ve CSV tahminleri hata sınırlarıyla verir (dosya başına çıktı yazılmaz)')
+    parser.add_argument('--ilk-k', '-kk', type=int, default=1000,
+                        help='Yaklaşık sayımda raporlanacak en sık sözcük sayısı (varsayılan: 1000)')
+    parser.add_argument('--orneklem', '-ob', type=int, default=1000,
+                        help='Yaklaşık sayımda analiz edilecek örneklem sözcüğü sayısı (varsayılan: 1000)')
+    parser.add_argument('--hata-payi', '-hp', type=float, default=1e-4,
+                        help='Yaklaşık frekansların toplam sözcük sayısına oranla en büyük hatası (varsayılan: 0.0001)')
+    parser.add_argument('--kismi', '-p',
+                        help='frekans-birlestir ile birleştirilebilir kısmi sonuç dosyası (ör. parca1.zip)')
+    parser.add_argument('--metrikler', '-mt',
+                        help='Aşama sürelerinin, sayaçların ve hızların yazılacağı JSON dosyası')
+    parser.add_argument('--prometheus', '-pr',
+                        help='Metriklerin ayrıca yazılacağı Prometheus textfile (ör. node_exporter klasöründe *.prom)')
+    parser.add_argument('--metrik-araligi', '-ma', type=float, default=60.0,
+                        help='Metriklerin çalışma sırasında yazılma aralığı, saniye (0: yalnızca sonda; varsayılan: 60)')
     
     args = parser.parse_args()
     
+    # Yaklaşık sayım manifesto, kısmi sonuç, bellek sınırı ve dosya başına çıktı kullanmaz
+    if args.yaklasik:
+        yok_sayilanlar = [secenek for secenek, deger in (('--manifest', args.manifest), ('--kismi', args.kismi),
+                                                          ('--bellek-siniri', args.bellek_siniri),
+                                                          ('--cikti-bicimi', args.cikti_bicimi))
+                          if deger is not None]
+        if yok_sayilanlar:
+            parser.error(f"--yaklasik ile birlikte kullanılamaz: {', '.join(yok_sayilanlar)}")
+    
     # Dosya veya klasör kontrolü
     if not args.dosya and not args.klasor:
         print("Hata: Dosya veya klasör belirtilmelidir.")
@@ -285,16 +507,51 @@ def main():
     else:
         dosya_yollari = klasordeki_dosyalari_bul(args.klasor, args.uzanti)
     
-    # Analiz başlat
-    dosyalari_analiz_et(
-        dosya_yollari=dosya_yollari,
-        veritabani_yolu=args.veritabani,
-        cikti_klasoru=args.cikti_klasoru,
-        ozet_dosyasi=args.ozet,
-        csv_dosyasi=args.csv,
-        zemberek_aktif=args.zemberek,
-        sayilari_atla=not args.sayilari_dahil_et
-    )
+    metrikler = None
+    if args.metrikler or args.prometheus:
+        metrikler = Metrikler(args.metrikler, args.prometheus, args.metrik_araligi)
+    
+    try:
+        if args.yaklasik:
+            yaklasik_analiz_et(
+                dosya_yollari=dosya_yollari,
+                veritabani_yolu=args.veritabani,
+                ozet_dosyasi=args.ozet,
+                csv_dosyasi=args.csv,
+                zemberek_aktif=args.zemberek,
+                sayilari_atla=not args.sayilari_dahil_et,
+                isci_sayisi=args.isci,
+                okuyucu_sayisi=args.okuyucu,
+                ilk_k=args.ilk_k,
+                orneklem_boyutu=args.orneklem,
+                hata_payi=args.hata_payi,
+                metrikler=metrikler
+            )
+        else:
+            # Analiz başlat
+            dosyalari_analiz_et(
+                dosya_yollari=dosya_yollari,
+                veritabani_yolu=args.veritabani,
+                cikti_klasoru=args.cikti_klasoru,
+                ozet_dosyasi=args.ozet,
+                csv_dosyasi=args.csv,
+                zemberek_aktif=args.zemberek,
+                sayilari_atla=not args.sayilari_dahil_et,
+                isci_sayisi=args.isci,
+                manifesto_yolu=args.manifest,
+                okuyucu_sayisi=args.okuyucu,
+                cikti_bicimi=args.cikti_bicimi or 'metin',
+                kismi_sonuc_yolu=args.kismi,
+                bellek_siniri_mb=args.bellek_siniri,
+                metrikler=metrikler
+            )
+    finally:
+        # Yarıda kalan çalışmanın metrikleri de yazılır
+        if metrikler is not None:
+            metrikler.yaz()
+            print("\nAşama süreleri:")
+            for satir in metrikler.rapor_satirlari():
+                print(satir)
 
 if __name__ == "__main__":
     main()
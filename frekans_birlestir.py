@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Türkçe Morfolojik Analiz - Kısmi Frekans Sonuçlarını Birleştirme
+
+Derlem makinelere bölünüp her parça `frekans_analizi.py --kismi parcaN.zip`
+ile işlendiğinde bu araç kısmi sonuçları ortak bir veritabanı gerekmeden
+birleştirir ve tek çalışmadakiyle aynı özet, CSV ve sorunlu sözcük
+çıktılarını üretir:
+
+    frekans-birlestir parca1.zip parca2.zip --ozet tum_sonuclar.txt --csv frekans_analizi.csv
+
+Kısmi sonuçlar verildiği sırayla birleştirilir; sonuç, dosya listeleri bu
+sırayla art arda eklenerek yapılmış tek bir çalışmanınkiyle aynıdır.
+"""
+
+import os
+import argparse
+from typing import Dict, List, Tuple
+
+from frekans_deposu import FrekansDeposu, FrekansGorunumu
+from sutunlu_cikti import analiz_getir, belge_araliklari, sutunlu_oku, sutunlu_yaz
+
+
+def kismi_sonuclari_birlestir(kismi_yollar: List[str],
+                              gorunum_sinifi: type = FrekansGorunumu) -> Tuple[FrekansDeposu, Dict[str, str], int]:
+    """Kısmi sonuç dosyalarını tek bir frekans deposunda birleştirir
+
+    Belgeler kısmi sonuçların ve her birindeki belge sırasıyla depoya eklenir;
+    böylece sözcük kimlikleri (ve eşit frekanslı sözcüklerin sırası) tek
+    çalışmadakiyle aynı olur. Bir sözcüğün analizi ilk görüldüğü kısmi
+    sonuçtan alınır.
+
+    Depoyu, {dosya_yolu: kodlama} sözlüğünü ve farklı kısmi sonuçlarda farklı
+    analiz edilmiş sözcük sayısını döndürür. Aynı belge birden fazla kısmi
+    sonuçta geçiyorsa ValueError yükseltir.
+    """
+    frekans_verileri = FrekansDeposu(gorunum_sinifi)
+    dosya_kodlamalari: Dict[str, str] = {}
+    celisen_analizler = 0
+
+    for kismi_yol in kismi_yollar:
+        veri = sutunlu_oku(kismi_yol)
+        sozcukler = veri['sozcukler']
+        kayit_sozcuk, kayit_sayi = veri['kayit_sozcuk'], veri['kayit_sayi']
+
+        for belge, aralik in zip(veri['belgeler'], belge_araliklari(veri)):
+            if belge['yol'] in dosya_kodlamalari:
+                raise ValueError(f"Belge birden fazla kısmi sonuçta var: {belge['yol']} ({kismi_yol})")
+            dosya_kodlamalari[belge['yol']] = belge['kodlama']
+            frekanslar = {sozcukler[kayit_sozcuk[k]]: kayit_sayi[k] for k in aralik}
+            frekans_verileri.belge_ekle(belge['yol'], frekanslar)
+
+        # Sözcüğün analizi ilk görüldüğü kısmi sonuçtan alınır
+        for kimlik, sozcuk in enumerate(sozcukler):
+            analiz = analiz_getir(veri, kimlik)
+            if analiz is None:
+                continue
+            hedef = frekans_verileri[sozcuk]
+            if hedef.morfolojik_analiz is None:
+                hedef.analiz_ekle(analiz)
+            elif hedef.morfolojik_analiz != analiz:
+                celisen_analizler += 1
+
+        print(f"Kısmi sonuç eklendi: {kismi_yol} ({len(veri['belgeler'])} belge, {len(sozcukler)} sözcük)")
+
+    return frekans_verileri, dosya_kodlamalari, celisen_analizler
+
+
+def main():
+    """Ana program fonksiyonu"""
+    parser = argparse.ArgumentParser(description='Türkçe Morfolojik Analiz - Kısmi Frekans Sonuçlarını Birleştirme')
+    parser.add_argument('kismi_sonuclar', nargs='+', help='Birleştirilecek kısmi sonuç dosyaları (frekans_analizi.py --kismi)')
+    parser.add_argument('--ozet', '-o', default='tum_sonuclar.txt', help='Tüm sonuçların özet dosyası')
+    parser.add_argument('--csv', '-csv', default='frekans_analizi.csv', help='CSV format özet dosyası')
+    parser.add_argument('--sorunlu', '-s',
+                        help='Sorunlu sözcükler dosyası; verilirse çıktılar sorunlu takipli analizdeki biçimde yazılır')
+    parser.add_argument('--veritabani', '-db', default='turkce_morfoloji.db',
+                        help='Sorunlu sözcüklerin kaydedileceği veritabanı (yalnızca --sorunlu ile)')
+    parser.add_argument('--kismi', '-p', help='Birleşik sonucu yeniden kısmi sonuç olarak da yaz')
+
+    args = parser.parse_args()
+
+    for kismi_yol in args.kismi_sonuclar:
+        if not os.path.exists(kismi_yol):
+            print(f"Hata: Dosya bulunamadı: {kismi_yol}")
+            return
+
+    if args.sorunlu:
+        import toplu_analiz_sorunlu_takip as cikti_modulu
+    else:
+        import frekans_analizi as cikti_modulu
+
+    try:
+        frekans_verileri, dosya_kodlamalari, celisen_analizler = kismi_sonuclari_birlestir(
+            args.kismi_sonuclar, cikti_modulu.FrekansBilgisi)
+    except ValueError as e:
+        print(f"Hata: {e}")
+        return
+
+    print(f"\nToplam {frekans_verileri.belge_sayisi} belge, {len(frekans_verileri)} benzersiz sözcük birleştirildi.")
+    if celisen_analizler:
+        print(f"{celisen_analizler} sözcük kısmi sonuçlarda farklı analiz edilmiş; ilk kısmi sonuçtaki analiz kullanıldı.")
+
+    if args.sorunlu:
+        cikti_modulu.sorunlu_sozcukleri_kaydet(frekans_verileri, args.veritabani, args.sorunlu)
+
+    if args.kismi:
+        sutunlu_yaz(frekans_verileri, dosya_kodlamalari, args.kismi, sorunlu_sutunu=bool(args.sorunlu))
+        print(f"Birleşik kısmi sonuç kaydedildi: {args.kismi}")
+
+    if args.ozet:
+        cikti_modulu.ozet_yaz(frekans_verileri, args.ozet)
+
+    if args.csv:
+        cikti_modulu.csv_yaz(frekans_verileri, args.csv)
+
+if __name__ == "__main__":
+    main()
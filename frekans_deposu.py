@@ -0,0 +1,283 @@
+"""
+Türkçe Morfolojik Analiz - Sütunlu Frekans Deposu
+
+Sözcük başına nesne ve dosya yolu anahtarlı sözlük tutmak yerine tüm frekans
+bilgisi tamsayı dizilerinde saklanır:
+
+- Sözcükler ve belgeler birer kez kaydedilip tamsayı kimlik alır (kimlikler
+  4 bayt, sayımlar 8 bayt yer tutar).
+- Toplam frekans ve belge frekansı sözcük kimliğiyle indekslenen dizilerdir.
+- Belge başına sayımlar belge sırasıyla (CSR) eklenir; sözcük başına belge
+  listesi gerektiğinde bu yapı bir kez sözcük sırasına çevrilir.
+
+FrekansDeposu salt okunur bir Mapping'dir: depo[sozcuk] o sözcüğün bilgisine
+erişen hafif bir görünüm nesnesi döndürür.
+"""
+
+import logging
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Mapping as MappingType, Optional, Tuple
+
+logger = logging.getLogger("TurkceMorfAnaliz")
+
+
+class FrekansGorunumu:
+    """Depodaki bir sözcüğün frekans ve analiz bilgisine erişim sağlar
+
+    Görünümler bilgi tutmaz; her erişimde depodaki dizilerden okur. Betikler
+    kendi FrekansBilgisi sınıflarını bundan türetir.
+    """
+
+    __slots__ = ('depo', 'kimlik')
+
+    def __init__(self, depo: 'FrekansDeposu', kimlik: int):
+        self.depo = depo
+        self.kimlik = kimlik
+
+    @property
+    def sozcuk(self) -> str:
+        return self.depo.sozcukler[self.kimlik]
+
+    @property
+    def toplam_frekans(self) -> int:
+        """Tüm metinlerdeki toplam görülme sayısı"""
+        return self.depo.toplam_frekanslar[self.kimlik]
+
+    @property
+    def belge_frekansi(self) -> int:
+        """Sözcüğün göründüğü belge sayısı"""
+        return self.depo.belge_frekanslari[self.kimlik]
+
+    @property
+    def belgeler(self) -> Dict[str, int]:
+        """Belge başına frekans: {dosya_yolu: sayı}"""
+        return dict(self.depo.sozcuk_belgeleri(self.kimlik))
+
+    @property
+    def morfolojik_analiz(self) -> Optional[dict]:
+        return self.depo.analizler[self.kimlik]
+
+    def analiz_ekle(self, analiz_sonucu: dict):
+        """Morfolojik analiz sonucunu ekler"""
+        self.depo.analizler[self.kimlik] = analiz_sonucu
+
+    def get_kok(self) -> str:
+        """Sözcüğün kökünü döndürür"""
+        analiz = self.morfolojik_analiz
+        if analiz and 'kok' in analiz:
+            return analiz['kok']
+        return self.sozcuk
+
+    def get_ekler(self) -> List[Tuple[str, str]]:
+        """Sözcüğün eklerini döndürür"""
+        analiz = self.morfolojik_analiz
+        if analiz and 'ekler' in analiz:
+            return analiz['ekler']
+        return []
+
+    def get_kaynak(self) -> str:
+        """Analiz kaynağını döndürür"""
+        analiz = self.morfolojik_analiz
+        if analiz and 'source' in analiz:
+            return analiz['source']
+        return 'bilinmiyor'
+
+
+class FrekansDeposu(Mapping):
+    """Sözcük ve belge frekanslarını sütun dizilerinde tutan depo"""
+
+    def __init__(self, gorunum_sinifi: type = FrekansGorunumu):
+        self.gorunum_sinifi = gorunum_sinifi
+
+        # Sözcük kimlikleri ve sözcük başına sütunlar
+        self._sozcuk_kimlikleri: Dict[str, int] = {}
+        self.sozcukler: List[str] = []
+        self.toplam_frekanslar = array('q')
+        self.belge_frekanslari = array('i')
+        self.analizler: List[Optional[dict]] = []
+        # Betiklerin sözcük başına bir baytlık işaretleri (ör. sorunlu)
+        self.isaretler = bytearray()
+
+        # Belgeler ve belge sırasıyla (CSR) sayımlar:
+        # belge b'nin kayıtları [belge_baslangiclari[b], belge_baslangiclari[b+1])
+        self._belge_kimlikleri: Dict[str, int] = {}
+        self.belge_yollari: List[str] = []
+        self.belge_baslangiclari = array('q', [0])
+        self.kayit_sozcukleri = array('i')
+        self.kayit_sayilari = array('q')
+
+        # Sözcük sırasıyla (CSR) sayımlar; ilk ihtiyaçta kurulur
+        self._sozcuk_baslangiclari = None
+        self._sozcuk_kayit_belgeleri = None
+        self._sozcuk_kayit_sayilari = None
+
+    def _sozcuk_kimligi(self, sozcuk: str) -> int:
+        """Sözcüğün kimliğini döndürür, yoksa yeni kimlik verir"""
+        kimlik = self._sozcuk_kimlikleri.get(sozcuk)
+        if kimlik is None:
+            kimlik = len(self.sozcukler)
+            self._sozcuk_kimlikleri[sozcuk] = kimlik
+            self.sozcukler.append(sozcuk)
+            self.toplam_frekanslar.append(0)
+            self.belge_frekanslari.append(0)
+            self.analizler.append(None)
+            self.isaretler.append(0)
+        return kimlik
+
+    def belge_ekle(self, dosya_yolu: str, frekanslar: MappingType[str, int]) -> int:
+        """Bir belgenin sözcük frekanslarını depoya ekler ve belge kimliğini döndürür
+
+        Her belge bir kez eklenir; frekanslar sözcük başına tek sayım içermelidir.
+        """
+        if dosya_yolu in self._belge_kimlikleri:
+            raise ValueError(f"Belge zaten eklenmiş: {dosya_yolu}")
+
+        kimlikler = array('i', [self._sozcuk_kimligi(sozcuk) for sozcuk in frekanslar])
+        sayilar = array('q', frekanslar.values())
+        self.kayit_sozcukleri.extend(kimlikler)
+        self.kayit_sayilari.extend(sayilar)
+
+        toplamlar = self.toplam_frekanslar
+        belge_frekanslari = self.belge_frekanslari
+        for kimlik, sayi in zip(kimlikler, sayilar):
+            toplamlar[kimlik] += sayi
+            belge_frekanslari[kimlik] += 1
+
+        belge_kimligi = len(self.belge_yollari)
+        self.belge_yollari.append(dosya_yolu)
+        self._belge_kimlikleri[dosya_yolu] = belge_kimligi
+        # Belge bu satırla tamamlanır; yarıda kesilen ekleme yarim_belgeyi_geri_al ile geri alınır
+        self.belge_baslangiclari.append(len(self.kayit_sozcukleri))
+
+        # Sözcük sıralı dizin artık eski
+        self._sozcuk_baslangiclari = None
+        return belge_kimligi
+
+    def yarim_belgeyi_geri_al(self):
+        """Kesintiyle (ör. Ctrl-C) yarıda kalan belge_ekle çağrısının izlerini siler"""
+        tamam = len(self.belge_baslangiclari) - 1
+        son = self.belge_baslangiclari[-1]
+        sozcuk_sayisi = min(len(self.sozcukler), len(self.toplam_frekanslar), len(self.belge_frekanslari),
+                            len(self.analizler), len(self.isaretler))
+
+        if (len(self.belge_yollari) == tamam and len(self.kayit_sozcukleri) == son
+                and len(self.kayit_sayilari) == son and len(self.sozcukler) == sozcuk_sayisi
+                and len(self._sozcuk_kimlikleri) == sozcuk_sayisi
+                and not (sozcuk_sayisi and self.belge_frekanslari[sozcuk_sayisi - 1] == 0)):
+            return
+
+        logger.warning("Yarıda kalan belge ekleme geri alınıyor")
+        del self.belge_yollari[tamam:]
+        del self.kayit_sozcukleri[son:]
+        del self.kayit_sayilari[son:]
+
+        # Sözcük toplamları kısmen güncellenmiş olabilir; tamamlanmış kayıtlardan yeniden hesaplanır
+        toplamlar = array('q', [0]) * sozcuk_sayisi
+        belge_frekanslari = array('i', [0]) * sozcuk_sayisi
+        for kimlik, sayi in zip(self.kayit_sozcukleri, self.kayit_sayilari):
+            toplamlar[kimlik] += sayi
+            belge_frekanslari[kimlik] += 1
+
+        # Yalnızca yarım belgede görülen sözcükler en sondadır
+        while sozcuk_sayisi and belge_frekanslari[sozcuk_sayisi - 1] == 0:
+            sozcuk_sayisi -= 1
+        self.toplam_frekanslar = toplamlar[:sozcuk_sayisi]
+        self.belge_frekanslari = belge_frekanslari[:sozcuk_sayisi]
+        del self.sozcukler[sozcuk_sayisi:]
+        del self.analizler[sozcuk_sayisi:]
+        del self.isaretler[sozcuk_sayisi:]
+
+        self._sozcuk_kimlikleri = {sozcuk: kimlik for kimlik, sozcuk in enumerate(self.sozcukler)}
+        self._belge_kimlikleri = {yol: kimlik for kimlik, yol in enumerate(self.belge_yollari)}
+        self._sozcuk_baslangiclari = None
+
+    def belge_frekanslari_getir(self, dosya_yolu: str) -> Dict[str, int]:
+        """Belgedeki sözcük frekanslarını eklenme sırasıyla döndürür"""
+        belge_kimligi = self._belge_kimlikleri[dosya_yolu]
+        bas = self.belge_baslangiclari[belge_kimligi]
+        son = self.belge_baslangiclari[belge_kimligi + 1]
+        sozcukler = self.sozcukler
+        return {sozcukler[kimlik]: sayi
+                for kimlik, sayi in zip(self.kayit_sozcukleri[bas:son], self.kayit_sayilari[bas:son])}
+
+    def _sozcuk_dizinini_kur(self):
+        """Belge sıralı kayıtlardan sözcük sıralı CSR dizinini kurar"""
+        sozcuk_sayisi = len(self.sozcukler)
+        kayit_sayisi = len(self.kayit_sozcukleri)
+
+        # Her sözcüğün kayıt aralığı belge frekanslarının önek toplamıdır
+        baslangiclar = array('q', [0]) * (sozcuk_sayisi + 1)
+        toplam = 0
+        for kimlik, belge_frekansi in enumerate(self.belge_frekanslari):
+            baslangiclar[kimlik] = toplam
+            toplam += belge_frekansi
+        baslangiclar[sozcuk_sayisi] = toplam
+
+        kayit_belgeleri = array('i', [0]) * kayit_sayisi
+        kayit_sayilari = array('q', [0]) * kayit_sayisi
+        yazma_konumlari = array('q', baslangiclar)
+
+        # Belgeler sırayla dolaşıldığı için her sözcüğün belgeleri artan sırada yazılır
+        for belge_kimligi in range(len(self.belge_yollari)):
+            for konum in range(self.belge_baslangiclari[belge_kimligi],
+                               self.belge_baslangiclari[belge_kimligi + 1]):
+                kimlik = self.kayit_sozcukleri[konum]
+                hedef = yazma_konumlari[kimlik]
+                kayit_belgeleri[hedef] = belge_kimligi
+                kayit_sayilari[hedef] = self.kayit_sayilari[konum]
+                yazma_konumlari[kimlik] = hedef + 1
+
+        self._sozcuk_baslangiclari = baslangiclar
+        self._sozcuk_kayit_belgeleri = kayit_belgeleri
+        self._sozcuk_kayit_sayilari = kayit_sayilari
+
+    def sozcuk_belgeleri(self, kimlik: int) -> Iterator[Tuple[str, int]]:
+        """Sözcüğün geçtiği belgeleri ve sayılarını belge eklenme sırasıyla üretir"""
+        if self._sozcuk_baslangiclari is None:
+            self._sozcuk_dizinini_kur()
+        bas = self._sozcuk_baslangiclari[kimlik]
+        son = self._sozcuk_baslangiclari[kimlik + 1]
+        for konum in range(bas, son):
+            yield self.belge_yollari[self._sozcuk_kayit_belgeleri[konum]], self._sozcuk_kayit_sayilari[konum]
+
+    def frekansa_gore_sirali(self) -> Iterator[Tuple[str, FrekansGorunumu]]:
+        """(sözcük, görünüm) çiftlerini toplam frekansa göre azalan sırada üretir
+
+        Eşit frekanslı sözcükler eklenme sırasını korur.
+        """
+        sirali = sorted(range(len(self.sozcukler)), key=self.toplam_frekanslar.__getitem__, reverse=True)
+        for kimlik in sirali:
+            yield self.sozcukler[kimlik], self.gorunum_sinifi(self, kimlik)
+
+    def gorunum(self, kimlik: int) -> FrekansGorunumu:
+        """Kimliği verilen sözcüğün görünümünü döndürür"""
+        return self.gorunum_sinifi(self, kimlik)
+
+    def __getitem__(self, sozcuk: str) -> FrekansGorunumu:
+        return self.gorunum_sinifi(self, self._sozcuk_kimlikleri[sozcuk])
+
+    def __contains__(self, sozcuk) -> bool:
+        return sozcuk in self._sozcuk_kimlikleri
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.sozcukler)
+
+    def __len__(self) -> int:
+        return len(self.sozcukler)
+
+    @property
+    def belge_sayisi(self) -> int:
+        return len(self.belge_yollari)
+
+    def __getstate__(self) -> dict:
+        # Sözcük sıralı dizin yeniden kurulabilir; pickle'a (kontrol noktası) yazılmaz.
+        # Görünüm sınıfı betiğin __main__ modülünde olabileceği için yükleyen
+        # tarafından yeniden atanır. Kesintiden sonra kaydeden taraf önce
+        # yarim_belgeyi_geri_al() çağırmalıdır; burada depo değiştirilmez.
+        durum = self.__dict__.copy()
+        durum['gorunum_sinifi'] = FrekansGorunumu
+        durum['_sozcuk_baslangiclari'] = None
+        durum['_sozcuk_kayit_belgeleri'] = None
+        durum['_sozcuk_kayit_sayilari'] = None
+        return durum
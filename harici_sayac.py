@@ -0,0 +1,538 @@
+"""
+Türkçe Morfolojik Analiz - Bellek Sınırlı (Diske Taşan) Frekans Sayacı
+
+Belleğe sığmayan derlemlerde FrekansDeposu yerine kullanılır. Sayımlar
+bellekte toplanır; tahmini boyut bellek sınırına ulaşınca sözcük sırasına
+dizilip geçici bir koşu (run) dosyasına yazılır ve bellek boşaltılır.
+Okuma bitince koşular dış birleştirmeyle (heapq.merge) sözcük başına tek
+kayda indirgenir:
+
+1. Sözcük sıralı birleşik akış partiler halinde analiz edilir; her benzersiz
+   sözcük bir kez ve bellekteki yoldakiyle aynı (alfabetik) sırada çözülür.
+2. Analizli kayıtlar yine sınırlı bellekle (toplam frekans azalan, ilk
+   görülme artan) sırasına dizilir; özet, CSV ve sorunlu çıktıları bu
+   akıştan yazılır.
+3. Belge başına çıktılar için belge sayımları eklenme sırasıyla ayrı bir
+   dosyada, analizler geçici bir SQLite tablosunda tutulur.
+
+Sözcüklerin belge kayıtları (belge kimliği, sayı) array('q') içinde tutulur.
+Çok sık sözcüklerin ("ve", "bir") birleştirmede biriken belge kayıtları
+_BELGE_TASMA_SINIRI'nı aşınca bir taşma dosyasına yazılır; kayıtta yalnızca
+dosyadaki parçaların konumları kalır.
+
+HariciSayac, betiklerin çıktı aşamasında kullandığı FrekansDeposu arayüzünü
+(frekansa_gore_sirali, belge_yollari, belge_frekanslari_getir, sayac[sozcuk])
+sağlar; sıralamalar ve çıktılar bellekteki depoyla aynıdır.
+"""
+
+import os
+import json
+import time
+import heapq
+import pickle
+import sqlite3
+import logging
+import tempfile
+import itertools
+import functools
+from array import array
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping as MappingType, Optional, Tuple
+
+from frekans_deposu import FrekansGorunumu
+from metrikler import Metrikler, olc, olcerek_uret
+
+logger = logging.getLogger("TurkceMorfAnaliz")
+
+# Bellek tahmini için boyutlar (bayt): yeni sözcük girdisi (sözlük yuvası, sözcük,
+# [toplam, sıra, belgeler] listesi ve boş dizi) ile array('q') içindeki belge kaydı
+# (iki 8 baytlık değer ve dizinin büyüme payı); sys.getsizeof örneklemesiyle ölçüldü
+_SOZCUK_GIRDISI_BAYT = 300
+_BELGE_KAYDI_BAYT = 20
+# Birleştirmede bir sözcük için bellekte tutulan en fazla belge değeri (kimlik ve
+# sayı ayrı sayılır); aşan kısım taşma dosyasına yazılır
+_BELGE_TASMA_SINIRI = 1 << 16
+# Analizli çıktı kaydı için sabit pay (analiz sözlüğü dahil)
+_CIKTI_KAYDI_BAYT = 900
+# Koşu dosyalarına kayıtlar bu büyüklükte gruplar halinde yazılır
+_YAZMA_GRUBU = 1000
+# Aynı anda açılacak en fazla koşu dosyası; fazlası önce gruplar halinde birleştirilir
+_EN_FAZLA_KOSU = 128
+# SQLite IN sorgusu başına en fazla parametre
+_SORGU_GRUBU = 900
+
+
+def _kosu_yaz(kayitlar: Iterable[tuple], klasor: str, onek: str) -> str:
+    """Sıralı kayıtları geçici bir koşu dosyasına pickle grupları halinde yazar"""
+    fd, yol = tempfile.mkstemp(prefix=onek, suffix='.kosu', dir=klasor)
+    kayitlar = iter(kayitlar)
+    with os.fdopen(fd, 'wb') as f:
+        while True:
+            grup = list(itertools.islice(kayitlar, _YAZMA_GRUBU))
+            if not grup:
+                break
+            pickle.dump(grup, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return yol
+
+
+def _kosu_oku(yol: str) -> Iterator[tuple]:
+    with open(yol, 'rb') as f:
+        while True:
+            try:
+                grup = pickle.load(f)
+            except EOFError:
+                return
+            yield from grup
+
+
+def _kosulari_birlestir(kosular: List[str], klasor: str, onek: str, anahtar: Optional[Callable] = None,
+                        indirge: Optional[Callable] = None) -> Iterator[tuple]:
+    """Sıralı koşuları tek bir sıralı akışta birleştirir
+
+    Eşit anahtarlı kayıtlar koşuların sırasıyla gelir. Koşu sayısı
+    _EN_FAZLA_KOSU'yu aşarsa ardışık koşular önce gruplar halinde birleştirilip
+    (kosular listesi yerinde güncellenerek) yeni koşulara yazılır. indirge
+    verilirse birleşik akışa (ara birleştirmelerde de) uygulanır.
+    """
+    while len(kosular) > _EN_FAZLA_KOSU:
+        yeni_kosular = []
+        for bas in range(0, len(kosular), _EN_FAZLA_KOSU):
+            grup = kosular[bas:bas + _EN_FAZLA_KOSU]
+            akis = heapq.merge(*map(_kosu_oku, grup), key=anahtar)
+            yeni_kosular.append(_kosu_yaz(indirge(akis) if indirge else akis, klasor, onek))
+            for yol in grup:
+                os.remove(yol)
+        logger.info(f"{len(kosular)} koşu ara birleştirmeyle {len(yeni_kosular)} koşuya indirildi")
+        kosular[:] = yeni_kosular
+
+    akis = heapq.merge(*map(_kosu_oku, kosular), key=anahtar)
+    return indirge(akis) if indirge else akis
+
+
+class _TasanBelgeler:
+    """Taşma dosyasına yazılmış belge kayıtları
+
+    parcalar dosyadaki (konum, değer sayısı) çiftleridir ve belge sırasıyla
+    okunur. Kayıtlarla birlikte koşu dosyalarına pickle edilir.
+    """
+
+    __slots__ = ('yol', 'parcalar', 'uzunluk')
+
+    def __init__(self, yol: str, parcalar: List[Tuple[int, int]]):
+        self.yol = yol
+        self.parcalar = parcalar
+        self.uzunluk = sum(sayi for _, sayi in parcalar)
+
+    def __len__(self) -> int:
+        return self.uzunluk
+
+    def oku(self) -> Iterator[array]:
+        """Belge değerlerini en fazla _BELGE_TASMA_SINIRI'lık (çift uzunluklu) dizilerle üretir"""
+        with open(self.yol, 'rb') as f:
+            for konum, sayi in self.parcalar:
+                f.seek(konum)
+                while sayi > 0:
+                    parca = array('q')
+                    parca.fromfile(f, min(sayi, _BELGE_TASMA_SINIRI))
+                    sayi -= len(parca)
+                    yield parca
+
+
+class _BelgeTasmasi:
+    """Sık sözcüklerin belge kayıtlarının yazıldığı, yalnızca sona eklenen dosya"""
+
+    def __init__(self, yol: str):
+        self.yol = yol
+        self._dosya = open(yol, 'ab')
+
+    def yaz(self, belgeler: array) -> Tuple[int, int]:
+        konum = self._dosya.tell()
+        belgeler.tofile(self._dosya)
+        self._dosya.flush()
+        return konum, len(belgeler)
+
+    def kapat(self):
+        self._dosya.close()
+
+
+def _sayimlari_indirge(akis: Iterator[tuple], tasma: _BelgeTasmasi) -> Iterator[tuple]:
+    """Aynı sözcüğün koşulardaki (sozcuk, toplam, belge_frekansi, ilk, belgeler) kayıtlarını toplar
+
+    Koşular belge sırasıyla yazıldığı için ilk kayıt en erken görülmeyi taşır
+    ve belge listeleri art arda eklenince belge sırası korunur. Biriken belge
+    değerleri _BELGE_TASMA_SINIRI'nı aşınca taşma dosyasına yazılır; daha
+    önce taşmış kayıtların parçaları kopyalanmadan devralınır.
+    """
+    for sozcuk, grup in itertools.groupby(akis, key=itemgetter(0)):
+        toplam = belge_frekansi = 0
+        ilk = None
+        parcalar: List[Tuple[int, int]] = []
+        belgeler = array('q')
+        for _, grup_toplami, grup_belge_frekansi, grup_ilk, grup_belgeleri in grup:
+            toplam += grup_toplami
+            belge_frekansi += grup_belge_frekansi
+            if ilk is None:
+                ilk = grup_ilk
+            if isinstance(grup_belgeleri, _TasanBelgeler):
+                if belgeler:
+                    parcalar.append(tasma.yaz(belgeler))
+                    belgeler = array('q')
+                parcalar.extend(grup_belgeleri.parcalar)
+            else:
+                belgeler.extend(grup_belgeleri)
+                if len(belgeler) >= _BELGE_TASMA_SINIRI:
+                    parcalar.append(tasma.yaz(belgeler))
+                    belgeler = array('q')
+        if parcalar:
+            if belgeler:
+                parcalar.append(tasma.yaz(belgeler))
+            belgeler = _TasanBelgeler(tasma.yol, parcalar)
+        yield sozcuk, toplam, belge_frekansi, ilk, belgeler
+
+
+class _SozcukKaydi:
+    """Tek sözcüklük depo: görünüm sınıfları bunun üzerinde (kimlik 0 ile) çalışır
+
+    belgeler düz [belge_kimligi, sayi, belge_kimligi, sayi, ...] dizisi ya da
+    taşma dosyasındaki karşılığıdır (_TasanBelgeler).
+    """
+
+    __slots__ = ('sozcukler', 'toplam_frekanslar', 'belge_frekanslari', 'analizler', 'isaretler',
+                 '_belgeler', '_belge_yollari')
+
+    def __init__(self, sozcuk: str, toplam: int, belge_frekansi: int, analiz: Optional[dict],
+                 isaret: int, belgeler, belge_yollari: List[str]):
+        self.sozcukler = (sozcuk,)
+        self.toplam_frekanslar = (toplam,)
+        self.belge_frekanslari = (belge_frekansi,)
+        self.analizler = [analiz]
+        self.isaretler = bytearray((isaret,))
+        self._belgeler = belgeler
+        self._belge_yollari = belge_yollari
+
+    def sozcuk_belgeleri(self, kimlik: int) -> Iterator[Tuple[str, int]]:
+        belgeler = self._belgeler
+        parcalar = belgeler.oku() if isinstance(belgeler, _TasanBelgeler) else (belgeler,)
+        for parca in parcalar:
+            for konum in range(0, len(parca), 2):
+                yield self._belge_yollari[parca[konum]], parca[konum + 1]
+
+
+class HariciSayac:
+    """Sayımları bellek sınırını aşınca sıralı koşular halinde diske döken frekans sayacı
+
+    Kullanım sırası: belge_ekle (tüm belgeler) -> birlestir -> sozcuk_partileri
+    ile analiz (analizleri_ekle) -> çıktı. Geçici dosyalar kapat() ile ya da en
+    geç program sonunda silinir; gecici_klasor verilmezse TMPDIR kullanılır.
+    """
+
+    def __init__(self, gorunum_sinifi: type = FrekansGorunumu, bellek_siniri_mb: float = 512,
+                 gecici_klasor: Optional[str] = None):
+        self.gorunum_sinifi = gorunum_sinifi
+        self.bellek_siniri = int(bellek_siniri_mb * 1024 * 1024)
+        self._gecici = tempfile.TemporaryDirectory(prefix='frekans_', dir=gecici_klasor)
+        self.klasor = self._gecici.name
+
+        # Belgeler ve eklenme sırasıyla belge sayımları (belge başına çıktılar için)
+        self._belge_kimlikleri: Dict[str, int] = {}
+        self.belge_yollari: List[str] = []
+        self._belge_konumlari = array('q')
+        self._belge_dosyasi = open(os.path.join(self.klasor, 'belgeler.pkl'), 'w+b')
+        self._tasma = _BelgeTasmasi(os.path.join(self.klasor, 'belge_tasmasi.bin'))
+
+        # Bellekteki koşu: {sozcuk: [toplam, ilk, belgeler dizisi]}
+        self._sayimlar: Dict[str, list] = {}
+        self._tahmini_boyut = 0
+        self._sira = 0
+        self._kosular: List[str] = []
+
+        self._birlesik_yol: Optional[str] = None
+        self._sozcuk_sayisi = 0
+
+        # Analiz aşaması
+        self._bekleyenler: Dict[str, tuple] = {}
+        self._cikti_tamponu: List[tuple] = []
+        self._cikti_boyutu = 0
+        self._cikti_kosulari: List[str] = []
+        self._baglanti: Optional[sqlite3.Connection] = None
+        self._onbellek: Dict[str, FrekansGorunumu] = {}
+
+    def belge_ekle(self, dosya_yolu: str, frekanslar: MappingType[str, int]) -> int:
+        """Bir belgenin sözcük frekanslarını ekler ve belge kimliğini döndürür"""
+        if dosya_yolu in self._belge_kimlikleri:
+            raise ValueError(f"Belge zaten eklenmiş: {dosya_yolu}")
+        if self._birlesik_yol is not None:
+            raise RuntimeError("Birleştirilmiş sayaca belge eklenemez")
+
+        belge_kimligi = len(self.belge_yollari)
+        sayimlar = self._sayimlar
+        yeni_sozcukler = 0
+        for sozcuk, sayi in frekanslar.items():
+            girdi = sayimlar.get(sozcuk)
+            if girdi is None:
+                sayimlar[sozcuk] = [sayi, self._sira, array('q', (belge_kimligi, sayi))]
+                self._sira += 1
+                yeni_sozcukler += 1
+            else:
+                girdi[0] += sayi
+                girdi[2].extend((belge_kimligi, sayi))
+
+        self._belge_konumlari.append(self._belge_dosyasi.tell())
+        pickle.dump((list(frekanslar), array('q', frekanslar.values())), self._belge_dosyasi,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+        self.belge_yollari.append(dosya_yolu)
+        self._belge_kimlikleri[dosya_yolu] = belge_kimligi
+
+        self._tahmini_boyut += yeni_sozcukler * _SOZCUK_GIRDISI_BAYT + len(frekanslar) * _BELGE_KAYDI_BAYT
+        if self._tahmini_boyut >= self.bellek_siniri:
+            self._kosu_yaz()
+        return belge_kimligi
+
+    def _kosu_yaz(self):
+        """Bellekteki sayımları sözcük sırasıyla bir koşu dosyasına yazıp belleği boşaltır"""
+        if not self._sayimlar:
+            return
+        kayitlar = ((sozcuk, girdi[0], len(girdi[2]) // 2, girdi[1], girdi[2])
+                    for sozcuk, girdi in sorted(self._sayimlar.items()))
+        self._kosular.append(_kosu_yaz(kayitlar, self.klasor, 'sayim_'))
+        logger.info(f"Sayım koşusu diske yazıldı: {len(self._sayimlar)} sözcük "
+                    f"(tahmini {self._tahmini_boyut / (1024 * 1024):.1f} MB)")
+        self._sayimlar = {}
+        self._tahmini_boyut = 0
+
+    @property
+    def kosu_sayisi(self) -> int:
+        """Diske yazılan sayım koşusu sayısı"""
+        return len(self._kosular)
+
+    def birlestir(self) -> int:
+        """Sayım koşularını sözcük başına tek kayıt içeren sıralı bir dosyada birleştirir
+
+        Birleştirilen koşu sayısını döndürür.
+        """
+        self._kosu_yaz()
+        self._belge_dosyasi.flush()
+
+        self._sozcuk_sayisi = 0
+
+        def say(akis):
+            for kayit in akis:
+                self._sozcuk_sayisi += 1
+                yield kayit
+
+        kosu_sayisi = len(self._kosular)
+        kosular = list(self._kosular)
+        indirge = functools.partial(_sayimlari_indirge, tasma=self._tasma)
+        akis = _kosulari_birlestir(kosular, self.klasor, 'sayim_', itemgetter(0), indirge)
+        self._birlesik_yol = _kosu_yaz(say(akis), self.klasor, 'birlesik_')
+        for yol in kosular:
+            os.remove(yol)
+        self._kosular = []
+        return kosu_sayisi
+
+    def sozcuk_partileri(self, parti_boyutu: int) -> Iterator[List[str]]:
+        """Birleşik sayımlardaki sözcükleri alfabetik sırayla partiler halinde üretir
+
+        Her parti için bulunan analizler analizleri_ekle ile verilir; analizi
+        verilmeyen sözcükler analizsiz kaydedilir.
+        """
+        self._baglanti = sqlite3.connect(os.path.join(self.klasor, 'analizler.db'))
+        self._baglanti.execute("PRAGMA journal_mode = OFF")
+        self._baglanti.execute("PRAGMA synchronous = OFF")
+        self._baglanti.execute('''
+        CREATE TABLE analizler (
+            sozcuk TEXT PRIMARY KEY,
+            toplam_frekans INTEGER,
+            belge_frekansi INTEGER,
+            analiz TEXT,
+            isaret INTEGER
+        )
+        ''')
+
+        kayitlar = _kosu_oku(self._birlesik_yol)
+        while True:
+            parti = list(itertools.islice(kayitlar, parti_boyutu))
+            if not parti:
+                break
+            self._bekleyenler = {kayit[0]: kayit for kayit in parti}
+            yield [kayit[0] for kayit in parti]
+            self._analizsizleri_ekle()
+
+        self._baglanti.commit()
+        self._cikti_bosalt()
+
+    def analizleri_ekle(self, analizler: Dict[str, dict]):
+        """Geçerli partideki sözcüklerin analizlerini ekler"""
+        satirlar = []
+        for sozcuk, analiz in analizler.items():
+            kayit = self._bekleyenler.pop(sozcuk, None)
+            if kayit is not None:
+                satirlar.append(self._cikti_kaydi_ekle(kayit, analiz))
+        self._baglanti.executemany("INSERT INTO analizler VALUES (?, ?, ?, ?, ?)", satirlar)
+
+    def _analizsizleri_ekle(self):
+        satirlar = [self._cikti_kaydi_ekle(kayit, None) for kayit in self._bekleyenler.values()]
+        self._bekleyenler = {}
+        self._baglanti.executemany("INSERT INTO analizler VALUES (?, ?, ?, ?, ?)", satirlar)
+
+    def _cikti_kaydi_ekle(self, kayit: tuple, analiz: Optional[dict]) -> tuple:
+        """Kaydı frekans sıralı çıktı koşularına ekler, SQLite satırını döndürür"""
+        sozcuk, toplam, belge_frekansi, ilk, belgeler = kayit
+        depo = _SozcukKaydi(sozcuk, toplam, belge_frekansi, None, 0, belgeler, self.belge_yollari)
+        if analiz is not None:
+            # Görünüm sınıfı işaretleri (ör. sorunlu) analizle birlikte belirler
+            self.gorunum_sinifi(depo, 0).analiz_ekle(analiz)
+        isaret = depo.isaretler[0]
+
+        self._cikti_tamponu.append((-toplam, ilk, sozcuk, belge_frekansi, belgeler, depo.analizler[0], isaret))
+        if not isinstance(belgeler, _TasanBelgeler):
+            self._cikti_boyutu += _CIKTI_KAYDI_BAYT + 8 * len(belgeler)
+        else:
+            self._cikti_boyutu += _CIKTI_KAYDI_BAYT + 16 * len(belgeler.parcalar)
+        if self._cikti_boyutu >= self.bellek_siniri:
+            self._cikti_bosalt()
+        return sozcuk, toplam, belge_frekansi, json.dumps(depo.analizler[0], ensure_ascii=False), isaret
+
+    def _cikti_bosalt(self):
+        if self._cikti_tamponu:
+            self._cikti_tamponu.sort(key=itemgetter(0, 1))
+            self._cikti_kosulari.append(_kosu_yaz(self._cikti_tamponu, self.klasor, 'cikti_'))
+            self._cikti_tamponu = []
+            self._cikti_boyutu = 0
+
+    def frekansa_gore_sirali(self) -> Iterator[Tuple[str, FrekansGorunumu]]:
+        """(sözcük, görünüm) çiftlerini toplam frekansa göre azalan sırada üretir
+
+        Eşit frekanslı sözcükler ilk görülme sırasını korur. Akış her çağrıda
+        koşulardan yeniden okunur.
+        """
+        akis = _kosulari_birlestir(self._cikti_kosulari, self.klasor, 'cikti_', itemgetter(0, 1))
+        for eksi_toplam, _, sozcuk, belge_frekansi, belgeler, analiz, isaret in akis:
+            depo = _SozcukKaydi(sozcuk, -eksi_toplam, belge_frekansi, analiz, isaret, belgeler, self.belge_yollari)
+            yield sozcuk, self.gorunum_sinifi(depo, 0)
+
+    def belge_frekanslari_getir(self, dosya_yolu: str) -> Dict[str, int]:
+        """Belgedeki sözcük frekanslarını eklenme sırasıyla döndürür
+
+        Belgenin sözcüklerinin analizleri de toplu olarak okunur; ardından
+        gelen sayac[sozcuk] erişimleri veritabanına gitmez.
+        """
+        self._belge_dosyasi.seek(self._belge_konumlari[self._belge_kimlikleri[dosya_yolu]])
+        sozcukler, sayilar = pickle.load(self._belge_dosyasi)
+
+        self._onbellek = {}
+        for bas in range(0, len(sozcukler), _SORGU_GRUBU):
+            grup = sozcukler[bas:bas + _SORGU_GRUBU]
+            sorgu = f"SELECT * FROM analizler WHERE sozcuk IN ({','.join('?' * len(grup))})"
+            for satir in self._baglanti.execute(sorgu, grup):
+                self._onbellek[satir[0]] = self._satir_gorunumu(satir)
+        return dict(zip(sozcukler, sayilar))
+
+    def _satir_gorunumu(self, satir: tuple) -> FrekansGorunumu:
+        # Veritabanındaki görünümlerin belge listesi yoktur (belge başına çıktılarda gerekmez)
+        sozcuk, toplam, belge_frekansi, analiz, isaret = satir
+        return self.gorunum_sinifi(_SozcukKaydi(sozcuk, toplam, belge_frekansi, json.loads(analiz),
+                                                isaret, [], self.belge_yollari), 0)
+
+    def __getitem__(self, sozcuk: str) -> FrekansGorunumu:
+        gorunum = self._onbellek.get(sozcuk)
+        if gorunum is None:
+            satir = self._baglanti.execute("SELECT * FROM analizler WHERE sozcuk = ?", (sozcuk,)).fetchone()
+            if satir is None:
+                raise KeyError(sozcuk)
+            gorunum = self._satir_gorunumu(satir)
+        return gorunum
+
+    def __len__(self) -> int:
+        """Benzersiz sözcük sayısı (birlestir çağrıldıktan sonra)"""
+        return self._sozcuk_sayisi
+
+    @property
+    def belge_sayisi(self) -> int:
+        return len(self.belge_yollari)
+
+    def kapat(self):
+        """Açık dosyaları kapatır ve geçici dosyaları siler"""
+        if self._baglanti is not None:
+            self._baglanti.close()
+            self._baglanti = None
+        self._belge_dosyasi.close()
+        self._tasma.kapat()
+        self._gecici.cleanup()
+
+
+def harici_analiz_et(frekans_verileri: HariciSayac, veritabani_yolu: str, zemberek_aktif: bool = False,
+                     parti_boyutu: int = 1000, isci_sayisi: int = 1, manifesto=None,
+                     metrikler: Optional[Metrikler] = None) -> None:
+    """Birleştirilmiş sayaçtaki sözcükleri sınırlı bellekle analiz eder
+
+    Sözcükler bellekteki analizle aynı alfabetik sırada ve aynı parti
+    boyutuyla çözümlenir; bellekte bir seferde yalnızca birkaç partilik
+    sözcük bulunur. manifesto verilirse kayıtlı analizler oradan alınır.
+    metrikler verilirse analiz ve kayıt aşamaları ile analizcinin
+    istatistikleri bellekteki analizdeki gibi kaydedilir.
+    """
+    from turkce_morfologik_analiz import TurkceMorfologikAnaliz
+    from paralel_analiz import partiler_halinde_coz
+
+    islenecek_toplam = len(frekans_verileri)
+    print(f"Toplam {islenecek_toplam} benzersiz sözcük analiz edilecek.")
+
+    # Analizci oluştur
+    analizci = TurkceMorfologikAnaliz(
+        veritabani_path=veritabani_yolu,
+        zemberek_jar_path="zemberek-full.jar" if zemberek_aktif else "non-existent.jar",
+        interaktif=False,
+        zemberek_oncelikli=zemberek_aktif,
+        metrikler=metrikler
+    )
+
+    # İşçi havuzu her grup için yeniden kurulduğu için gruplar parti boyutunun katıdır
+    grup_boyutu = parti_boyutu * max(isci_sayisi, 1) * 10
+
+    baslangic = time.time()
+    islenen = 0
+    kayitli = 0
+    try:
+        gruplar = frekans_verileri.sozcuk_partileri(grup_boyutu)
+        for sozcukler in olcerek_uret(metrikler, 'analiz', gruplar):
+            if manifesto is not None:
+                kayitli_analizler = manifesto.analizleri_getir(sozcukler)
+                frekans_verileri.analizleri_ekle(kayitli_analizler)
+                sozcukler = [sozcuk for sozcuk in sozcukler if sozcuk not in kayitli_analizler]
+                kayitli += len(kayitli_analizler)
+                islenen += len(kayitli_analizler)
+                if not sozcukler:
+                    continue
+
+            partiler = partiler_halinde_coz(analizci, sozcukler, parti_boyutu, isci_sayisi)
+            for parti_sonuclari in olcerek_uret(metrikler, 'analiz', partiler, len):
+                frekans_verileri.analizleri_ekle(parti_sonuclari)
+                if manifesto is not None:
+                    with olc(metrikler, 'kayit', len(parti_sonuclari)):
+                        manifesto.analizleri_kaydet(parti_sonuclari)
+                islenen += len(parti_sonuclari)
+                if metrikler is not None:
+                    metrikler.bolum_ekle('analizci', analizci.istatistikler())
+                    metrikler.gerekirse_yaz()
+
+                # İlerleme göster
+                gecen_sure = time.time() - baslangic
+                hiz = islenen / gecen_sure if gecen_sure > 0 else 0
+                kalan_sure = (islenecek_toplam - islenen) / hiz if hiz > 0 else 0
+                print(f"\rİlerleme: {islenen}/{islenecek_toplam} sözcük ({islenen/islenecek_toplam*100:.1f}%) | "
+                      f"Hız: {hiz:.1f} sözcük/sn | Kalan: {kalan_sure:.1f} sn", end="")
+
+        print()  # Yeni satır
+    finally:
+        if metrikler is not None:
+            metrikler.bolum_ekle('analizci', analizci.istatistikler())
+        with olc(metrikler, 'kayit'):
+            analizci.kapat()
+
+    if manifesto is not None:
+        print(f"{kayitli} sözcüğün analizi manifestodan alındı.")
+
+    toplam_sure = time.time() - baslangic
+    print(f"\nAnaliz tamamlandı. {islenecek_toplam} sözcük {toplam_sure:.2f} saniyede işlendi.")
+    print(f"Ortalama hız: {islenecek_toplam / toplam_sure:.2f} sözcük/saniye")
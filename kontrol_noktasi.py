@@ -0,0 +1,89 @@
+"""
+Türkçe Morfolojik Analiz - Uzun Toplu Analizler İçin Kontrol Noktaları
+
+Çalışma durumu (okunan dosyalar, biriken sayımlar, analiz edilmiş sözcükler)
+belirli aralıklarla pickle ile diske yazılır. Yazma önce geçici dosyaya yapılır
+ve os.replace ile yerine konur; kesinti anında bile diskte her zaman tam bir
+kontrol noktası kalır.
+"""
+
+import os
+import time
+import pickle
+import logging
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("TurkceMorfAnaliz")
+
+# Kontrol noktası biçimi değişirse artırılır
+KONTROL_NOKTASI_SURUMU = 1
+
+
+class KontrolNoktasi:
+    """Çalışma durumunu belirli aralıklarla atomik olarak kaydeden yardımcı
+
+    durum sözlüğü çağıran tarafından güncellenir; gerekirse_kaydet() son
+    kayıttan bu yana aralik saniye geçtiyse, kaydet() her zaman yazar.
+    aralik 0 ise kontrol noktası tutulmaz.
+    """
+
+    def __init__(self, dosya_yolu: str, aralik: float = 300.0):
+        self.dosya_yolu = dosya_yolu
+        self.aralik = aralik
+        self.durum: Dict[str, Any] = {}
+        self.kayit_sayisi = 0
+        self._son_kayit = time.monotonic()
+
+    @property
+    def etkin(self) -> bool:
+        return self.aralik > 0
+
+    def yukle(self) -> Optional[Dict[str, Any]]:
+        """Diskteki kontrol noktasını yükler; yoksa ya da okunamıyorsa None döndürür"""
+        if not os.path.exists(self.dosya_yolu):
+            return None
+        try:
+            with open(self.dosya_yolu, 'rb') as f:
+                durum = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            logger.error(f"Kontrol noktası okunamadı: {self.dosya_yolu} - {e}")
+            return None
+
+        if durum.get('surum') != KONTROL_NOKTASI_SURUMU:
+            logger.error(f"Kontrol noktası sürümü uyumsuz: {self.dosya_yolu}")
+            return None
+
+        self.durum = durum
+        return durum
+
+    def kaydet(self):
+        """Durumu geçici dosyaya yazıp atomik olarak kontrol noktasının yerine koyar"""
+        if not self.etkin:
+            return
+
+        self.durum['surum'] = KONTROL_NOKTASI_SURUMU
+        gecici_yol = f"{self.dosya_yolu}.gecici"
+        baslangic = time.perf_counter()
+        with open(gecici_yol, 'wb') as f:
+            pickle.dump(self.durum, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(gecici_yol, self.dosya_yolu)
+
+        self.kayit_sayisi += 1
+        self._son_kayit = time.monotonic()
+        logger.info(f"Kontrol noktası kaydedildi: {self.dosya_yolu} "
+                    f"({time.perf_counter() - baslangic:.2f} sn)")
+
+    def gerekirse_kaydet(self) -> bool:
+        """Son kayıttan bu yana aralık dolduysa durumu kaydeder"""
+        if self.etkin and time.monotonic() - self._son_kayit >= self.aralik:
+            self.kaydet()
+            return True
+        return False
+
+    def sil(self):
+        """Başarıyla biten çalışmanın kontrol noktasını siler"""
+        for yol in (self.dosya_yolu, f"{self.dosya_yolu}.gecici"):
+            if os.path.exists(yol):
+                os.remove(yol)
@@ -0,0 +1,346 @@
+"""
+Türkçe Morfolojik Analiz - Aşama Metrikleri
+
+Toplu çalışmalarda zamanın nereye gittiğini profilleyici bağlamadan görmek
+için aşama başına duvar saati ve işlemci süresi, çağrı ve iş birimi sayıları
+ile hızlar toplanır. Aşamalar:
+
+- okuma: dosyadan bayt okuma (birim: bayt)
+- cozme: baytların metne çözülmesi (birim: bayt)
+- ayirma: metnin sözcüklere ayrılıp sayılması (birim: sözcük)
+- sayim: dosya sayımlarının frekans deposuna eklenmesi (birim: belge)
+- analiz: sözcüklerin kök ve eklerine ayrılması (birim: sözcük)
+- kayit: veritabanı, manifesto ve kontrol noktası yazmaları (birim: yazma)
+- cikti: özet, CSV ve dosya başına çıktıların yazılması (birim: dosya)
+
+İç içe aşamalarda süre en içteki aşamaya yazılır: ayirma içinde yapılan
+okuma ayirma süresinden düşülür. Süreler iş parçacıkları üzerinden toplanır;
+eşzamanlı okuyucularla aşama süreleri toplam çalışma süresini aşabilir.
+İşlemci süresi yalnızca ölçen iş parçacığınındır (time.thread_time; Python
+3.6'da sürecin işlemci süresi); işçi süreçlerde geçen süre ana süreçte
+bekleme olarak görünür.
+
+GecikmeHistogrami, tek tek işlemlerin (ör. parcala'nın her çözümleme yolunun)
+gecikme dağılımını HDR histogramlarındaki gibi logaritmik-doğrusal kovalarda,
+değerin %3'ü içinde bir duyarlıkla ve sabit bellekle tutar.
+
+Metrikler JSON dosyasına ve isteğe bağlı olarak Prometheus node_exporter
+textfile biçiminde yazılır. Yazma önce geçici dosyaya yapılır ve os.replace
+ile yerine konur.
+"""
+
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Önceden tanımlı aşamalar (çıktılarda bu sırayla yer alır)
+ASAMALAR = ('okuma', 'cozme', 'ayirma', 'sayim', 'analiz', 'kayit', 'cikti')
+
+# Prometheus metrik adlarının öneki
+PROMETHEUS_ONEKI = 'turkce_morfoloji'
+
+# olcerek_uret'te üretecin bittiğini gösterir
+_BITTI = object()
+
+# İş parçacığının işlemci saati; time.thread_time Python 3.7'de geldi, daha
+# eski sürümlerde sürecin işlemci saati kullanılır
+_islemci_saati = getattr(time, 'thread_time', time.process_time)
+
+
+class Metrikler:
+    """Aşama sürelerini ve sayaçları toplayıp belirli aralıklarla yazan yardımcı
+
+    asama(ad) bağlam yöneticisi bloğun süresini ölçer. sayac_ekle() adlandırılmış
+    sayaçları artırır. gerekirse_yaz() son yazmadan bu yana aralik saniye
+    geçtiyse, yaz() her zaman yazar. Tüm yöntemler iş parçacıkları arasında
+    güvenlidir.
+    """
+
+    def __init__(self, json_yolu: Optional[str] = None, prometheus_yolu: Optional[str] = None,
+                 aralik: float = 60.0):
+        self.json_yolu = json_yolu
+        self.prometheus_yolu = prometheus_yolu
+        self.aralik = aralik
+        self.yazma_sayisi = 0
+        # {aşama: [duvar_sn, islemci_sn, cagri, adet]}
+        self._asamalar: Dict[str, list] = {ad: [0.0, 0.0, 0, 0] for ad in ASAMALAR}
+        self._sayaclar: Dict[str, int] = {}
+        self._bolumler: Dict[str, Dict] = {}
+        self._kilit = threading.Lock()
+        self._yerel = threading.local()
+        self._baslangic = time.perf_counter()
+        self._baslangic_islemci = time.process_time()
+        self._son_yazma = time.monotonic()
+
+    def _ekle(self, ad: str, duvar: float, islemci: float, cagri: int = 0, adet: int = 0):
+        with self._kilit:
+            kayit = self._asamalar.get(ad)
+            if kayit is None:
+                kayit = self._asamalar[ad] = [0.0, 0.0, 0, 0]
+            kayit[0] += duvar
+            kayit[1] += islemci
+            kayit[2] += cagri
+            kayit[3] += adet
+
+    @contextmanager
+    def asama(self, ad: str, adet: int = 0):
+        """Bloğun duvar saati ve işlemci süresini ad aşamasına ekler
+
+        Blok içinde açılan aşamaların süresi bu aşamadan düşülür. Birim sayısı
+        blok sonunda biliniyorsa adet_ekle() ile eklenebilir.
+        """
+        yigin = getattr(self._yerel, 'yigin', None)
+        if yigin is None:
+            yigin = self._yerel.yigin = []
+
+        simdi, islemci = time.perf_counter(), _islemci_saati()
+        if yigin:
+            # Üstteki aşamanın buraya kadarki süresi ona yazılır, ölçümü duraklar
+            ust = yigin[-1]
+            self._ekle(ust[0], simdi - ust[1], islemci - ust[2])
+        yigin.append([ad, simdi, islemci])
+        try:
+            yield self
+        finally:
+            simdi, islemci = time.perf_counter(), _islemci_saati()
+            _, bas, bas_islemci = yigin.pop()
+            self._ekle(ad, simdi - bas, islemci - bas_islemci, 1, adet)
+            if yigin:
+                yigin[-1][1], yigin[-1][2] = simdi, islemci
+
+    def sure_ekle(self, ad: str, duvar: float, islemci: float = 0.0, adet: int = 0):
+        """Başka yerde ölçülmüş bir süreyi aşamaya ekler"""
+        self._ekle(ad, duvar, islemci, 1, adet)
+
+    def adet_ekle(self, ad: str, adet: int):
+        """Aşamanın işlediği birim sayısını artırır"""
+        self._ekle(ad, 0.0, 0.0, 0, adet)
+
+    def sayac_ekle(self, ad: str, deger: int = 1):
+        """Adlandırılmış bir sayacı artırır"""
+        with self._kilit:
+            self._sayaclar[ad] = self._sayaclar.get(ad, 0) + deger
+
+    def bolum_ekle(self, ad: str, veri: Dict):
+        """Özete ad anahtarıyla ek bir bölüm koyar (ör. analizcinin istatistikleri)"""
+        with self._kilit:
+            self._bolumler[ad] = veri
+
+    def ozet(self) -> Dict:
+        """Metriklerin o anki durumunu sözlük olarak döndürür"""
+        with self._kilit:
+            asamalar = {ad: list(kayit) for ad, kayit in self._asamalar.items()}
+            sayaclar = dict(self._sayaclar)
+            bolumler = dict(self._bolumler)
+
+        return {
+            'zaman': time.time(),
+            'gecen_sure': time.perf_counter() - self._baslangic,
+            'islemci_suresi': time.process_time() - self._baslangic_islemci,
+            'asamalar': {
+                ad: {
+                    'duvar_sn': duvar,
+                    'islemci_sn': islemci,
+                    'cagri': cagri,
+                    'adet': adet,
+                    'hiz': adet / duvar if duvar > 0 else 0.0
+                }
+                for ad, (duvar, islemci, cagri, adet) in asamalar.items()
+            },
+            'sayaclar': sayaclar,
+            **bolumler
+        }
+
+    @staticmethod
+    def prometheus_metni(ozet: Dict) -> str:
+        """Özeti Prometheus metin biçimine çevirir"""
+        satirlar = []
+
+        def metrik(ad: str, tur: str, aciklama: str, degerler):
+            satirlar.append(f"# HELP {PROMETHEUS_ONEKI}_{ad} {aciklama}")
+            satirlar.append(f"# TYPE {PROMETHEUS_ONEKI}_{ad} {tur}")
+            for etiketler, deger in degerler:
+                satirlar.append(f"{PROMETHEUS_ONEKI}_{ad}{etiketler} {deger}")
+
+        asamalar = ozet['asamalar'].items()
+        metrik('asama_duvar_saniye_toplam', 'counter', 'Aşamada geçen duvar saati süresi',
+               [(f'{{asama="{ad}"}}', a['duvar_sn']) for ad, a in asamalar])
+        metrik('asama_islemci_saniye_toplam', 'counter', 'Aşamada harcanan işlemci süresi',
+               [(f'{{asama="{ad}"}}', a['islemci_sn']) for ad, a in asamalar])
+        metrik('asama_cagri_toplam', 'counter', 'Aşama ölçüm sayısı',
+               [(f'{{asama="{ad}"}}', a['cagri']) for ad, a in asamalar])
+        metrik('asama_birim_toplam', 'counter', 'Aşamada işlenen birim sayısı',
+               [(f'{{asama="{ad}"}}', a['adet']) for ad, a in asamalar])
+        metrik('sayac_toplam', 'counter', 'Çalışma sayaçları',
+               [(f'{{ad="{ad}"}}', deger) for ad, deger in sorted(ozet['sayaclar'].items())])
+        yollar = ozet.get('analizci', {}).get('yollar', {})
+        if yollar:
+            degerler = []
+            for yol, ist in yollar.items():
+                for quantile, yuzdelik in (('0.5', 'p50_us'), ('0.9', 'p90_us'), ('0.99', 'p99_us')):
+                    degerler.append((f'{{yol="{yol}",quantile="{quantile}"}}', ist[yuzdelik] / 1e6))
+                degerler.append((f'_sum{{yol="{yol}"}}', ist['toplam_ms'] / 1e3))
+                degerler.append((f'_count{{yol="{yol}"}}', ist['sayi']))
+            metrik('parcala_gecikme_saniye', 'summary', 'parcala çözümleme yollarının gecikmesi', degerler)
+        metrik('gecen_saniye', 'gauge', 'Çalışmanın başından beri geçen süre',
+               [('', ozet['gecen_sure'])])
+        metrik('son_yazma_zamani', 'gauge', 'Metriklerin yazıldığı an (Unix zamanı)',
+               [('', ozet['zaman'])])
+        return "\n".join(satirlar) + "\n"
+
+    @staticmethod
+    def _atomik_yaz(dosya_yolu: str, icerik: str):
+        gecici_yol = f"{dosya_yolu}.gecici"
+        with open(gecici_yol, 'w', encoding='utf-8') as f:
+            f.write(icerik)
+        os.replace(gecici_yol, dosya_yolu)
+
+    def yaz(self):
+        """Metrikleri JSON (ve verilmişse Prometheus) dosyasına yazar"""
+        ozet = self.ozet()
+        if self.json_yolu:
+            self._atomik_yaz(self.json_yolu, json.dumps(ozet, ensure_ascii=False, indent=2))
+        if self.prometheus_yolu:
+            self._atomik_yaz(self.prometheus_yolu, self.prometheus_metni(ozet))
+        self.yazma_sayisi += 1
+        self._son_yazma = time.monotonic()
+
+    def gerekirse_yaz(self) -> bool:
+        """Son yazmadan bu yana aralık dolduysa metrikleri yazar"""
+        if self.aralik > 0 and time.monotonic() - self._son_yazma >= self.aralik:
+            self.yaz()
+            return True
+        return False
+
+    def rapor_satirlari(self) -> List[str]:
+        """Aşama sürelerini okunur satırlar olarak döndürür (ölçüm yapılmamış aşamalar atlanır)"""
+        ozet = self.ozet()
+        satirlar = [f"Toplam süre: {ozet['gecen_sure']:.2f} sn (işlemci: {ozet['islemci_suresi']:.2f} sn)"]
+        for ad, asama in ozet['asamalar'].items():
+            if asama['cagri'] == 0:
+                continue
+            satirlar.append(f"  {ad:<8} {asama['duvar_sn']:9.2f} sn  işlemci {asama['islemci_sn']:9.2f} sn  "
+                            f"{asama['adet']:>12} birim  {asama['hiz']:12.1f} birim/sn")
+        return satirlar
+
+
+class GecikmeHistogrami:
+    """Nanosaniye gecikmeler için HDR tarzı logaritmik-doğrusal histogram
+
+    2^ANLAMLI_BIT'ten küçük değerler kendi kovasındadır; daha büyük değerlerin
+    her ikinin kuvveti aralığı 2^(ANLAMLI_BIT - 1) eşit kovaya bölünür. Böylece
+    kova genişliği değerin en fazla 1/16'sı olur ve yüzdelikler kovanın orta
+    noktasıyla (hata <= %3) verilir.
+    """
+
+    ANLAMLI_BIT = 5
+    _YARIM = 1 << (ANLAMLI_BIT - 1)
+
+    __slots__ = ('kovalar', 'sayi', 'toplam', 'en_buyuk')
+
+    def __init__(self):
+        self.kovalar: Dict[int, int] = {}
+        self.sayi = 0
+        self.toplam = 0
+        self.en_buyuk = 0
+
+    @classmethod
+    def kova(cls, deger: int) -> int:
+        kaydirma = deger.bit_length() - cls.ANLAMLI_BIT
+        if kaydirma <= 0:
+            return deger
+        return kaydirma * cls._YARIM + (deger >> kaydirma)
+
+    @classmethod
+    def kova_araligi(cls, kova: int) -> Tuple[int, int]:
+        """Kovanın [alt, üst) değer aralığı"""
+        if kova < 2 * cls._YARIM:
+            return kova, kova + 1
+        kaydirma = kova // cls._YARIM - 1
+        alt = (kova - kaydirma * cls._YARIM) << kaydirma
+        return alt, alt + (1 << kaydirma)
+
+    def ekle(self, deger: int, adet: int = 1):
+        kova = self.kova(deger)
+        self.kovalar[kova] = self.kovalar.get(kova, 0) + adet
+        self.sayi += adet
+        self.toplam += deger * adet
+        if deger > self.en_buyuk:
+            self.en_buyuk = deger
+
+    def birlestir(self, diger: 'GecikmeHistogrami'):
+        for kova, adet in diger.kovalar.items():
+            self.kovalar[kova] = self.kovalar.get(kova, 0) + adet
+        self.sayi += diger.sayi
+        self.toplam += diger.toplam
+        self.en_buyuk = max(self.en_buyuk, diger.en_buyuk)
+
+    def yuzdelik(self, oran: float) -> float:
+        """Değerlerin oran kadarının altında kaldığı değer (kova orta noktası)"""
+        if not self.sayi:
+            return 0.0
+        hedef = oran * self.sayi
+        birikimli = 0
+        for kova in sorted(self.kovalar):
+            birikimli += self.kovalar[kova]
+            if birikimli >= hedef:
+                alt, ust = self.kova_araligi(kova)
+                return min((alt + ust - 1) / 2, self.en_buyuk)
+        return float(self.en_buyuk)
+
+    def ozet(self) -> Dict:
+        """Sayı, toplam ve yüzdelikleri (mikrosaniye) döndürür"""
+        return {
+            'sayi': self.sayi,
+            'toplam_ms': self.toplam / 1e6,
+            'ortalama_us': self.toplam / self.sayi / 1e3 if self.sayi else 0.0,
+            'p50_us': self.yuzdelik(0.5) / 1e3,
+            'p90_us': self.yuzdelik(0.9) / 1e3,
+            'p99_us': self.yuzdelik(0.99) / 1e3,
+            'en_buyuk_us': self.en_buyuk / 1e3
+        }
+
+
+class _BosBaglam:
+    """Hiçbir şey yapmayan bağlam yöneticisi (Python 3.6'da contextlib.nullcontext yok)"""
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *hata):
+        return False
+
+
+_BOS_BAGLAM = _BosBaglam()
+
+
+def olc(metrikler: Optional[Metrikler], ad: str, adet: int = 0):
+    """metrikler verilmişse metrikler.asama(ad, adet), verilmemişse boş bağlam döndürür"""
+    return metrikler.asama(ad, adet) if metrikler is not None else _BOS_BAGLAM
+
+
+def olcerek_uret(metrikler: Optional[Metrikler], ad: str, ogeler: Iterable,
+                 adet: Optional[Callable] = None) -> Iterator:
+    """Öğeleri üretir; her öğenin üretilmesi için geçen süreyi ad aşamasına ekler
+
+    Tembel üreteçlerin (ör. parti parti çözümleme) işi ancak sıradaki öğe
+    istendiğinde yapıldığı için ölçüm bu noktada yapılır. adet verilirse
+    adet(öğe) aşamanın birim sayısına eklenir.
+    """
+    if metrikler is None:
+        yield from ogeler
+        return
+
+    yineleyici = iter(ogeler)
+    while True:
+        with metrikler.asama(ad):
+            oge = next(yineleyici, _BITTI)
+        if oge is _BITTI:
+            return
+        if adet is not None:
+            metrikler.adet_ekle(ad, adet(oge))
+        yield oge
+
@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Türkçe Morfolojik Analiz - Derlem Boyutuna Göre Ölçeklenme Ölçümleri
+
+Veritabanındaki kokler ve ekler tablolarından, Zipf dağılımlı sözcük
+frekanslarıyla tekrarlanabilir yapay derlemler üretilir ve toplu çalışma
+araçları (toplu_analiz, frekans_analizi, toplu_analiz_sorunlu_takip) her
+derlem boyutunda ayrı bir süreç olarak çalıştırılır. Her çalışma için süre,
+işlemci süresi, sözcük/sn ve MB/sn hızı, tepe bellek (RSS) ve veritabanı
+büyümesi JSON dosyasına yazılır.
+
+    python olcek_olcumu.py --boyutlar 1e4 1e5 1e6 --cikti olcek.json
+    python olcek_olcumu.py --boyutlar 1e7 --araclar frekans_analizi --isci 8 --zaman-asimi 7200
+
+Tepe RSS, süreç ağacındaki en büyük tek sürecin tepe değeridir; çok işçili
+çalışmalarda işçilerin toplamı değildir.
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import hashlib
+import shutil
+import signal
+import sqlite3
+import argparse
+import platform
+import tempfile
+import threading
+import subprocess
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+
+from veritabani import MorfolojikVeritabani
+from performans_olcumu import KOKLER
+
+KOD_KLASORU = os.path.dirname(os.path.abspath(__file__))
+
+ARACLAR = {
+    'toplu_analiz': 'toplu_analiz.py',
+    'frekans_analizi': 'frekans_analizi.py',
+    'toplu_analiz_sorunlu_takip': 'toplu_analiz_sorunlu_takip.py'
+}
+
+VARSAYILAN_BOYUTLAR = [10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7, 10 ** 8]
+
+# Ek kategorilerinin sözcükte dizilme sırası ve her birinin eklenme olasılığı;
+# fiil köklerine yalnızca bir fiil çekim eki eklenir
+ISIM_EK_SIRASI = (('yapim_ekleri', 0.3), ('sahiplik_ekleri', 0.4), ('isim_cekimleri', 0.6))
+FIIL_EK_SIRASI = (('fiil_cekimleri', 1.0),)
+
+UNLULER = set('aeıioöuü')
+KALIN_UNLULER = set('aıou')
+# Son ünlüye göre dar (ı/i/u/ü) ve geniş (a/e) ek ünlüleri
+DAR_UNLU = {'a': 'ı', 'ı': 'ı', 'o': 'u', 'u': 'u', 'e': 'i', 'i': 'i', 'ö': 'ü', 'ü': 'ü'}
+GENIS_UNLU = {'a': 'a', 'ı': 'a', 'o': 'a', 'u': 'a', 'e': 'e', 'i': 'e', 'ö': 'e', 'ü': 'e'}
+
+# Art arda bu kadar denemede yeni sözcük çıkmazsa dağarcık tükenmiş sayılır
+TUKENME_DENEMESI = 1000
+
+# Bilinmeyen sözcükler Türkçede bulunmayan bir harfle başlar; hiçbir köke uymaz
+YABANCI_HARFLER = 'qwx'
+HARFLER = 'abcdefghijklmnoprstuvyz'
+
+# Dosyalar bu kadar sözcüklük parçalar halinde yazılır (bellek sınırlı kalsın)
+YAZMA_PARCASI = 100000
+
+
+def sozluk_yukle(veritabani_yolu: Optional[str] = None) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+    """Kökleri ve ekleri veritabanından okur
+
+    Veritabanı verilmezse (ya da kök tablosu boşsa) varsayılan eklerle
+    kurulan geçici bir veritabanı ve ölçüm köklerinin listesi kullanılır.
+    """
+    klasor = None
+    if not veritabani_yolu:
+        klasor = tempfile.mkdtemp(prefix="olcek_sozluk_")
+        veritabani_yolu = os.path.join(klasor, "sozluk.db")
+    try:
+        veritabani = MorfolojikVeritabani(veritabani_yolu, readonly=klasor is None)
+        kokler = veritabani.get_bilinen_kokler() or dict(KOKLER)
+        ekler = veritabani.get_bilinen_ekler()
+        veritabani.kapat()
+    finally:
+        if klasor:
+            shutil.rmtree(klasor, ignore_errors=True)
+    return kokler, ekler
+
+
+def _uyumlu_mu(govde: str, ek: str) -> bool:
+    """Ek gövdeye ünlü uyumuyla ve ünlü çatışması olmadan eklenebilir mi"""
+    if govde[-1] in UNLULER and ek[0] in UNLULER:
+        return False
+    son = next((harf for harf in reversed(govde) if harf in UNLULER), None)
+    ilk = next((harf for harf in ek if harf in UNLULER), None)
+    if son is None or ilk is None or ilk in 'oö':
+        return True
+    return ilk == (DAR_UNLU[son] if ilk in 'ıiuü' else GENIS_UNLU[son])
+
+
+def sozcuk_dagarcigi(kokler: Dict[str, str], ekler: Dict[str, List[str]], boyut: int,
+                     tohum: int = 42) -> List[str]:
+    """Köklere kategori sırasıyla uyumlu ekler eklenerek üretilen benzersiz sözcükler
+
+    Listedeki sıra Zipf dağılımındaki sıradır: ilk sözcük en sık olanıdır.
+    Kökler ve ekler yetmezse liste istenenden kısa olabilir.
+    """
+    rastgele = random.Random(tohum)
+    kategoriler = {kategori: sorted(set(liste)) for kategori, liste in ekler.items()}
+    kok_listesi = sorted(kokler)
+    uyumlu_ekler: Dict[Tuple, List[str]] = {}
+
+    sozcukler = dict.fromkeys(kok_listesi[:boyut])
+    tekrar = 0
+    while len(sozcukler) < boyut and tekrar < TUKENME_DENEMESI:
+        kok = rastgele.choice(kok_listesi)
+        sozcuk = kok
+        for kategori, olasilik in (FIIL_EK_SIRASI if kokler[kok] == 'fiil' else ISIM_EK_SIRASI):
+            if rastgele.random() >= olasilik:
+                continue
+            # Uyum yalnızca son ünlüye ve son harfin ünlü olup olmamasına bağlıdır
+            anahtar = (kategori, next((h for h in reversed(sozcuk) if h in UNLULER), None), sozcuk[-1] in UNLULER)
+            uyumlular = uyumlu_ekler.get(anahtar)
+            if uyumlular is None:
+                uyumlular = [ek for ek in kategoriler.get(kategori, []) if _uyumlu_mu(sozcuk, ek)]
+                uyumlu_ekler[anahtar] = uyumlular
+            if uyumlular:
+                sozcuk += rastgele.choice(uyumlular)
+        if sozcuk in sozcukler:
+            tekrar += 1
+        else:
+            sozcukler[sozcuk] = None
+            tekrar = 0
+
+    sozcukler = list(sozcukler)
+    rastgele.shuffle(sozcukler)
+    return sozcukler
+
+
+def bilinmeyen_sozcukler(sayi: int, tohum: int = 42) -> List[str]:
+    """Analizcinin tanıyamayacağı yapay sözcükler"""
+    rastgele = random.Random(tohum)
+    sozcukler = set()
+    while len(sozcukler) < sayi:
+        uzunluk = rastgele.randint(4, 9)
+        sozcukler.add(rastgele.choice(YABANCI_HARFLER) + "".join(rastgele.choices(HARFLER, k=uzunluk - 1)))
+    return sorted(sozcukler)
+
+
+def zipf_agirliklari(sayi: int, us: float = 1.07) -> List[float]:
+    """Sıra r için 1 / r^us ağırlıklarının birikimli toplamları (random.choices için)"""
+    return list(accumulate(1.0 / (sira ** us) for sira in range(1, sayi + 1)))
+
+
+def dosya_boyutlari(sozcuk_sayisi: int, dosya_sayisi: int) -> List[int]:
+    """Toplam sözcük sayısını dosyalara olabildiğince eşit böler"""
+    bolum, kalan = divmod(sozcuk_sayisi, dosya_sayisi)
+    return [bolum + (1 if i < kalan else 0) for i in range(dosya_sayisi)]
+
+
+def _metne_cevir(sozcukler: List[str], rastgele: random.Random) -> str:
+    """Sözcükleri 5-15 sözcüklük cümlelere ve satırlara dizer"""
+    satirlar = []
+    i = 0
+    while i < len(sozcukler):
+        uzunluk = rastgele.randint(5, 15)
+        cumle = sozcukler[i:i + uzunluk]
+        i += uzunluk
+        cumle[0] = cumle[0].capitalize()
+        satirlar.append(" ".join(cumle) + rastgele.choice('..,?!'))
+    return "\n".join(satirlar) + "\n"
+
+
+def derlem_uret(klasor: str, sozcuk_sayisi: int, dosya_sayisi: int,
+                dagarcik: List[str], bilinmeyenler: List[str],
+                bilinmeyen_orani: float = 0.02, zipf_us: float = 1.07, tohum: int = 42) -> Dict:
+    """klasor'e toplam sozcuk_sayisi sözcüklük dosya_sayisi metin dosyası yazar
+
+    Sözcükler dagarcik'tan Zipf dağılımıyla seçilir; her sözcük
+    bilinmeyen_orani olasılıkla bilinmeyen bir sözcükle değiştirilir. Her
+    dosya (tohum, dosya sırası) ile tohumlanır; aynı ayarlar aynı derlemi verir.
+    """
+    os.makedirs(klasor, exist_ok=True)
+    birikimli = zipf_agirliklari(len(dagarcik), zipf_us)
+    toplam_bayt = 0
+
+    for sira, boyut in enumerate(dosya_boyutlari(sozcuk_sayisi, dosya_sayisi)):
+        rastgele = random.Random(f"{tohum}-{sira}")
+        yol = os.path.join(klasor, f"metin{sira:05d}.txt")
+        with open(yol, 'w', encoding='utf-8') as f:
+            kalan = boyut
+            while kalan > 0:
+                adet = min(kalan, YAZMA_PARCASI)
+                sozcukler = rastgele.choices(dagarcik, cum_weights=birikimli, k=adet)
+                if bilinmeyenler and bilinmeyen_orani > 0:
+                    for i in range(adet):
+                        if rastgele.random() < bilinmeyen_orani:
+                            sozcukler[i] = rastgele.choice(bilinmeyenler)
+                f.write(_metne_cevir(sozcukler, rastgele))
+                kalan -= adet
+        toplam_bayt += os.path.getsize(yol)
+
+    return {'sozcuk_sayisi': sozcuk_sayisi, 'dosya_sayisi': dosya_sayisi, 'bayt': toplam_bayt}
+
+
+def derlem_hazirla(calisma_klasoru: str, sozcuk_sayisi: int, ayarlar: Dict,
+                   dagarcik: List[str], bilinmeyenler: List[str]) -> Tuple[str, Dict]:
+    """Derlemi üretir; aynı ayarlarla daha önce üretilmişse yeniden kullanır
+
+    ayarlar: dosya_sayisi, dosya_boyutu, bilinmeyen_orani, zipf_us, tohum ve
+    dağarcığı tanımlayan değerler. dosya_sayisi verilmezse dosya_boyutu sözcüklük dosyalar üretilir.
+    """
+    dosya_sayisi = ayarlar.get('dosya_sayisi') or max(1, math.ceil(sozcuk_sayisi / ayarlar['dosya_boyutu']))
+    klasor = os.path.join(calisma_klasoru, f"derlem_{sozcuk_sayisi}")
+    bilgi_yolu = os.path.join(calisma_klasoru, f"derlem_{sozcuk_sayisi}.json")
+    kimlik = dict(ayarlar, sozcuk_sayisi=sozcuk_sayisi, dosya_sayisi=dosya_sayisi, dosya_boyutu=None)
+
+    if os.path.exists(bilgi_yolu) and os.path.isdir(klasor):
+        with open(bilgi_yolu, encoding='utf-8') as f:
+            bilgi = json.load(f)
+        if bilgi.get('ayarlar') == kimlik:
+            return klasor, bilgi
+
+    shutil.rmtree(klasor, ignore_errors=True)
+    baslangic = time.perf_counter()
+    bilgi = derlem_uret(klasor, sozcuk_sayisi, dosya_sayisi, dagarcik, bilinmeyenler,
+                        ayarlar['bilinmeyen_orani'], ayarlar['zipf_us'], ayarlar['tohum'])
+    bilgi['uretim_suresi'] = time.perf_counter() - baslangic
+    bilgi['ayarlar'] = kimlik
+    with open(bilgi_yolu, 'w', encoding='utf-8') as f:
+        json.dump(bilgi, f, ensure_ascii=False, indent=2)
+    return klasor, bilgi
+
+
+def _veritabani_boyutu(yol: str) -> int:
+    """Veritabanı ve WAL/SHM dosyalarının toplam boyutu"""
+    return sum(os.path.getsize(yol + ek) for ek in ('', '-wal', '-shm') if os.path.exists(yol + ek))
+
+
+def _analiz_sayisi(yol: str) -> int:
+    if not os.path.exists(yol):
+        return 0
+    try:
+        conn = sqlite3.connect(f"file:{yol}?mode=ro", uri=True)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM sozcuk_analizleri").fetchone()[0]
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return 0
+
+
+def _klasor_boyutu(klasor: str) -> int:
+    return sum(os.path.getsize(os.path.join(kok, ad)) for kok, _, adlar in os.walk(klasor) for ad in adlar)
+
+
+def _grubu_sonlandir(grup_kimligi: int):
+    """Süreç grubundaki tüm süreçleri SIGKILL ile sonlandırır (grup boşsa bir şey yapmaz)"""
+    try:
+        os.killpg(grup_kimligi, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def _cikis_kodu(durum: int) -> int:
+    """wait durumunu Popen.returncode biçimine çevirir (sinyalle bitişte -sinyal)
+
+    os.waitstatus_to_exitcode Python 3.9'da geldiği için durum elle çözülür.
+    """
+    if os.WIFSIGNALED(durum):
+        return -os.WTERMSIG(durum)
+    if os.WIFEXITED(durum):
+        return os.WEXITSTATUS(durum)
+    return durum
+
+
+def arac_calistir(arac: str, derlem_klasoru: str, calisma_klasoru: str, isci: int = 1,
+                  zaman_asimi: Optional[float] = None, kaynak_veritabani: Optional[str] = None,
+                  sakla: bool = False) -> Dict:
+    """Aracı derlem üzerinde ayrı bir süreçte çalıştırıp ölçümlerini döndürür
+
+    Her çalışma kendi klasöründe, kaynak veritabanının bir kopyasıyla (ya da
+    boş bir veritabanıyla) başlar. Süreç os.wait4 ile beklenir; işlemci
+    süresi ve tepe RSS, beklenmiş alt süreçleri de kapsar.
+    """
+    klasor = os.path.join(calisma_klasoru, f"{arac}_{os.path.basename(derlem_klasoru)}")
+    shutil.rmtree(klasor, ignore_errors=True)
+    os.makedirs(klasor)
+    veritabani = os.path.join(klasor, "olcum.db")
+    if kaynak_veritabani:
+        shutil.copyfile(kaynak_veritabani, veritabani)
+    onceki_boyut = _veritabani_boyutu(veritabani)
+    onceki_analiz = _analiz_sayisi(veritabani)
+
+    komut = [sys.executable, os.path.join(KOD_KLASORU, ARACLAR[arac]),
+             '--klasor', derlem_klasoru, '--veritabani', veritabani,
+             '--cikti-klasoru', os.path.join(klasor, 'cikti'), '--ozet', os.path.join(klasor, 'ozet.txt'),
+             '--isci', str(isci)]
+
+    with open(os.path.join(klasor, 'cikti.log'), 'w', encoding='utf-8') as gunluk:
+        # Araç kendi süreç grubunda başlatılır; zaman aşımında --isci ile
+        # açılan işçi süreçleri de grupla birlikte sonlandırılır
+        surec = subprocess.Popen(komut, cwd=klasor, stdout=gunluk, stderr=subprocess.STDOUT,
+                                 stdin=subprocess.DEVNULL, start_new_session=True)
+        zamanlayici = None
+        if zaman_asimi:
+            zamanlayici = threading.Timer(zaman_asimi, _grubu_sonlandir, (surec.pid,))
+            zamanlayici.start()
+        baslangic = time.perf_counter()
+        _, durum, kaynaklar = os.wait4(surec.pid, 0)
+        sure = time.perf_counter() - baslangic
+        if zamanlayici:
+            zamanlayici.cancel()
+        surec.returncode = _cikis_kodu(durum)
+        # Ana süreçten sonra kalan işçiler sonraki ölçümü bozmasın
+        _grubu_sonlandir(surec.pid)
+
+    # Linux'ta ru_maxrss KB, macOS'ta bayt cinsindendir
+    tepe_rss = kaynaklar.ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+    sonraki_boyut = _veritabani_boyutu(veritabani)
+    sonuc = {
+        'arac': arac,
+        'cikis_kodu': surec.returncode,
+        'zaman_asimi': bool(zaman_asimi) and surec.returncode == -9 and sure >= zaman_asimi,
+        'sure_sn': sure,
+        'islemci_sn': kaynaklar.ru_utime + kaynaklar.ru_stime,
+        'tepe_rss_mb': tepe_rss / (1024 * 1024),
+        'veritabani_once_bayt': onceki_boyut,
+        'veritabani_sonra_bayt': sonraki_boyut,
+        'veritabani_buyume_bayt': sonraki_boyut - onceki_boyut,
+        'yeni_analiz': _analiz_sayisi(veritabani) - onceki_analiz,
+        'cikti_bayt': _klasor_boyutu(os.path.join(klasor, 'cikti'))
+    }
+    if not sakla:
+        shutil.rmtree(klasor, ignore_errors=True)
+    return sonuc
+
+
+def _atomik_yaz(yol: str, veri: Dict):
+    gecici = yol + ".tmp"
+    with open(gecici, 'w', encoding='utf-8') as f:
+        json.dump(veri, f, ensure_ascii=False, indent=2)
+    os.replace(gecici, yol)
+
+
+def _boyut(deger: str) -> int:
+    """'1e6' gibi bilimsel gösterimi de kabul eden sözcük sayısı"""
+    return int(float(deger))
+
+
+def main():
+    """Ana program fonksiyonu"""
+    parser = argparse.ArgumentParser(description='Türkçe Morfolojik Analiz - Ölçeklenme Ölçümleri')
+    parser.add_argument('--cikti', '-o', default='olcek_sonuclari.json', help='Sonuçların yazılacağı JSON dosyası')
+    parser.add_argument('--boyutlar', '-n', type=_boyut, nargs='+', default=VARSAYILAN_BOYUTLAR,
+                        help='Ölçülecek derlem boyutları, sözcük (varsayılan: 1e4 1e5 1e6 1e7 1e8)')
+    parser.add_argument('--araclar', '-a', nargs='+', choices=list(ARACLAR), default=list(ARACLAR),
+                        help='Ölçülecek araçlar (varsayılan: hepsi)')
+    parser.add_argument('--calisma-klasoru', '-c', default='olcek_calismasi',
+                        help='Derlemlerin ve çalışma klasörlerinin tutulacağı klasör')
+    parser.add_argument('--veritabani', '-db',
+                        help='Kök ve eklerin okunacağı, her çalışmanın kopyasıyla başlayacağı veritabanı')
+    parser.add_argument('--dosya-sayisi', '-ds', type=int,
+                        help='Derlem başına dosya sayısı (verilmezse --dosya-boyutu kullanılır)')
+    parser.add_argument('--dosya-boyutu', '-dsb', type=_boyut, default=100000,
+                        help='Dosya başına sözcük sayısı (varsayılan: 100000)')
+    parser.add_argument('--dagarcik', '-d', type=_boyut, default=50000,
+                        help='Benzersiz sözcük dağarcığı boyutu (varsayılan: 50000)')
+    parser.add_argument('--bilinmeyen-orani', '-bo', type=float, default=0.02,
+                        help='Bilinmeyen sözcük oranı (varsayılan: 0.02)')
+    parser.add_argument('--zipf', '-zu', type=float, default=1.07, help='Zipf üssü (varsayılan: 1.07)')
+    parser.add_argument('--tohum', '-t', type=int, default=42, help='Rastgelelik tohumu (varsayılan: 42)')
+    parser.add_argument('--isci', '--workers', '-w', type=int, default=1, help='Araçlara verilecek işçi sayısı')
+    parser.add_argument('--zaman-asimi', '-za', type=float,
+                        help='Tek çalışmanın en uzun süresi (sn); aşan araç daha büyük boyutlarda atlanır')
+    parser.add_argument('--sakla', action='store_true', help='Çalışma klasörlerini (veritabanı, çıktılar) silme')
+
+    args = parser.parse_args()
+
+    if args.veritabani and not os.path.exists(args.veritabani):
+        print(f"Hata: Veritabanı bulunamadı: {args.veritabani}")
+        sys.exit(2)
+
+    os.makedirs(args.calisma_klasoru, exist_ok=True)
+    calisma_klasoru = os.path.abspath(args.calisma_klasoru)
+    kaynak_veritabani = os.path.abspath(args.veritabani) if args.veritabani else None
+
+    kokler, ekler = sozluk_yukle(kaynak_veritabani)
+    dagarcik = sozcuk_dagarcigi(kokler, ekler, args.dagarcik, args.tohum)
+    bilinmeyenler = bilinmeyen_sozcukler(max(100, len(dagarcik) // 10), args.tohum)
+    print(f"Dağarcık: {len(kokler)} kök, {sum(len(l) for l in ekler.values())} ek, "
+          f"{len(dagarcik)} sözcük, {len(bilinmeyenler)} bilinmeyen sözcük")
+
+    ayarlar = {
+        'dosya_sayisi': args.dosya_sayisi,
+        'dosya_boyutu': args.dosya_boyutu,
+        'bilinmeyen_orani': args.bilinmeyen_orani,
+        'zipf_us': args.zipf,
+        'tohum': args.tohum,
+        'dagarcik_boyutu': len(dagarcik),
+        'bilinmeyen_sayisi': len(bilinmeyenler),
+        # Kaynak veritabanı değişirse kayıtlı derlemler yeniden üretilsin
+        'dagarcik_ozeti': hashlib.blake2b("\n".join(dagarcik + bilinmeyenler).encode('utf-8'),
+                                          digest_size=8).hexdigest()
+    }
+    rapor = {
+        'ortam': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'islemci': platform.processor(),
+            'islemci_sayisi': os.cpu_count(),
+            'zaman': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'ayarlar': dict(ayarlar, isci=args.isci, zaman_asimi=args.zaman_asimi,
+                        veritabani=kaynak_veritabani, kok_sayisi=len(kokler)),
+        'derlemler': {},
+        'sonuclar': []
+    }
+    basarisizlar = set()
+
+    for sozcuk_sayisi in sorted(args.boyutlar):
+        print(f"\nDerlem hazırlanıyor: {sozcuk_sayisi} sözcük")
+        derlem, bilgi = derlem_hazirla(calisma_klasoru, sozcuk_sayisi, ayarlar, dagarcik, bilinmeyenler)
+        rapor['derlemler'][str(sozcuk_sayisi)] = bilgi
+        print(f"  {bilgi['dosya_sayisi']} dosya, {bilgi['bayt'] / (1024 * 1024):.1f} MB")
+
+        for arac in args.araclar:
+            if arac in basarisizlar:
+                print(f"  {arac:<28} atlandı (daha küçük bir boyutta başarısız oldu)")
+                continue
+            sonuc = arac_calistir(arac, derlem, calisma_klasoru, args.isci, args.zaman_asimi,
+                                  kaynak_veritabani, args.sakla)
+            sonuc['sozcuk_sayisi'] = sozcuk_sayisi
+            sonuc['sozcuk_saniye'] = sozcuk_sayisi / sonuc['sure_sn'] if sonuc['sure_sn'] else 0.0
+            sonuc['mb_saniye'] = bilgi['bayt'] / (1024 * 1024) / sonuc['sure_sn'] if sonuc['sure_sn'] else 0.0
+            rapor['sonuclar'].append(sonuc)
+            _atomik_yaz(args.cikti, rapor)
+
+            if sonuc['cikis_kodu'] != 0:
+                basarisizlar.add(arac)
+                durum = "ZAMAN AŞIMI" if sonuc['zaman_asimi'] else f"HATA (çıkış kodu {sonuc['cikis_kodu']})"
+                print(f"  {arac:<28} {durum} - {sonuc['sure_sn']:.1f} sn")
+                continue
+            print(f"  {arac:<28} {sonuc['sure_sn']:9.1f} sn  {sonuc['sozcuk_saniye']:10.0f} sözcük/sn  "
+                  f"RSS {sonuc['tepe_rss_mb']:7.1f} MB  DB +{sonuc['veritabani_buyume_bayt'] / (1024 * 1024):.1f} MB")
+
+    print(f"\nSonuçlar kaydedildi: {args.cikti}")
+    if basarisizlar:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Türkçe Morfolojik Analiz - Çok Süreçli Toplu Analiz
+"""
+
+import logging
+import multiprocessing
+from typing import Dict, Iterator, List
+
+from turkce_morfologik_analiz import TurkceMorfologikAnaliz
+
+logger = logging.getLogger("TurkceMorfAnaliz")
+
+# Her işçi sürecin kendi analizcisi (süreç başına bir kez kurulur)
+_isci_analizci = None
+
+
+def _isci_baslat(veritabani_yolu: str, zemberek_jar_path: str, ayarlar: Dict):
+    """İşçi süreçte salt okunur veritabanı bağlantılı bir analizci oluşturur"""
+    global _isci_analizci
+    _isci_analizci = TurkceMorfologikAnaliz(
+        veritabani_path=veritabani_yolu,
+        zemberek_jar_path=zemberek_jar_path,
+        interaktif=False,
+        salt_okunur=True,
+        **ayarlar
+    )
+
+
+def _isci_parti_coz(parti: List[str]):
+    """Bir sözcük partisini çözümler; sonuçları, bekleyen yazmaları ve yol histogramlarını döndürür"""
+    sonuclar = _isci_analizci.parcala_toplu(parti)
+    analizler, sorunlular = _isci_analizci.bekleyen_yazmalari_al()
+    return sonuclar, analizler, sorunlular, _isci_analizci.yol_histogramlarini_al()
+
+
+def partiler_halinde_coz(analizci: TurkceMorfologikAnaliz, sozcukler: List[str],
+                         parti_boyutu: int = 1000, isci_sayisi: int = 1) -> Iterator[Dict[str, Dict]]:
+    """Sözcükleri partiler halinde çözümler; isci_sayisi > 1 ise işçi süreçler kullanılır"""
+    if isci_sayisi > 1:
+        yield from paralel_parcala(analizci, sozcukler, isci_sayisi, parti_boyutu)
+        return
+
+    for bas in range(0, len(sozcukler), parti_boyutu):
+        yield analizci.parcala_toplu(sozcukler[bas:bas + parti_boyutu])
+
+
+def paralel_parcala(analizci: TurkceMorfologikAnaliz, sozcukler: List[str],
+                    isci_sayisi: int, parti_boyutu: int = 1000) -> Iterator[Dict[str, Dict]]:
+    """Sözcükleri partilere bölerek işçi süreçlerde çözümler
+
+    Her işçi aynı ayarlarla kendi analizcisini salt okunur bağlantıyla kurar.
+    İşçilerin ürettiği yeni analizler ana sürece döner ve verilen analizcinin
+    bağlantısı üzerinden (tek yazıcı) kaydedilir. Partilerin sonuçları verilen
+    sırayla üretilir.
+
+    İşçiler birbirinin o çalışmada keşfettiği kökleri görmez; bu yüzden sonuçlar
+    tek süreçli çalışmadan küçük farklar gösterebilir.
+    """
+    # İşçiler yalnızca kaydedilmiş verileri görür
+    analizci.veritabani.tamponu_bosalt()
+
+    ayarlar = {
+        'max_derinlik': analizci.max_derinlik,
+        'unlu_uyumu_kontrol': analizci.unlu_uyumu_kontrol,
+        'unsuz_yumusama_kontrol': analizci.unsuz_yumusama_kontrol,
+        'zemberek_oncelikli': analizci.zemberek_oncelikli,
+        'onbellek_boyutu': analizci.onbellek.kapasite
+    }
+    partiler = [sozcukler[bas:bas + parti_boyutu] for bas in range(0, len(sozcukler), parti_boyutu)]
+
+    # JVM (Zemberek) ve SQLite bağlantıları fork ile güvenle kopyalanamaz
+    baglam = multiprocessing.get_context("spawn")
+    with baglam.Pool(
+        processes=isci_sayisi,
+        initializer=_isci_baslat,
+        initargs=(analizci.veritabani.db_path, analizci.zemberek_jar_path, ayarlar)
+    ) as havuz:
+        logger.info(f"{isci_sayisi} işçi süreç ile {len(partiler)} parti çözümlenecek")
+        for sonuclar, analizler, sorunlular, histogramlar in havuz.imap(_isci_parti_coz, partiler):
+            if analizler or sorunlular:
+                analizci.yazmalari_kaydet(analizler, sorunlular)
+            # İşçilerin çözümleme yolu istatistikleri ana analizcide toplanır
+            analizci.yol_histogramlarini_birlestir(histogramlar)
+            yield sonuclar
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Türkçe Morfolojik Analiz - Sıcak Yollar İçin Mikro Performans Ölçümleri
+
+Analizcinin sık çağrılan işlevleri sabit tohumlu, yapay bir sözcük listesi
+üzerinde ölçülür. Her ölçüm önce ısınma turları, sonra tekrarlar halinde
+çalışır; tekrar başına işlem başı süre (ns) kaydedilir ve en küçük, ortanca,
+ortalama, standart sapma ve 90. yüzdelik olarak özetlenir. Sonuçlar JSON
+dosyasına yazılır.
+
+Karşılaştırma modunda sonuçlar kayıtlı bir taban çizgisiyle karşılaştırılır;
+ortanca süresi taban çizgisindekinden eşik oranından fazla artan bir işlev
+varsa program 1 çıkış koduyla biter:
+
+    python performans_olcumu.py --cikti taban.json
+    python performans_olcumu.py --cikti yeni.json --karsilastir taban.json --esik 0.10
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import logging
+import argparse
+import platform
+import tempfile
+import statistics
+from typing import Callable, Dict, List, Optional, Tuple
+
+from turkce_morfologik_analiz import TurkceMorfologikAnaliz
+
+logger = logging.getLogger("TurkceMorfAnaliz")
+
+# Yapay sözcük listesinin kökleri ve ekleri (biçimbilimsel doğruluk gerekmez,
+# gerçek metindeki kök/ek uzunluk ve tekrar dağılımına benzemesi yeterlidir)
+KOKLER = {
+    'ev': 'isim', 'kitap': 'isim', 'okul': 'isim', 'masa': 'isim', 'kalem': 'isim',
+    'ağaç': 'isim', 'göz': 'isim', 'yol': 'isim', 'dağ': 'isim', 'köpek': 'isim',
+    'çocuk': 'isim', 'şehir': 'isim', 'kapı': 'isim', 'deniz': 'isim', 'gün': 'isim',
+    'gel': 'fiil', 'yap': 'fiil', 'git': 'fiil', 'oku': 'fiil', 'yaz': 'fiil',
+    'bak': 'fiil', 'koş': 'fiil', 'gör': 'fiil', 'bil': 'fiil', 'sev': 'fiil',
+    'güzel': 'sıfat', 'büyük': 'sıfat', 'küçük': 'sıfat', 'uzun': 'sıfat', 'yeni': 'sıfat'
+}
+EKLER = ['ler', 'lar', 'de', 'da', 'den', 'dan', 'e', 'a', 'i', 'ı', 'in', 'ın', 'im', 'ım',
+         'imiz', 'ımız', 'dir', 'dır', 'di', 'dı', 'iyor', 'ıyor', 'ecek', 'acak', 'ki', 'le', 'la']
+
+# Hiçbir kurala uymayan sözcükler (varsayılan yol)
+BILINMEYENLER = ['qwxz', 'zzzt', 'brrr', 'pfft', 'hmmm']
+
+
+def sozcuk_listesi(sozcuk_sayisi: int, tohum: int = 42) -> List[str]:
+    """Kök + 0-3 ekten oluşan tekrarlanabilir bir benzersiz sözcük listesi üretir"""
+    rastgele = random.Random(tohum)
+    kokler = sorted(KOKLER)
+    sozcukler = dict.fromkeys(BILINMEYENLER)
+    while len(sozcukler) < sozcuk_sayisi:
+        sozcuk = rastgele.choice(kokler) + "".join(rastgele.choice(EKLER) for _ in range(rastgele.randint(0, 3)))
+        sozcukler[sozcuk] = None
+    return list(sozcukler)[:sozcuk_sayisi]
+
+
+def ozetle(sureler_ns: List[float]) -> Dict[str, float]:
+    """Tekrar başına işlem süresi (ns) listesinin istatistiksel özeti"""
+    sirali = sorted(sureler_ns)
+    return {
+        'en_kucuk': sirali[0],
+        'ortanca': statistics.median(sirali),
+        'ortalama': statistics.mean(sirali),
+        'standart_sapma': statistics.stdev(sirali) if len(sirali) > 1 else 0.0,
+        'p90': sirali[min(len(sirali) - 1, int(0.9 * len(sirali)))]
+    }
+
+
+def olc(islev: Callable, islem_sayisi: int, tekrar: int, isinma: int,
+        hazirlik: Optional[Callable] = None) -> Dict:
+    """islev'i ısınma turlarından sonra tekrar kez çalıştırıp işlem başı süreyi özetler
+
+    hazirlik verilirse her turdan önce (süreye katılmadan) çağrılır ve dönüş
+    değeri islev'e verilir.
+    """
+    sureler = []
+    for tur in range(isinma + tekrar):
+        durum = hazirlik() if hazirlik else None
+        baslangic = time.perf_counter()
+        islev(durum)
+        sure = (time.perf_counter() - baslangic) * 1e9
+        if tur >= isinma:
+            sureler.append(sure / islem_sayisi)
+    ozet = ozetle(sureler)
+    return {
+        'islem_sayisi': islem_sayisi,
+        'tekrar': tekrar,
+        'isinma': isinma,
+        'ns_islem': ozet,
+        'islem_saniye': 1e9 / ozet['ortanca'] if ozet['ortanca'] else 0.0
+    }
+
+
+class OlcumOrtami:
+    """Ölçümler için geçici veritabanlı analizciler kuran yardımcı"""
+
+    def __init__(self, sozcukler: List[str]):
+        self.sozcukler = sozcukler
+        self.klasor = tempfile.mkdtemp(prefix="performans_")
+        self._sayac = 0
+        self._analizciler: List[TurkceMorfologikAnaliz] = []
+
+    def analizci(self) -> TurkceMorfologikAnaliz:
+        """Kökleri yüklenmiş, boş veritabanlı yeni bir analizci"""
+        self._sayac += 1
+        analizci = TurkceMorfologikAnaliz(
+            veritabani_path=os.path.join(self.klasor, f"olcum{self._sayac}.db"),
+            zemberek_jar_path="non-existent.jar",
+            interaktif=False,
+            zemberek_oncelikli=False
+        )
+        analizci.sozluk_ekle_toplu(KOKLER.items())
+        self._analizciler.append(analizci)
+        return analizci
+
+    def soguk_analizci(self) -> TurkceMorfologikAnaliz:
+        """Önceki soğuk analizciyi kapatıp yenisini kurar (veritabanı dosyaları birikmesin)"""
+        if len(self._analizciler) > 1:
+            onceki = self._analizciler.pop()
+            onceki.kapat()
+            os.unlink(onceki.veritabani.db_path)
+        return self.analizci()
+
+    def kapat(self):
+        for analizci in self._analizciler:
+            analizci.kapat()
+        shutil.rmtree(self.klasor, ignore_errors=True)
+
+
+def olcumleri_calistir(sozcuk_sayisi: int = 2000, tekrar: int = 15, isinma: int = 3,
+                       secilenler: Optional[List[str]] = None) -> Dict[str, Dict]:
+    """Tüm (ya da seçilen) ölçümleri çalıştırır, {ad: sonuç} döndürür"""
+    sozcukler = sozcuk_listesi(sozcuk_sayisi)
+    ortam = OlcumOrtami(sozcukler)
+    onceki_seviye = logger.level
+    # Her soğuk turda kurulan analizcinin başlangıç günlükleri ölçümü gölgelemesin
+    logger.setLevel(logging.ERROR)
+
+    try:
+        sicak = ortam.analizci()
+        # Kök/ek çiftleri: ek bulma ve ünlü uyumu denetimlerinin girdileri
+        ciftler: List[Tuple[str, str]] = [(sozcuk[:-len(ek)], ek) for sozcuk in sozcukler
+                                          for ek, _ in sicak._bul_olasi_ekler(sozcuk)]
+        # Sıcak veritabanı: tüm sözcüklerin analizleri kayıtlı, önbellek her turda boşaltılır
+        for sozcuk in sozcukler:
+            sicak.parcala(sozcuk)
+        sicak.veritabani.tamponu_bosalt()
+        metin = " ".join(sozcuk_listesi(sozcuk_sayisi // 2, tohum=7) * 3)
+
+        def onbellegi_bosalt():
+            sicak.onbellek.temizle()
+
+        def hepsini(islev: Callable, girdiler: List) -> Callable:
+            return lambda _: [islev(girdi) for girdi in girdiler]
+
+        def ciftlerle(islev: Callable) -> Callable:
+            return lambda _: [islev(kok, ek) for kok, ek in ciftler]
+
+        def soguk_parcala(analizci: TurkceMorfologikAnaliz):
+            with analizci.veritabani.toplu_islem():
+                for sozcuk in sozcukler:
+                    analizci.parcala(sozcuk)
+
+        # ad: (işlev, işlem sayısı, hazırlık)
+        olcumler = {
+            '_bul_olasi_ekler': (hepsini(sicak._bul_olasi_ekler, sozcukler), len(sozcukler), None),
+            '_kontrol_unlu_uyumu': (hepsini(sicak._kontrol_unlu_uyumu, sozcukler), len(sozcukler), None),
+            '_kontrol_kucuk_unlu_uyumu': (ciftlerle(sicak._kontrol_kucuk_unlu_uyumu), len(ciftler), None),
+            '_kontrol_yumusama': (ciftlerle(sicak._kontrol_yumusama), len(ciftler), None),
+            'parcala_soguk': (soguk_parcala, len(sozcukler), ortam.soguk_analizci),
+            'parcala_sicak': (hepsini(sicak.parcala, sozcukler), len(sozcukler), onbellegi_bosalt),
+            'sozcuk_analizi_getir': (hepsini(sicak.veritabani.sozcuk_analizi_getir, sozcukler),
+                                     len(sozcukler), None),
+            'metinden_sozcukleri_coz': (lambda _: sicak.metinden_sozcukleri_coz(metin),
+                                        len(metin.split()), onbellegi_bosalt)
+        }
+
+        sonuclar = {}
+        for ad, (islev, islem_sayisi, hazirlik) in olcumler.items():
+            if secilenler and ad not in secilenler:
+                continue
+            sonuclar[ad] = olc(islev, islem_sayisi, tekrar, isinma, hazirlik)
+            print(f"{ad:<28} ortanca {sonuclar[ad]['ns_islem']['ortanca']:12.1f} ns/işlem  "
+                  f"(±{sonuclar[ad]['ns_islem']['standart_sapma']:.1f})")
+        return sonuclar
+    finally:
+        ortam.kapat()
+        logger.setLevel(onceki_seviye)
+
+
+def karsilastir(taban: Dict[str, Dict], yeni: Dict[str, Dict], esik: float = 0.10) -> List[Dict]:
+    """Ortanca süreleri taban çizgisiyle karşılaştırır
+
+    Her iki tarafta bulunan her ölçüm için oran = yeni / taban ortanca
+    süresidir; oran 1 + esik'i aşarsa ölçüm gerilemiş sayılır.
+    """
+    karsilastirmalar = []
+    for ad in yeni:
+        if ad not in taban:
+            continue
+        taban_ortanca = taban[ad]['ns_islem']['ortanca']
+        yeni_ortanca = yeni[ad]['ns_islem']['ortanca']
+        oran = yeni_ortanca / taban_ortanca if taban_ortanca else 1.0
+        karsilastirmalar.append({
+            'ad': ad,
+            'taban_ns': taban_ortanca,
+            'yeni_ns': yeni_ortanca,
+            'oran': oran,
+            'geriledi': oran > 1 + esik
+        })
+    return karsilastirmalar
+
+
+def main():
+    """Ana program fonksiyonu"""
+    parser = argparse.ArgumentParser(description='Türkçe Morfolojik Analiz - Mikro Performans Ölçümleri')
+    parser.add_argument('--cikti', '-o', default='performans_sonuclari.json', help='Sonuçların yazılacağı JSON dosyası')
+    parser.add_argument('--karsilastir', '-k', help='Karşılaştırılacak taban çizgisi (önceki bir --cikti dosyası)')
+    parser.add_argument('--esik', '-e', type=float, default=0.10,
+                        help='Gerileme sayılacak ortanca süre artışı oranı (varsayılan: 0.10)')
+    parser.add_argument('--tekrar', '-t', type=int, default=15, help='Ölçüm tekrarı (varsayılan: 15)')
+    parser.add_argument('--isinma', '-i', type=int, default=3, help='Ölçülmeyen ısınma turu (varsayılan: 3)')
+    parser.add_argument('--sozcuk-sayisi', '-n', type=int, default=2000,
+                        help='Yapay sözcük listesinin boyutu (varsayılan: 2000)')
+    parser.add_argument('--olcum', '-m', action='append',
+                        help='Yalnızca bu ölçümü çalıştır (birden fazla verilebilir)')
+
+    args = parser.parse_args()
+
+    taban = None
+    if args.karsilastir:
+        if not os.path.exists(args.karsilastir):
+            print(f"Hata: Taban çizgisi bulunamadı: {args.karsilastir}")
+            sys.exit(2)
+        with open(args.karsilastir, encoding='utf-8') as f:
+            taban = json.load(f)
+
+    sonuclar = olcumleri_calistir(args.sozcuk_sayisi, args.tekrar, args.isinma, args.olcum)
+
+    with open(args.cikti, 'w', encoding='utf-8') as f:
+        json.dump({
+            'ortam': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'islemci': platform.processor(),
+                'zaman': time.strftime('%Y-%m-%dT%H:%M:%S')
+            },
+            'ayarlar': {'sozcuk_sayisi': args.sozcuk_sayisi, 'tekrar': args.tekrar, 'isinma': args.isinma},
+            'olcumler': sonuclar
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\nSonuçlar kaydedildi: {args.cikti}")
+
+    if taban is None:
+        return
+
+    if taban.get('ayarlar', {}).get('sozcuk_sayisi') != args.sozcuk_sayisi:
+        print("Uyarı: Taban çizgisi farklı bir sözcük sayısıyla ölçülmüş.")
+
+    karsilastirmalar = karsilastir(taban['olcumler'], sonuclar, args.esik)
+    print(f"\nTaban çizgisiyle karşılaştırma ({args.karsilastir}, eşik %{args.esik * 100:.0f}):")
+    for k in karsilastirmalar:
+        durum = "GERİLEDİ" if k['geriledi'] else "tamam"
+        print(f"  {k['ad']:<28} {k['taban_ns']:12.1f} -> {k['yeni_ns']:12.1f} ns  ({k['oran']:.2f}x)  {durum}")
+
+    gerileyenler = [k['ad'] for k in karsilastirmalar if k['geriledi']]
+    if gerileyenler:
+        print(f"\nHATA: {len(gerileyenler)} ölçüm geriledi: {', '.join(gerileyenler)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -7,11 +7,11 @@ Türkçe Morfolojik Analiz - Raporlama Aracı
 import sqlite3
 import argparse
 import os
-import json
 import csv
 from typing import Dict, List, Tuple
 import matplotlib.pyplot as plt
-from collections import Counter
+
+from veritabani import semayi_guncelle
 
 class MorfolojiRaporAracı:
     """Morfolojik analiz için raporlama ve istatistik aracı"""
@@ -21,6 +21,8 @@ class MorfolojiRaporAracı:
         if not os.path.exists(self.db_path):
             raise FileNotFoundError(f"Veritabanı bulunamadı: {self.db_path}")
         self.conn = sqlite3.connect(self.db_path)
+        # Eski veritabanlarında kaynak ve ek tabloları bir kez doldurulur
+        semayi_guncelle(self.conn)
         self.conn.row_factory = sqlite3.Row
     
     def kapat(self):
@@ -42,10 +44,10 @@ class MorfolojiRaporAracı:
         istatistikler['kok_turleri'] = {row['tur']: row['sayi'] for row in cursor.fetchall()}
         
         # Ek istatistikleri
-        cursor.execute("SELECT COUNT(*) as sayi FROM ekler")
+        cursor.execute("SELECT COUNT(*) as sayi FROM ekler WHERE tanimli = 1")
         istatistikler['ek_sayisi'] = cursor.fetchone()['sayi']
         
-        cursor.execute("SELECT kategori, COUNT(*) as sayi FROM ekler GROUP BY kategori")
+        cursor.execute("SELECT kategori, COUNT(*) as sayi FROM ekler WHERE tanimli = 1 GROUP BY kategori")
         istatistikler['ek_kategorileri'] = {row['kategori']: row['sayi'] for row in cursor.fetchall()}
         
         # Analiz istatistikleri
@@ -60,8 +62,7 @@ class MorfolojiRaporAracı:
         
         # Kaynak istatistikleri
         cursor.execute(
-            "SELECT json_extract(analiz_json, '$.source') as kaynak, COUNT(*) as sayi "
-            "FROM sozcuk_analizleri GROUP BY kaynak"
+            "SELECT kaynak, COUNT(*) as sayi FROM sozcuk_analizleri GROUP BY kaynak"
         )
         istatistikler['analiz_kaynaklari'] = {row['kaynak']: row['sayi'] for row in cursor.fetchall()}
         
@@ -82,21 +83,18 @@ class MorfolojiRaporAracı:
         return [(row['kok'], row['kullanim']) for row in cursor.fetchall()]
     
     def get_en_cok_kullanilan_ekler(self, limit: int = 20) -> List[Tuple[str, str, int]]:
-        """En çok kullanılan ekleri listeler"""
-        # Bu daha karmaşık, JSON'dan ekler dizisini çıkarıp saymalıyız
+        """En çok kullanılan ekleri listeler (her analizdeki her ek bir kez sayılır)"""
         cursor = self.conn.cursor()
-        cursor.execute("SELECT analiz_json FROM sozcuk_analizleri")
-        
-        # Her bir analizdeki ekleri say
-        ek_sayaci = Counter()
-        for row in cursor.fetchall():
-            analiz = json.loads(row['analiz_json'])
-            for ek, kategori in analiz.get('ekler', []):
-                ek_sayaci[(ek, kategori)] += 1
-        
-        # En çok kullanılan ekleri döndür
-        en_cok_ekler = ek_sayaci.most_common(limit)
-        return [(ek, kategori, sayi) for (ek, kategori), sayi in en_cok_ekler]
+        cursor.execute(
+            "SELECT e.ek, e.kategori, se.sayi "
+            "FROM (SELECT ek_id, COUNT(*) as sayi, MIN(sozcuk_id) as ilk "
+            "      FROM sozcuk_ekleri GROUP BY ek_id) se "
+            "JOIN ekler e ON e.id = se.ek_id "
+            "ORDER BY se.sayi DESC, se.ilk "
+            "LIMIT ?",
+            (limit,)
+        )
+        return [(row['ek'], row['kategori'], row['sayi']) for row in cursor.fetchall()]
     
     def get_sorunlu_sozcukler(self) -> List[Dict]:
         """Çözülemeyen sorunlu sözcükleri listeler"""
@@ -33,6 +33,9 @@ setup(
             "turkce-morfologik-analiz=turkce_morfologik_analiz:main",
             "turkce-rapor=rapor_araci:main",
             "turkce-coklu-islem=coklu_islem:main",
+            "frekans-birlestir=frekans_birlestir:main",
+            "turkce-performans=performans_olcumu:main",
+            "turkce-olcek=olcek_olcumu:main",
         ],
     },
 )
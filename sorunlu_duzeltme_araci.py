@@ -12,6 +12,12 @@ import time
 import json
 from typing import List, Dict, Tuple, Optional
 
+from ek_agaci import EkAgaci
+from veritabani import SORGU_PARAMETRE_SINIRI, ek_kimligi_getir, parcalara_bol, semayi_guncelle
+
+# Her kök için gösterilecek en fazla ek tahmini
+KOK_BASINA_EK_TAHMINI = 3
+
 def veritabanini_baglat(veritabani_yolu: str) -> sqlite3.Connection:
     """Veritabanına bağlanır"""
     if not os.path.exists(veritabani_yolu):
@@ -20,6 +26,7 @@ def veritabanini_baglat(veritabani_yolu: str) -> sqlite3.Connection:
     
     try:
         conn = sqlite3.connect(veritabani_yolu)
+        semayi_guncelle(conn)
         return conn
     except sqlite3.Error as e:
         print(f"Veritabanı bağlantı hatası: {e}")
@@ -107,50 +114,84 @@ def dosyalarda_bul(sozcuk: str, belgeler_str: str) -> List[Tuple[str, int, List[
     
     return dosya_bilgileri
 
-def kok_ve_ek_tahmini_yap(sozcuk: str, conn: sqlite3.Connection) -> List[Tuple[str, str]]:
-    """Sözcük için olası kök ve ek tahminleri yapar"""
+def ek_agacini_yukle(conn: sqlite3.Connection) -> EkAgaci:
+    """Bilinen ekleri sıklığa göre sıralı bir ters ek ağacına yükler"""
     cursor = conn.cursor()
+    ek_agaci = EkAgaci()
     
-    # Kökler tablosundan olası kökler
-    cursor.execute("""
-    SELECT kok, tur
-    FROM kokler
-    WHERE ? LIKE kok || '%'
-    ORDER BY LENGTH(kok) DESC
-    LIMIT 5
-    """, (sozcuk,))
+    # Aynı düğümde biten ekler eklenme sırasını korur; sık olanlar önce gelsin
+    cursor.execute("SELECT ek, kategori FROM ekler WHERE tanimli = 1 ORDER BY frekans DESC, id")
+    for ek, kategori in cursor.fetchall():
+        ek_agaci.ekle(ek, kategori)
     
-    olasi_kokler = cursor.fetchall()
+    return ek_agaci
+
+def olasi_kokler_getir(sozcuk: str, conn: sqlite3.Connection, limit: int = 5) -> List[Tuple[str, str]]:
+    """Sözcüğün önekleri arasındaki bilinen kökleri uzundan kısaya döndürür
     
-    # Ekler tablosundan olası ekler (en sık kullanılanlar)
-    cursor.execute("""
-    SELECT ek, kategori
-    FROM ekler
-    ORDER BY frekans DESC
-    LIMIT 10
-    """)
+    Önekler tek tek sayılıp kokler.kok üzerindeki tekil indeksle eşitlik
+    aramasına çevrilir; kökler tablosunun boyutundan bağımsız olarak en fazla
+    len(sozcuk) indeks araması yapılır. Çok uzun sözcüklerde (URL, birleşik
+    metin) önekler SORGU_PARAMETRE_SINIRI'nı aşmayan parçalar halinde,
+    uzundan kısaya sorgulanır ve limit dolunca durulur.
+    """
+    onekler = [sozcuk[:i] for i in range(len(sozcuk), 0, -1)]
     
-    olasi_ekler = cursor.fetchall()
+    cursor = conn.cursor()
+    kokler = []
+    # LIMIT de bir parametre olduğu için parçalar bir eksik tutulur
+    for parca in parcalara_bol(onekler, SORGU_PARAMETRE_SINIRI - 1):
+        yer_tutucular = ", ".join("?" * len(parca))
+        cursor.execute(f"""
+        SELECT kok, tur
+        FROM kokler
+        WHERE kok IN ({yer_tutucular})
+        ORDER BY LENGTH(kok) DESC
+        LIMIT ?
+        """, (*parca, limit - len(kokler)))
+        kokler.extend(cursor.fetchall())
+        if len(kokler) >= limit:
+            break
+    
+    return kokler
+
+def kok_ve_ek_tahmini_yap(sozcuk: str, conn: sqlite3.Connection,
+                          ek_agaci: Optional[EkAgaci] = None) -> List[Tuple[str, str]]:
+    """Sözcük için olası kök ve ek tahminleri yapar
+    
+    Tahminler kök uzunluğuna göre (uzundan kısaya), her kök için de kalan
+    kısmın sonuyla eşleşen ek uzunluğuna göre sıralıdır. Art arda çok sayıda
+    sözcük için çağrılacaksa ek_agacini_yukle ile bir kez yüklenen ağaç
+    verilmelidir.
+    """
+    olasi_kokler = olasi_kokler_getir(sozcuk, conn)
+    if not olasi_kokler:
+        return []
+    
+    if ek_agaci is None:
+        ek_agaci = ek_agacini_yukle(conn)
     
     # Kökler ve eklerden tahminler oluştur
     tahminler = []
     
-    if olasi_kokler:
-        # En uzun köklerle başla (greedy yaklaşım)
-        for kok, tur in olasi_kokler:
-            if sozcuk.startswith(kok):
-                ek_kismi = sozcuk[len(kok):]
-                if not ek_kismi:
-                    tahminler.append((kok, ""))
-                else:
-                    # Ek kısmı için uygun ekler bul
-                    for ek, kategori in olasi_ekler:
-                        if ek_kismi == ek or ek_kismi.endswith(ek):
-                            tahminler.append((kok, ek))
-                    
-                    # Hiç uygun ek bulunamadıysa, ek kısmını olduğu gibi ekle
-                    if not any(tahmin[0] == kok for tahmin in tahminler):
-                        tahminler.append((kok, ek_kismi))
+    # En uzun köklerle başla (greedy yaklaşım)
+    for kok, tur in olasi_kokler:
+        ek_kismi = sozcuk[len(kok):]
+        if not ek_kismi:
+            tahminler.append((kok, ""))
+            continue
+        
+        # Ek kısmının tamamı ya da sonuyla eşleşen bilinen ekler
+        uygun_ekler = []
+        for ek, kategori in ek_agaci.eslesenler(ek_kismi, kok_uzunlugu=0):
+            if ek not in uygun_ekler:
+                uygun_ekler.append(ek)
+        
+        if uygun_ekler:
+            tahminler.extend((kok, ek) for ek in uygun_ekler[:KOK_BASINA_EK_TAHMINI])
+        else:
+            # Hiç uygun ek bulunamadıysa, ek kısmını olduğu gibi ekle
+            tahminler.append((kok, ek_kismi))
     
     return tahminler
 
@@ -188,12 +229,22 @@ def sozcuk_duzenle(conn: sqlite3.Connection, sozcuk_id: int, kok: str, tur: str,
         
         # Sorunlu sözcük analizini kaydet
         cursor.execute("""
-        INSERT INTO sozcuk_analizleri (sozcuk, kok_id, analiz_json)
-        VALUES (?, ?, ?)
+        INSERT INTO sozcuk_analizleri (sozcuk, kok_id, analiz_json, kaynak)
+        VALUES (?, ?, ?, 'manuel_duzeltme')
         ON CONFLICT(sozcuk) DO UPDATE SET 
-        kok_id = ?, analiz_json = ?, frekans = frekans + 1
+        kok_id = ?, analiz_json = ?, kaynak = 'manuel_duzeltme', frekans = frekans + 1
         """, (sozcuk, kok_id, json.dumps(analiz_sonuc), kok_id, json.dumps(analiz_sonuc)))
         
+        # Analizin eklerini güncelle
+        cursor.execute("SELECT id FROM sozcuk_analizleri WHERE sozcuk = ?", (sozcuk,))
+        analiz_id = cursor.fetchone()[0]
+        cursor.execute("DELETE FROM sozcuk_ekleri WHERE sozcuk_id = ?", (analiz_id,))
+        for sira, (ek_metni, kategori) in enumerate(analiz_sonuc['ekler']):
+            cursor.execute(
+                "INSERT INTO sozcuk_ekleri (sozcuk_id, sira, ek_id) VALUES (?, ?, ?)",
+                (analiz_id, sira, ek_kimligi_getir(cursor, ek_metni, kategori))
+            )
+        
         # Sorunlu sözcük durumunu güncelle
         cursor.execute("""
         UPDATE sorunlu_sozcukler 
@@ -221,6 +272,9 @@ def sozcuk_duzenle(conn: sqlite3.Connection, sozcuk_id: int, kok: str, tur: str,
 
 def interaktif_menu(conn: sqlite3.Connection):
     """Sorunlu sözcükleri düzeltmek için interaktif menü"""
+    # Ek ağacı bir kez yüklenir; tahminler her sözcükte yeniden kurmaz
+    ek_agaci = ek_agacini_yukle(conn)
+    
     while True:
         print("\n=== SORUNLU SÖZCÜK DÜZELTME ARACI ===")
         print("1. En sık kullanılan sorunlu sözcükleri göster")
@@ -299,7 +353,7 @@ def interaktif_menu(conn: sqlite3.Connection):
                         print(f"   ... ve {len(satirlar)-5} satır daha")
             
             # Olası kök ve ek tahminleri
-            tahminler = kok_ve_ek_tahmini_yap(sozcuk, conn)
+            tahminler = kok_ve_ek_tahmini_yap(sozcuk, conn, ek_agaci)
             
             if tahminler:
                 print("\nOlası kök-ek kombinasyonları:")
@@ -373,7 +427,7 @@ def interaktif_menu(conn: sqlite3.Connection):
                     sozcuk = row[0]
                     print(f"\nSözcük: {sozcuk} (ID: {sozcuk_id})")
                     
-                    tahminler = kok_ve_ek_tahmini_yap(sozcuk, conn)
+                    tahminler = kok_ve_ek_tahmini_yap(sozcuk, conn, ek_agaci)
                     if tahminler:
                         print("Olası kök-ek kombinasyonları:")
                         for i, (kok, ek) in enumerate(tahminler):
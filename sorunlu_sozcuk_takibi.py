@@ -6,7 +6,6 @@ Sorunlu sözcüklerin hangi dosyalarda geçtiğini kaydeder
 """
 
 import os
-import re
 import argparse
 import time
 import glob
@@ -16,97 +15,35 @@ import sqlite3
 from collections import Counter, defaultdict
 from typing import Dict, Set, List, Tuple, Counter as CounterType
 
-class FrekansBilgisi:
-    """Sözcük frekans bilgisi sınıfı"""
-    def __init__(self, sozcuk: str):
-        self.sozcuk = sozcuk
-        self.toplam_frekans = 0  # Tüm metinlerdeki toplam görülme sayısı
-        self.belge_frekansi = 0  # Sözcüğün göründüğü belge sayısı
-        self.belgeler = {}  # Belge başına frekans: {dosya_yolu: sayı}
-        self.morfolojik_analiz = None  # Morfolojik analiz sonucu
-        self.sorunlu = False  # Sözcüğün sorunlu olup olmadığı
-        
-    def belgeye_ekle(self, dosya_yolu: str, sayi: int = 1):
-        """Sözcüğün belgedeki frekansını günceller"""
-        self.toplam_frekans += sayi
+from frekans_deposu import FrekansDeposu, FrekansGorunumu
+# temizle_ve_parcala adı bu modülden içe aktaranlar için korunuyor
+from sozcuk_ayirici import dosya_frekanslari, metin_frekanslari as temizle_ve_parcala
+
+class FrekansBilgisi(FrekansGorunumu):
+    """Sözcük frekans bilgisi (FrekansDeposu içindeki bir sözcüğün görünümü)"""
+    __slots__ = ()
+    
+    @property
+    def sorunlu(self) -> bool:
+        """Sözcüğün sorunlu olup olmadığı (depodaki işaret baytında tutulur)"""
+        return bool(self.depo.isaretler[self.kimlik])
+    
+    @sorunlu.setter
+    def sorunlu(self, deger: bool):
+        self.depo.isaretler[self.kimlik] = 1 if deger else 0
         
-        if dosya_yolu not in self.belgeler:
-            self.belge_frekansi += 1
-            self.belgeler[dosya_yolu] = sayi
-        else:
-            self.belgeler[dosya_yolu] += sayi
-    
     def analiz_ekle(self, analiz_sonucu: dict):
         """Morfolojik analiz sonucunu ekler"""
-        self.morfolojik_analiz = analiz_sonucu
+        super().analiz_ekle(analiz_sonucu)
         # Analiz kaynağı 'varsayilan' ise veya ekler boşsa sorunlu kabul et
         if analiz_sonucu.get('source') == 'varsayilan' or not analiz_sonucu.get('ekler'):
             self.sorunlu = True
         
-    def get_kok(self) -> str:
-        """Sözcüğün kökünü döndürür"""
-        if self.morfolojik_analiz and 'kok' in self.morfolojik_analiz:
-            return self.morfolojik_analiz['kok']
-        return self.sozcuk
-    
-    def get_ekler(self) -> List[Tuple[str, str]]:
-        """Sözcüğün eklerini döndürür"""
-        if self.morfolojik_analiz and 'ekler' in self.morfolojik_analiz:
-            return self.morfolojik_analiz['ekler']
-        return []
-    
-    def get_kaynak(self) -> str:
-        """Analiz kaynağını döndürür"""
-        if self.morfolojik_analiz and 'source' in self.morfolojik_analiz:
-            return self.morfolojik_analiz['source']
-        return 'bilinmiyor'
-        
     def get_belgeler_str(self) -> str:
         """Sözcüğün geçtiği belgeleri ve frekansları string olarak döndürür"""
-        return "; ".join([f"{os.path.basename(dosya)}:{sayi}" for dosya, sayi in self.belgeler.items()])
+        return "; ".join([f"{os.path.basename(dosya)}:{sayi}" for dosya, sayi in self.depo.sozcuk_belgeleri(self.kimlik)])
 
-def temizle_ve_parcala(metin: str, sayilari_atla: bool = True) -> Dict[str, int]:
-    """Metni temizler ve sözcük frekanslarını döndürür"""
-    # Noktalama işaretlerini temizle
-    temiz_metin = re.sub(r'[^\w\s]', ' ', metin)
-    
-    # Sözcükleri ayır ve küçük harfe çevir
-    sozcukler = temiz_metin.lower().split()
-    
-    # Sözcük frekanslarını sayar
-    frekanslar = Counter()
-    
-    for sozcuk in sozcukler:
-        if len(sozcuk) <= 1:  # Çok kısa sözcükleri atla
-            continue
-            
-        if sayilari_atla and (sozcuk.isdigit() or re.match(r'^\d+[a-zA-Z]*$', sozcuk)):
-            continue  # Sayıları atla
-            
-        frekanslar[sozcuk] += 1
-        
-    return frekanslar
-
-def dosya_oku(dosya_yolu: str) -> str:
-    """Metin dosyasını okur, farklı kodlamaları dener"""
-    kodlamalar = ['utf-8', 'latin-1', 'windows-1254', 'iso-8859-9']
-    
-    for kodlama in kodlamalar:
-        try:
-            with open(dosya_yolu, 'r', encoding=kodlama) as f:
-                return f.read()
-        except UnicodeDecodeError:
-            continue
-    
-    # Hiçbir kodlama çalışmazsa, binary olarak oku ve decode edebileceğimiz karakterleri al
-    try:
-        with open(dosya_yolu, 'rb') as f:
-            return f.read().decode('utf-8', errors='ignore')
-    except Exception as e:
-        print(f"HATA: {dosya_yolu} dosyası okunamadı: {e}")
-        return ""
-
-def sorunlu_sozcukleri_kaydet(frekans_verileri: Dict[str, FrekansBilgisi], 
+def sorunlu_sozcukleri_kaydet(frekans_verileri: FrekansDeposu, 
                               veritabani_yolu: str, 
                               sorunlu_dosyasi: str) -> None:
     """Sorunlu sözcükleri veritabanına ve metin dosyasına kaydeder"""
@@ -192,7 +129,8 @@ def sorunlu_sozcukleri_kaydet(frekans_verileri: Dict[str, FrekansBilgisi],
     else:
         print(f"Veritabanı bulunamadı: {veritabani_yolu}, sorunlu sözcükler yalnızca metin dosyasına kaydedildi.")
 
-def analiz_et(frekans_verileri: Dict[str, FrekansBilgisi], veritabani_yolu: str, zemberek_aktif: bool = False) -> None:
+def analiz_et(frekans_verileri: FrekansDeposu, veritabani_yolu: str, zemberek_aktif: bool = False,
+              parti_boyutu: int = 1000) -> None:
     """Sözcükleri analiz et ve frekans verilerine ekle"""
     from turkce_morfologik_analiz import TurkceMorfologikAnaliz
     
@@ -209,18 +147,22 @@ def analiz_et(frekans_verileri: Dict[str, FrekansBilgisi], veritabani_yolu: str,
     
     islenecek_toplam = len(sozcukler)
     
+    sirali_sozcukler = sorted(sozcukler)
+    
+    # Sözcükleri partiler halinde çözümle (kayıtlı analizler tek sorguda gelir)
     baslangic = time.time()
-    for i, sozcuk in enumerate(sorted(sozcukler)):
-        analiz_sonuc = analizci.parcala(sozcuk)
-        frekans_verileri[sozcuk].analiz_ekle(analiz_sonuc)
+    for bas in range(0, islenecek_toplam, parti_boyutu):
+        parti = sirali_sozcukler[bas:bas + parti_boyutu]
+        for sozcuk, analiz_sonuc in analizci.parcala_toplu(parti).items():
+            frekans_verileri[sozcuk].analiz_ekle(analiz_sonuc)
+        islenen = bas + len(parti)
         
         # İlerleme göster
-        if (i+1) % 100 == 0 or i+1 == islenecek_toplam:
-            gecen_sure = time.time() - baslangic
-            hiz = (i+1) / gecen_sure if gecen_sure > 0 else 0
-            kalan_sure = (islenecek_toplam - (i+1)) / hiz if hiz > 0 else 0
-            print(f"\rİlerleme: {i+1}/{islenecek_toplam} sözcük ({(i+1)/islenecek_toplam*100:.1f}%) | "
-                  f"Hız: {hiz:.1f} sözcük/sn | Kalan: {kalan_sure:.1f} sn", end="")
+        gecen_sure = time.time() - baslangic
+        hiz = islenen / gecen_sure if gecen_sure > 0 else 0
+        kalan_sure = (islenecek_toplam - islenen) / hiz if hiz > 0 else 0
+        print(f"\rİlerleme: {islenen}/{islenecek_toplam} sözcük ({islenen/islenecek_toplam*100:.1f}%) | "
+              f"Hız: {hiz:.1f} sözcük/sn | Kalan: {kalan_sure:.1f} sn", end="")
     
     print()  # Yeni satır
     
@@ -252,7 +194,7 @@ def klasordeki_dosyalari_bul(klasor_yolu: str, uzanti: str = ".txt") -> List[str
 def dosyalari_analiz_et(dosya_yollari: List[str], veritabani_yolu: str, 
                        cikti_klasoru: str, ozet_dosyasi: str, csv_dosyasi: str,
                        sorunlu_dosyasi: str,
-                       zemberek_aktif: bool = False, sayilari_atla: bool = True) -> Dict[str, FrekansBilgisi]:
+                       zemberek_aktif: bool = False, sayilari_atla: bool = True) -> FrekansDeposu:
     """Birden fazla dosyayı analiz eder, frekans bilgilerini toplar"""
     if not dosya_yollari:
         print("İşlenecek dosya bulunamadı.")
@@ -264,26 +206,20 @@ def dosyalari_analiz_et(dosya_yollari: List[str], veritabani_yolu: str,
         print(f"Çıktı klasörü oluşturuldu: {cikti_klasoru}")
     
     # Frekans verilerini topla
-    frekans_verileri = {}  # {sozcuk: FrekansBilgisi}
-    dosya_analiz_sonuclari = {}  # {dosya_yolu: {sozcuk: frekans}}
+    frekans_verileri = FrekansDeposu(FrekansBilgisi)  # {sozcuk: FrekansBilgisi}
+    dosya_kodlamalari = {}  # {dosya_yolu: kodlama}
     
     # Tüm dosyaları oku ve frekans bilgilerini topla
     for i, dosya_yolu in enumerate(dosya_yollari):
         print(f"\n[{i+1}/{len(dosya_yollari)}] Dosya okunuyor: {dosya_yolu}")
-        metin = dosya_oku(dosya_yolu)
-        frekanslar = temizle_ve_parcala(metin, sayilari_atla)
-        
-        # Frekans verilerini güncelle
-        for sozcuk, frekans in frekanslar.items():
-            if sozcuk not in frekans_verileri:
-                frekans_verileri[sozcuk] = FrekansBilgisi(sozcuk)
-            
-            frekans_verileri[sozcuk].belgeye_ekle(dosya_yolu, frekans)
+        kodlama_bilgisi = {}
+        frekanslar = dosya_frekanslari(dosya_yolu, sayilari_atla, bilgi=kodlama_bilgisi)
+        dosya_kodlamalari[dosya_yolu] = kodlama_bilgisi['kodlama']
         
-        # Dosya bazında frekansları kaydet
-        dosya_analiz_sonuclari[dosya_yolu] = frekanslar
+        # Frekans verilerini güncelle (dosya bazında frekanslar da depoda tutulur)
+        frekans_verileri.belge_ekle(dosya_yolu, frekanslar)
         
-        print(f"  Dosyadan {len(frekanslar)} benzersiz sözcük çıkarıldı (toplam kullanım: {sum(frekanslar.values())})")
+        print(f"  Dosyadan {len(frekanslar)} benzersiz sözcük çıkarıldı (toplam kullanım: {sum(frekanslar.values())}, kodlama: {dosya_kodlamalari[dosya_yolu]})")
     
     print(f"\nToplam {len(frekans_verileri)} benzersiz sözcük bulundu.")
     
@@ -294,12 +230,14 @@ def dosyalari_analiz_et(dosya_yollari: List[str], veritabani_yolu: str,
     sorunlu_sozcukleri_kaydet(frekans_verileri, veritabani_yolu, sorunlu_dosyasi)
     
     # Her dosya için ayrı analiz sonucu dosyası oluştur
-    for dosya_yolu, frekanslar in dosya_analiz_sonuclari.items():
+    for dosya_yolu in frekans_verileri.belge_yollari:
+        frekanslar = frekans_verileri.belge_frekanslari_getir(dosya_yolu)
         dosya_adi = os.path.basename(dosya_yolu)
         cikti_dosyasi = os.path.join(cikti_klasoru, f"{os.path.splitext(dosya_adi)[0]}_analiz.txt")
         
         with open(cikti_dosyasi, 'w', encoding='utf-8') as f:
             f.write(f"# Dosya: {dosya_yolu}\n")
+            f.write(f"# Kodlama: {dosya_kodlamalari[dosya_yolu]}\n")
             f.write(f"# Toplam sözcük sayısı: {sum(frekanslar.values())}\n")
             f.write(f"# Benzersiz sözcük sayısı: {len(frekanslar)}\n\n")
             f.write("# Sözcük\tFrekans\tKök\tEkler\tKaynak\tSorunlu\n")
@@ -322,7 +260,7 @@ def dosyalari_analiz_et(dosya_yollari: List[str], veritabani_yolu: str,
             f.write("# Sözcük\tToplam_Frekans\tBelge_Frekansı\tKök\tEkler\tKaynak\tSorunlu\n")
             
             # Frekansa göre sırala (en yüksekten en düşüğe)
-            for sozcuk, veri in sorted(frekans_verileri.items(), key=lambda x: x[1].toplam_frekans, reverse=True):
+            for sozcuk, veri in frekans_verileri.frekansa_gore_sirali():
                 ekler_str = ", ".join([f"{ek} ({kategori})" for ek, kategori in veri.get_ekler()])
                 
                 f.write(f"{sozcuk}\t{veri.toplam_frekans}\t{veri.belge_frekansi}\t{veri.get_kok()}\t"
@@ -337,7 +275,7 @@ def dosyalari_analiz_et(dosya_yollari: List[str], veritabani_yolu: str,
             writer.writerow(["Sözcük", "Toplam_Frekans", "Belge_Frekansı", "Kök", "Ekler", "Kaynak", "Sorunlu", "Belgeler"])
             
             # Frekansa göre sırala (en yüksekten en düşüğe)
-            for sozcuk, veri in sorted(frekans_verileri.items(), key=lambda x: x[1].toplam_frekans, reverse=True):
+            for sozcuk, veri in frekans_verileri.frekansa_gore_sirali():
                 ekler_str = ", ".join([f"{ek} ({kategori})" for ek, kategori in veri.get_ekler()])
                 
                 writer.writerow([
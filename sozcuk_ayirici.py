@@ -0,0 +1,267 @@
+"""
+Türkçe Morfolojik Analiz - Akışlı Sözcük Ayırıcı
+
+Dosyalar sabit boyutlu bayt parçaları halinde okunur ve sözcüklere ayrılır;
+dosyanın tamamı hiçbir zaman belleğe alınmaz. Parça sınırında bölünen
+sözcükler ve çok baytlı karakterler bir sonraki parçayla birleştirilir.
+
+Metin NFC biçimine getirilir ve Türkçe kurallarına göre küçük harfe çevrilir
+(İ -> i, I -> ı); bellekteki metinler ve dosyalar aynı kurallarla ayrılır.
+"""
+
+import re
+import codecs
+import logging
+import itertools
+import unicodedata
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from metrikler import olc
+
+logger = logging.getLogger("TurkceMorfAnaliz")
+
+# Varsayılan okuma parçası (bayt)
+PARCA_BOYUTU = 1 << 20
+
+# cp1254 ile iso-8859-9 yalnızca 0x80-0x9F aralığında ayrışır: cp1254 burada
+# tırnak, tire gibi yazım işaretleri tutar, iso-8859-9'da ise bu baytlar
+# metinde kullanılmayan kontrol karakterleridir
+_C1_DISI_BAYTLAR = bytes(range(0x80)) + bytes(range(0xa0, 0x100))
+_CP1254_TANIMSIZ_BAYTLAR = frozenset(b'\x81\x8d\x8e\x8f\x90\x9d\x9e')
+
+# Noktalama ve boşluk dışındaki karakter dizileri sözcüktür
+SOZCUK_DESENI = re.compile(r'\w+')
+# Sayılar ve "2ler", "15inci" gibi sayıyla başlayan kısaltmalar (küçük harfe çevrilmiş metinde)
+SAYI_DESENI = re.compile(r'\d+[a-z]*')
+
+
+def turkce_kucuk_harf(metin: str) -> str:
+    """Metni NFC biçimine getirip Türkçe kurallarına göre küçük harfe çevirir
+
+    str.lower() İ harfini "i̇" (i + birleşik nokta), I harfini "i" yapar; bu
+    iki harf önceden çevrilir. (str.replace, str.translate'ten çok daha hızlıdır.)
+    """
+    metin = unicodedata.normalize('NFC', metin)
+    return metin.replace('İ', 'i').replace('I', 'ı').lower()
+
+
+def tek_bayt_kodlama_sec(veri: bytes) -> str:
+    """UTF-8 olmayan Türkçe baytlar için cp1254 ile iso-8859-9 arasında seçim yapar
+
+    0x80-0x9F aralığında bayt varsa ve hepsi cp1254'te tanımlıysa cp1254,
+    aksi halde iso-8859-9 seçilir. (Bu aralık dışında iki kodlama aynıdır.)
+    """
+    c1_baytlari = set(veri.translate(None, _C1_DISI_BAYTLAR))
+    if c1_baytlari and not c1_baytlari & _CP1254_TANIMSIZ_BAYTLAR:
+        return 'cp1254'
+    return 'iso-8859-9'
+
+
+def kodlama_tespit_et(veri: bytes) -> str:
+    """Bayt dizisinin kodlamasını tahmin eder: 'utf-8', 'cp1254' ya da 'iso-8859-9'"""
+    try:
+        veri.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return tek_bayt_kodlama_sec(veri)
+
+
+def metin_parcalari(dosya_yolu: str, parca_boyutu: int = PARCA_BOYUTU,
+                    bilgi: Optional[Dict] = None, metrikler=None) -> Iterator[str]:
+    """Dosyayı bir kez, parça parça okuyup çözülmüş metin parçaları üretir
+
+    Okuma UTF-8 ile başlar. Geçersiz bir bayt dizisine rastlanırsa o noktaya
+    kadar çözülen metin korunur, dosyanın geri kalanı tek baytlı Türkçe
+    kodlamayla okunur. Tek baytlı kodlamalarda parçalar birbirinden bağımsız
+    çözülebildiği için cp1254/iso-8859-9 seçimi her parçanın baytlarına göre
+    yapılır. bilgi verilirse seçilen kodlama bilgi['kodlama'] olarak yazılır.
+    metrikler verilirse okuma ve çözme süreleri parça başına ölçülür (bkz. metrikler).
+    """
+    if bilgi is None:
+        bilgi = {}
+    bilgi['kodlama'] = 'utf-8'
+    cozucu = codecs.getincrementaldecoder('utf-8')()
+
+    with open(dosya_yolu, 'rb') as f:
+        while True:
+            with olc(metrikler, 'okuma'):
+                parca = f.read(parca_boyutu)
+            son = not parca
+
+            with olc(metrikler, 'cozme', len(parca)):
+                if cozucu is not None:
+                    try:
+                        metin = cozucu.decode(parca, final=son)
+                    except UnicodeDecodeError as e:
+                        # e.object, çözücüde bekleyen baytlar ile bu parçanın birleşimidir
+                        gecerli_kisim = e.object[:e.start].decode('utf-8')
+                        kalan = e.object[e.start:]
+                        kodlama = tek_bayt_kodlama_sec(kalan)
+                        logger.debug(f"{dosya_yolu}: UTF-8 değil, {kodlama} ile okunuyor")
+                        metin = gecerli_kisim + kalan.decode(kodlama)
+                        bilgi['kodlama'] = kodlama
+                        cozucu = None
+                else:
+                    kodlama = tek_bayt_kodlama_sec(parca)
+                    metin = parca.decode(kodlama)
+                    # cp1254 gerektiren tek bir parça bile dosyayı cp1254 yapar
+                    if kodlama == 'cp1254':
+                        bilgi['kodlama'] = kodlama
+            if metrikler is not None:
+                metrikler.adet_ekle('okuma', len(parca))
+
+            if metin:
+                yield metin
+            if son:
+                break
+
+
+def _suzulmus_sozcukler(metin: str, sayilari_atla: bool, en_kisa: int) -> List[str]:
+    """Küçük harfe çevrilmiş metindeki sözcükleri tek geçişte ayırır ve süzer"""
+    sayi_mi = SAYI_DESENI.fullmatch
+    # Sayı denetimi yalnızca rakamla başlayan sözcüklerde yapılır
+    return [sozcuk for sozcuk in SOZCUK_DESENI.findall(metin)
+            if len(sozcuk) >= en_kisa
+            and not (sayilari_atla and sozcuk[0].isdigit()
+                     and (sozcuk.isdigit() or sayi_mi(sozcuk)))]
+
+
+def _kesim_noktasi(parca: str) -> int:
+    """Parçanın sonundaki (yarım kalmış olabilecek) sözcüğün başlangıç konumu"""
+    kesim = len(parca)
+    while kesim and (parca[kesim - 1].isalnum() or parca[kesim - 1] == '_'):
+        kesim -= 1
+    # Parçanın sonundaki birleşik işaret önceki harfe aittir
+    while kesim and unicodedata.combining(parca[kesim - 1]):
+        kesim -= 1
+        while kesim and (parca[kesim - 1].isalnum() or parca[kesim - 1] == '_'):
+            kesim -= 1
+    return kesim
+
+
+def sozcukleri_ayir(parcalar: Iterable[str], sayilari_atla: bool = True,
+                    en_kisa: int = 2) -> Iterator[List[str]]:
+    """Metin parçalarından her parça için süzülmüş sözcük listesi üretir
+
+    Bir parçanın sonuna kadar uzanan sözcük, NFC birleştirmesi de doğru
+    yapılsın diye küçük harfe çevrilmeden bir sonraki parçanın başına eklenir.
+    Yarım kalan sözcüğün parçaları bir listede biriktirilir ve yalnızca yeni
+    parça taranır; ayırıcısız uzun metinler (ör. küçültülmüş dosyalar) de
+    doğrusal sürede işlenir.
+    """
+    artan: List[str] = []  # Yarım kalmış sözcüğün parçaları (yalnızca sözcük karakterleri)
+    for parca in parcalar:
+        kesim = _kesim_noktasi(parca)
+        if not kesim:
+            # Parçada ayırıcı yok: tamamı yarım kalan sözcüğün devamıdır
+            artan.append(parca)
+            continue
+
+        if artan:
+            artan.append(parca[:kesim])
+            metin = ''.join(artan)
+        else:
+            metin = parca[:kesim]
+        artan = [parca[kesim:]] if kesim < len(parca) else []
+        yield _suzulmus_sozcukler(turkce_kucuk_harf(metin), sayilari_atla, en_kisa)
+
+    if artan:
+        yield _suzulmus_sozcukler(turkce_kucuk_harf(''.join(artan)), sayilari_atla, en_kisa)
+
+
+def metin_frekanslari(metin: str, sayilari_atla: bool = True, en_kisa: int = 2) -> Counter:
+    """Metindeki sözcük frekanslarını döndürür"""
+    return Counter(_suzulmus_sozcukler(turkce_kucuk_harf(metin), sayilari_atla, en_kisa))
+
+
+def metin_sozcuk_kumesi(metin: str, sayilari_atla: bool = True, en_kisa: int = 2) -> Set[str]:
+    """Metindeki tekil sözcükleri döndürür"""
+    return set(_suzulmus_sozcukler(turkce_kucuk_harf(metin), sayilari_atla, en_kisa))
+
+
+def dosya_sozcukleri(dosya_yolu: str, sayilari_atla: bool = True, en_kisa: int = 2,
+                     parca_boyutu: int = PARCA_BOYUTU,
+                     bilgi: Optional[Dict] = None) -> Iterator[str]:
+    """Dosyadaki sözcükleri küçük harfe çevrilmiş ve süzülmüş olarak üretir"""
+    parcalar = metin_parcalari(dosya_yolu, parca_boyutu, bilgi)
+    for sozcukler in sozcukleri_ayir(parcalar, sayilari_atla, en_kisa):
+        yield from sozcukler
+
+
+def dosya_frekanslari(dosya_yolu: str, sayilari_atla: bool = True,
+                      frekanslar: Optional[Counter] = None,
+                      parca_boyutu: int = PARCA_BOYUTU,
+                      bilgi: Optional[Dict] = None, metrikler=None) -> Counter:
+    """Dosyadaki sözcük frekanslarını sayar
+
+    frekanslar verilirse sayımlar bu Counter'a eklenir. bilgi verilirse
+    dosyanın kodlaması bilgi['kodlama'] olarak yazılır. metrikler verilirse
+    okuma, çözme ve ayırma aşamaları ölçülür.
+    """
+    if frekanslar is None:
+        frekanslar = Counter()
+    parcalar = metin_parcalari(dosya_yolu, parca_boyutu, bilgi, metrikler)
+    if metrikler is None:
+        for sozcukler in sozcukleri_ayir(parcalar, sayilari_atla):
+            frekanslar.update(sozcukler)
+        return frekanslar
+
+    # Okuma ve çözme metin_parcalari içinde ayrıca ölçülür, ayırma süresinden düşülür
+    sozcuk_sayisi = 0
+    with metrikler.asama('ayirma'):
+        for sozcukler in sozcukleri_ayir(parcalar, sayilari_atla):
+            frekanslar.update(sozcukler)
+            sozcuk_sayisi += len(sozcukler)
+    metrikler.adet_ekle('ayirma', sozcuk_sayisi)
+    return frekanslar
+
+
+def dosya_sozcuk_kumesi(dosya_yolu: str, sayilari_atla: bool = True,
+                        parca_boyutu: int = PARCA_BOYUTU,
+                        bilgi: Optional[Dict] = None) -> Set[str]:
+    """Dosyadaki tekil sözcükleri döndürür (kodlama bilgisi dosya_frekanslari'daki gibi)"""
+    kume = set()
+    for sozcukler in sozcukleri_ayir(metin_parcalari(dosya_yolu, parca_boyutu, bilgi), sayilari_atla):
+        kume.update(sozcukler)
+    return kume
+
+
+def dosyalari_sirali_isle(islev: Callable[[str], Any], dosya_yollari: Iterable[str],
+                          okuyucu_sayisi: int = 1, pencere: int = 0) -> Iterator[Tuple[str, Any]]:
+    """islev(dosya_yolu) çağrılarını okuyucu iş parçacıklarında yürütür
+
+    (dosya_yolu, sonuç) çiftleri, dosyalar hangi sırayla biterse bitsin,
+    verilen sırayla üretilir; birleştirme tek bir (çağıran) iş parçacığında
+    ve her çalışmada aynı sırada yapılır. Aynı anda en fazla pencere
+    (varsayılan: 2 * okuyucu_sayisi) dosya okunur ya da sonucu bekler, böylece
+    bellekte tutulan sayım sayısı sınırlıdır. Ağ depolamasında dosya açma ve
+    okuma beklemeleri örtüşür. okuyucu_sayisi 1 ise dosyalar sırayla işlenir.
+    """
+    if okuyucu_sayisi <= 1:
+        for dosya_yolu in dosya_yollari:
+            yield dosya_yolu, islev(dosya_yolu)
+        return
+
+    pencere = max(pencere or 2 * okuyucu_sayisi, okuyucu_sayisi)
+    yollar = iter(dosya_yollari)
+    bekleyenler = deque()
+    havuz = ThreadPoolExecutor(max_workers=okuyucu_sayisi, thread_name_prefix="okuyucu")
+    try:
+        for dosya_yolu in itertools.islice(yollar, pencere):
+            bekleyenler.append((dosya_yolu, havuz.submit(islev, dosya_yolu)))
+
+        while bekleyenler:
+            dosya_yolu, gelecek = bekleyenler.popleft()
+            sonuc = gelecek.result()
+            # Çağıran sonucu işlerken pencere dolu kalsın
+            for sonraki in itertools.islice(yollar, 1):
+                bekleyenler.append((sonraki, havuz.submit(islev, sonraki)))
+            yield dosya_yolu, sonuc
+    finally:
+        # Kesinti ya da hata durumunda sıradaki dosyalar okunmaz
+        # (shutdown'ın cancel_futures seçeneği Python 3.9'da geldi)
+        for _, gelecek in bekleyenler:
+            gelecek.cancel()
+        havuz.shutdown(wait=False)
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Türkçe Morfolojik Analiz - Sütunlu Sonuç Dosyası
+
+Dosya başına bir *_analiz.txt yazmak yerine tüm sonuçlar tek bir zip
+dosyasına, sözlükle kodlanmış sütunlar halinde yazılır:
+
+- Sözcükler, kökler, ek dizileri, kaynaklar ve (JSON) analizler birer kez
+  (satır başına bir değer, UTF-8) saklanır; sözcük sütunları bunlara tamsayı
+  kimlikle bağlanır.
+- Belge-sözcük sayımları (belge_id, sozcuk_id, sayi) üçlüleridir.
+- Sayısal sütunlar little-endian ham dizilerdir (.i32, .i64, .u8).
+
+Standart kütüphane ya da NumPy ile okunabilir:
+
+    import zipfile, numpy as np
+    with zipfile.ZipFile("sutunlu_sonuclar.zip") as z:
+        sozcukler = z.read("sozcukler.txt").decode("utf-8").split("\\n")
+        sayilar = np.frombuffer(z.read("kayit_sayi.i64"), "<i8")
+
+Analizlerin tamamı saklandığı için bu dosyalar ayrı makinelerde üretilmiş
+kısmi sonuçlar olarak da kullanılır (bkz. frekans_birlestir).
+
+Dosya başına metin çıktıları istenirse bu modülle yeniden üretilebilir:
+
+    python sutunlu_cikti.py analiz_sonuclari/sutunlu_sonuclar.zip --cikti-klasoru analiz_sonuclari
+"""
+
+import os
+import sys
+import json
+import zipfile
+import argparse
+from array import array
+from typing import Any, Dict, List, Optional
+
+from frekans_deposu import FrekansDeposu
+
+SUTUNLU_DOSYA_ADI = "sutunlu_sonuclar.zip"
+BICIM_SURUMU = 1
+
+# Dosya uzantısı -> (array tür kodu, açıklama)
+_SAYISAL_TURLER = {
+    '.i32': ('i', 'int32'),
+    '.i64': ('q', 'int64'),
+    '.u8': ('B', 'uint8')
+}
+
+
+def ekler_metni(ekler) -> str:
+    """Ek listesini metin çıktılarındaki biçimde yazar"""
+    ekler_str = ", ".join([f"{ek} ({kategori})" for ek, kategori in ekler])
+    return ekler_str if ekler_str else 'Yok'
+
+
+def _dizi_baytlari(dizi: array) -> bytes:
+    """Diziyi little-endian baytlara çevirir"""
+    if sys.byteorder == 'big' and dizi.itemsize > 1:
+        dizi = array(dizi.typecode, dizi)
+        dizi.byteswap()
+    return dizi.tobytes()
+
+
+def _baytlardan_dizi(veri: bytes, uzanti: str) -> array:
+    dizi = array(_SAYISAL_TURLER[uzanti][0])
+    dizi.frombytes(veri)
+    if sys.byteorder == 'big' and dizi.itemsize > 1:
+        dizi.byteswap()
+    return dizi
+
+
+def _sozluk_kimligi(sozluk: Dict[str, int], deger: str) -> int:
+    kimlik = sozluk.get(deger)
+    if kimlik is None:
+        kimlik = sozluk[deger] = len(sozluk)
+    return kimlik
+
+
+def sutunlu_yaz(frekans_verileri: FrekansDeposu, dosya_kodlamalari: Dict[str, str],
+                cikti_yolu: str, sorunlu_sutunu: bool = False) -> str:
+    """Frekans deposunu ve analizleri tek bir sütunlu zip dosyasına yazar
+
+    sorunlu_sutunu True ise depodaki işaret baytları sozcuk_sorunlu.u8
+    sütunu olarak eklenir. Yazılan dosyanın yolunu döndürür.
+    """
+    kokler: Dict[str, int] = {}
+    ek_dizileri: Dict[str, int] = {}
+    kaynaklar: Dict[str, int] = {}
+    analizler: Dict[str, int] = {}
+    sozcuk_kok = array('i')
+    sozcuk_ekler = array('i')
+    sozcuk_kaynak = array('i')
+    sozcuk_analiz = array('i')
+
+    for kimlik in range(len(frekans_verileri)):
+        veri = frekans_verileri.gorunum(kimlik)
+        sozcuk_kok.append(_sozluk_kimligi(kokler, veri.get_kok()))
+        sozcuk_ekler.append(_sozluk_kimligi(ek_dizileri, ekler_metni(veri.get_ekler())))
+        sozcuk_kaynak.append(_sozluk_kimligi(kaynaklar, veri.get_kaynak()))
+        sozcuk_analiz.append(_sozluk_kimligi(analizler, json.dumps(veri.morfolojik_analiz, ensure_ascii=False)))
+
+    # Belge sıralı kayıtlar (belge_id, sozcuk_id, sayi) üçlülerine açılır
+    kayit_belge = array('i')
+    baslangiclar = frekans_verileri.belge_baslangiclari
+    for belge_kimligi in range(frekans_verileri.belge_sayisi):
+        kayit_belge.extend(array('i', [belge_kimligi]) * (baslangiclar[belge_kimligi + 1] - baslangiclar[belge_kimligi]))
+
+    sutunlar = {
+        'sozcuk_kok.i32': sozcuk_kok,
+        'sozcuk_ekler.i32': sozcuk_ekler,
+        'sozcuk_kaynak.i32': sozcuk_kaynak,
+        'sozcuk_analiz.i32': sozcuk_analiz,
+        'sozcuk_toplam_frekans.i64': frekans_verileri.toplam_frekanslar,
+        'sozcuk_belge_frekansi.i32': frekans_verileri.belge_frekanslari,
+        'kayit_belge.i32': kayit_belge,
+        'kayit_sozcuk.i32': frekans_verileri.kayit_sozcukleri,
+        'kayit_sayi.i64': frekans_verileri.kayit_sayilari
+    }
+    if sorunlu_sutunu:
+        sutunlar['sozcuk_sorunlu.u8'] = array('B', frekans_verileri.isaretler)
+
+    bicim = {
+        'surum': BICIM_SURUMU,
+        'bayt_sirasi': 'little',
+        'belge_sayisi': frekans_verileri.belge_sayisi,
+        'sozcuk_sayisi': len(frekans_verileri),
+        'kayit_sayisi': len(frekans_verileri.kayit_sozcukleri),
+        'sutunlar': {ad: _SAYISAL_TURLER[os.path.splitext(ad)[1]][1] for ad in sutunlar}
+    }
+    belgeler = [{'yol': yol, 'kodlama': dosya_kodlamalari.get(yol)} for yol in frekans_verileri.belge_yollari]
+
+    gecici_yol = f"{cikti_yolu}.gecici"
+    with zipfile.ZipFile(gecici_yol, 'w', compression=zipfile.ZIP_DEFLATED) as z:
+        z.writestr('bicim.json', json.dumps(bicim, ensure_ascii=False, indent=2))
+        z.writestr('belgeler.json', json.dumps(belgeler, ensure_ascii=False))
+        z.writestr('sozcukler.txt', "\n".join(frekans_verileri.sozcukler))
+        z.writestr('kokler.txt', "\n".join(kokler))
+        z.writestr('ekler.txt', "\n".join(ek_dizileri))
+        z.writestr('kaynaklar.txt', "\n".join(kaynaklar))
+        z.writestr('analizler.txt', "\n".join(analizler))
+        for ad, dizi in sutunlar.items():
+            z.writestr(ad, _dizi_baytlari(dizi))
+    os.replace(gecici_yol, cikti_yolu)
+    return cikti_yolu
+
+
+def sutunlu_oku(dosya_yolu: str) -> Dict[str, Any]:
+    """Sütunlu sonuç dosyasını okur
+
+    Sözlükleri (sozcukler, kokler, ekler, kaynaklar, analizler) metin listesi,
+    sayısal sütunları array, belgeleri ise {'yol', 'kodlama'} listesi olarak
+    döndürür. Analizler JSON metinleridir (bkz. analiz_getir).
+    """
+    with zipfile.ZipFile(dosya_yolu) as z:
+        bicim = json.loads(z.read('bicim.json'))
+        if bicim.get('surum') != BICIM_SURUMU:
+            raise ValueError(f"Desteklenmeyen sütunlu sonuç sürümü: {bicim.get('surum')}")
+
+        sonuc: Dict[str, Any] = {'bicim': bicim, 'belgeler': json.loads(z.read('belgeler.json'))}
+        for ad in ('sozcukler', 'kokler', 'ekler', 'kaynaklar', 'analizler'):
+            metin = z.read(f'{ad}.txt').decode('utf-8')
+            sonuc[ad] = metin.split("\n") if metin else []
+        for ad in bicim['sutunlar']:
+            taban, uzanti = os.path.splitext(ad)
+            sonuc[taban] = _baytlardan_dizi(z.read(ad), uzanti)
+    return sonuc
+
+
+def analiz_getir(veri: Dict[str, Any], kimlik: int) -> Optional[dict]:
+    """sutunlu_oku ile okunmuş sonuçta bir sözcüğün analizini döndürür"""
+    return json.loads(veri['analizler'][veri['sozcuk_analiz'][kimlik]])
+
+
+def belge_araliklari(veri: Dict[str, Any]) -> List[range]:
+    """Her belgenin kayıt aralığını (kayıtlar belge sırasıyla yazıldığı için bitişiktir) döndürür"""
+    kayit_belge = veri['kayit_belge']
+    araliklar = []
+    bas = 0
+    for belge_kimligi in range(len(veri['belgeler'])):
+        son = bas
+        while son < len(kayit_belge) and kayit_belge[son] == belge_kimligi:
+            son += 1
+        araliklar.append(range(bas, son))
+        bas = son
+    return araliklar
+
+
+def metin_olarak_disa_aktar(dosya_yolu: str, cikti_klasoru: str) -> List[str]:
+    """Sütunlu sonuçtan dosya başına *_analiz.txt çıktılarını üretir
+
+    Çıktılar doğrudan metin biçiminde yazılanlarla aynıdır; sonuç dosyasında
+    sorunlu sütunu varsa 'Sorunlu' sütunu da yazılır. Yazılan dosyaları döndürür.
+    """
+    veri = sutunlu_oku(dosya_yolu)
+    sozcukler, kokler, ekler, kaynaklar = veri['sozcukler'], veri['kokler'], veri['ekler'], veri['kaynaklar']
+    sozcuk_kok, sozcuk_ekler, sozcuk_kaynak = veri['sozcuk_kok'], veri['sozcuk_ekler'], veri['sozcuk_kaynak']
+    sorunlu = veri.get('sozcuk_sorunlu')
+    kayit_sozcuk, kayit_sayi = veri['kayit_sozcuk'], veri['kayit_sayi']
+
+    if not os.path.exists(cikti_klasoru):
+        os.makedirs(cikti_klasoru)
+
+    yazilanlar = []
+    for belge, aralik in zip(veri['belgeler'], belge_araliklari(veri)):
+        kayitlar = list(zip(kayit_sozcuk[aralik.start:aralik.stop], kayit_sayi[aralik.start:aralik.stop]))
+
+        dosya_adi = os.path.basename(belge['yol'])
+        cikti_dosyasi = os.path.join(cikti_klasoru, f"{os.path.splitext(dosya_adi)[0]}_analiz.txt")
+        with open(cikti_dosyasi, 'w', encoding='utf-8') as f:
+            f.write(f"# Dosya: {belge['yol']}\n")
+            f.write(f"# Kodlama: {belge['kodlama']}\n")
+            f.write(f"# Toplam sözcük sayısı: {sum(sayi for _, sayi in kayitlar)}\n")
+            f.write(f"# Benzersiz sözcük sayısı: {len(kayitlar)}\n\n")
+            f.write("# Sözcük\tFrekans\tKök\tEkler\tKaynak" + ("\tSorunlu\n" if sorunlu is not None else "\n"))
+
+            # Frekansa göre sırala (en yüksekten en düşüğe)
+            for kimlik, sayi in sorted(kayitlar, key=lambda x: x[1], reverse=True):
+                f.write(f"{sozcukler[kimlik]}\t{sayi}\t{kokler[sozcuk_kok[kimlik]]}\t"
+                        f"{ekler[sozcuk_ekler[kimlik]]}\t{kaynaklar[sozcuk_kaynak[kimlik]]}")
+                if sorunlu is not None:
+                    f.write(f"\t{'Evet' if sorunlu[kimlik] else 'Hayır'}")
+                f.write("\n")
+
+        yazilanlar.append(cikti_dosyasi)
+    return yazilanlar
+
+
+def main():
+    """Sütunlu sonuçtan dosya başına metin çıktıları üretir"""
+    parser = argparse.ArgumentParser(description='Türkçe Morfolojik Analiz - Sütunlu Sonuçları Metne Aktarma')
+    parser.add_argument('sonuc_dosyasi', help='Sütunlu sonuç dosyası (sutunlu_sonuclar.zip)')
+    parser.add_argument('--cikti-klasoru', '-c', default='analiz_sonuclari', help='Metin çıktılarının yazılacağı klasör')
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.sonuc_dosyasi):
+        print(f"Hata: Dosya bulunamadı: {args.sonuc_dosyasi}")
+        return
+
+    yazilanlar = metin_olarak_disa_aktar(args.sonuc_dosyasi, args.cikti_klasoru)
+    print(f"{len(yazilanlar)} dosya analizi kaydedildi: {args.cikti_klasoru}")
+
+if __name__ == "__main__":
+    main()
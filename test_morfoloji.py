@@ -7,8 +7,10 @@ Türkçe Morfolojik Analiz - Test Modülü
 import unittest
 import os
 import tempfile
+import shutil
 import time
 from turkce_morfologik_analiz import TurkceMorfologikAnaliz
+from veritabani import MorfolojikVeritabani
 
 class TestMorfolojikAnaliz(unittest.TestCase):
     """TurkceMorfologikAnaliz sınıfı için test"""
@@ -89,6 +91,794 @@ class TestMorfolojikAnaliz(unittest.TestCase):
         self.assertEqual(sonuc['kok'], "kitap")
         self.assertGreaterEqual(len(sonuc['ekler']), 2)
     
+    def test_ek_agaci(self):
+        """Ek ağacı doğrusal taramayla aynı ekleri aynı sırada bulmalı"""
+        for sozcuk in ["kitaplarımızdan", "evlerimizde", "geldiler", "a", "güzellik"]:
+            beklenen = []
+            for kategori, ek_listesi in self.analizci.ekler.items():
+                for ek in ek_listesi:
+                    if sozcuk.endswith(ek) and len(sozcuk) > len(ek):
+                        beklenen.append((ek, kategori))
+            beklenen.sort(key=lambda x: len(x[0]), reverse=True)
+
+            self.assertEqual(self.analizci._bul_olasi_ekler(sozcuk), beklenen)
+
+    def test_onbellek(self):
+        """Tekrarlanan sözcükler önbellekten gelmeli, sözlük değişince önbellek boşalmalı"""
+        self.analizci.parcala("evde")
+        onceki = self.analizci.onbellek_istatistikleri()
+        sonuc = self.analizci.parcala("evde")
+        sonraki = self.analizci.onbellek_istatistikleri()
+
+        self.assertEqual(sonuc['kok'], "ev")
+        self.assertEqual(sonraki['isabet'], onceki['isabet'] + 1)
+
+        # Çağıranın sonucu değiştirmesi önbellekteki kaydı bozmamalı
+        sonuc['kok'] = "bozuk"
+        sonuc['ekler'].append(("x", "y"))
+        tekrar = self.analizci.parcala("evde")
+        self.assertEqual(tekrar['kok'], "ev")
+        self.assertNotIn(("x", "y"), tekrar['ekler'])
+
+        self.analizci.sozluk_ekle("masa", "isim")
+        self.assertEqual(self.analizci.onbellek_istatistikleri()['boyut'], 0)
+
+    def test_parcala_istatistikleri(self):
+        """Her çözümleme yolu ayrı sayılmalı, gecikme yüzdelikleri kova duyarlığında olmalı"""
+        from metrikler import GecikmeHistogrami
+
+        temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        temp_db.close()
+        analizci = TurkceMorfologikAnaliz(veritabani_path=temp_db.name,
+                                          zemberek_jar_path="non-existent.jar", interaktif=False)
+        try:
+            analizci.sozluk_ekle("güzel", "sıfat")
+            analizci.parcala("güzeller")
+            analizci.parcala("güzeller")
+            analizci.parcala_toplu(["güzel", "güzeller"])
+            yollar = analizci.istatistikler()['yollar']
+        finally:
+            analizci.kapat()
+            os.unlink(temp_db.name)
+        self.assertEqual({yol: ist['sayi'] for yol, ist in yollar.items()},
+                         {'tek_ek': 1, 'onbellek': 1, 'toplu_onbellek': 1, 'bilinen_kok': 1})
+        self.assertAlmostEqual(sum(ist['oran'] for ist in yollar.values()), 1.0)
+
+        histogram = GecikmeHistogrami()
+        for deger in range(1, 100001):
+            histogram.ekle(deger)
+        for oran in (0.5, 0.9, 0.99):
+            self.assertAlmostEqual(histogram.yuzdelik(oran), oran * 100000, delta=oran * 100000 * 0.04)
+        self.assertEqual(histogram.en_buyuk, 100000)
+        self.assertLess(len(histogram.kovalar), 300)
+
+    def test_parcala_toplu(self):
+        """Toplu çözümleme tek tek çözümlemeyle aynı sonuçları vermeli"""
+        sozcukler = ["evlerde", "kitaplar", "gel", "evlerde", "Evden"]
+        sonuclar = self.analizci.parcala_toplu(sozcukler)
+
+        self.assertEqual(list(sonuclar), ["evlerde", "kitaplar", "gel", "Evden"])
+        for sozcuk, sonuc in sonuclar.items():
+            self.assertEqual(sonuc['kok'], self.analizci.parcala(sozcuk)['kok'])
+
+    def test_uzun_sozcuk_not_tablosu(self):
+        """Özyinelemeli parçalamada her (önek, derinlik) çifti bir kez çözümlenmeli"""
+        temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        temp_db.close()
+        analizci = TurkceMorfologikAnaliz(
+            veritabani_path=temp_db.name,
+            zemberek_jar_path="non-existent.jar",
+            interaktif=False,
+            onbellek_boyutu=0
+        )
+
+        # Birbiriyle örtüşen ekler aynı öneke farklı yollardan ulaşılmasını sağlar
+        for ek in ["r", "t", "rt", "tr"]:
+            analizci.ek_ekle(ek, "deneme")
+
+        cagrilar = []
+        asil_adimlar = analizci._parcala_adimlari
+
+        def sayan_adimlar(onek, derinlik, not_tablosu):
+            cagrilar.append((onek, derinlik))
+            return asil_adimlar(onek, derinlik, not_tablosu)
+
+        analizci._parcala_adimlari = sayan_adimlar
+        try:
+            sozcuk = "kelamrtrtrt"
+            analizci.parcala(sozcuk)
+        finally:
+            analizci.kapat()
+            os.unlink(temp_db.name)
+
+        self.assertEqual(len(cagrilar), len(set(cagrilar)))
+        self.assertLessEqual(len(cagrilar), len(sozcuk) * analizci.max_derinlik)
+
+    def test_yazma_tamponu(self):
+        """Tampondaki yazmalar okunabilmeli ve kapanışta diske yazılmalı"""
+        temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        temp_db.close()
+        analizci = TurkceMorfologikAnaliz(
+            veritabani_path=temp_db.name,
+            zemberek_jar_path="non-existent.jar",
+            interaktif=False,
+            onbellek_boyutu=0,
+            yazma_tamponu=1000
+        )
+        try:
+            analizci.sozluk_ekle("masa", "isim")
+            analizci.parcala("masalar")
+            self.assertGreater(analizci.veritabani.tampon_istatistikleri()['bekleyen_yazma'], 0)
+            self.assertIsNotNone(analizci.veritabani.sozcuk_analizi_getir("masalar"))
+        finally:
+            analizci.kapat()
+
+        veritabani = MorfolojikVeritabani(temp_db.name)
+        try:
+            self.assertIsNotNone(veritabani.sozcuk_analizi_getir("masalar"))
+        finally:
+            veritabani.kapat()
+            os.unlink(temp_db.name)
+
+    def test_yazma_tamponu_suresi(self):
+        """Süre eşiği dolunca yeni yazma beklenmeden kaydedilmeli, kilit bırakılmalı"""
+        import sqlite3
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        db_yolu = os.path.join(temp_dir, "sure.db")
+        veritabani = MorfolojikVeritabani(db_yolu, tampon_boyutu=1000, tampon_suresi=0.2)
+        try:
+            veritabani.kok_ekle("masa")
+            self.assertTrue(veritabani.conn.in_transaction)
+
+            time.sleep(0.6)
+            self.assertFalse(veritabani.conn.in_transaction)
+            diger = sqlite3.connect(db_yolu, timeout=0)
+            self.assertEqual(diger.execute("SELECT COUNT(*) FROM kokler WHERE kok = 'masa'").fetchone(), (1,))
+            diger.execute("INSERT INTO kokler (kok, tur) VALUES ('kalem', 'isim')")
+            diger.commit()
+            diger.close()
+            self.assertEqual(veritabani.tampon_istatistikleri()['bosaltma_sayisi'], 1)
+        finally:
+            veritabani.kapat()
+
+    def test_toplu_getir_kilit_almaz(self):
+        """Toplu okuma transaction açmamalı; başka bağlantı hemen yazabilmeli"""
+        import sqlite3
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        db_yolu = os.path.join(temp_dir, "okuma.db")
+        veritabani = MorfolojikVeritabani(db_yolu, tampon_boyutu=1000, tampon_suresi=60)
+        try:
+            veritabani.sozcuk_analizi_kaydet("evler", 1, '{"kok": "ev"}')
+            veritabani.tamponu_bosalt()
+
+            # Parametre sınırını aşan liste birden fazla sorguya bölünür
+            sozcukler = [f"sozcuk{i}" for i in range(2500)] + ["evler", "evler"]
+            self.assertEqual(veritabani.sozcuk_analizleri_toplu_getir(sozcukler), {"evler": {"kok": "ev"}})
+            self.assertFalse(veritabani.conn.in_transaction)
+
+            diger = sqlite3.connect(db_yolu, timeout=0)
+            diger.execute("INSERT INTO kokler (kok, tur) VALUES ('masa', 'isim')")
+            diger.commit()
+            diger.close()
+        finally:
+            veritabani.kapat()
+
+    def test_toplu_yazma(self):
+        """Toplu yazmalar tekli yazmalarla aynı veritabanı durumunu üretmeli"""
+        gecici_klasor = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, gecici_klasor)
+        kokler = [("ev", "isim", "manuel"), ("git", "fiil", "manuel"), ("ev", "isim", "manuel")]
+        sorunlular = [("qwx", "beklemede", ""), ("qwx", "bilinmiyor", "iki kez")]
+        tablolar = {}
+        for kip in ('tekli', 'toplu'):
+            veritabani = MorfolojikVeritabani(os.path.join(gecici_klasor, f"{kip}.db"))
+            if kip == 'tekli':
+                kimlikler = {kok: veritabani.kok_ekle(kok, tur, kaynak) for kok, tur, kaynak in kokler}
+                veritabani.ek_ekle("cik", "yapim_ekleri")
+                veritabani.sozcuk_analizi_kaydet("evler", kimlikler["ev"], '{"kok": "ev"}')
+                veritabani.sozcuk_analizi_kaydet("evler", kimlikler["ev"], '{"kok": "ev", "ekler": ["ler"]}')
+                for sorunlu in sorunlular:
+                    veritabani.sorunlu_sozcuk_ekle(*sorunlu)
+            else:
+                kimlikler = veritabani.kok_ekle_toplu(kokler)
+                self.assertTrue(veritabani.ek_ekle_toplu([("cik", "yapim_ekleri")]))
+                self.assertTrue(veritabani.sozcuk_analizi_kaydet_toplu([
+                    ("evler", kimlikler["ev"], '{"kok": "ev"}'),
+                    ("evler", kimlikler["ev"], '{"kok": "ev", "ekler": ["ler"]}')]))
+                self.assertTrue(veritabani.sorunlu_sozcuk_ekle_toplu(iter(sorunlular)))
+            self.assertEqual(set(kimlikler), {"ev", "git"})
+            cursor = veritabani.conn.cursor()
+            tablolar[kip] = [
+                cursor.execute("SELECT id, kok, tur, frekans, kaynak FROM kokler ORDER BY id").fetchall(),
+                cursor.execute("SELECT ek, kategori, frekans FROM ekler ORDER BY id").fetchall(),
+                cursor.execute("SELECT sozcuk, kok_id, analiz_json, frekans FROM sozcuk_analizleri").fetchall(),
+                cursor.execute("SELECT sozcuk, durum, not_metni, deneme_sayisi FROM sorunlu_sozcukler").fetchall()
+            ]
+            veritabani.kapat()
+        self.assertEqual(tablolar['tekli'], tablolar['toplu'])
+        self.assertEqual(tablolar['toplu'][0][0][3], 2)
+
+    def test_kok_kimlik_haritasi(self):
+        """Bilinen kökün ID'si sorgusuz dönmeli, frekans artışları commit'te yazılmalı"""
+        import sqlite3
+        gecici_klasor = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, gecici_klasor)
+        db_yolu = os.path.join(gecici_klasor, "kokler.db")
+        veritabani = MorfolojikVeritabani(db_yolu)
+        kok_id = veritabani.kok_ekle("ev")
+        veritabani.kapat()
+
+        veritabani = MorfolojikVeritabani(db_yolu)
+        self.assertIn("ev", veritabani.get_bilinen_kokler())
+        sorgular = []
+        veritabani.conn.set_trace_callback(sorgular.append)
+        with veritabani.toplu_islem():
+            for _ in range(5):
+                self.assertEqual(veritabani.kok_ekle("ev"), kok_id)
+            self.assertEqual(sorgular, [])
+        self.assertEqual(len([s for s in sorgular if s.startswith("UPDATE kokler")]), 1)
+        self.assertEqual(veritabani.kok_ekle_toplu([("ev", "isim", "x"), ("kitap", "isim", "x")])["ev"], kok_id)
+        veritabani.kapat()
+
+        conn = sqlite3.connect(db_yolu)
+        self.assertEqual(dict(conn.execute("SELECT kok, frekans FROM kokler")), {"ev": 7, "kitap": 1})
+        conn.close()
+
+    def test_normalize_analizler(self):
+        """Eski JSON satırları taşınmalı, yeni analizlerin kaynağı ve ekleri tablolara yazılmalı"""
+        import json
+        import sqlite3
+        gecici_klasor = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, gecici_klasor)
+        db_yolu = os.path.join(gecici_klasor, "eski.db")
+        conn = sqlite3.connect(db_yolu)
+        conn.execute("CREATE TABLE kokler (id INTEGER PRIMARY KEY, kok TEXT UNIQUE, tur TEXT, "
+                     "frekans INTEGER DEFAULT 1, guven_puani INTEGER DEFAULT 50, kaynak TEXT)")
+        conn.execute("CREATE TABLE ekler (id INTEGER PRIMARY KEY, ek TEXT, kategori TEXT, "
+                     "frekans INTEGER DEFAULT 1, UNIQUE(ek, kategori))")
+        conn.execute("CREATE TABLE sozcuk_analizleri (id INTEGER PRIMARY KEY, sozcuk TEXT UNIQUE, kok_id INTEGER, "
+                     "analiz_json TEXT, frekans INTEGER DEFAULT 1, son_guncelleme TIMESTAMP)")
+        conn.execute("INSERT INTO ekler (ek, kategori) VALUES ('ler', 'isim_cekimleri'), ('de', 'isim_cekimleri')")
+        conn.executemany("INSERT INTO sozcuk_analizleri (sozcuk, analiz_json) VALUES (?, ?)", [
+            ("evlerde", json.dumps({'kok': 'ev', 'ekler': [('ler', 'isim_cekimleri'), ('de', 'isim_cekimleri')],
+                                    'source': 'kendi_analiz_recursif'})),
+            ("evler", json.dumps({'kok': 'ev', 'ekler': [('Noun+A3pl', 'zemberek')], 'source': 'zemberek'})),
+            ("evim", json.dumps({'kok': 'ev', 'ekler': ['im', ('de', 'isim_cekimleri')], 'source': 'eski'})),
+            ("bozuk", "{")])
+        conn.commit()
+        conn.close()
+
+        veritabani = MorfolojikVeritabani(db_yolu)
+        cursor = veritabani.conn.cursor()
+
+        def ekleri(sozcuk):
+            return cursor.execute(
+                "SELECT e.ek FROM sozcuk_analizleri sa JOIN sozcuk_ekleri se ON se.sozcuk_id = sa.id "
+                "JOIN ekler e ON e.id = se.ek_id WHERE sa.sozcuk = ? ORDER BY se.sira", (sozcuk,)).fetchall()
+
+        self.assertEqual(dict(cursor.execute("SELECT sozcuk, kaynak FROM sozcuk_analizleri")),
+                         {"evlerde": "kendi_analiz_recursif", "evler": "zemberek", "evim": "eski", "bozuk": None})
+        self.assertEqual(ekleri("evlerde"), [("ler",), ("de",)])
+        # [ek, kategori] biçiminde olmayan ek öğeleri taşınmaz
+        self.assertEqual(ekleri("evim"), [("de",)])
+        self.assertEqual(ekleri("evler"), [("Noun+A3pl",)])
+        # Yalnızca analizde geçen ek analizcinin ek listesine girmemeli
+        self.assertNotIn("zemberek", veritabani.get_bilinen_ekler())
+
+        analiz = {'kok': 'ev', 'ekler': [('ler', 'isim_cekimleri')], 'source': 'kendi_analiz'}
+        veritabani.sozcuk_analizi_kaydet("evler", 1, json.dumps(analiz), analiz)
+        analiz = {'kok': 'ev', 'ekler': [('de', 'isim_cekimleri')], 'source': 'kendi_analiz'}
+        veritabani.sozcuk_analizi_kaydet_toplu([("evde", 1, json.dumps(analiz))])
+        self.assertEqual(ekleri("evler"), [("ler",)])
+        self.assertEqual(ekleri("evde"), [("de",)])
+        veritabani.sozcuk_analizi_kaydet("evlerde", 1, '{"kok": "ev", "ekler": ["ler", ["de", "isim_cekimleri"]]}')
+        veritabani.tamponu_bosalt()
+        self.assertEqual(ekleri("evlerde"), [("de",)])
+        self.assertEqual(veritabani._bekleyen_ekler, {})
+        self.assertEqual(cursor.execute("SELECT kaynak FROM sozcuk_analizleri WHERE sozcuk = 'evde'").fetchone(),
+                         ("kendi_analiz",))
+        veritabani.kapat()
+
+    def test_kok_ve_ek_tahmini(self):
+        """Kök adayları öneklerden uzundan kısaya bulunmalı, kalan kısım bilinen eklerle eşleşmeli"""
+        import sqlite3
+        from sorunlu_duzeltme_araci import (veritabanini_baglat, ek_agacini_yukle,
+                                            olasi_kokler_getir, kok_ve_ek_tahmini_yap)
+
+        gecici_klasor = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, gecici_klasor)
+        db_yolu = os.path.join(gecici_klasor, "tahmin.db")
+        veritabani = MorfolojikVeritabani(db_yolu)
+        veritabani.kok_ekle_toplu([(kok, "isim", "deneme") for kok in ("kitap", "kit", "kitaplık", "ev")])
+        veritabani.tamponu_bosalt()
+        veritabani.kapat()
+
+        conn = veritabanini_baglat(db_yolu)
+        self.assertEqual([kok for kok, tur in olasi_kokler_getir("kitaplarda", conn)], ["kitap", "kit"])
+        self.assertEqual(olasi_kokler_getir("qwxz", conn), [])
+        # Parametre sınırını aşan uzunlukta sözcükler parça parça sorgulanmalı
+        # (eski SQLite sürümlerindeki 999 sınırı, destekleniyorsa burada da kurulur)
+        if hasattr(conn, 'setlimit'):
+            conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+        self.assertEqual([kok for kok, tur in olasi_kokler_getir("kitap" + "x" * 5000, conn)], ["kitap", "kit"])
+        self.assertEqual(olasi_kokler_getir("kitap" + "x" * 5000, conn, limit=1), [("kitap", "isim")])
+
+        ek_agaci = ek_agacini_yukle(conn)
+        tahminler = kok_ve_ek_tahmini_yap("kitaplarda", conn, ek_agaci)
+        self.assertEqual(tahminler, kok_ve_ek_tahmini_yap("kitaplarda", conn))
+        self.assertEqual(tahminler[0][0], "kitap")
+        for kok, ek in tahminler:
+            self.assertTrue(("kitaplarda"[len(kok):]).endswith(ek))
+        self.assertIn(("kitap", "da"), tahminler)
+        self.assertEqual(kok_ve_ek_tahmini_yap("ev", conn, ek_agaci), [("ev", "")])
+        conn.close()
+
+    def test_paralel_parcala(self):
+        """İşçi süreçlerin analizleri tek süreçle aynı olmalı ve ana süreçte kaydedilmeli"""
+        from paralel_analiz import paralel_parcala
+
+        sozcukler = sorted(["evlerde", "kitaplar", "gelir", "güzeller", "yapar", "qwxz"])
+        sonuclar = {}
+        for parti_sonuclari in paralel_parcala(self.analizci, sozcukler, isci_sayisi=2, parti_boyutu=2):
+            sonuclar.update(parti_sonuclari)
+
+        self.assertEqual(list(sonuclar), sozcukler)
+        for sozcuk in sozcukler:
+            self.assertEqual(sonuclar[sozcuk]['kok'], self.analizci.parcala(sozcuk)['kok'])
+        self.assertIsNotNone(self.analizci.veritabani.sozcuk_analizi_getir("evlerde"))
+
+    def test_akisli_sozcuk_ayirici(self):
+        """Parça sınırında bölünen sözcükler ve çok baytlı harfler doğru birleşmeli"""
+        from sozcuk_ayirici import dosya_frekanslari
+
+        metin = "Güzel kitaplar, güzel evler!\nÇocuğun 123 kitabı; 2ler evde."
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', encoding='utf-8', delete=False) as f:
+            f.write(metin)
+        try:
+            beklenen = dosya_frekanslari(f.name)
+            for parca_boyutu in (1, 2, 3, 5, 8):
+                self.assertEqual(dosya_frekanslari(f.name, parca_boyutu=parca_boyutu), beklenen)
+        finally:
+            os.unlink(f.name)
+
+        self.assertEqual(beklenen["güzel"], 2)
+        self.assertIn("çocuğun", beklenen)
+        self.assertNotIn("123", beklenen)
+        self.assertNotIn("2ler", beklenen)
+
+        # Ayırıcısız uzun bir sözcük birçok parçaya bölünse de tek sözcük kalmalı
+        from sozcuk_ayirici import sozcukleri_ayir
+        parcalar = ["kitap"] * 1000 + ["lar evler"]
+        sozcukler = [s for liste in sozcukleri_ayir(parcalar) for s in liste]
+        self.assertEqual(sozcukler, ["kitap" * 1000 + "lar", "evler"])
+
+    def test_kodlama_tespiti(self):
+        """UTF-8 olmayan dosyalarda cp1254 ve iso-8859-9 ayırt edilmeli"""
+        from sozcuk_ayirici import dosya_sozcuk_kumesi, kodlama_tespit_et
+
+        metin = "Işık ağaçlar \u201cgüzel\u201d şeyler"
+        self.assertEqual(kodlama_tespit_et(metin.encode('utf-8')), 'utf-8')
+        self.assertEqual(kodlama_tespit_et(metin.encode('cp1254')), 'cp1254')
+        self.assertEqual(kodlama_tespit_et("Işık ağaçlar".encode('iso-8859-9')), 'iso-8859-9')
+
+        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as f:
+            f.write(metin.encode('cp1254'))
+        try:
+            bilgi = {}
+            sozcukler = dosya_sozcuk_kumesi(f.name, bilgi=bilgi, parca_boyutu=4)
+        finally:
+            os.unlink(f.name)
+
+        self.assertEqual(bilgi['kodlama'], 'cp1254')
+        self.assertEqual(sozcukler, {"ışık", "ağaçlar", "güzel", "şeyler"})
+
+    def test_turkce_kucuk_harf(self):
+        """İ/I doğru küçültülmeli, ayrışık yazılmış harfler birleştirilmeli"""
+        from sozcuk_ayirici import metin_frekanslari, turkce_kucuk_harf
+
+        self.assertEqual(turkce_kucuk_harf("İSTANBUL IŞIK"), "istanbul ışık")
+        self.assertEqual(turkce_kucuk_harf("I\u0307stanbul"), "istanbul")
+
+        frekanslar = metin_frekanslari("İstanbul istanbul I\u0307STANBUL Işık ışık")
+        self.assertEqual(frekanslar, {"istanbul": 3, "ışık": 2})
+
+    def test_dosyalari_sirali_isle(self):
+        """Eşzamanlı okunan dosyaların sonuçları verilen sırayla gelmeli"""
+        from sozcuk_ayirici import dosyalari_sirali_isle
+
+        yollar = [f"dosya{i}.txt" for i in range(20)]
+
+        def oku(dosya_yolu):
+            # Önceki dosyalar daha geç bitsin
+            time.sleep(0.001 * (20 - int(dosya_yolu[5:-4])))
+            return dosya_yolu.upper()
+
+        for okuyucu_sayisi in (1, 4):
+            sonuclar = list(dosyalari_sirali_isle(oku, yollar, okuyucu_sayisi, pencere=6))
+            self.assertEqual(sonuclar, [(yol, yol.upper()) for yol in yollar])
+
+        def hatali_oku(dosya_yolu):
+            raise OSError(dosya_yolu)
+
+        with self.assertRaises(OSError):
+            list(dosyalari_sirali_isle(hatali_oku, yollar, 4))
+
+    def test_frekans_deposu(self):
+        """Sütunlu depo sözcük ve belge frekanslarını sözlüklerle aynı vermeli"""
+        from collections import Counter
+        from frekans_deposu import FrekansDeposu
+
+        belgeler = {
+            "a.txt": Counter({"ev": 3, "kitap": 1}),
+            "b.txt": Counter({"kitap": 2, "gel": 1}),
+            "c.txt": Counter({"ev": 1})
+        }
+        depo = FrekansDeposu()
+        for dosya_yolu, frekanslar in belgeler.items():
+            depo.belge_ekle(dosya_yolu, frekanslar)
+
+        self.assertEqual(len(depo), 3)
+        self.assertEqual(depo["ev"].toplam_frekans, 4)
+        self.assertEqual(depo["ev"].belge_frekansi, 2)
+        self.assertEqual(depo["ev"].belgeler, {"a.txt": 3, "c.txt": 1})
+        self.assertEqual(depo.belge_frekanslari_getir("b.txt"), {"kitap": 2, "gel": 1})
+        self.assertEqual([sozcuk for sozcuk, _ in depo.frekansa_gore_sirali()], ["ev", "kitap", "gel"])
+
+        depo["gel"].analiz_ekle({'kok': 'gel', 'ekler': [], 'source': 'kokler_db'})
+        self.assertEqual(depo["gel"].get_kaynak(), 'kokler_db')
+        self.assertEqual(depo["ev"].get_kok(), 'ev')
+
+        # Yeni belge eklenince sözcük sıralı dizin yeniden kurulmalı
+        depo.belge_ekle("d.txt", Counter({"ev": 2}))
+        self.assertEqual(depo["ev"].belgeler, {"a.txt": 3, "c.txt": 1, "d.txt": 2})
+
+    def test_dosya_manifestosu(self):
+        """Değişmemiş dosyalar manifestodan, değişenler yeniden okunmalı"""
+        from collections import Counter
+        from dosya_manifestosu import DosyaManifestosu
+
+        gecici_klasor = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, gecici_klasor)
+        dosya_yolu = os.path.join(gecici_klasor, "metin.txt")
+        with open(dosya_yolu, 'w', encoding='utf-8') as f:
+            f.write("ev evler kitap")
+
+        manifesto = DosyaManifestosu(os.path.join(gecici_klasor, "manifesto.db"))
+        self.assertIsNone(manifesto.degismemis_kayit(dosya_yolu))
+        manifesto.dosya_kaydet(dosya_yolu, Counter({"ev": 1, "evler": 1, "kitap": 1}), 'utf-8')
+        manifesto.analizleri_kaydet({"ev": {'kok': 'ev', 'ekler': [], 'source': 'kokler_db'},
+                                     "evler": {'kok': 'evler', 'ekler': [], 'source': 'varsayilan'}})
+
+        kayit = manifesto.degismemis_kayit(dosya_yolu)
+        self.assertIsNotNone(kayit)
+        self.assertEqual(manifesto.frekanslari_getir(kayit['id']), {"ev": 1, "evler": 1, "kitap": 1})
+        # Çözümlenemeyen sözcüğün varsayılan analizi saklanmamalı
+        self.assertEqual(list(manifesto.analizleri_getir(["ev", "evler", "kitap"])), ["ev"])
+
+        # Dokunulmuş ama içeriği aynı dosya değişmemiş sayılmalı
+        os.utime(dosya_yolu, ns=(0, 0))
+        self.assertIsNotNone(manifesto.degismemis_kayit(dosya_yolu))
+
+        with open(dosya_yolu, 'a', encoding='utf-8') as f:
+            f.write(" defter")
+        self.assertIsNone(manifesto.degismemis_kayit(dosya_yolu))
+        manifesto.kapat()
+
+    def test_kontrol_noktasi(self):
+        """Yarıda kesilen belge eklemesi geri alınıp kontrol noktasına yazılmamalı"""
+        from collections import Counter
+        from frekans_deposu import FrekansDeposu
+        from kontrol_noktasi import KontrolNoktasi
+
+        class KesilenSayim(dict):
+            def __iter__(self):
+                for i, sozcuk in enumerate(super().__iter__()):
+                    if i == 2:
+                        raise KeyboardInterrupt
+                    yield sozcuk
+
+        depo = FrekansDeposu()
+        depo.belge_ekle("a.txt", Counter({"ev": 2, "kitap": 1}))
+        with self.assertRaises(KeyboardInterrupt):
+            depo.belge_ekle("b.txt", KesilenSayim({"ev": 1, "okul": 1, "defter": 1}))
+
+        # Serileştirme depoyu değiştirmemeli; geri alma kaydedenin işidir
+        import pickle
+        pickle.dumps(depo)
+        self.assertEqual(list(depo), ["ev", "kitap", "okul"])
+        depo.yarim_belgeyi_geri_al()
+        self.assertEqual(list(depo), ["ev", "kitap"])
+
+        gecici_klasor = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, gecici_klasor)
+        kontrol = KontrolNoktasi(os.path.join(gecici_klasor, "kontrol.pkl"))
+        kontrol.durum = {'frekans_verileri': depo}
+        kontrol.kaydet()
+
+        yuklenen = KontrolNoktasi(kontrol.dosya_yolu).yukle()['frekans_verileri']
+        self.assertEqual(list(yuklenen), ["ev", "kitap"])
+        self.assertEqual(yuklenen.belge_sayisi, 1)
+        self.assertEqual(yuklenen["ev"].toplam_frekans, 2)
+
+        # Devam eden çalışma aynı belgeyi yeniden ekleyebilmeli
+        yuklenen.belge_ekle("b.txt", Counter({"ev": 1, "okul": 1, "defter": 1}))
+        self.assertEqual(yuklenen["ev"].belgeler, {"a.txt": 2, "b.txt": 1})
+
+        kontrol.sil()
+        self.assertFalse(os.path.exists(kontrol.dosya_yolu))
+
+    def test_sutunlu_cikti(self):
+        """Sütunlu sonuçlar analizleri bir kez saklamalı ve metne geri aktarılabilmeli"""
+        from collections import Counter
+        from frekans_deposu import FrekansDeposu
+        from sutunlu_cikti import metin_olarak_disa_aktar, sutunlu_oku, sutunlu_yaz
+
+        depo = FrekansDeposu()
+        depo.belge_ekle("metinler/a.txt", Counter({"evler": 3, "ev": 1}))
+        depo.belge_ekle("metinler/b.txt", Counter({"ev": 2}))
+        depo["evler"].analiz_ekle({'kok': 'ev', 'ekler': [('ler', 'isim_cekimleri')], 'source': 'kendi_analiz'})
+        depo["ev"].analiz_ekle({'kok': 'ev', 'ekler': [], 'source': 'kokler_db'})
+
+        gecici_klasor = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, gecici_klasor)
+        yol = sutunlu_yaz(depo, {"metinler/a.txt": 'utf-8', "metinler/b.txt": 'cp1254'},
+                          os.path.join(gecici_klasor, "sonuclar.zip"))
+
+        veri = sutunlu_oku(yol)
+        self.assertEqual(veri['kokler'], ["ev"])
+        self.assertEqual(list(veri['kayit_belge']), [0, 0, 1])
+        self.assertEqual(list(veri['kayit_sayi']), [3, 1, 2])
+        self.assertEqual(list(veri['sozcuk_toplam_frekans']), [3, 3])
+
+        yazilanlar = metin_olarak_disa_aktar(yol, gecici_klasor)
+        with open(yazilanlar[1], encoding='utf-8') as f:
+            satirlar = f.read().splitlines()
+        self.assertEqual(satirlar[1], "# Kodlama: cp1254")
+        self.assertEqual(satirlar[-1], "ev\t2\tev\tYok\tkokler_db")
+
+    def test_harici_sayac(self):
+        """Diske taşan sayaç bellekteki depoyla aynı sıralamaları ve sayımları vermeli"""
+        from collections import Counter
+        import harici_sayac
+        from frekans_deposu import FrekansDeposu
+        from harici_sayac import HariciSayac
+
+        belgeler = [(f"b{i}.txt", Counter({f"s{(i * 7 + j) % 23}": (i + j) % 5 + 1 for j in range(9)}))
+                    for i in range(12)]
+        analiz = {'kok': 'ev', 'ekler': [], 'source': 'kokler_db'}
+
+        depo = FrekansDeposu()
+        for yol, frekanslar in belgeler:
+            depo.belge_ekle(yol, frekanslar)
+        depo["s3"].analiz_ekle(analiz)
+
+        eski_sinir, eski_tasma_siniri = harici_sayac._EN_FAZLA_KOSU, harici_sayac._BELGE_TASMA_SINIRI
+        harici_sayac._EN_FAZLA_KOSU = 3  # ara birleştirmeler de denensin
+        harici_sayac._BELGE_TASMA_SINIRI = 4  # sık sözcüklerin belge kayıtları taşsın
+        sayac = HariciSayac(bellek_siniri_mb=0.001)
+        try:
+            for yol, frekanslar in belgeler:
+                sayac.belge_ekle(yol, frekanslar)
+            self.assertEqual(sayac.birlestir(), len(belgeler))
+            self.assertGreater(os.path.getsize(sayac._tasma.yol), 0)
+            self.assertEqual(len(sayac), len(depo))
+
+            sirali_sozcukler = []
+            for parti in sayac.sozcuk_partileri(4):
+                sirali_sozcukler.extend(parti)
+                if "s3" in parti:
+                    sayac.analizleri_ekle({"s3": analiz})
+            self.assertEqual(sirali_sozcukler, sorted(depo))
+
+            beklenen = [(sozcuk, veri.toplam_frekans, veri.belge_frekansi, veri.belgeler)
+                        for sozcuk, veri in depo.frekansa_gore_sirali()]
+            bulunan = [(sozcuk, veri.toplam_frekans, veri.belge_frekansi, veri.belgeler)
+                       for sozcuk, veri in sayac.frekansa_gore_sirali()]
+            self.assertEqual(bulunan, beklenen)
+
+            self.assertEqual(sayac.belge_frekanslari_getir("b5.txt"), depo.belge_frekanslari_getir("b5.txt"))
+            self.assertEqual(sayac["s3"].get_kaynak(), 'kokler_db')
+            self.assertIsNone(sayac["s4"].morfolojik_analiz)
+        finally:
+            harici_sayac._EN_FAZLA_KOSU, harici_sayac._BELGE_TASMA_SINIRI = eski_sinir, eski_tasma_siniri
+            sayac.kapat()
+        self.assertFalse(os.path.exists(sayac.klasor))
+
+        # Sınırlı bellekli analiz de analizcinin istatistiklerini metriklere eklemeli
+        from metrikler import Metrikler
+        gecici_klasor = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, gecici_klasor)
+        metrikler = Metrikler()
+        sayac = HariciSayac(bellek_siniri_mb=0.001)
+        try:
+            sayac.belge_ekle("b.txt", Counter({"kitap": 2, "güzel": 1}))
+            sayac.birlestir()
+            harici_sayac.harici_analiz_et(sayac, os.path.join(gecici_klasor, "kokler.db"), metrikler=metrikler)
+            self.assertIsNotNone(sayac["kitap"].morfolojik_analiz)
+        finally:
+            sayac.kapat()
+        ozet = metrikler.ozet()
+        self.assertEqual(ozet['asamalar']['analiz']['adet'], 2)
+        self.assertEqual(sum(yol['sayi'] for yol in ozet['analizci']['yollar'].values()), 2)
+
+    def test_yaklasik_sayim(self):
+        """Yaklaşık sayım en sık sözcükleri bulmalı ve hata sınırlarına uymalı"""
+        from collections import Counter
+        from yaklasik_sayim import YaklasikSayac
+
+        # Zipf benzeri dağılım: s{r} sözcüğü her belgede 600 // r kez geçer
+        belgeler = [Counter({f"s{r}": 600 // r for r in range(1, 400) if (r + b) % 3 or r < 50})
+                    for b in range(20)]
+        gercek = Counter()
+        belge_frekanslari = Counter()
+        for frekanslar in belgeler:
+            gercek.update(frekanslar)
+            belge_frekanslari.update(frekanslar.keys())
+
+        sayac = YaklasikSayac(ilk_k=10, orneklem_boyutu=25, epsilon=0.001)
+        for i, frekanslar in enumerate(belgeler):
+            sayac.belge_ekle(f"b{i}.txt", frekanslar)
+
+        en_sikler = sayac.en_sikler()
+        self.assertEqual(len(en_sikler), 10)
+        self.assertEqual([sozcuk for sozcuk, _, _ in en_sikler[:5]], ["s1", "s2", "s3", "s4", "s5"])
+        for sozcuk, tahmin, alt_sinir in en_sikler:
+            self.assertTrue(alt_sinir <= gercek[sozcuk] <= tahmin)
+
+        for sozcuk, sayi in gercek.items():
+            self.assertTrue(0 <= sayac.frekans_tahmini(sozcuk) - sayi <= sayac.frekanslar.hata_siniri)
+            self.assertGreaterEqual(sayac.belge_frekansi_tahmini(sozcuk), belge_frekanslari[sozcuk])
+        self.assertAlmostEqual(sayac.benzersiz.tahmin(), len(gercek), delta=len(gercek) * 0.05)
+        self.assertEqual(len(sayac.orneklem.sozcukler()), 25)
+
+        # Yaklaşık kipte kullanılmayan seçenekler sessizce yok sayılmamalı
+        import io
+        import sys
+        from contextlib import redirect_stderr
+        from unittest import mock
+        import frekans_analizi
+        for secenekler in (['-m', 'manifesto.db'], ['-p', 'parca.zip'], ['-bs', '64'], ['-b', 'sutunlu']):
+            with mock.patch.object(sys, 'argv', ['frekans_analizi.py', '-k', '.', '-y'] + secenekler), \
+                    redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+                frekans_analizi.main()
+
+    def test_metrikler(self):
+        """İç içe aşamalar ayrı ölçülmeli, metrikler JSON ve Prometheus olarak yazılmalı"""
+        import json
+        from metrikler import Metrikler, olcerek_uret
+        from sozcuk_ayirici import dosya_frekanslari
+
+        gecici_klasor = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, gecici_klasor)
+        metrikler = Metrikler(os.path.join(gecici_klasor, "m.json"), os.path.join(gecici_klasor, "m.prom"))
+
+        dosya_yolu = os.path.join(gecici_klasor, "metin.txt")
+        with open(dosya_yolu, 'w', encoding='utf-8') as f:
+            f.write("Evler ve kitaplar. " * 100)
+        frekanslar = dosya_frekanslari(dosya_yolu, parca_boyutu=256, metrikler=metrikler)
+        self.assertEqual(frekanslar["evler"], 100)
+
+        with metrikler.asama('analiz'):
+            time.sleep(0.02)
+            with metrikler.asama('kayit', 5):
+                time.sleep(0.05)
+        self.assertEqual(list(olcerek_uret(metrikler, 'cikti', [[1, 2], [3]], len)), [[1, 2], [3]])
+        metrikler.sayac_ekle('parcalanan_sozcuk', 3)
+        metrikler.yaz()
+
+        with open(os.path.join(gecici_klasor, "m.json"), encoding='utf-8') as f:
+            ozet = json.load(f)
+        asamalar = ozet['asamalar']
+        self.assertEqual(asamalar['okuma']['adet'], os.path.getsize(dosya_yolu))
+        self.assertEqual(asamalar['ayirma']['adet'], 300)
+        # Kayıt süresi analiz süresinden düşülür
+        self.assertLess(asamalar['analiz']['duvar_sn'], 0.045)
+        self.assertGreaterEqual(asamalar['kayit']['duvar_sn'], 0.05)
+        self.assertEqual(asamalar['kayit']['adet'], 5)
+        self.assertEqual((asamalar['cikti']['cagri'], asamalar['cikti']['adet']), (3, 3))
+        self.assertEqual(ozet['sayaclar'], {'parcalanan_sozcuk': 3})
+
+        with open(os.path.join(gecici_klasor, "m.prom"), encoding='utf-8') as f:
+            prometheus = f.read()
+        self.assertIn('turkce_morfoloji_asama_birim_toplam{asama="kayit"} 5', prometheus)
+        self.assertIn('turkce_morfoloji_sayac_toplam{ad="parcalanan_sozcuk"} 3', prometheus)
+
+    def test_kismi_sonuclari_birlestir(self):
+        """Kısmi sonuçların birleşimi tek depodakiyle aynı olmalı"""
+        from collections import Counter
+        from frekans_deposu import FrekansDeposu
+        from frekans_birlestir import kismi_sonuclari_birlestir
+        from sutunlu_cikti import sutunlu_yaz
+
+        belgeler = [("a.txt", Counter({"evler": 3, "ev": 1})), ("b.txt", Counter({"ev": 2, "kitap": 3})),
+                    ("c.txt", Counter({"kitap": 1, "evde": 4}))]
+        analiz = {'kok': 'ev', 'ekler': [('ler', 'isim_cekimleri')], 'source': 'kendi_analiz'}
+
+        gecici_klasor = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, gecici_klasor)
+        tek = FrekansDeposu()
+        kismi_yollar = []
+        for i, parca in enumerate((belgeler[:2], belgeler[2:])):
+            depo = FrekansDeposu()
+            for yol, frekanslar in parca:
+                depo.belge_ekle(yol, frekanslar)
+                tek.belge_ekle(yol, frekanslar)
+            depo["ev" if i == 0 else "evde"].analiz_ekle(analiz)
+            kismi_yollar.append(sutunlu_yaz(depo, {}, os.path.join(gecici_klasor, f"parca{i}.zip")))
+
+        birlesik, _, celisen = kismi_sonuclari_birlestir(kismi_yollar)
+        self.assertEqual(birlesik.sozcukler, tek.sozcukler)
+        self.assertEqual(birlesik.toplam_frekanslar, tek.toplam_frekanslar)
+        self.assertEqual(birlesik.belge_frekanslari, tek.belge_frekanslari)
+        self.assertEqual(birlesik["kitap"].belgeler, {"b.txt": 3, "c.txt": 1})
+        self.assertEqual(birlesik["evde"].get_kok(), "ev")
+        self.assertIsNone(birlesik["kitap"].morfolojik_analiz)
+        self.assertEqual(celisen, 0)
+
+        with self.assertRaises(ValueError):
+            kismi_sonuclari_birlestir(kismi_yollar + kismi_yollar[:1])
+
+    def test_performans_olcumu(self):
+        """Mikro ölçümler özet üretmeli, karşılaştırma eşiği aşan gerilemeyi bulmalı"""
+        from performans_olcumu import karsilastir, olcumleri_calistir
+
+        sonuclar = olcumleri_calistir(sozcuk_sayisi=40, tekrar=3, isinma=1,
+                                      secilenler=['_bul_olasi_ekler', 'parcala_soguk', 'parcala_sicak'])
+        self.assertEqual(set(sonuclar), {'_bul_olasi_ekler', 'parcala_soguk', 'parcala_sicak'})
+        for sonuc in sonuclar.values():
+            ozet = sonuc['ns_islem']
+            self.assertEqual(sonuc['islem_sayisi'], 40)
+            self.assertTrue(0 < ozet['en_kucuk'] <= ozet['ortanca'] <= ozet['p90'])
+
+        yavas = {ad: {'ns_islem': dict(sonuc['ns_islem'], ortanca=sonuc['ns_islem']['ortanca'] * 1.5)}
+                 for ad, sonuc in sonuclar.items()}
+        self.assertFalse(any(k['geriledi'] for k in karsilastir(sonuclar, sonuclar, esik=0.1)))
+        self.assertTrue(all(k['geriledi'] for k in karsilastir(sonuclar, yavas, esik=0.1)))
+        self.assertFalse(any(k['geriledi'] for k in karsilastir(sonuclar, yavas, esik=0.6)))
+
+    def test_olcek_olcumu(self):
+        """Yapay derlem tekrarlanabilir olmalı, araç ölçümü bellek ve veritabanı büyümesini kaydetmeli"""
+        import olcek_olcumu
+
+        kokler, ekler = olcek_olcumu.sozluk_yukle()
+        dagarcik = olcek_olcumu.sozcuk_dagarcigi(kokler, ekler, 500)
+        self.assertEqual(len(dagarcik), 500)
+        self.assertEqual(dagarcik, olcek_olcumu.sozcuk_dagarcigi(kokler, ekler, 500))
+        bilinmeyenler = olcek_olcumu.bilinmeyen_sozcukler(50)
+
+        gecici_klasor = tempfile.mkdtemp()
+        try:
+            bilgiler = []
+            for ad in ('a', 'b'):
+                bilgiler.append(olcek_olcumu.derlem_uret(os.path.join(gecici_klasor, ad), 3001, 2, dagarcik,
+                                                         bilinmeyenler, bilinmeyen_orani=0.1))
+            dosyalar = sorted(os.listdir(os.path.join(gecici_klasor, 'a')))
+            self.assertEqual(len(dosyalar), 2)
+            for dosya in dosyalar:
+                with open(os.path.join(gecici_klasor, 'a', dosya), encoding='utf-8') as f1, \
+                        open(os.path.join(gecici_klasor, 'b', dosya), encoding='utf-8') as f2:
+                    self.assertEqual(f1.read(), f2.read())
+
+            sozcukler = []
+            for dosya in dosyalar:
+                with open(os.path.join(gecici_klasor, 'a', dosya), encoding='utf-8') as f:
+                    sozcukler.extend(s.strip('.,?!').lower() for s in f.read().split())
+            self.assertEqual(len(sozcukler), 3001)
+            bilinmeyen = sum(1 for s in sozcukler if s in set(bilinmeyenler))
+            self.assertTrue(150 < bilinmeyen < 450)
+            # Zipf: en sık sözcük, listenin ortasındaki bir sözcükten çok daha sık geçer
+            self.assertGreater(sozcukler.count(dagarcik[0]), 10 * max(1, sozcukler.count(dagarcik[250])))
+
+            sonuc = olcek_olcumu.arac_calistir('frekans_analizi', os.path.join(gecici_klasor, 'a'), gecici_klasor)
+            self.assertEqual(sonuc['cikis_kodu'], 0)
+            self.assertGreater(sonuc['tepe_rss_mb'], 0)
+            self.assertGreater(sonuc['veritabani_buyume_bayt'], 0)
+            self.assertGreater(sonuc['yeni_analiz'], 0)
+        finally:
+            shutil.rmtree(gecici_klasor, ignore_errors=True)
+
     def test_metin_analizi(self):
         """Metin analizi testi"""
         test_metin = "evde kitap okuyorum ve güzel bir gün geçiriyorum"
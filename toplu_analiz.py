@@ -6,50 +6,19 @@ Klasör veya tek dosya analizi yapabilir
 """
 
 import os
-import re
 import argparse
 import time
 import glob
 from typing import Dict, Set, List, Tuple
 
-def temizle_ve_parcala(metin: str, sayilari_atla: bool = True) -> Set[str]:
-    """Metni temizler ve tekil sözcüklere ayırır"""
-    # Noktalama işaretlerini temizle
-    temiz_metin = re.sub(r'[^\w\s]', ' ', metin)
-    
-    # Sözcüklere ayır ve küçük harfe çevir
-    if sayilari_atla:
-        # Sayı içermeyen sözcükleri seç
-        sozcukler = {s.lower() for s in temiz_metin.split() 
-                    if s and len(s) > 1 and not s.isdigit() and not re.match(r'^\d+[a-zA-Z]*$', s)}
-    else:
-        # Tüm sözcükleri seç
-        sozcukler = {s.lower() for s in temiz_metin.split() if s and len(s) > 1}
-    
-    return sozcukler
-
-def dosya_oku(dosya_yolu: str) -> str:
-    """Metin dosyasını okur, farklı kodlamaları dener"""
-    kodlamalar = ['utf-8', 'latin-1', 'windows-1254', 'iso-8859-9']
-    
-    for kodlama in kodlamalar:
-        try:
-            with open(dosya_yolu, 'r', encoding=kodlama) as f:
-                return f.read()
-        except UnicodeDecodeError:
-            continue
-    
-    # Hiçbir kodlama çalışmazsa, binary olarak oku ve decode edebileceğimiz karakterleri al
-    try:
-        with open(dosya_yolu, 'rb') as f:
-            return f.read().decode('utf-8', errors='ignore')
-    except Exception as e:
-        print(f"HATA: {dosya_yolu} dosyası okunamadı: {e}")
-        return ""
+# temizle_ve_parcala adı bu modülden içe aktaranlar için korunuyor
+from sozcuk_ayirici import dosya_sozcuk_kumesi, dosyalari_sirali_isle, metin_sozcuk_kumesi as temizle_ve_parcala
 
-def analiz_et(sozcukler: Set[str], veritabani_yolu: str, zemberek_aktif: bool = False) -> Dict:
+def analiz_et(sozcukler: Set[str], veritabani_yolu: str, zemberek_aktif: bool = False,
+              parti_boyutu: int = 1000, isci_sayisi: int = 1) -> Dict:
     """Sözcükleri analiz et"""
     from turkce_morfologik_analiz import TurkceMorfologikAnaliz
+    from paralel_analiz import partiler_halinde_coz
     
     print(f"Toplam {len(sozcukler)} benzersiz sözcük analiz edilecek.")
     
@@ -64,17 +33,21 @@ def analiz_et(sozcukler: Set[str], veritabani_yolu: str, zemberek_aktif: bool =
     sonuclar = {}
     islenecek_toplam = len(sozcukler)
     
+    sirali_sozcukler = sorted(sozcukler)
+    
+    # Sözcükleri partiler halinde çözümle (kayıtlı analizler tek sorguda gelir)
     baslangic = time.time()
-    for i, sozcuk in enumerate(sorted(sozcukler)):
-        sonuclar[sozcuk] = analizci.parcala(sozcuk)
+    islenen = 0
+    for parti_sonuclari in partiler_halinde_coz(analizci, sirali_sozcukler, parti_boyutu, isci_sayisi):
+        sonuclar.update(parti_sonuclari)
+        islenen += len(parti_sonuclari)
         
         # İlerleme göster
-        if (i+1) % 100 == 0 or i+1 == islenecek_toplam:
-            gecen_sure = time.time() - baslangic
-            hiz = (i+1) / gecen_sure if gecen_sure > 0 else 0
-            kalan_sure = (islenecek_toplam - (i+1)) / hiz if hiz > 0 else 0
-            print(f"\rİlerleme: {i+1}/{islenecek_toplam} sözcük ({(i+1)/islenecek_toplam*100:.1f}%) | "
-                  f"Hız: {hiz:.1f} sözcük/sn | Kalan: {kalan_sure:.1f} sn", end="")
+        gecen_sure = time.time() - baslangic
+        hiz = islenen / gecen_sure if gecen_sure > 0 else 0
+        kalan_sure = (islenecek_toplam - islenen) / hiz if hiz > 0 else 0
+        print(f"\rİlerleme: {islenen}/{islenecek_toplam} sözcük ({islenen/islenecek_toplam*100:.1f}%) | "
+              f"Hız: {hiz:.1f} sözcük/sn | Kalan: {kalan_sure:.1f} sn", end="")
     
     print()  # Yeni satır
     
@@ -107,8 +80,13 @@ def klasordeki_dosyalari_bul(klasor_yolu: str, uzanti: str = ".txt") -> List[str
 
 def dosyalari_analiz_et(dosya_yollari: List[str], veritabani_yolu: str, 
                        cikti_klasoru: str, ozet_dosyasi: str,
-                       zemberek_aktif: bool = False, sayilari_atla: bool = True) -> Dict:
-    """Birden fazla dosyayı analiz eder ve sonuçları dosya başına kaydeder"""
+                       zemberek_aktif: bool = False, sayilari_atla: bool = True,
+                       isci_sayisi: int = 1, okuyucu_sayisi: int = 1) -> Dict:
+    """Birden fazla dosyayı analiz eder ve sonuçları dosya başına kaydeder
+    
+    okuyucu_sayisi > 1 ise dosyalar iş parçacıklarında eşzamanlı okunur;
+    sözcükler yine dosya listesinin sırasıyla birleştirilir.
+    """
     if not dosya_yollari:
         print("İşlenecek dosya bulunamadı.")
         return {}
@@ -120,12 +98,19 @@ def dosyalari_analiz_et(dosya_yollari: List[str], veritabani_yolu: str,
     
     tum_sozcukler = set()
     dosya_analiz_sonuclari = {}
+    dosya_kodlamalari = {}  # {dosya_yolu: kodlama}
+    
+    def dosyayi_oku(dosya_yolu: str) -> Tuple[Set[str], str]:
+        """Dosyanın sözcüklerini ve kodlamasını döndürür (okuyucu iş parçacığında çalışır)"""
+        kodlama_bilgisi = {}
+        sozcukler = dosya_sozcuk_kumesi(dosya_yolu, sayilari_atla, bilgi=kodlama_bilgisi)
+        return sozcukler, kodlama_bilgisi['kodlama']
     
     # Tüm dosyaları oku ve sözcükleri topla
-    for i, dosya_yolu in enumerate(dosya_yollari):
-        print(f"\n[{i+1}/{len(dosya_yollari)}] Dosya okunuyor: {dosya_yolu}")
-        metin = dosya_oku(dosya_yolu)
-        sozcukler = temizle_ve_parcala(metin, sayilari_atla)
+    okunanlar = dosyalari_sirali_isle(dosyayi_oku, dosya_yollari, okuyucu_sayisi)
+    for i, (dosya_yolu, (sozcukler, kodlama)) in enumerate(okunanlar):
+        print(f"\n[{i+1}/{len(dosya_yollari)}] Dosya okundu: {dosya_yolu}")
+        dosya_kodlamalari[dosya_yolu] = kodlama
         
         # Sözcükleri genel havuza ekle
         tum_sozcukler.update(sozcukler)
@@ -133,12 +118,12 @@ def dosyalari_analiz_et(dosya_yollari: List[str], veritabani_yolu: str,
         # Dosya bazında sözcük listesini kaydet
         dosya_analiz_sonuclari[dosya_yolu] = sozcukler
         
-        print(f"  Dosyadan {len(sozcukler)} benzersiz sözcük çıkarıldı.")
+        print(f"  Dosyadan {len(sozcukler)} benzersiz sözcük çıkarıldı (kodlama: {dosya_kodlamalari[dosya_yolu]}).")
     
     print(f"\nToplam {len(tum_sozcukler)} benzersiz sözcük bulundu.")
     
     # Tüm sözcükleri analiz et
-    sonuclar = analiz_et(tum_sozcukler, veritabani_yolu, zemberek_aktif)
+    sonuclar = analiz_et(tum_sozcukler, veritabani_yolu, zemberek_aktif, isci_sayisi=isci_sayisi)
     
     # Her dosya için ayrı analiz sonucu dosyası oluştur
     for dosya_yolu, sozcukler in dosya_analiz_sonuclari.items():
@@ -147,6 +132,7 @@ def dosyalari_analiz_et(dosya_yollari: List[str], veritabani_yolu: str,
         
         with open(cikti_dosyasi, 'w', encoding='utf-8') as f:
             f.write(f"# Dosya: {dosya_yolu}\n")
+            f.write(f"# Kodlama: {dosya_kodlamalari[dosya_yolu]}\n")
             f.write(f"# Toplam sözcük sayısı: {len(sozcukler)}\n\n")
             
             for sozcuk in sorted(sozcukler):
@@ -185,6 +171,10 @@ def main():
     parser.add_argument('--ozet', '-o', default='tum_sonuclar.txt', help='Tüm sonuçların özet dosyası')
     parser.add_argument('--zemberek', '-z', action='store_true', help='Zemberek kullan')
     parser.add_argument('--sayilari-dahil-et', '-s', action='store_true', help='Sayıları analize dahil et')
+    parser.add_argument('--isci', '--workers', '-w', type=int, default=1,
+                        help='Analiz için kullanılacak işçi süreç sayısı (varsayılan: 1)')
+    parser.add_argument('--okuyucu', '--readers', '-r', type=int, default=1,
+                        help='Dosyaları eşzamanlı okuyup sözcüklere ayıracak iş parçacığı sayısı (varsayılan: 1)')
     
     args = parser.parse_args()
     
@@ -213,7 +203,9 @@ def main():
         cikti_klasoru=args.cikti_klasoru,
         ozet_dosyasi=args.ozet,
         zemberek_aktif=args.zemberek,
-        sayilari_atla=not args.sayilari_dahil_et
+        sayilari_atla=not args.sayilari_dahil_et,
+        isci_sayisi=args.isci,
+        okuyucu_sayisi=args.okuyucu
     )
 
 if __name__ == "__main__":
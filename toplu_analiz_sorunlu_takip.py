@@ -6,7 +6,8 @@ Sorunlu sözcüklerin hangi dosyalarda geçtiğini kaydeder
 """
 
 import os
-import re
+import sys
+import signal
 import argparse
 import time
 import glob
@@ -14,32 +15,38 @@ import csv
 import json
 import sqlite3
 from collections import Counter, defaultdict
-from typing import Dict, Set, List, Tuple, Counter as CounterType
+from typing import Dict, Set, List, Optional, Tuple, Counter as CounterType
 
-class FrekansBilgisi:
-    """Sözcük frekans bilgisi sınıfı"""
-    def __init__(self, sozcuk: str):
-        self.sozcuk = sozcuk
-        self.toplam_frekans = 0  # Tüm metinlerdeki toplam görülme sayısı
-        self.belge_frekansi = 0  # Sözcüğün göründüğü belge sayısı
-        self.belgeler = {}  # Belge başına frekans: {dosya_yolu: sayı}
-        self.morfolojik_analiz = None  # Morfolojik analiz sonucu
-        self.sorunlu = False  # Sözcüğün sorunlu olup olmadığı
-        
-    def belgeye_ekle(self, dosya_yolu: str, sayi: int = 1):
-        """Sözcüğün belgedeki frekansını günceller"""
-        self.toplam_frekans += sayi
+from frekans_deposu import FrekansDeposu, FrekansGorunumu
+from harici_sayac import HariciSayac, harici_analiz_et
+from kontrol_noktasi import KontrolNoktasi
+from metrikler import Metrikler, olc, olcerek_uret
+from sutunlu_cikti import SUTUNLU_DOSYA_ADI, sutunlu_yaz
+# temizle_ve_parcala adı bu modülden içe aktaranlar için korunuyor
+from sozcuk_ayirici import dosya_frekanslari, dosyalari_sirali_isle, metin_frekanslari as temizle_ve_parcala
+
+class FrekansBilgisi(FrekansGorunumu):
+    """Sözcük frekans bilgisi (FrekansDeposu içindeki bir sözcüğün görünümü)"""
+    __slots__ = ()
+    
+    @property
+    def sorunlu(self) -> bool:
+        """Sözcüğün sorunlu olup olmadığı (depodaki işaret baytında tutulur)"""
+        return bool(self.depo.isaretler[self.kimlik])
+    
+    @sorunlu.setter
+    def sorunlu(self, deger: bool):
+        self.depo.isaretler[self.kimlik] = 1 if deger else 0
         
-        if dosya_yolu not in self.belgeler:
-            self.belge_frekansi += 1
-            self.belgeler[dosya_yolu] = sayi
-        else:
-            self.belgeler[dosya_yolu] += sayi
-    
     def analiz_ekle(self, analiz_sonucu: dict):
         """Morfolojik analiz sonucunu ekler"""
-        self.morfolojik_analiz = analiz_sonucu
+        # İşaret analizden önce yazılır: analizi eklenmiş bir sözcüğün işareti
+        # (kesinti anında kaydedilen kontrol noktasında da) her zaman günceldir
+        self._sorunlu_isaretle(analiz_sonucu)
+        super().analiz_ekle(analiz_sonucu)
         
+    def _sorunlu_isaretle(self, analiz_sonucu: dict):
+        """Analiz sonucuna göre sözcüğün sorunlu işaretini belirler"""
         # Sorunlu sözcük tespiti:
         # 1. Eğer kaynağı 'varsayilan' ise sorunlu
         if analiz_sonucu.get('source') == 'varsayilan':
@@ -77,76 +84,17 @@ class FrekansBilgisi:
             else:
                 self.sorunlu = True
         
-    def get_kok(self) -> str:
-        """Sözcüğün kökünü döndürür"""
-        if self.morfolojik_analiz and 'kok' in self.morfolojik_analiz:
-            return self.morfolojik_analiz['kok']
-        return self.sozcuk
-    
-    def get_ekler(self) -> List[Tuple[str, str]]:
-        """Sözcüğün eklerini döndürür"""
-        if self.morfolojik_analiz and 'ekler' in self.morfolojik_analiz:
-            return self.morfolojik_analiz['ekler']
-        return []
-    
-    def get_kaynak(self) -> str:
-        """Analiz kaynağını döndürür"""
-        if self.morfolojik_analiz and 'source' in self.morfolojik_analiz:
-            return self.morfolojik_analiz['source']
-        return 'bilinmiyor'
-        
     def get_belgeler_str(self) -> str:
         """Sözcüğün geçtiği belgeleri ve frekansları string olarak döndürür"""
-        return "; ".join([f"{os.path.basename(dosya)}:{sayi}" for dosya, sayi in self.belgeler.items()])
-        
-def temizle_ve_parcala(metin: str, sayilari_atla: bool = True) -> Dict[str, int]:
-    """Metni temizler ve sözcük frekanslarını döndürür"""
-    # Noktalama işaretlerini temizle
-    temiz_metin = re.sub(r'[^\w\s]', ' ', metin)
-    
-    # Sözcükleri ayır ve küçük harfe çevir
-    sozcukler = temiz_metin.lower().split()
-    
-    # Sözcük frekanslarını sayar
-    frekanslar = Counter()
-    
-    for sozcuk in sozcukler:
-        if len(sozcuk) <= 1:  # Çok kısa sözcükleri atla
-            continue
-            
-        if sayilari_atla and (sozcuk.isdigit() or re.match(r'^\d+[a-zA-Z]*$', sozcuk)):
-            continue  # Sayıları atla
-            
-        frekanslar[sozcuk] += 1
+        return "; ".join([f"{os.path.basename(dosya)}:{sayi}" for dosya, sayi in self.depo.sozcuk_belgeleri(self.kimlik)])
         
-    return frekanslar
-
-def dosya_oku(dosya_yolu: str) -> str:
-    """Metin dosyasını okur, farklı kodlamaları dener"""
-    kodlamalar = ['utf-8', 'latin-1', 'windows-1254', 'iso-8859-9']
-    
-    for kodlama in kodlamalar:
-        try:
-            with open(dosya_yolu, 'r', encoding=kodlama) as f:
-                return f.read()
-        except UnicodeDecodeError:
-            continue
-    
-    # Hiçbir kodlama çalışmazsa, binary olarak oku ve decode edebileceğimiz karakterleri al
-    try:
-        with open(dosya_yolu, 'rb') as f:
-            return f.read().decode('utf-8', errors='ignore')
-    except Exception as e:
-        print(f"HATA: {dosya_yolu} dosyası okunamadı: {e}")
-        return ""
-
-def sorunlu_sozcukleri_kaydet(frekans_verileri: Dict[str, FrekansBilgisi], 
+def sorunlu_sozcukleri_kaydet(frekans_verileri: FrekansDeposu, 
                               veritabani_yolu: str, 
                               sorunlu_dosyasi: str) -> None:
     """Sorunlu sözcükleri veritabanına ve metin dosyasına kaydeder"""
-    # Sorunlu sözcükleri filtrele
-    sorunlu_sozcukler = {sozcuk: veri for sozcuk, veri in frekans_verileri.items() 
-                        if veri.sorunlu}
+    # Sorunlu sözcükleri filtrele (frekansa göre sıralı; en yüksekten en düşüğe)
+    sorunlu_sozcukler = [(sozcuk, veri) for sozcuk, veri in frekans_verileri.frekansa_gore_sirali() 
+                         if veri.sorunlu]
     
     print(f"\nToplam {len(sorunlu_sozcukler)} sorunlu sözcük bulundu.")
     
@@ -155,8 +103,7 @@ def sorunlu_sozcukleri_kaydet(frekans_verileri: Dict[str, FrekansBilgisi],
         f.write(f"# Toplam {len(sorunlu_sozcukler)} sorunlu sözcük bulundu\n\n")
         f.write("# Sözcük\tFrekans\tBelge_Frekansı\tKaynak\tBelgeler\n")
         
-        # Frekansa göre sırala (en yüksekten en düşüğe)
-        for sozcuk, veri in sorted(sorunlu_sozcukler.items(), key=lambda x: x[1].toplam_frekans, reverse=True):
+        for sozcuk, veri in sorunlu_sozcukler:
             f.write(f"{sozcuk}\t{veri.toplam_frekans}\t{veri.belge_frekansi}\t{veri.get_kaynak()}\t{veri.get_belgeler_str()}\n")
     
     print(f"Sorunlu sözcükler kaydedildi: {sorunlu_dosyasi}")
@@ -207,7 +154,7 @@ def sorunlu_sozcukleri_kaydet(frekans_verileri: Dict[str, FrekansBilgisi],
                 print(f"Tablo kontrol hatası: {e}")
             
             # Sorunlu sözcükleri ekle
-            for sozcuk, veri in sorunlu_sozcukler.items():
+            for sozcuk, veri in sorunlu_sozcukler:
                 try:
                     # Önce detay tablosuna ekle
                     cursor.execute('''
@@ -240,11 +187,24 @@ def sorunlu_sozcukleri_kaydet(frekans_verileri: Dict[str, FrekansBilgisi],
     else:
         print(f"Veritabanı bulunamadı: {veritabani_yolu}, sorunlu sözcükler yalnızca metin dosyasına kaydedildi.")
         
-def analiz_et(frekans_verileri: Dict[str, FrekansBilgisi], veritabani_yolu: str, zemberek_aktif: bool = False) -> None:
-    """Sözcükleri analiz et ve frekans verilerine ekle"""
+def analiz_et(frekans_verileri: FrekansDeposu, veritabani_yolu: str, zemberek_aktif: bool = False,
+              parti_boyutu: int = 1000, isci_sayisi: int = 1,
+              kontrol_noktasi: Optional[KontrolNoktasi] = None,
+              metrikler: Optional[Metrikler] = None) -> None:
+    """Sözcükleri analiz et ve frekans verilerine ekle
+    
+    Analizi zaten eklenmiş sözcükler (kontrol noktasından devam ederken) atlanır.
+    metrikler verilirse analiz ve kayıt aşamaları ölçülür.
+    """
     from turkce_morfologik_analiz import TurkceMorfologikAnaliz
+    from paralel_analiz import partiler_halinde_coz
     
-    sozcukler = list(frekans_verileri.keys())
+    sozcukler = [sozcuk for sozcuk, analiz in zip(frekans_verileri.sozcukler, frekans_verileri.analizler)
+                 if analiz is None]
+    if len(sozcukler) < len(frekans_verileri):
+        print(f"{len(frekans_verileri) - len(sozcukler)} sözcük daha önce analiz edilmiş.")
+    if not sozcukler:
+        return
     print(f"Toplam {len(sozcukler)} benzersiz sözcük analiz edilecek.")
     
     # Analizci oluştur
@@ -252,27 +212,45 @@ def analiz_et(frekans_verileri: Dict[str, FrekansBilgisi], veritabani_yolu: str,
         veritabani_path=veritabani_yolu,
         zemberek_jar_path="zemberek-full.jar" if zemberek_aktif else "non-existent.jar",
         interaktif=False,
-        zemberek_oncelikli=zemberek_aktif
+        zemberek_oncelikli=zemberek_aktif,
+        metrikler=metrikler
     )
     
     islenecek_toplam = len(sozcukler)
     
+    sirali_sozcukler = sorted(sozcukler)
+    
+    # Sözcükleri partiler halinde çözümle (kayıtlı analizler tek sorguda gelir)
     baslangic = time.time()
-    for i, sozcuk in enumerate(sorted(sozcukler)):
-        analiz_sonuc = analizci.parcala(sozcuk)
-        frekans_verileri[sozcuk].analiz_ekle(analiz_sonuc)
-        
-        # İlerleme göster
-        if (i+1) % 100 == 0 or i+1 == islenecek_toplam:
+    islenen = 0
+    try:
+        partiler = partiler_halinde_coz(analizci, sirali_sozcukler, parti_boyutu, isci_sayisi)
+        for parti_sonuclari in olcerek_uret(metrikler, 'analiz', partiler, len):
+            for sozcuk, analiz_sonuc in parti_sonuclari.items():
+                frekans_verileri[sozcuk].analiz_ekle(analiz_sonuc)
+            islenen += len(parti_sonuclari)
+            
+            if kontrol_noktasi:
+                with olc(metrikler, 'kayit'):
+                    kontrol_noktasi.gerekirse_kaydet()
+            if metrikler is not None:
+                metrikler.bolum_ekle('analizci', analizci.istatistikler())
+                metrikler.gerekirse_yaz()
+            
+            # İlerleme göster
             gecen_sure = time.time() - baslangic
-            hiz = (i+1) / gecen_sure if gecen_sure > 0 else 0
-            kalan_sure = (islenecek_toplam - (i+1)) / hiz if hiz > 0 else 0
-            print(f"\rİlerleme: {i+1}/{islenecek_toplam} sözcük ({(i+1)/islenecek_toplam*100:.1f}%) | "
+            hiz = islenen / gecen_sure if gecen_sure > 0 else 0
+            kalan_sure = (islenecek_toplam - islenen) / hiz if hiz > 0 else 0
+            print(f"\rİlerleme: {islenen}/{islenecek_toplam} sözcük ({islenen/islenecek_toplam*100:.1f}%) | "
                   f"Hız: {hiz:.1f} sözcük/sn | Kalan: {kalan_sure:.1f} sn", end="")
-    
-    print()  # Yeni satır
-    
-    analizci.kapat()
+        
+        print()  # Yeni satır
+    finally:
+        # Kesintide de bekleyen veritabanı yazmaları kaydedilir
+        if metrikler is not None:
+            metrikler.bolum_ekle('analizci', analizci.istatistikler())
+        with olc(metrikler, 'kayit'):
+            analizci.kapat()
     
     bitis = time.time()
     toplam_sure = bitis - baslangic
@@ -297,112 +275,233 @@ def klasordeki_dosyalari_bul(klasor_yolu: str, uzanti: str = ".txt") -> List[str
     print(f"{len(dosya_yollari)} adet {uzanti} dosyası bulundu.")
     return dosya_yollari
 
+def ozet_yaz(frekans_verileri: FrekansDeposu, ozet_dosyasi: str) -> None:
+    """Tüm sonuçları frekansa göre sıralı özet dosyasına yazar"""
+    with open(ozet_dosyasi, 'w', encoding='utf-8') as f:
+        f.write(f"# Toplam {frekans_verileri.belge_sayisi} dosya analiz edildi\n")
+        f.write(f"# Toplam {len(frekans_verileri)} benzersiz sözcük bulundu\n\n")
+        f.write("# Sözcük\tToplam_Frekans\tBelge_Frekansı\tKök\tEkler\tKaynak\tSorunlu\n")
+        
+        # Frekansa göre sırala (en yüksekten en düşüğe)
+        for sozcuk, veri in frekans_verileri.frekansa_gore_sirali():
+            ekler_str = ", ".join([f"{ek} ({kategori})" for ek, kategori in veri.get_ekler()])
+            
+            f.write(f"{sozcuk}\t{veri.toplam_frekans}\t{veri.belge_frekansi}\t{veri.get_kok()}\t"
+                   f"{ekler_str if ekler_str else 'Yok'}\t{veri.get_kaynak()}\t{'Evet' if veri.sorunlu else 'Hayır'}\n")
+    
+    print(f"Özet sonuçlar kaydedildi: {ozet_dosyasi}")
+
+def csv_yaz(frekans_verileri: FrekansDeposu, csv_dosyasi: str) -> None:
+    """Tüm sonuçları frekansa göre sıralı CSV dosyasına yazar"""
+    with open(csv_dosyasi, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Sözcük", "Toplam_Frekans", "Belge_Frekansı", "Kök", "Ekler", "Kaynak", "Sorunlu", "Belgeler"])
+        
+        # Frekansa göre sırala (en yüksekten en düşüğe)
+        for sozcuk, veri in frekans_verileri.frekansa_gore_sirali():
+            ekler_str = ", ".join([f"{ek} ({kategori})" for ek, kategori in veri.get_ekler()])
+            
+            writer.writerow([
+                sozcuk, 
+                veri.toplam_frekans, 
+                veri.belge_frekansi, 
+                veri.get_kok(),
+                ekler_str if ekler_str else 'Yok',
+                veri.get_kaynak(),
+                'Evet' if veri.sorunlu else 'Hayır',
+                veri.get_belgeler_str()
+            ])
+    
+    print(f"CSV sonuçlar kaydedildi: {csv_dosyasi}")
+
 def dosyalari_analiz_et(dosya_yollari: List[str], veritabani_yolu: str, 
                        cikti_klasoru: str, ozet_dosyasi: str, csv_dosyasi: str,
                        sorunlu_dosyasi: str,
-                       zemberek_aktif: bool = False, sayilari_atla: bool = True) -> Dict[str, FrekansBilgisi]:
-    """Birden fazla dosyayı analiz eder, frekans bilgilerini toplar"""
+                       zemberek_aktif: bool = False, sayilari_atla: bool = True,
+                       isci_sayisi: int = 1, kontrol_noktasi_yolu: Optional[str] = None,
+                       kontrol_araligi: float = 300.0, devam: bool = False,
+                       okuyucu_sayisi: int = 1, cikti_bicimi: str = 'metin',
+                       bellek_siniri_mb: Optional[float] = None,
+                       metrikler: Optional[Metrikler] = None) -> FrekansDeposu:
+    """Birden fazla dosyayı analiz eder, frekans bilgilerini toplar
+    
+    kontrol_noktasi_yolu verilirse okunan dosyaların sayımları ve analiz edilen
+    sözcükler kontrol_araligi saniyede bir bu dosyaya kaydedilir; kesintide
+    (Ctrl-C) son durum da yazılır. devam True ise çalışma kayıtlı kontrol
+    noktasından sürdürülür. Çalışma başarıyla bitince kontrol noktası silinir.
+    
+    okuyucu_sayisi > 1 ise dosyalar iş parçacıklarında eşzamanlı okunur;
+    sayımlar yine dosya listesinin sırasıyla birleştirilir.
+    
+    cikti_bicimi 'sutunlu' ise dosya başına *_analiz.txt yerine tüm dosyaların
+    sonuçları cikti_klasoru içinde tek bir sütunlu dosyaya yazılır (bkz. sutunlu_cikti).
+    
+    bellek_siniri_mb verilirse sayımlar bu sınırı aşınca geçici dosyalara
+    taşar ve dış birleştirmeyle toplanır (bkz. harici_sayac); çıktılar aynıdır.
+    Bu modda kontrol noktası tutulmaz.
+    
+    metrikler verilirse okuma, çözme, ayırma, sayım, analiz, kayıt ve çıktı
+    aşamalarının süreleri ölçülür ve metrikler çalışma boyunca belirli
+    aralıklarla yazılır (bkz. metrikler). Son yazma çağıranındır.
+    """
     if not dosya_yollari:
         print("İşlenecek dosya bulunamadı.")
         return {}
     
+    if bellek_siniri_mb and cikti_bicimi == 'sutunlu':
+        print("HATA: Bellek sınırlı sayımda sütunlu çıktı desteklenmiyor.")
+        return {}
+    if bellek_siniri_mb and kontrol_noktasi_yolu:
+        print("Not: Bellek sınırlı sayımda kontrol noktası tutulmaz.")
+        kontrol_noktasi_yolu = None
+    
     # Çıktı klasörünü oluştur
     if not os.path.exists(cikti_klasoru):
         os.makedirs(cikti_klasoru)
         print(f"Çıktı klasörü oluşturuldu: {cikti_klasoru}")
     
     # Frekans verilerini topla
-    frekans_verileri = {}  # {sozcuk: FrekansBilgisi}
-    dosya_analiz_sonuclari = {}  # {dosya_yolu: {sozcuk: frekans}}
-    
-    # Tüm dosyaları oku ve frekans bilgilerini topla
-    for i, dosya_yolu in enumerate(dosya_yollari):
-        print(f"\n[{i+1}/{len(dosya_yollari)}] Dosya okunuyor: {dosya_yolu}")
-        metin = dosya_oku(dosya_yolu)
-        frekanslar = temizle_ve_parcala(metin, sayilari_atla)
-        
-        # Frekans verilerini güncelle
-        for sozcuk, frekans in frekanslar.items():
-            if sozcuk not in frekans_verileri:
-                frekans_verileri[sozcuk] = FrekansBilgisi(sozcuk)
+    if bellek_siniri_mb:
+        # Sayımlar bellek sınırını aşınca diske taşar
+        frekans_verileri = HariciSayac(FrekansBilgisi, bellek_siniri_mb)
+    else:
+        frekans_verileri = FrekansDeposu(FrekansBilgisi)  # {sozcuk: FrekansBilgisi}
+    dosya_kodlamalari = {}  # {dosya_yolu: kodlama}
+    
+    kontrol = KontrolNoktasi(kontrol_noktasi_yolu, kontrol_araligi) if kontrol_noktasi_yolu else None
+    if devam and kontrol:
+        durum = kontrol.yukle()
+        if durum is None:
+            print(f"Devam edilecek kontrol noktası bulunamadı ({kontrol_noktasi_yolu}), baştan başlanıyor.")
+        elif durum['dosya_yollari'] != dosya_yollari or durum['sayilari_atla'] != sayilari_atla:
+            print(f"HATA: Kontrol noktası farklı bir dosya listesi ya da ayarlarla oluşturulmuş: {kontrol_noktasi_yolu}")
+            return {}
+        else:
+            frekans_verileri = durum['frekans_verileri']
+            frekans_verileri.gorunum_sinifi = FrekansBilgisi
+            dosya_kodlamalari = durum['dosya_kodlamalari']
+            print(f"Kontrol noktasından devam ediliyor: {frekans_verileri.belge_sayisi}/{len(dosya_yollari)} dosya okunmuş.")
+    
+    if kontrol:
+        kontrol.durum = {
+            'dosya_yollari': dosya_yollari,
+            'sayilari_atla': sayilari_atla,
+            'frekans_verileri': frekans_verileri,
+            'dosya_kodlamalari': dosya_kodlamalari
+        }
+    
+    def dosyayi_oku(dosya_yolu: str) -> Tuple[CounterType[str], str]:
+        """Dosyanın sözcük sayımlarını ve kodlamasını döndürür (okuyucu iş parçacığında çalışır)"""
+        kodlama_bilgisi = {}
+        frekanslar = dosya_frekanslari(dosya_yolu, sayilari_atla, bilgi=kodlama_bilgisi, metrikler=metrikler)
+        return frekanslar, kodlama_bilgisi['kodlama']
+    
+    try:
+        # Tüm dosyaları oku ve frekans bilgilerini topla (dosyalar sırayla birleştirildiği
+        # için depodaki belge sayısı okunmuş dosya sayısıdır)
+        ilk_dosya = frekans_verileri.belge_sayisi
+        okunanlar = dosyalari_sirali_isle(dosyayi_oku, dosya_yollari[ilk_dosya:], okuyucu_sayisi)
+        for i, (dosya_yolu, (frekanslar, kodlama)) in enumerate(okunanlar, ilk_dosya):
+            print(f"\n[{i+1}/{len(dosya_yollari)}] Dosya okundu: {dosya_yolu}")
+            dosya_kodlamalari[dosya_yolu] = kodlama
             
-            frekans_verileri[sozcuk].belgeye_ekle(dosya_yolu, frekans)
+            # Frekans verilerini güncelle (dosya bazında frekanslar da depoda tutulur)
+            with olc(metrikler, 'sayim', 1):
+                frekans_verileri.belge_ekle(dosya_yolu, frekanslar)
+            
+            print(f"  Dosyadan {len(frekanslar)} benzersiz sözcük çıkarıldı (toplam kullanım: {sum(frekanslar.values())}, kodlama: {dosya_kodlamalari[dosya_yolu]})")
+            
+            if kontrol:
+                with olc(metrikler, 'kayit'):
+                    kontrol.gerekirse_kaydet()
+            if metrikler is not None:
+                metrikler.sayac_ekle('okunan_dosya')
+                metrikler.gerekirse_yaz()
         
-        # Dosya bazında frekansları kaydet
-        dosya_analiz_sonuclari[dosya_yolu] = frekanslar
+        if bellek_siniri_mb:
+            with olc(metrikler, 'sayim'):
+                kosu_sayisi = frekans_verileri.birlestir()
+            print(f"\nSayımlar {kosu_sayisi} koşudan birleştirildi.")
         
-        print(f"  Dosyadan {len(frekanslar)} benzersiz sözcük çıkarıldı (toplam kullanım: {sum(frekanslar.values())})")
-    
-    print(f"\nToplam {len(frekans_verileri)} benzersiz sözcük bulundu.")
-    
-    # Tüm sözcükleri analiz et
-    analiz_et(frekans_verileri, veritabani_yolu, zemberek_aktif)
+        print(f"\nToplam {len(frekans_verileri)} benzersiz sözcük bulundu.")
+        
+        # Tüm sözcükleri analiz et
+        if bellek_siniri_mb:
+            harici_analiz_et(frekans_verileri, veritabani_yolu, zemberek_aktif, isci_sayisi=isci_sayisi,
+                             metrikler=metrikler)
+        else:
+            analiz_et(frekans_verileri, veritabani_yolu, zemberek_aktif, isci_sayisi=isci_sayisi,
+                      kontrol_noktasi=kontrol, metrikler=metrikler)
+        
+        # Çıktı aşamasında kesilirse analiz yeniden yapılmasın
+        if kontrol:
+            with olc(metrikler, 'kayit'):
+                kontrol.kaydet()
+    except KeyboardInterrupt:
+        if kontrol and kontrol.etkin:
+            print("\nÇalışma kesildi, kontrol noktası kaydediliyor...")
+            # Kesinti belge_ekle'nin ortasına denk geldiyse yarım belge kaydedilmesin
+            frekans_verileri.yarim_belgeyi_geri_al()
+            kontrol.kaydet()
+            print(f"Kaldığı yerden sürdürmek için --devam ile yeniden çalıştırın ({kontrol_noktasi_yolu}).")
+        raise
     
     # Sorunlu sözcükleri kaydet
-    sorunlu_sozcukleri_kaydet(frekans_verileri, veritabani_yolu, sorunlu_dosyasi)
-    
-    # Her dosya için ayrı analiz sonucu dosyası oluştur
-    for dosya_yolu, frekanslar in dosya_analiz_sonuclari.items():
-        dosya_adi = os.path.basename(dosya_yolu)
-        cikti_dosyasi = os.path.join(cikti_klasoru, f"{os.path.splitext(dosya_adi)[0]}_analiz.txt")
-        
-        with open(cikti_dosyasi, 'w', encoding='utf-8') as f:
-            f.write(f"# Dosya: {dosya_yolu}\n")
-            f.write(f"# Toplam sözcük sayısı: {sum(frekanslar.values())}\n")
-            f.write(f"# Benzersiz sözcük sayısı: {len(frekanslar)}\n\n")
-            f.write("# Sözcük\tFrekans\tKök\tEkler\tKaynak\tSorunlu\n")
+    with olc(metrikler, 'kayit'):
+        sorunlu_sozcukleri_kaydet(frekans_verileri, veritabani_yolu, sorunlu_dosyasi)
+    
+    if cikti_bicimi == 'sutunlu':
+        # Tüm dosyaların sonuçları tek bir sözlükle kodlanmış sütunlu dosyada
+        with olc(metrikler, 'cikti', 1):
+            cikti_dosyasi = sutunlu_yaz(frekans_verileri, dosya_kodlamalari,
+                                        os.path.join(cikti_klasoru, SUTUNLU_DOSYA_ADI), sorunlu_sutunu=True)
+        print(f"Sütunlu sonuçlar kaydedildi: {cikti_dosyasi}")
+    else:
+        # Her dosya için ayrı analiz sonucu dosyası oluştur
+        for dosya_yolu in frekans_verileri.belge_yollari:
+            frekanslar = frekans_verileri.belge_frekanslari_getir(dosya_yolu)
+            dosya_adi = os.path.basename(dosya_yolu)
+            cikti_dosyasi = os.path.join(cikti_klasoru, f"{os.path.splitext(dosya_adi)[0]}_analiz.txt")
             
-            # Frekansa göre sırala (en yüksekten en düşüğe)
-            for sozcuk, frekans in sorted(frekanslar.items(), key=lambda x: x[1], reverse=True):
-                veri = frekans_verileri[sozcuk]
-                ekler_str = ", ".join([f"{ek} ({kategori})" for ek, kategori in veri.get_ekler()])
+            with olc(metrikler, 'cikti', 1), open(cikti_dosyasi, 'w', encoding='utf-8') as f:
+                f.write(f"# Dosya: {dosya_yolu}\n")
+                f.write(f"# Kodlama: {dosya_kodlamalari[dosya_yolu]}\n")
+                f.write(f"# Toplam sözcük sayısı: {sum(frekanslar.values())}\n")
+                f.write(f"# Benzersiz sözcük sayısı: {len(frekanslar)}\n\n")
+                f.write("# Sözcük\tFrekans\tKök\tEkler\tKaynak\tSorunlu\n")
                 
-                f.write(f"{sozcuk}\t{frekans}\t{veri.get_kok()}\t{ekler_str if ekler_str else 'Yok'}\t"
-                       f"{veri.get_kaynak()}\t{'Evet' if veri.sorunlu else 'Hayır'}\n")
-        
-        print(f"Dosya analizi kaydedildi: {cikti_dosyasi}")
+                # Frekansa göre sırala (en yüksekten en düşüğe)
+                for sozcuk, frekans in sorted(frekanslar.items(), key=lambda x: x[1], reverse=True):
+                    veri = frekans_verileri[sozcuk]
+                    ekler_str = ", ".join([f"{ek} ({kategori})" for ek, kategori in veri.get_ekler()])
+                    
+                    f.write(f"{sozcuk}\t{frekans}\t{veri.get_kok()}\t{ekler_str if ekler_str else 'Yok'}\t"
+                           f"{veri.get_kaynak()}\t{'Evet' if veri.sorunlu else 'Hayır'}\n")
+            
+            print(f"Dosya analizi kaydedildi: {cikti_dosyasi}")
     
     # Tüm sonuçları özet dosyasına yaz
     if ozet_dosyasi:
-        with open(ozet_dosyasi, 'w', encoding='utf-8') as f:
-            f.write(f"# Toplam {len(dosya_yollari)} dosya analiz edildi\n")
-            f.write(f"# Toplam {len(frekans_verileri)} benzersiz sözcük bulundu\n\n")
-            f.write("# Sözcük\tToplam_Frekans\tBelge_Frekansı\tKök\tEkler\tKaynak\tSorunlu\n")
-            
-            # Frekansa göre sırala (en yüksekten en düşüğe)
-            for sozcuk, veri in sorted(frekans_verileri.items(), key=lambda x: x[1].toplam_frekans, reverse=True):
-                ekler_str = ", ".join([f"{ek} ({kategori})" for ek, kategori in veri.get_ekler()])
-                
-                f.write(f"{sozcuk}\t{veri.toplam_frekans}\t{veri.belge_frekansi}\t{veri.get_kok()}\t"
-                       f"{ekler_str if ekler_str else 'Yok'}\t{veri.get_kaynak()}\t{'Evet' if veri.sorunlu else 'Hayır'}\n")
-        
-        print(f"Özet sonuçlar kaydedildi: {ozet_dosyasi}")
+        with olc(metrikler, 'cikti', 1):
+            ozet_yaz(frekans_verileri, ozet_dosyasi)
     
     # CSV formatında kaydet
     if csv_dosyasi:
-        with open(csv_dosyasi, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(["Sözcük", "Toplam_Frekans", "Belge_Frekansı", "Kök", "Ekler", "Kaynak", "Sorunlu", "Belgeler"])
-            
-            # Frekansa göre sırala (en yüksekten en düşüğe)
-            for sozcuk, veri in sorted(frekans_verileri.items(), key=lambda x: x[1].toplam_frekans, reverse=True):
-                ekler_str = ", ".join([f"{ek} ({kategori})" for ek, kategori in veri.get_ekler()])
-                
-                writer.writerow([
-                    sozcuk, 
-                    veri.toplam_frekans, 
-                    veri.belge_frekansi, 
-                    veri.get_kok(),
-                    ekler_str if ekler_str else 'Yok',
-                    veri.get_kaynak(),
-                    'Evet' if veri.sorunlu else 'Hayır',
-                    veri.get_belgeler_str()
-                ])
-        
-        print(f"CSV sonuçlar kaydedildi: {csv_dosyasi}")
+        with olc(metrikler, 'cikti', 1):
+            csv_yaz(frekans_verileri, csv_dosyasi)
+    
+    if bellek_siniri_mb:
+        frekans_verileri.kapat()
+    
+    if kontrol:
+        kontrol.sil()
     
     return frekans_verileri
 
+def _sonlandirma_sinyali(signum, frame):
+    """SIGTERM'i (ör. küme işinin kesilmesi) Ctrl-C gibi ele alır"""
+    raise KeyboardInterrupt
+
 def main():
     """Ana program fonksiyonu"""
     parser = argparse.ArgumentParser(description='Türkçe Morfolojik Analiz - Sorunlu Sözcük Takipli Toplu Analiz')
@@ -416,6 +515,28 @@ def main():
     parser.add_argument('--sorunlu', '-s', default='sorunlu_sozcukler.txt', help='Sorunlu sözcükler dosyası')
     parser.add_argument('--zemberek', '-z', action='store_true', help='Zemberek kullan')
     parser.add_argument('--sayilari-dahil-et', '-sd', action='store_true', help='Sayıları analize dahil et')
+    parser.add_argument('--isci', '--workers', '-w', type=int, default=1,
+                        help='Analiz için kullanılacak işçi süreç sayısı (varsayılan: 1)')
+    parser.add_argument('--okuyucu', '--readers', '-r', type=int, default=1,
+                        help='Dosyaları eşzamanlı okuyup sözcüklere ayıracak iş parçacığı sayısı (varsayılan: 1)')
+    parser.add_argument('--cikti-bicimi', '-b', choices=['metin', 'sutunlu'], default='metin',
+                        help='Dosya başına çıktı biçimi: her dosya için *_analiz.txt (metin) ya da '
+                             'tek bir sütunlu zip dosyası (sutunlu) (varsayılan: metin)')
+    parser.add_argument('--bellek-siniri', '-bs', type=float,
+                        help='Sayımlar için bellek sınırı (MB); aşılınca sayımlar geçici dosyalara taşar '
+                             '(geçici klasör TMPDIR ile seçilir; kontrol noktası tutulmaz)')
+    parser.add_argument('--kontrol-noktasi', '-kn', default='toplu_analiz_kontrol.pkl',
+                        help='Kontrol noktası dosyası (varsayılan: toplu_analiz_kontrol.pkl)')
+    parser.add_argument('--kontrol-araligi', '-ka', type=float, default=300.0,
+                        help='Kontrol noktası kayıt aralığı, saniye (0: kontrol noktası tutma; varsayılan: 300)')
+    parser.add_argument('--devam', '--resume', action='store_true',
+                        help='Son kontrol noktasından devam et')
+    parser.add_argument('--metrikler', '-mt',
+                        help='Aşama sürelerinin, sayaçların ve hızların yazılacağı JSON dosyası')
+    parser.add_argument('--prometheus', '-pr',
+                        help='Metriklerin ayrıca yazılacağı Prometheus textfile (ör. node_exporter klasöründe *.prom)')
+    parser.add_argument('--metrik-araligi', '-ma', type=float, default=60.0,
+                        help='Metriklerin çalışma sırasında yazılma aralığı, saniye (0: yalnızca sonda; varsayılan: 60)')
     
     args = parser.parse_args()
     
@@ -437,17 +558,41 @@ def main():
     else:
         dosya_yollari = klasordeki_dosyalari_bul(args.klasor, args.uzanti)
     
+    signal.signal(signal.SIGTERM, _sonlandirma_sinyali)
+    
+    metrikler = None
+    if args.metrikler or args.prometheus:
+        metrikler = Metrikler(args.metrikler, args.prometheus, args.metrik_araligi)
+    
     # Analiz başlat
-    dosyalari_analiz_et(
-        dosya_yollari=dosya_yollari,
-        veritabani_yolu=args.veritabani,
-        cikti_klasoru=args.cikti_klasoru,
-        ozet_dosyasi=args.ozet,
-        csv_dosyasi=args.csv,
-        sorunlu_dosyasi=args.sorunlu,
-        zemberek_aktif=args.zemberek,
-        sayilari_atla=not args.sayilari_dahil_et
-    )
+    try:
+        dosyalari_analiz_et(
+            dosya_yollari=dosya_yollari,
+            veritabani_yolu=args.veritabani,
+            cikti_klasoru=args.cikti_klasoru,
+            ozet_dosyasi=args.ozet,
+            csv_dosyasi=args.csv,
+            sorunlu_dosyasi=args.sorunlu,
+            zemberek_aktif=args.zemberek,
+            sayilari_atla=not args.sayilari_dahil_et,
+            isci_sayisi=args.isci,
+            kontrol_noktasi_yolu=args.kontrol_noktasi,
+            kontrol_araligi=args.kontrol_araligi,
+            devam=args.devam,
+            okuyucu_sayisi=args.okuyucu,
+            cikti_bicimi=args.cikti_bicimi,
+            bellek_siniri_mb=args.bellek_siniri,
+            metrikler=metrikler
+        )
+    except KeyboardInterrupt:
+        sys.exit(130)
+    finally:
+        # Kesilen çalışmanın metrikleri de yazılır
+        if metrikler is not None:
+            metrikler.yaz()
+            print("\nAşama süreleri:")
+            for satir in metrikler.rapor_satirlari():
+                print(satir)
 
 if __name__ == "__main__":
     main()
@@ -4,18 +4,22 @@
 Türkçe Morfolojik Analiz - Ana Program
 """
 
-import re
 import os
 import sys
 import logging
 import argparse
 import json
-from typing import List, Dict, Tuple, Set, Optional, Union
+import time
+from typing import List, Dict, Tuple, Set, Optional, Union, Iterable
 
 # Proje modülleri
 from config_utils import config_yukle, config_kaydet, ornek_config_olustur
 from veritabani import MorfolojikVeritabani
 from zemberek_wrapper import ZemberekWrapper
+from ek_agaci import EkAgaci
+from onbellek import AnalizOnbellegi
+from metrikler import GecikmeHistogrami
+from sozcuk_ayirici import dosya_sozcukleri, metin_sozcuk_kumesi, turkce_kucuk_harf
 
 # Logging yapılandırması
 logging.basicConfig(
@@ -38,18 +42,43 @@ class TurkceMorfologikAnaliz:
                  max_derinlik: int = 5,
                  unlu_uyumu_kontrol: bool = True,
                  unsuz_yumusama_kontrol: bool = True,
-                 zemberek_oncelikli: bool = True):
-        self.veritabani = MorfolojikVeritabani(veritabani_path)
+                 zemberek_oncelikli: bool = True,
+                 onbellek_boyutu: int = 10000,
+                 onbellek_isitma: int = 0,
+                 yazma_tamponu: int = 0,
+                 salt_okunur: bool = False,
+                 metrikler=None):
+        self.veritabani = MorfolojikVeritabani(veritabani_path, readonly=salt_okunur,
+                                               tampon_boyutu=yazma_tamponu, metrikler=metrikler)
         self.zemberek = ZemberekWrapper(zemberek_jar_path)
+        self.zemberek_jar_path = zemberek_jar_path
         self.interaktif = interaktif
         self.max_derinlik = max_derinlik
         self.unlu_uyumu_kontrol = unlu_uyumu_kontrol
         self.unsuz_yumusama_kontrol = unsuz_yumusama_kontrol
         self.zemberek_oncelikli = zemberek_oncelikli
         
+        # Verilirse çözümleme sayaçları ve veritabanı kayıt süreleri toplanır (bkz. metrikler)
+        self.metrikler = metrikler
+        
+        # parcala'nın her çözümleme yolu için gecikme histogramı (bkz. istatistikler)
+        self.yol_histogramlari: Dict[str, GecikmeHistogrami] = {}
+        
+        # Salt okunur modda yeni analizler veritabanına yazılmaz, burada birikir
+        # ve bekleyen_yazmalari_al ile alınıp başka bir bağlantı üzerinden kaydedilir
+        self.salt_okunur = salt_okunur
+        self.bekleyen_analizler = []
+        self.bekleyen_sorunlular = []
+        
         # Veritabanından bilinen kökler ve ekleri yükle
         self.bilinen_kokler = self.veritabani.get_bilinen_kokler()
         self.ekler = self.veritabani.get_bilinen_ekler()
+        self.ek_agaci = EkAgaci(self.ekler)
+        
+        # Sık görülen sözcüklerin analizleri için önbellek
+        self.onbellek = AnalizOnbellegi(onbellek_boyutu)
+        if onbellek_isitma > 0:
+            self.onbellegi_isit(onbellek_isitma)
         
         # Bazı temel düzenli ifadeler
         self.unlu_harfler = set('aeıioöuü')
@@ -59,20 +88,118 @@ class TurkceMorfologikAnaliz:
         logger.info(f"Zemberek: {'Aktif' if self.zemberek.available else 'Devre dışı'}")
         logger.info(f"İnteraktif mod: {'Açık' if interaktif else 'Kapalı'}")
         logger.info(f"Gelişmiş ayarlar: max_derinlik={max_derinlik}, ünlü_uyumu={unlu_uyumu_kontrol}, ünsüz_yumuşama={unsuz_yumusama_kontrol}")
+        logger.info(f"Önbellek: kapasite={onbellek_boyutu}, ısıtılan kayıt={len(self.onbellek)}")
     
     def _bul_olasi_ekler(self, sozcuk: str) -> List[Tuple[str, str]]:
-        """Sözcükteki olası ekleri bulur"""
-        bulunan_ekler = []
-        
-        # Tüm ek kategorilerini kontrol et
-        for kategori, ek_listesi in self.ekler.items():
-            for ek in ek_listesi:
-                if sozcuk.endswith(ek) and len(sozcuk) > len(ek):
-                    bulunan_ekler.append((ek, kategori))
+        """Sözcükteki olası ekleri bulur (uzun ekler önce gelir)"""
+        return self.ek_agaci.eslesenler(sozcuk)
+    
+    def ekleri_yenile(self):
+        """Ekleri veritabanından yeniden yükler ve ek ağacını yeniden kurar"""
+        self.ekler = self.veritabani.get_bilinen_ekler()
+        self.ek_agaci = EkAgaci(self.ekler)
+    
+    def onbellegi_isit(self, kayit_sayisi: int):
+        """En sık kullanılan analizleri veritabanından önbelleğe yükler"""
+        for sozcuk, analiz in self.veritabani.en_sik_analizleri_getir(kayit_sayisi):
+            self.onbellek.ekle(sozcuk, analiz)
+    
+    def onbellek_istatistikleri(self) -> Dict:
+        """Önbellek isabet/ıska sayaçlarını döndürür"""
+        return self.onbellek.istatistikler()
+    
+    def _yol_kaydet(self, yol: str, sure_ns: int, adet: int = 1):
+        """Bir çözümleme yolunun gecikmesini histogramına ekler"""
+        histogram = self.yol_histogramlari.get(yol)
+        if histogram is None:
+            histogram = self.yol_histogramlari[yol] = GecikmeHistogrami()
+        histogram.ekle(sure_ns, adet)
+    
+    def istatistikler(self) -> Dict:
+        """Çözümleme yollarının sayılarını, oranlarını ve gecikmelerini döndürür
         
-        # Uzunluğa göre sırala (daha uzun ekler önce gelsin)
-        bulunan_ekler.sort(key=lambda x: len(x[0]), reverse=True)
-        return bulunan_ekler
+        Yollar: not_tablosu (aynı parcala çağrısında çözülmüş önek), onbellek,
+        veritabani, zemberek, bilinen_kok, tek_ek, yumusama, ozyineleme,
+        kullanici, varsayilan ve max_derinlik; parcala_toplu'nun toplu
+        sorgularından gelenler toplu_onbellek ve toplu_veritabani (gecikme
+        sözcük başına düşen paydır). Özyinelemeli çağrılar da sayılır ve
+        üst çağrının gecikmesi alt çağrılarınkini içerir.
+        """
+        toplam = sum(histogram.sayi for histogram in self.yol_histogramlari.values())
+        yollar = {}
+        for yol, histogram in sorted(self.yol_histogramlari.items(), key=lambda x: -x[1].toplam):
+            yollar[yol] = histogram.ozet()
+            yollar[yol]['oran'] = histogram.sayi / toplam if toplam else 0.0
+        return {
+            'toplam_cagri': toplam,
+            'yollar': yollar,
+            'onbellek': self.onbellek.istatistikler()
+        }
+    
+    def istatistik_satirlari(self) -> List[str]:
+        """istatistikler()'i okunur satırlar olarak döndürür (en çok zaman alan yol önce)"""
+        istatistikler = self.istatistikler()
+        satirlar = [f"Çözümleme yolları ({istatistikler['toplam_cagri']} çağrı, önbellek isabet oranı "
+                    f"%{istatistikler['onbellek']['isabet_orani'] * 100:.1f}):"]
+        for yol, ist in istatistikler['yollar'].items():
+            satirlar.append(f"  {yol:<16} {ist['sayi']:>9} (%{ist['oran'] * 100:5.1f})  "
+                            f"toplam {ist['toplam_ms']:10.1f} ms  ortalama {ist['ortalama_us']:8.1f} µs  "
+                            f"p50 {ist['p50_us']:8.1f} µs  p99 {ist['p99_us']:8.1f} µs")
+        return satirlar
+    
+    def yol_histogramlarini_al(self) -> Dict[str, GecikmeHistogrami]:
+        """Biriken yol histogramlarını döndürür ve sıfırlar (işçi süreçten aktarım için)"""
+        histogramlar, self.yol_histogramlari = self.yol_histogramlari, {}
+        return histogramlar
+    
+    def yol_histogramlarini_birlestir(self, histogramlar: Dict[str, GecikmeHistogrami]):
+        """Başka bir analizcinin yol histogramlarını bu analizcininkilere ekler"""
+        for yol, histogram in histogramlar.items():
+            if yol in self.yol_histogramlari:
+                self.yol_histogramlari[yol].birlestir(histogram)
+            else:
+                self.yol_histogramlari[yol] = histogram
+    
+    def _analizi_kaydet(self, sozcuk: str, sonuc: Dict, tur: str = 'isim'):
+        """Analiz sonucunu veritabanına kaydeder ve önbelleğe ekler"""
+        if self.salt_okunur:
+            self.bekleyen_analizler.append((sozcuk, sonuc, tur))
+        else:
+            kok_id = self.veritabani.kok_ekle(sonuc['kok'], tur, sonuc['source'])
+            self.veritabani.sozcuk_analizi_kaydet(sozcuk, kok_id, json.dumps(sonuc), sonuc)
+        self.onbellek.ekle(sozcuk, sonuc)
+    
+    def _sorunlu_kaydet(self, sozcuk: str, durum: str, not_metni: str = ''):
+        """Sorunlu sözcüğü veritabanına kaydeder (salt okunur modda bekletir)"""
+        if self.salt_okunur:
+            self.bekleyen_sorunlular.append((sozcuk, durum, not_metni))
+        else:
+            self.veritabani.sorunlu_sozcuk_ekle(sozcuk, durum, not_metni)
+    
+    def bekleyen_yazmalari_al(self) -> Tuple[List[Tuple[str, Dict, str]], List[Tuple[str, str, str]]]:
+        """Salt okunur modda biriken analizleri ve sorunlu sözcükleri döndürür ve listeleri boşaltır"""
+        analizler, sorunlular = self.bekleyen_analizler, self.bekleyen_sorunlular
+        self.bekleyen_analizler = []
+        self.bekleyen_sorunlular = []
+        return analizler, sorunlular
+    
+    def yazmalari_kaydet(self, analizler: List[Tuple[str, Dict, str]],
+                         sorunlular: List[Tuple[str, str, str]]):
+        """Başka bir analizcinin bekleyen yazmalarını tek transaction'da kaydeder"""
+        if self.salt_okunur:
+            self.bekleyen_analizler.extend(analizler)
+            self.bekleyen_sorunlular.extend(sorunlular)
+        else:
+            with self.veritabani.toplu_islem():
+                kok_idleri = self.veritabani.kok_ekle_toplu(
+                    (sonuc['kok'], tur, sonuc['source']) for _, sonuc, tur in analizler)
+                self.veritabani.sozcuk_analizi_kaydet_toplu(
+                    (sozcuk, kok_idleri.get(sonuc['kok'], -1), json.dumps(sonuc), sonuc)
+                    for sozcuk, sonuc, _ in analizler)
+                self.veritabani.sorunlu_sozcuk_ekle_toplu(sorunlular)
+        for sozcuk, sonuc, tur in analizler:
+            self.onbellek.ekle(sozcuk, sonuc)
+            self.bilinen_kokler.setdefault(sonuc['kok'], tur)
     
     def _kontrol_unlu_uyumu(self, kelime: str) -> bool:
         """Büyük ünlü uyumunu kontrol eder"""
@@ -168,24 +295,54 @@ class TurkceMorfologikAnaliz:
             
         return True
     
-    def parcala(self, sozcuk: str, derinlik: int = 0) -> Dict:
-        """Sözcüğü kök ve eklerine ayırır"""
-        sozcuk = sozcuk.lower()
+    def parcala(self, sozcuk: str, derinlik: int = 0, _not_tablosu: Optional[Dict] = None) -> Dict:
+        """Sözcüğü kök ve eklerine ayırır
+        
+        Çoklu ek denemesi (adım 6) sözcüğün öneklerini özyinelemeli olarak
+        çözümler. Her (önek, derinlik) çiftinin sonucu not tablosunda saklanır,
+        böylece aynı önek aynı derinlikte yalnızca bir kez çözümlenir. Bir
+        sözcük için en fazla len(sozcuk) * max_derinlik durum oluşur; her durum
+        en fazla len(sozcuk) ek dener, toplam iş polinom sınırlıdır.
+        """
+        sozcuk = turkce_kucuk_harf(sozcuk)
         
         # Maksimum derinlik kontrolü
         if derinlik >= self.max_derinlik:
             logger.debug(f"Maksimum derinliğe ulaşıldı ({self.max_derinlik}): {sozcuk}")
+            self._yol_kaydet('max_derinlik', 0)
             return {
                 'kok': sozcuk,
                 'ekler': [],
                 'source': 'max_derinlik_asildi'
             }
         
-        # 1. Veritabanında bu sözcük için önceden yapılmış bir analiz var mı?
+        if _not_tablosu is None:
+            _not_tablosu = {}
+        
+        if derinlik == 0 and self.metrikler is not None:
+            self.metrikler.sayac_ekle('parcalanan_sozcuk')
+        
+        baslangic = time.perf_counter()
+        anahtar = (sozcuk, derinlik)
+        if anahtar in _not_tablosu:
+            yol = 'not_tablosu'
+        else:
+            _not_tablosu[anahtar], yol = self._parcala_adimlari(sozcuk, derinlik, _not_tablosu)
+        self._yol_kaydet(yol, int((time.perf_counter() - baslangic) * 1e9))
+        return _not_tablosu[anahtar]
+    
+    def _parcala_adimlari(self, sozcuk: str, derinlik: int, not_tablosu: Dict) -> Tuple[Dict, str]:
+        """parcala için çözümleme adımlarını sırasıyla uygular; sonucu ve çözümleme yolunu döndürür"""
+        # 1. Bu sözcük için önceden yapılmış bir analiz var mı? (önce önbellek, sonra veritabanı)
+        onceki_analiz = self.onbellek.getir(sozcuk)
+        if onceki_analiz:
+            return onceki_analiz, 'onbellek'
+        
         onceki_analiz = self.veritabani.sozcuk_analizi_getir(sozcuk)
         if onceki_analiz:
             logger.debug(f"Veritabanından analiz bulundu: {sozcuk}")
-            return onceki_analiz
+            self.onbellek.ekle(sozcuk, onceki_analiz)
+            return onceki_analiz, 'veritabani'
         
         # 2. Zemberek'i dene
         if self.zemberek_oncelikli and self.zemberek.available:
@@ -193,22 +350,13 @@ class TurkceMorfologikAnaliz:
             if zemberek_analiz:
                 logger.debug(f"Zemberek analizi başarılı: {sozcuk}")
                 
-                # Analizi veritabanına kaydet
-                kok_id = self.veritabani.kok_ekle(
-                    zemberek_analiz['kok'], 
-                    'isim',  # Zemberek'ten tur bilgisini almak daha karmaşık
-                    'zemberek'
-                )
-                self.veritabani.sozcuk_analizi_kaydet(
-                    sozcuk, 
-                    kok_id, 
-                    json.dumps(zemberek_analiz)
-                )
+                # Analizi veritabanına kaydet (Zemberek'ten tur bilgisini almak daha karmaşık)
+                self._analizi_kaydet(sozcuk, zemberek_analiz, 'isim')
                 
                 # Bilinen kökleri güncelle
                 self.bilinen_kokler[zemberek_analiz['kok']] = 'isim'
                 
-                return zemberek_analiz
+                return zemberek_analiz, 'zemberek'
         
         # 3. Eğer sözcük zaten bilinen listede varsa, doğrudan köktür
         if sozcuk in self.bilinen_kokler:
@@ -219,10 +367,9 @@ class TurkceMorfologikAnaliz:
             }
             
             # Veritabanına kaydet
-            kok_id = self.veritabani.kok_ekle(sozcuk, self.bilinen_kokler[sozcuk], 'kokler_db')
-            self.veritabani.sozcuk_analizi_kaydet(sozcuk, kok_id, json.dumps(sonuc))
+            self._analizi_kaydet(sozcuk, sonuc, self.bilinen_kokler[sozcuk])
             
-            return sonuc
+            return sonuc, 'bilinen_kok'
         
         # 4. Olası ekleri bul
         olasi_ekler = self._bul_olasi_ekler(sozcuk)
@@ -240,13 +387,12 @@ class TurkceMorfologikAnaliz:
                 }
                 
                 # Veritabanına kaydet
-                kok_id = self.veritabani.kok_ekle(olasi_kok, 'isim', 'kendi_analiz')
-                self.veritabani.sozcuk_analizi_kaydet(sozcuk, kok_id, json.dumps(sonuc))
+                self._analizi_kaydet(sozcuk, sonuc, 'isim')
                 
                 # Bilinen kökleri güncelle
                 self.bilinen_kokler[olasi_kok] = 'isim'
                 
-                return sonuc
+                return sonuc, 'tek_ek'
                 
             # b. Ünsüz yumuşaması kontrolü
             yumusak_kok = self._kontrol_yumusama(olasi_kok, ek)
@@ -258,16 +404,15 @@ class TurkceMorfologikAnaliz:
                 }
                 
                 # Veritabanına kaydet
-                kok_id = self.veritabani.kok_ekle(yumusak_kok, self.bilinen_kokler.get(yumusak_kok, 'isim'), 'kendi_analiz_yumusama')
-                self.veritabani.sozcuk_analizi_kaydet(sozcuk, kok_id, json.dumps(sonuc))
+                self._analizi_kaydet(sozcuk, sonuc, self.bilinen_kokler.get(yumusak_kok, 'isim'))
                 
-                return sonuc
+                return sonuc, 'yumusama'
         
         # 6. Birden fazla ek olabilir, recursive olarak dene
         for ek, kategori in olasi_ekler:
             if len(sozcuk) > len(ek):
                 olasi_kok = sozcuk[:-len(ek)]
-                alt_parcalama = self.parcala(olasi_kok, derinlik + 1)
+                alt_parcalama = self.parcala(olasi_kok, derinlik + 1, not_tablosu)
                 
                 if alt_parcalama['kok'] != olasi_kok:  # Alt parçalama başarılı olduysa
                     ekler = alt_parcalama['ekler'] + [(ek, kategori)]
@@ -278,17 +423,12 @@ class TurkceMorfologikAnaliz:
                     }
                     
                     # Veritabanına kaydet
-                    kok_id = self.veritabani.kok_ekle(
-                        alt_parcalama['kok'], 
-                        self.bilinen_kokler.get(alt_parcalama['kok'], 'isim'), 
-                        'kendi_analiz_recursif'
-                    )
-                    self.veritabani.sozcuk_analizi_kaydet(sozcuk, kok_id, json.dumps(sonuc))
+                    self._analizi_kaydet(sozcuk, sonuc, self.bilinen_kokler.get(alt_parcalama['kok'], 'isim'))
                     
-                    return sonuc
+                    return sonuc, 'ozyineleme'
         
         # 7. Hiçbir kurala uymadıysa, sorunlu sözcük olarak işaretle
-        self.veritabani.sorunlu_sozcuk_ekle(sozcuk, 'çözülemedi')
+        self._sorunlu_kaydet(sozcuk, 'çözülemedi')
         
         if self.interaktif:
             try:
@@ -318,13 +458,12 @@ class TurkceMorfologikAnaliz:
                 }
                 
                 # Veritabanına kaydet
-                kok_id = self.veritabani.kok_ekle(yanit, tur, 'kullanici_giris')
-                self.veritabani.sozcuk_analizi_kaydet(sozcuk, kok_id, json.dumps(sonuc))
+                self._analizi_kaydet(sozcuk, sonuc, tur)
                 
                 # Sorunlu sözcük durumunu güncelle
-                self.veritabani.sorunlu_sozcuk_ekle(sozcuk, 'çözüldü', f'Kök: {yanit}, Tür: {tur}')
+                self._sorunlu_kaydet(sozcuk, 'çözüldü', f'Kök: {yanit}, Tür: {tur}')
                 
-                return sonuc
+                return sonuc, 'kullanici'
                 
             except Exception as e:
                 logger.error(f"Kullanıcı girişi sırasında hata: {e}")
@@ -336,30 +475,75 @@ class TurkceMorfologikAnaliz:
             'source': 'varsayilan'
         }
         
-        return sonuc
+        return sonuc, 'varsayilan'
+    
+    def parcala_toplu(self, sozcukler: Iterable[str]) -> Dict[str, Dict]:
+        """Birden fazla sözcüğü tek seferde kök ve eklerine ayırır
+        
+        Önbellekte olmayan sözcüklerin kayıtlı analizleri tek bir sorguyla
+        getirilir. Yalnızca hiç görülmemiş sözcükler kural motorundan (ve
+        Zemberek'ten) geçer; yeni sonuçlar tek bir transaction'da kaydedilir.
+        Sonuç sözlüğünün anahtarları verilen sözcüklerdir.
+        """
+        girdiler = list(dict.fromkeys(sozcukler))
+        kucuk_halleri = {sozcuk: turkce_kucuk_harf(sozcuk) for sozcuk in girdiler}
+        
+        # 1. Önbellekteki analizler
+        baslangic = time.perf_counter()
+        analizler = {}
+        aranacaklar = set()
+        for kucuk_hali in kucuk_halleri.values():
+            if kucuk_hali in analizler or kucuk_hali in aranacaklar:
+                continue
+            analiz = self.onbellek.getir(kucuk_hali)
+            if analiz:
+                analizler[kucuk_hali] = analiz
+            else:
+                aranacaklar.add(kucuk_hali)
+        if analizler:
+            sure_ns = int((time.perf_counter() - baslangic) * 1e9)
+            self._yol_kaydet('toplu_onbellek', sure_ns // len(analizler), len(analizler))
+        
+        if self.metrikler is not None:
+            self.metrikler.sayac_ekle('onbellek_isabeti', len(analizler))
+        
+        # 2. Veritabanında kayıtlı analizler (tek sorgu)
+        if aranacaklar:
+            baslangic = time.perf_counter()
+            kayitli_analizler = self.veritabani.sozcuk_analizleri_toplu_getir(aranacaklar)
+            for sozcuk, analiz in kayitli_analizler.items():
+                analizler[sozcuk] = analiz
+                self.onbellek.ekle(sozcuk, analiz)
+            aranacaklar.difference_update(kayitli_analizler)
+            if kayitli_analizler:
+                sure_ns = int((time.perf_counter() - baslangic) * 1e9)
+                self._yol_kaydet('toplu_veritabani', sure_ns // len(kayitli_analizler), len(kayitli_analizler))
+            if self.metrikler is not None:
+                self.metrikler.sayac_ekle('veritabani_isabeti', len(kayitli_analizler))
+        
+        # 3. Bilinmeyen sözcükler kural motorundan geçer, yazmalar tek transaction'da.
+        # Ortak önekler parti boyunca bir kez çözümlensin diye not tablosu paylaşılır.
+        if aranacaklar:
+            not_tablosu = {}
+            with self.veritabani.toplu_islem():
+                for sozcuk in sorted(aranacaklar):
+                    analizler[sozcuk] = self.parcala(sozcuk, _not_tablosu=not_tablosu)
+        
+        return {sozcuk: analizler[kucuk_halleri[sozcuk]] for sozcuk in girdiler}
     
     def metinden_sozcukleri_coz(self, metin: str) -> Dict[str, Dict]:
         """Bir metindeki tüm sözcükleri çözümler"""
-        # Metni temizle ve sözcüklere ayır
-        temiz_metin = re.sub(r'[^\w\s]', ' ', metin)
-        sozcukler = [s for s in temiz_metin.lower().split() if s]
+        # Benzersiz sözcükleri bul (sayılar ve tek harfler de çözümlenir)
+        benzersiz_sozcukler = metin_sozcuk_kumesi(metin, sayilari_atla=False, en_kisa=1)
         
-        # Benzersiz sözcükleri bul
-        benzersiz_sozcukler = set(sozcukler)
-        
-        # Her bir sözcüğü çözümle
-        sonuclar = {}
-        for sozcuk in benzersiz_sozcukler:
-            sonuclar[sozcuk] = self.parcala(sozcuk)
-            
-        return sonuclar
+        # Tüm sözcükleri tek seferde çözümle
+        return self.parcala_toplu(benzersiz_sozcukler)
     
     def dosyadan_cozumle(self, dosya_yolu: str) -> Dict[str, Dict]:
-        """Bir metin dosyasındaki tüm sözcükleri çözümler"""
+        """Bir metin dosyasındaki tüm sözcükleri çözümler (dosya parça parça okunur)"""
         try:
-            with open(dosya_yolu, 'r', encoding='utf-8') as f:
-                metin = f.read()
-            return self.metinden_sozcukleri_coz(metin)
+            sozcukler = set(dosya_sozcukleri(dosya_yolu, sayilari_atla=False, en_kisa=1))
+            return self.parcala_toplu(sozcukler)
         except Exception as e:
             logger.error(f"Dosya okuma hatası: {e}")
             return {}
@@ -368,23 +552,38 @@ class TurkceMorfologikAnaliz:
         """Bilinen sözcükler sözlüğüne yeni bir sözcük ekler"""
         self.veritabani.kok_ekle(sozcuk, tur, 'manuel_ekleme')
         self.bilinen_kokler[sozcuk] = tur
+        
+        # Sözlük değişti, önbellekteki analizler artık güncel olmayabilir
+        self.onbellek.temizle()
+    
+    def sozluk_ekle_toplu(self, sozcukler: Iterable[Tuple[str, str]]) -> int:
+        """(sözcük, tür) çiftlerini sözlüğe tek transaction'da ekler, eklenen sayıyı döndürür"""
+        sozcukler = list(sozcukler)
+        self.veritabani.kok_ekle_toplu((sozcuk, tur, 'manuel_ekleme') for sozcuk, tur in sozcukler)
+        self.bilinen_kokler.update(sozcukler)
+        if sozcukler:
+            self.onbellek.temizle()
+        return len(sozcukler)
+    
+    def ek_ekle(self, ek: str, kategori: str):
+        """Bilinen ekler listesine yeni bir ek ekler"""
+        self.veritabani.ek_ekle(ek, kategori)
+        if ek not in self.ekler.setdefault(kategori, []):
+            self.ekler[kategori].append(ek)
+            self.ek_agaci.ekle(ek, kategori)
     
     def sozluk_yukle(self, dosya_yolu: str) -> int:
         """Harici bir sözcük listesi dosyasından sözlük yükler"""
         try:
-            eklenen = 0
+            sozcukler = []
             with open(dosya_yolu, 'r', encoding='utf-8') as dosya:
                 for satir in dosya:
                     bolumler = satir.strip().split('\t')
                     if len(bolumler) >= 2:
-                        sozcuk = bolumler[0]
-                        tur = bolumler[1]
-                        self.sozluk_ekle(sozcuk, tur)
-                        eklenen += 1
+                        sozcukler.append((bolumler[0], bolumler[1]))
                     elif len(bolumler) == 1 and bolumler[0]:
-                        sozcuk = bolumler[0]
-                        self.sozluk_ekle(sozcuk, 'isim')
-                        eklenen += 1
+                        sozcukler.append((bolumler[0], 'isim'))
+            eklenen = self.sozluk_ekle_toplu(sozcukler)
             
             logger.info(f"{eklenen} sözcük yüklendi: {dosya_yolu}")
             return eklenen
@@ -394,6 +593,9 @@ class TurkceMorfologikAnaliz:
     
     def kapat(self):
         """Kaynakları serbest bırakır"""
+        if self.yol_histogramlari:
+            for satir in self.istatistik_satirlari():
+                logger.info(satir)
         self.veritabani.kapat()
         logger.info("Veritabanı bağlantısı kapatıldı")
 
@@ -444,6 +646,9 @@ def main():
     unlu_uyumu_kontrol = config['Gelismis'].getboolean('unlu_uyumu_kontrol', True)
     unsuz_yumusama_kontrol = config['Gelismis'].getboolean('unsuz_yumusama_kontrol', True)
     zemberek_oncelikli = config['Gelismis'].getboolean('zemberek_oncelikli', True)
+    onbellek_boyutu = config['Gelismis'].getint('onbellek_boyutu', 10000)
+    onbellek_isitma = config['Gelismis'].getint('onbellek_isitma', 0)
+    yazma_tamponu = config['Gelismis'].getint('yazma_tamponu', 0)
     
     # Analizci nesnesi oluştur
     analizci = TurkceMorfologikAnaliz(
@@ -453,7 +658,10 @@ def main():
         max_derinlik=max_derinlik,
         unlu_uyumu_kontrol=unlu_uyumu_kontrol,
         unsuz_yumusama_kontrol=unsuz_yumusama_kontrol,
-        zemberek_oncelikli=zemberek_oncelikli
+        zemberek_oncelikli=zemberek_oncelikli,
+        onbellek_boyutu=onbellek_boyutu,
+        onbellek_isitma=onbellek_isitma,
+        yazma_tamponu=yazma_tamponu
     )
     
     try:
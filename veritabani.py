@@ -5,18 +5,182 @@ Türkçe Morfolojik Analiz - Veritabanı İşlemleri
 import sqlite3
 import logging
 import os
-from typing import Dict, List, Optional
+import json
+import time
+import atexit
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from metrikler import olc
 
 logger = logging.getLogger("TurkceMorfAnaliz")
 
+# INSERT ... RETURNING SQLite 3.35'ten itibaren desteklenir
+RETURNING_DESTEKLI = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Tek sorguda bağlanabilecek en fazla parametre (eski SQLite sürümlerinin sınırı)
+SORGU_PARAMETRE_SINIRI = 999
+
+# PRAGMA user_version ile tutulan şema sürümü (bkz. semayi_guncelle)
+SEMA_SURUMU = 1
+
+# Geçersiz analiz_json satırlarında json_each boş nesneye uygulanır
+_GECERLI_ANALIZ = "CASE WHEN json_valid(sa.analiz_json) THEN sa.analiz_json ELSE '{}' END"
+# Yalnızca [ek, kategori] biçimindeki ek öğeleri taşınır (eski satırlarda düz metin olabilir)
+_GECERLI_EK = "j.type = 'array' AND json_array_length(j.value) = 2"
+
+
+def _kilitli(metot):
+    """Metodu bağlantı kilidi altında çalıştırır (bkz. MorfolojikVeritabani._zamanlayici)"""
+    @functools.wraps(metot)
+    def sarmal(self, *args, **kwargs):
+        with self._kilit:
+            return metot(self, *args, **kwargs)
+    return sarmal
+
+
+def parcalara_bol(ogeler: List, boyut: int) -> Iterable[List]:
+    """Listeyi en fazla boyut elemanlı ardışık parçalara böler"""
+    for baslangic in range(0, len(ogeler), boyut):
+        yield ogeler[baslangic:baslangic + boyut]
+
+
+def _sutun_var_mi(conn: sqlite3.Connection, tablo: str, sutun: str) -> bool:
+    return any(satir[1] == sutun for satir in conn.execute(f"PRAGMA table_info({tablo})"))
+
+
+def semayi_guncelle(conn: sqlite3.Connection):
+    """Veritabanını güncel şemaya taşır
+    
+    Sürüm 1: analizlerin kaynağı sozcuk_analizleri.kaynak sütununda, ekleri
+    sozcuk_ekleri (sozcuk_id, sira, ek_id) tablosunda tutulur; eski satırlar
+    analiz_json'dan SQL içinde doldurulur. Yalnızca analizlerde geçen (ek,
+    kategori) çiftleri ekler tablosuna tanimli = 0 ile eklenir ve analizcinin
+    ek listesine girmez.
+    """
+    if not _sutun_var_mi(conn, 'sozcuk_analizleri', 'kaynak'):
+        conn.execute("ALTER TABLE sozcuk_analizleri ADD COLUMN kaynak TEXT")
+    if not _sutun_var_mi(conn, 'ekler', 'tanimli'):
+        conn.execute("ALTER TABLE ekler ADD COLUMN tanimli INTEGER DEFAULT 1")
+    
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS sozcuk_ekleri (
+        sozcuk_id INTEGER NOT NULL,
+        sira INTEGER NOT NULL,
+        ek_id INTEGER NOT NULL,
+        PRIMARY KEY (sozcuk_id, sira),
+        FOREIGN KEY (sozcuk_id) REFERENCES sozcuk_analizleri (id),
+        FOREIGN KEY (ek_id) REFERENCES ekler (id)
+    ) WITHOUT ROWID
+    ''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_sozcuk_ekleri_ek ON sozcuk_ekleri (ek_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_sozcuk_analizleri_kaynak ON sozcuk_analizleri (kaynak)")
+    
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SEMA_SURUMU:
+        return
+    
+    try:
+        conn.execute(
+            "UPDATE sozcuk_analizleri SET kaynak = json_extract(analiz_json, '$.source') "
+            "WHERE kaynak IS NULL AND json_valid(analiz_json)"
+        )
+        conn.execute(
+            "INSERT OR IGNORE INTO ekler (ek, kategori, frekans, tanimli) "
+            "SELECT DISTINCT json_extract(j.value, '$[0]'), json_extract(j.value, '$[1]'), 0, 0 "
+            f"FROM sozcuk_analizleri sa, json_each({_GECERLI_ANALIZ}, '$.ekler') j WHERE {_GECERLI_EK}"
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO sozcuk_ekleri (sozcuk_id, sira, ek_id) "
+            f"SELECT sa.id, j.key, e.id FROM sozcuk_analizleri sa, json_each({_GECERLI_ANALIZ}, '$.ekler') j "
+            "JOIN ekler e ON e.ek = json_extract(j.value, '$[0]') AND e.kategori = json_extract(j.value, '$[1]') "
+            f"WHERE {_GECERLI_EK}"
+        )
+        conn.execute(f"PRAGMA user_version = {SEMA_SURUMU}")
+        conn.commit()
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+    logger.info(f"Veritabanı şeması {SEMA_SURUMU}. sürüme taşındı")
+
+
+def ek_kimligi_getir(cursor: sqlite3.Cursor, ek: str, kategori: str) -> int:
+    """(ek, kategori) çiftinin ID'si; çift ekler tablosunda yoksa tanımsız olarak eklenir"""
+    cursor.execute(
+        "INSERT OR IGNORE INTO ekler (ek, kategori, frekans, tanimli) VALUES (?, ?, 0, 0)",
+        (ek, kategori)
+    )
+    cursor.execute("SELECT id FROM ekler WHERE ek = ? AND kategori = ?", (ek, kategori))
+    return cursor.fetchone()[0]
+
+
+def _ek_ciftleri(sozcuk_id: int, ekler) -> Iterable[Tuple[int, str, str]]:
+    """Analizin eklerinden (sıra, ek, kategori) üçlülerini üretir
+    
+    [ek, kategori] biçiminde olmayan öğeler günlüğe yazılıp atlanır; sıra
+    öğenin analizdeki konumudur (semayi_guncelle ile aynı).
+    """
+    if not isinstance(ekler, (list, tuple)):
+        logger.warning(f"Geçersiz ek listesi atlandı (sözcük id {sozcuk_id}): {ekler!r}")
+        return
+    for sira, oge in enumerate(ekler):
+        if isinstance(oge, (list, tuple)) and len(oge) == 2:
+            yield sira, oge[0], oge[1]
+        else:
+            logger.warning(f"Geçersiz ek atlandı (sözcük id {sozcuk_id}): {oge!r}")
+
+
+def _analizi_coz(analiz_json: str) -> Dict:
+    try:
+        return json.loads(analiz_json)
+    except (TypeError, ValueError):
+        return {}
+
 class MorfolojikVeritabani:
     """SQLite veritabanı yönetim sınıfı - Çoklu İşlem İçin Düzeltilmiş"""
     
-    def __init__(self, db_path: str = "turkce_morfoloji.db", readonly: bool = False):
+    def __init__(self, db_path: str = "turkce_morfoloji.db", readonly: bool = False,
+                 tampon_boyutu: int = 0, tampon_suresi: float = 2.0, metrikler=None):
         self.db_path = db_path
         self.conn = None
         self.readonly = readonly
+        self._toplu_islem_derinligi = 0
+        
+        # Yazma tamponu (write-behind): tampon_boyutu > 0 ise yazmalar açık
+        # transaction'da bekletilir ve eşik aşılınca tek seferde kaydedilir
+        self.tampon_boyutu = tampon_boyutu
+        self.tampon_suresi = tampon_suresi
+        self._bekleyen_yazma = 0
+        self._ilk_bekleme = None
+        self._bosaltma_sayisi = 0
+        self._bosaltilan_yazma = 0
+        self._toplam_bosaltma_suresi = 0.0
+        self._en_uzun_bosaltma = 0.0
+        
+        # Süre eşiği bir sonraki yazmayı beklemeden zamanlayıcıyla uygulanır;
+        # zamanlayıcı iş parçacığı bağlantıyı yalnızca bu kilit altında kullanır
+        self._kilit = threading.RLock()
+        self._zamanlayici = None
+        
+        # Verilirse commit süreleri 'kayit' aşamasına yazılır (bkz. metrikler)
+        self.metrikler = metrikler
+        
+        # Bilinen köklerin ID'leri (get_bilinen_kokler ile yüklenir, eklemelerle
+        # güncellenir) ve bilinen köklerin commit'e kadar biriken frekans artışları
+        self._kok_idleri: Dict[str, int] = {}
+        self._bekleyen_kok_frekanslari: Dict[int, int] = {}
+        
+        # (ek, kategori) -> ekler.id ve commit'e kadar biriken analiz ekleri:
+        # {sözcük id: ekler} ile eski ekleri silinecek sözcüklerin ID'leri
+        self._ek_idleri: Dict[Tuple[str, str], int] = {}
+        self._bekleyen_ekler: Dict[int, List] = {}
+        self._silinecek_ekler: Set[int] = set()
+        
         self.initialize_db()
+        
+        if self.tampon_boyutu > 0 and not self.readonly:
+            atexit.register(self.tamponu_bosalt)
     
     def initialize_db(self):
         """Veritabanı bağlantısını başlatır ve gerekli tabloları oluşturur"""
@@ -35,7 +199,8 @@ class MorfolojikVeritabani:
                     return
             
             # İmmediate modunda bağlantı (SQLite kilitleme sorununu azaltır)
-            self.conn = sqlite3.connect(self.db_path, isolation_level="IMMEDIATE", timeout=60.0)
+            self.conn = sqlite3.connect(self.db_path, isolation_level="IMMEDIATE", timeout=60.0,
+                                        check_same_thread=False)
             cursor = self.conn.cursor()
             
             # PRAGMA ayarları
@@ -63,6 +228,7 @@ class MorfolojikVeritabani:
                 ek TEXT,
                 kategori TEXT,
                 frekans INTEGER DEFAULT 1,
+                tanimli INTEGER DEFAULT 1,
                 UNIQUE(ek, kategori)
             )
             ''')
@@ -76,6 +242,7 @@ class MorfolojikVeritabani:
                 analiz_json TEXT,
                 frekans INTEGER DEFAULT 1,
                 son_guncelleme TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                kaynak TEXT,
                 FOREIGN KEY (kok_id) REFERENCES kokler (id)
             )
             ''')
@@ -91,6 +258,9 @@ class MorfolojikVeritabani:
             )
             ''')
             
+            # Analiz kaynakları ve ekleri için normalize tablolar (eski veritabanları taşınır)
+            semayi_guncelle(self.conn)
+            
             self.conn.commit()
             logger.info("Veritabanı başarıyla oluşturuldu/bağlandı.")
             
@@ -119,23 +289,34 @@ class MorfolojikVeritabani:
         if not self.conn:
             return
             
-        cursor = self.conn.cursor()
-        for kategori, ek_listesi in default_ekler.items():
-            for ek in ek_listesi:
-                try:
-                    cursor.execute(
-                        "INSERT OR IGNORE INTO ekler (ek, kategori) VALUES (?, ?)", 
-                        (ek, kategori)
-                    )
-                except sqlite3.Error as e:
-                    logger.warning(f"Ek ekleme hatası: {ek} - {e}")
+        try:
+            self.conn.executemany(
+                "INSERT INTO ekler (ek, kategori) VALUES (?, ?) "
+                "ON CONFLICT(ek, kategori) DO UPDATE SET tanimli = 1 WHERE tanimli = 0",
+                [(ek, kategori) for kategori, ek_listesi in default_ekler.items() for ek in ek_listesi]
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Varsayılan ek ekleme hatası: {e}")
         
         self.conn.commit()
     
+    @_kilitli
     def kapat(self):
-        """Veritabanı bağlantısını kapatır"""
+        """Bekleyen yazmaları kaydeder ve veritabanı bağlantısını kapatır"""
+        if self.tampon_boyutu > 0 and not self.readonly:
+            atexit.unregister(self.tamponu_bosalt)
+        if self._zamanlayici is not None:
+            self._zamanlayici.cancel()
+            self._zamanlayici = None
+        
         if self.conn:
             try:
+                self.tamponu_bosalt()
+                if self.tampon_boyutu > 0:
+                    istatistik = self.tampon_istatistikleri()
+                    logger.info(f"Yazma tamponu: {istatistik['bosaltma_sayisi']} boşaltma, "
+                                f"{istatistik['bosaltilan_yazma']} yazma, "
+                                f"ortalama {istatistik['ortalama_sure'] * 1000:.1f} ms")
                 self.conn.close()
                 self.conn = None
             except sqlite3.Error as e:
@@ -148,27 +329,151 @@ class MorfolojikVeritabani:
             if not self.conn:
                 raise sqlite3.Error("Veritabanı bağlantısı kurulamadı")
     
+    @_kilitli
+    def _commit(self, yazma_sayisi: int = 1):
+        """Yapılan yazmaları kaydeder
+        
+        Toplu işlem içindeyken kayıt bloğun sonuna, yazma tamponu etkinken
+        boyut ya da süre eşiği aşılana kadar ertelenir. Bekleyen yazmalar aynı
+        bağlantıdaki okumalara görünür. Süre eşiği yeni yazma gelmese de
+        zamanlayıcıyla uygulanır; boşta kalan bağlantı yazma kilidini
+        tampon_suresi'nden uzun tutmaz.
+        """
+        self._bekleyen_yazma += yazma_sayisi
+        
+        if self._toplu_islem_derinligi > 0:
+            return
+        
+        if self.tampon_boyutu > 0:
+            if self._ilk_bekleme is None:
+                self._ilk_bekleme = time.monotonic()
+            kalan_sure = self.tampon_suresi - (time.monotonic() - self._ilk_bekleme)
+            if self._bekleyen_yazma < self.tampon_boyutu and kalan_sure > 0:
+                self._zamanlayiciyi_kur(kalan_sure)
+                return
+        
+        self.tamponu_bosalt()
+    
+    def _zamanlayiciyi_kur(self, sure: float):
+        if self._zamanlayici is None:
+            self._zamanlayici = threading.Timer(sure, self._sure_dolunca_bosalt)
+            self._zamanlayici.daemon = True
+            self._zamanlayici.start()
+    
+    @_kilitli
+    def _sure_dolunca_bosalt(self):
+        """Zamanlayıcıdan çağrılır: süre eşiği dolmuşsa bekleyen yazmaları kaydeder
+        
+        Toplu işlem sürerken kayıt bloğun sonuna bırakılır.
+        """
+        self._zamanlayici = None
+        if self._ilk_bekleme is None or self._toplu_islem_derinligi > 0:
+            return
+        kalan_sure = self.tampon_suresi - (time.monotonic() - self._ilk_bekleme)
+        if kalan_sure <= 0:
+            self.tamponu_bosalt()
+            # Kayıt başarısız olduysa (ör. kilit) daha sonra yeniden denenir
+            kalan_sure = self.tampon_suresi
+        if self._ilk_bekleme is not None:
+            self._zamanlayiciyi_kur(kalan_sure)
+    
+    @_kilitli
+    def tamponu_bosalt(self):
+        """Bekleyen tüm yazmaları tek bir commit ile kaydeder"""
+        if not self.conn:
+            return
+        
+        self._kok_frekanslarini_yaz()
+        self._analiz_eklerini_yaz()
+        
+        if self.conn.in_transaction:
+            baslangic = time.perf_counter()
+            try:
+                with olc(self.metrikler, 'kayit', self._bekleyen_yazma):
+                    self.conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Yazma tamponu boşaltma hatası: {e}")
+                return
+            sure = time.perf_counter() - baslangic
+            
+            self._bosaltma_sayisi += 1
+            self._bosaltilan_yazma += self._bekleyen_yazma
+            self._toplam_bosaltma_suresi += sure
+            self._en_uzun_bosaltma = max(self._en_uzun_bosaltma, sure)
+        
+        self._bekleyen_yazma = 0
+        self._ilk_bekleme = None
+    
+    def _kok_frekanslarini_yaz(self):
+        """Bilinen köklerin biriken frekans artışlarını tek executemany ile yazar"""
+        if not self._bekleyen_kok_frekanslari:
+            return
+        try:
+            self.conn.executemany(
+                "UPDATE kokler SET frekans = frekans + ? WHERE id = ?",
+                [(artis, kok_id) for kok_id, artis in self._bekleyen_kok_frekanslari.items()]
+            )
+            self._bekleyen_kok_frekanslari.clear()
+        except sqlite3.Error as e:
+            logger.error(f"Kök frekansı güncelleme hatası: {e}")
+    
+    def tampon_istatistikleri(self) -> Dict:
+        """Yazma tamponu boşaltma sayılarını ve sürelerini döndürür"""
+        return {
+            'bosaltma_sayisi': self._bosaltma_sayisi,
+            'bosaltilan_yazma': self._bosaltilan_yazma,
+            'bekleyen_yazma': self._bekleyen_yazma,
+            'toplam_sure': self._toplam_bosaltma_suresi,
+            'ortalama_sure': (self._toplam_bosaltma_suresi / self._bosaltma_sayisi
+                              if self._bosaltma_sayisi else 0.0),
+            'en_uzun_sure': self._en_uzun_bosaltma
+        }
+    
+    @contextmanager
+    def toplu_islem(self):
+        """Blok içindeki tüm yazma işlemlerini tek bir transaction'da toplar
+        
+        Kullanım:
+            with veritabani.toplu_islem():
+                veritabani.kok_ekle(...)
+                veritabani.sozcuk_analizi_kaydet(...)
+        """
+        self._check_connection()
+        self._toplu_islem_derinligi += 1
+        try:
+            yield self
+        finally:
+            self._toplu_islem_derinligi -= 1
+            if self._toplu_islem_derinligi == 0 and self.conn:
+                self._commit(0)
+    
+    @_kilitli
     def get_bilinen_kokler(self) -> Dict[str, str]:
         """Veritabanındaki bilinen kökleri çeker"""
         bilinen_kokler = {}
         try:
             self._check_connection()
             cursor = self.conn.cursor()
-            cursor.execute("SELECT kok, tur FROM kokler")
-            for row in cursor.fetchall():
-                bilinen_kokler[row[0]] = row[1]
+            cursor.execute("SELECT id, kok, tur FROM kokler")
+            for kok_id, kok, tur in cursor.fetchall():
+                bilinen_kokler[kok] = tur
+                self._kok_idleri[kok] = kok_id
             return bilinen_kokler
         except sqlite3.Error as e:
             logger.error(f"Bilinen kökleri çekme hatası: {e}")
             return {}
     
+    @_kilitli
     def get_bilinen_ekler(self) -> Dict[str, List[str]]:
-        """Veritabanındaki bilinen ekleri kategorilerine göre çeker"""
+        """Veritabanındaki bilinen ekleri kategorilerine göre çeker
+        
+        Yalnızca analizlerde geçtiği için kaydedilmiş (tanimli = 0) ekler alınmaz.
+        """
         bilinen_ekler = {}
         try:
             self._check_connection()
             cursor = self.conn.cursor()
-            cursor.execute("SELECT ek, kategori FROM ekler")
+            cursor.execute("SELECT ek, kategori FROM ekler WHERE tanimli = 1")
             for row in cursor.fetchall():
                 ek, kategori = row
                 if kategori not in bilinen_ekler:
@@ -179,10 +484,21 @@ class MorfolojikVeritabani:
             logger.error(f"Bilinen ekleri çekme hatası: {e}")
             return {}
     
+    @_kilitli
     def kok_ekle(self, kok: str, tur: str = 'isim', kaynak: str = 'kullanici') -> int:
-        """Yeni bir kök ekler veya varsa frekansını artırır"""
+        """Yeni bir kök ekler veya varsa frekansını artırır
+        
+        ID'si bilinen kökün frekans artışı bekletilir ve commit sırasında
+        toplu yazılır; yeni kökün ID'si eklemeyle birlikte alınır.
+        """
         if self.readonly:
             return -1  # Salt okunur modda ekleme yapmayız
+        
+        kok_id = self._kok_idleri.get(kok)
+        if kok_id is not None:
+            self._bekleyen_kok_frekanslari[kok_id] = self._bekleyen_kok_frekanslari.get(kok_id, 0) + 1
+            self._commit()
+            return kok_id
             
         try:
             self._check_connection()
@@ -194,24 +510,33 @@ class MorfolojikVeritabani:
             
             while retry_count < max_retry:
                 try:
-                    cursor.execute(
-                        "INSERT INTO kokler (kok, tur, kaynak) VALUES (?, ?, ?) "
-                        "ON CONFLICT(kok) DO UPDATE SET frekans = frekans + 1",
-                        (kok, tur, kaynak)
-                    )
-                    self.conn.commit()
-                    
-                    # Eklenen veya güncellenen kökün ID'sini getir
-                    cursor.execute("SELECT id FROM kokler WHERE kok = ?", (kok,))
-                    result = cursor.fetchone()
+                    if RETURNING_DESTEKLI:
+                        cursor.execute(
+                            "INSERT INTO kokler (kok, tur, kaynak) VALUES (?, ?, ?) "
+                            "ON CONFLICT(kok) DO UPDATE SET frekans = frekans + 1 RETURNING id",
+                            (kok, tur, kaynak)
+                        )
+                        result = cursor.fetchall()
+                        self._commit()
+                    else:
+                        cursor.execute(
+                            "INSERT INTO kokler (kok, tur, kaynak) VALUES (?, ?, ?) "
+                            "ON CONFLICT(kok) DO UPDATE SET frekans = frekans + 1",
+                            (kok, tur, kaynak)
+                        )
+                        self._commit()
+                        
+                        # Eklenen veya güncellenen kökün ID'sini getir
+                        cursor.execute("SELECT id FROM kokler WHERE kok = ?", (kok,))
+                        result = cursor.fetchall()
                     if result:
-                        return result[0]
+                        self._kok_idleri[kok] = result[0][0]
+                        return result[0][0]
                     return -1
                     
                 except sqlite3.OperationalError as e:
                     if "database is locked" in str(e) and retry_count < max_retry - 1:
                         retry_count += 1
-                        import time
                         time.sleep(0.2 * (2 ** retry_count))  # Exponential backoff
                         continue
                     raise
@@ -223,6 +548,7 @@ class MorfolojikVeritabani:
             logger.error(f"Kök ekleme hatası: {kok} - {e}")
             return -1
     
+    @_kilitli
     def ek_ekle(self, ek: str, kategori: str) -> bool:
         """Yeni bir ek ekler veya varsa frekansını artırır"""
         if self.readonly:
@@ -233,19 +559,28 @@ class MorfolojikVeritabani:
             cursor = self.conn.cursor()
             cursor.execute(
                 "INSERT INTO ekler (ek, kategori) VALUES (?, ?) "
-                "ON CONFLICT(ek, kategori) DO UPDATE SET frekans = frekans + 1",
+                "ON CONFLICT(ek, kategori) DO UPDATE SET frekans = frekans + 1, tanimli = 1",
                 (ek, kategori)
             )
-            self.conn.commit()
+            self._commit()
             return True
         except sqlite3.Error as e:
             logger.error(f"Ek ekleme hatası: {ek} - {e}")
             return False
     
-    def sozcuk_analizi_kaydet(self, sozcuk: str, kok_id: int, analiz_json: str) -> bool:
-        """Bir sözcüğün analiz sonucunu kaydeder"""
+    @_kilitli
+    def sozcuk_analizi_kaydet(self, sozcuk: str, kok_id: int, analiz_json: str,
+                              analiz: Optional[Dict] = None) -> bool:
+        """Bir sözcüğün analiz sonucunu kaydeder
+        
+        Kaynak ve ekler normalize sütunlara da yazılır; analiz sözlüğü
+        verilmezse analiz_json'dan çözülür.
+        """
         if self.readonly:
             return False  # Salt okunur modda ekleme yapmayız
+        
+        if analiz is None:
+            analiz = _analizi_coz(analiz_json)
             
         try:
             self._check_connection()
@@ -258,18 +593,27 @@ class MorfolojikVeritabani:
             while retry_count < max_retry:
                 try:
                     cursor.execute(
-                        "INSERT INTO sozcuk_analizleri (sozcuk, kok_id, analiz_json) VALUES (?, ?, ?) "
+                        "INSERT INTO sozcuk_analizleri (sozcuk, kok_id, analiz_json, kaynak) VALUES (?, ?, ?, ?) "
                         "ON CONFLICT(sozcuk) DO UPDATE SET "
-                        "kok_id = ?, analiz_json = ?, frekans = frekans + 1, son_guncelleme = CURRENT_TIMESTAMP",
-                        (sozcuk, kok_id, analiz_json, kok_id, analiz_json)
+                        "kok_id = excluded.kok_id, analiz_json = excluded.analiz_json, kaynak = excluded.kaynak, "
+                        "frekans = frekans + 1, son_guncelleme = CURRENT_TIMESTAMP"
+                        + (" RETURNING id, frekans" if RETURNING_DESTEKLI else ""),
+                        (sozcuk, kok_id, analiz_json, analiz.get('source'))
                     )
-                    self.conn.commit()
+                    if RETURNING_DESTEKLI:
+                        sozcuk_id, frekans = cursor.fetchall()[0]
+                    else:
+                        cursor.execute("SELECT id, frekans FROM sozcuk_analizleri WHERE sozcuk = ?", (sozcuk,))
+                        sozcuk_id, frekans = cursor.fetchone()
+                    self._bekleyen_ekler[sozcuk_id] = analiz.get('ekler', [])
+                    if frekans > 1:
+                        self._silinecek_ekler.add(sozcuk_id)
+                    self._commit()
                     return True
                     
                 except sqlite3.OperationalError as e:
                     if "database is locked" in str(e) and retry_count < max_retry - 1:
                         retry_count += 1
-                        import time
                         time.sleep(0.2 * (2 ** retry_count))  # Exponential backoff
                         continue
                     raise
@@ -281,6 +625,7 @@ class MorfolojikVeritabani:
             logger.error(f"Sözcük analizi kaydetme hatası: {sozcuk} - {e}")
             return False
     
+    @_kilitli
     def sorunlu_sozcuk_ekle(self, sozcuk: str, durum: str = 'beklemede', not_metni: str = '') -> bool:
         """Sorunlu bir sözcüğü veritabanına ekler"""
         if self.readonly:
@@ -302,13 +647,12 @@ class MorfolojikVeritabani:
                         "deneme_sayisi = deneme_sayisi + 1, durum = ?, not_metni = ?",
                         (sozcuk, durum, not_metni, durum, not_metni)
                     )
-                    self.conn.commit()
+                    self._commit()
                     return True
                     
                 except sqlite3.OperationalError as e:
                     if "database is locked" in str(e) and retry_count < max_retry - 1:
                         retry_count += 1
-                        import time
                         time.sleep(0.2 * (2 ** retry_count))  # Exponential backoff
                         continue
                     raise
@@ -320,6 +664,216 @@ class MorfolojikVeritabani:
             logger.error(f"Sorunlu sözcük ekleme hatası: {sozcuk} - {e}")
             return False
     
+    def _kilitlenirse_tekrarla(self, islem):
+        """islem'i çalıştırır; veritabanı kilitliyse üstel beklemeyle yeniden dener
+        
+        Kilit hatası yazma transaction'ı başlarken alındığından yeniden
+        denenen toplu yazma iki kez uygulanmaz.
+        """
+        max_retry = 3
+        retry_count = 0
+        while True:
+            try:
+                return islem()
+            except sqlite3.OperationalError as e:
+                if "database is locked" in str(e) and retry_count < max_retry - 1:
+                    retry_count += 1
+                    time.sleep(0.2 * (2 ** retry_count))  # Exponential backoff
+                    continue
+                raise
+    
+    @_kilitli
+    def kok_ekle_toplu(self, kokler: Iterable[Tuple[str, str, str]]) -> Dict[str, int]:
+        """(kök, tür, kaynak) üçlülerini tek transaction'da ekler, {kök: id} döndürür
+        
+        kok_ekle ile aynı çakışma kuralı geçerlidir: var olan (ya da listede
+        tekrarlanan) her kökün frekansı bir artar. ID'si bilinen köklerin
+        artışları bekletilir; yeni köklerin ID'leri yazmadan sonra geçici bir
+        tabloyla tek sorguda çekilir.
+        """
+        if self.readonly:
+            return {}
+        
+        satirlar = []
+        kimlikler = {}
+        sayi = 0
+        for satir in kokler:
+            sayi += 1
+            kok_id = self._kok_idleri.get(satir[0])
+            if kok_id is None:
+                satirlar.append(satir)
+            else:
+                self._bekleyen_kok_frekanslari[kok_id] = self._bekleyen_kok_frekanslari.get(kok_id, 0) + 1
+                kimlikler[satir[0]] = kok_id
+        if not sayi:
+            return {}
+        
+        def yaz():
+            cursor = self.conn.cursor()
+            cursor.executemany(
+                "INSERT INTO kokler (kok, tur, kaynak) VALUES (?, ?, ?) "
+                "ON CONFLICT(kok) DO UPDATE SET frekans = frekans + 1",
+                satirlar
+            )
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS aranan_kokler (kok TEXT PRIMARY KEY)")
+            cursor.execute("DELETE FROM aranan_kokler")
+            cursor.executemany(
+                "INSERT OR IGNORE INTO aranan_kokler (kok) VALUES (?)",
+                ((kok,) for kok, _, _ in satirlar)
+            )
+            cursor.execute(
+                "SELECT k.kok, k.id FROM aranan_kokler a JOIN kokler k ON k.kok = a.kok"
+            )
+            yeniler = dict(cursor.fetchall())
+            cursor.execute("DELETE FROM aranan_kokler")
+            return yeniler
+        
+        try:
+            self._check_connection()
+            if satirlar:
+                yeniler = self._kilitlenirse_tekrarla(yaz)
+                self._kok_idleri.update(yeniler)
+                kimlikler.update(yeniler)
+            self._commit(sayi)
+            return kimlikler
+        except sqlite3.Error as e:
+            logger.error(f"Toplu kök ekleme hatası ({sayi} kök): {e}")
+            return {}
+    
+    @_kilitli
+    def _toplu_yaz(self, sorgu: str, satirlar: List[Tuple], aciklama: str) -> bool:
+        """Satırları executemany ile tek transaction'da yazar"""
+        if self.readonly:
+            return False
+        if not satirlar:
+            return True
+        try:
+            self._check_connection()
+            self._kilitlenirse_tekrarla(lambda: self.conn.executemany(sorgu, satirlar))
+            self._commit(len(satirlar))
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Toplu {aciklama} hatası ({len(satirlar)} satır): {e}")
+            return False
+    
+    def ek_ekle_toplu(self, ekler: Iterable[Tuple[str, str]]) -> bool:
+        """(ek, kategori) çiftlerini tek transaction'da ekler (ek_ekle ile aynı çakışma kuralı)"""
+        return self._toplu_yaz(
+            "INSERT INTO ekler (ek, kategori) VALUES (?, ?) "
+            "ON CONFLICT(ek, kategori) DO UPDATE SET frekans = frekans + 1, tanimli = 1",
+            list(ekler), "ek ekleme"
+        )
+    
+    @_kilitli
+    def sozcuk_analizi_kaydet_toplu(self, analizler: Iterable[Tuple]) -> bool:
+        """(sözcük, kök id, analiz json[, analiz]) satırlarını tek transaction'da kaydeder
+        
+        Analiz sözlüğü verilmeyen satırlarda kaynak ve ekler analiz_json'dan
+        çözülür. Sözcük ID'leri yazmadan sonra geçici tabloyla tek sorguda
+        çekilir ve ekler sozcuk_ekleri'ne toplu yazılır.
+        """
+        if self.readonly:
+            return False
+        
+        satirlar = []
+        son_ekler = {}  # Listede tekrarlanan sözcükte son analiz geçerlidir
+        for satir in analizler:
+            analiz = satir[3] if len(satir) > 3 else _analizi_coz(satir[2])
+            satirlar.append((satir[0], satir[1], satir[2], analiz.get('source')))
+            son_ekler[satir[0]] = analiz.get('ekler', [])
+        if not satirlar:
+            return True
+        
+        def yaz():
+            cursor = self.conn.cursor()
+            cursor.executemany(
+                "INSERT INTO sozcuk_analizleri (sozcuk, kok_id, analiz_json, kaynak) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(sozcuk) DO UPDATE SET "
+                "kok_id = excluded.kok_id, analiz_json = excluded.analiz_json, kaynak = excluded.kaynak, "
+                "frekans = frekans + 1, son_guncelleme = CURRENT_TIMESTAMP",
+                satirlar
+            )
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS aranan_sozcukler (sozcuk TEXT PRIMARY KEY)")
+            cursor.execute("DELETE FROM aranan_sozcukler")
+            cursor.executemany(
+                "INSERT OR IGNORE INTO aranan_sozcukler (sozcuk) VALUES (?)",
+                ((sozcuk,) for sozcuk in son_ekler)
+            )
+            cursor.execute(
+                "SELECT sa.sozcuk, sa.id, sa.frekans FROM aranan_sozcukler a "
+                "JOIN sozcuk_analizleri sa ON sa.sozcuk = a.sozcuk"
+            )
+            kayitlar = cursor.fetchall()
+            cursor.execute("DELETE FROM aranan_sozcukler")
+            for sozcuk, sozcuk_id, frekans in kayitlar:
+                self._bekleyen_ekler[sozcuk_id] = son_ekler[sozcuk]
+                if frekans > 1:
+                    self._silinecek_ekler.add(sozcuk_id)
+        
+        try:
+            self._check_connection()
+            self._kilitlenirse_tekrarla(yaz)
+            self._commit(len(satirlar))
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Toplu sözcük analizi kaydetme hatası ({len(satirlar)} satır): {e}")
+            return False
+    
+    def _ek_kimligi(self, cursor: sqlite3.Cursor, ek: str, kategori: str) -> int:
+        """(ek, kategori) çiftinin ID'si; ilk çağrıda tüm ek ID'leri belleğe yüklenir"""
+        if not self._ek_idleri:
+            cursor.execute("SELECT id, ek, kategori FROM ekler")
+            self._ek_idleri = {(ek_, kategori_): ek_id for ek_id, ek_, kategori_ in cursor.fetchall()}
+        ek_id = self._ek_idleri.get((ek, kategori))
+        if ek_id is None:
+            ek_id = ek_kimligi_getir(cursor, ek, kategori)
+            self._ek_idleri[(ek, kategori)] = ek_id
+        return ek_id
+    
+    def _analiz_eklerini_yaz(self):
+        """Biriken analiz eklerini sozcuk_ekleri tablosuna toplu yazar
+        
+        Yalnızca önceden kaydı olabilecek (frekansı 1'i aşan) sözcüklerin
+        eski ekleri silinir. Silme ve ekleme bir savepoint içinde yapılır;
+        hata olursa ikisi birlikte geri alınır. Bekleyen ekler her durumda
+        boşaltılır.
+        """
+        if not self._bekleyen_ekler:
+            return
+        cursor = self.conn.cursor()
+        try:
+            satirlar = []
+            for sozcuk_id, ekler in self._bekleyen_ekler.items():
+                for sira, ek, kategori in _ek_ciftleri(sozcuk_id, ekler):
+                    satirlar.append((sozcuk_id, sira, self._ek_kimligi(cursor, ek, kategori)))
+            
+            cursor.execute("SAVEPOINT analiz_ekleri")
+            try:
+                if self._silinecek_ekler:
+                    cursor.executemany("DELETE FROM sozcuk_ekleri WHERE sozcuk_id = ?",
+                                       [(sozcuk_id,) for sozcuk_id in self._silinecek_ekler])
+                cursor.executemany("INSERT INTO sozcuk_ekleri (sozcuk_id, sira, ek_id) VALUES (?, ?, ?)", satirlar)
+            except sqlite3.Error:
+                cursor.execute("ROLLBACK TO analiz_ekleri")
+                raise
+            finally:
+                cursor.execute("RELEASE analiz_ekleri")
+        except sqlite3.Error as e:
+            logger.error(f"Analiz ekleri yazma hatası: {e}")
+        finally:
+            self._bekleyen_ekler.clear()
+            self._silinecek_ekler.clear()
+    
+    def sorunlu_sozcuk_ekle_toplu(self, sorunlular: Iterable[Tuple[str, str, str]]) -> bool:
+        """(sözcük, durum, not) üçlülerini tek transaction'da ekler"""
+        return self._toplu_yaz(
+            "INSERT INTO sorunlu_sozcukler (sozcuk, durum, not_metni) VALUES (?, ?, ?) "
+            "ON CONFLICT(sozcuk) DO UPDATE SET "
+            "deneme_sayisi = deneme_sayisi + 1, durum = excluded.durum, not_metni = excluded.not_metni",
+            list(sorunlular), "sorunlu sözcük ekleme"
+        )
+    
+    @_kilitli
     def sozcuk_analizi_getir(self, sozcuk: str) -> Optional[Dict]:
         """Veritabanında kayıtlı bir sözcüğün analizini getirir"""
         try:
@@ -338,14 +892,12 @@ class MorfolojikVeritabani:
                     )
                     result = cursor.fetchone()
                     if result:
-                        import json
                         return json.loads(result[0])
                     return None
                     
                 except sqlite3.OperationalError as e:
                     if "database is locked" in str(e) and retry_count < max_retry - 1:
                         retry_count += 1
-                        import time
                         time.sleep(0.2 * (2 ** retry_count))  # Exponential backoff
                         continue
                     raise
@@ -355,4 +907,48 @@ class MorfolojikVeritabani:
                     
         except sqlite3.Error as e:
             logger.error(f"Sözcük analizi getirme hatası: {sozcuk} - {e}")
-            return None
\ No newline at end of file
+            return None
+    
+    @_kilitli
+    def en_sik_analizleri_getir(self, limit: int = 1000) -> List[Tuple[str, Dict]]:
+        """En sık analiz edilen sözcükleri ve analizlerini frekans sırasıyla getirir"""
+        try:
+            self._check_connection()
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "SELECT sozcuk, analiz_json FROM sozcuk_analizleri "
+                "ORDER BY frekans DESC LIMIT ?",
+                (limit,)
+            )
+            return [(sozcuk, json.loads(analiz_json)) for sozcuk, analiz_json in cursor.fetchall()]
+        except (sqlite3.Error, ValueError) as e:
+            logger.error(f"Sık analizleri getirme hatası: {e}")
+            return []
+    
+    @_kilitli
+    def sozcuk_analizleri_toplu_getir(self, sozcukler: Iterable[str]) -> Dict[str, Dict]:
+        """Birden fazla sözcüğün kayıtlı analizlerini getirir
+        
+        Sözcükler SORGU_PARAMETRE_SINIRI'lık parçalar halinde WHERE sozcuk IN
+        (...) sorgularıyla aranır; okuma transaction açmaz ve yazma kilidi
+        almaz. Yalnızca kaydı bulunan sözcükler sonuçta yer alır.
+        """
+        sonuclar = {}
+        try:
+            self._check_connection()
+            cursor = self.conn.cursor()
+            
+            for parca in parcalara_bol(list(dict.fromkeys(sozcukler)), SORGU_PARAMETRE_SINIRI):
+                cursor.execute(
+                    "SELECT sozcuk, analiz_json FROM sozcuk_analizleri "
+                    f"WHERE sozcuk IN ({', '.join('?' * len(parca))})",
+                    parca
+                )
+                for sozcuk, analiz_json in cursor.fetchall():
+                    sonuclar[sozcuk] = json.loads(analiz_json)
+            
+            return sonuclar
+            
+        except (sqlite3.Error, ValueError) as e:
+            logger.error(f"Toplu sözcük analizi getirme hatası: {e}")
+            return sonuclar
@@ -0,0 +1,250 @@
+"""
+Türkçe Morfolojik Analiz - Yaklaşık Sayım
+
+Yeni bir derlemi hızlıca keşfetmek için derlem boyutundan bağımsız, sabit
+bellekli özet yapıları:
+
+- CountMinSketch: sözcük ve belge frekansı tahmini (tahmin >= gerçek değer;
+  1 - delta olasılıkla tahmin <= gerçek + epsilon * N)
+- HyperLogLog: benzersiz sözcük sayısı tahmini (bağıl standart hata 1.04 / sqrt(m))
+- SpaceSaving: en sık k sözcük (her sözcüğün gerçek sayısı [sayi - hata, sayi]
+  aralığındadır; gerçek sayısı N / k'yı aşan her sözcük listededir)
+- AltKOrneklem: özet değeri en küçük k sözcük; benzersiz sözcüklerden
+  düzgün dağılımlı, tekrarlanabilir bir örneklem
+
+Tüm yapılar sözcük başına bir kez hesaplanan 128 bitlik blake2b özetini
+kullanır; sonuçlar çalışmadan çalışmaya değişmez.
+"""
+
+import math
+import heapq
+import hashlib
+from array import array
+from typing import Dict, List, Mapping as MappingType, Set, Tuple
+
+_UST_64 = (1 << 64) - 1
+
+
+def sozcuk_ozeti(sozcuk: str) -> int:
+    """Sözcüğün 128 bitlik özetini döndürür (tüm yapılarda ortak)"""
+    return int.from_bytes(hashlib.blake2b(sozcuk.encode('utf-8'), digest_size=16).digest(), 'little')
+
+
+class CountMinSketch:
+    """Count-Min sketch: derinlik x genişlik sayaç tablosu
+
+    Satır indeksleri özetin iki 64 bitlik yarısından çift özetlemeyle
+    (h1 + i * h2) türetilir.
+    """
+
+    def __init__(self, genislik: int, derinlik: int):
+        self.genislik = genislik
+        self.derinlik = derinlik
+        self.satirlar = [array('q', [0]) * genislik for _ in range(derinlik)]
+        self.toplam = 0
+
+    @classmethod
+    def hata_payindan(cls, epsilon: float, delta: float) -> 'CountMinSketch':
+        """Hata payı epsilon * N ve başarısızlık olasılığı delta için boyutlandırır"""
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)))
+
+    def indeksler(self, ozet: int) -> List[int]:
+        """Özetin her satırdaki sütun indeksi (aynı boyutlu sketch'ler için ortaktır)"""
+        h1 = ozet & _UST_64
+        h2 = (ozet >> 64) | 1
+        genislik = self.genislik
+        return [(h1 + i * h2) % genislik for i in range(self.derinlik)]
+
+    def ekle(self, ozet: int, sayi: int = 1):
+        for satir, indeks in zip(self.satirlar, self.indeksler(ozet)):
+            satir[indeks] += sayi
+        self.toplam += sayi
+
+    def tahmin(self, ozet: int) -> int:
+        return min(satir[indeks] for satir, indeks in zip(self.satirlar, self.indeksler(ozet)))
+
+    @property
+    def hata_siniri(self) -> int:
+        """Tahminin gerçek değeri en fazla bu kadar aşar (olasılık >= guven)"""
+        return math.ceil(math.e / self.genislik * self.toplam)
+
+    @property
+    def guven(self) -> float:
+        return 1 - math.exp(-self.derinlik)
+
+
+class HyperLogLog:
+    """HyperLogLog benzersiz eleman sayacı (2^duyarlik kayıt)"""
+
+    def __init__(self, duyarlik: int = 14):
+        self.duyarlik = duyarlik
+        self.kayit_sayisi = 1 << duyarlik
+        self.kayitlar = bytearray(self.kayit_sayisi)
+
+    def ekle(self, ozet: int):
+        h = ozet & _UST_64
+        indeks = h & (self.kayit_sayisi - 1)
+        kalan = h >> self.duyarlik
+        # Kalan bitlerde ilk 1 bitinin sırası
+        sira = (64 - self.duyarlik) - kalan.bit_length() + 1
+        if sira > self.kayitlar[indeks]:
+            self.kayitlar[indeks] = sira
+
+    def tahmin(self) -> int:
+        m = self.kayit_sayisi
+        alfa = 0.7213 / (1 + 1.079 / m)
+        tahmin = alfa * m * m / sum(2.0 ** -kayit for kayit in self.kayitlar)
+        bos = self.kayitlar.count(0)
+        if tahmin <= 2.5 * m and bos:
+            # Küçük değerlerde doğrusal sayım
+            tahmin = m * math.log(m / bos)
+        return round(tahmin)
+
+    @property
+    def standart_hata(self) -> float:
+        """Tahminin bağıl standart hatası"""
+        return 1.04 / math.sqrt(self.kayit_sayisi)
+
+
+class SpaceSaving:
+    """Space-Saving en sık k eleman yapısı
+
+    En küçük sayılı eleman tembel bir min-yığınla bulunur: yığında her
+    eleman için bir giriş vardır ve girişler yalnızca eskiyip küçülebilir;
+    tepedeki giriş güncel değilse güncellenip yığına geri konur.
+    """
+
+    def __init__(self, kapasite: int):
+        self.kapasite = kapasite
+        self.sayilar: Dict[str, int] = {}
+        self.hatalar: Dict[str, int] = {}
+        self._yigin: List[Tuple[int, str]] = []
+
+    def ekle(self, sozcuk: str, sayi: int = 1):
+        sayilar = self.sayilar
+        if sozcuk in sayilar:
+            sayilar[sozcuk] += sayi
+            return
+        if len(sayilar) < self.kapasite:
+            sayilar[sozcuk] = sayi
+            self.hatalar[sozcuk] = 0
+            heapq.heappush(self._yigin, (sayi, sozcuk))
+            return
+
+        # En küçük sayılı elemanı çıkar, yenisi onun sayısını hata olarak devralır
+        while True:
+            en_kucuk, aday = self._yigin[0]
+            if sayilar[aday] == en_kucuk:
+                break
+            heapq.heapreplace(self._yigin, (sayilar[aday], aday))
+        del sayilar[aday]
+        del self.hatalar[aday]
+        sayilar[sozcuk] = en_kucuk + sayi
+        self.hatalar[sozcuk] = en_kucuk
+        heapq.heapreplace(self._yigin, (en_kucuk + sayi, sozcuk))
+
+    def en_sikler(self) -> List[Tuple[str, int, int]]:
+        """(sözcük, sayı, hata) üçlülerini sayıya göre azalan sırada döndürür"""
+        return sorted(((sozcuk, sayi, self.hatalar[sozcuk]) for sozcuk, sayi in self.sayilar.items()),
+                      key=lambda x: (-x[1], x[0]))
+
+
+class AltKOrneklem:
+    """Özet değeri en küçük boyut kadar benzersiz sözcüğü tutan örneklem"""
+
+    def __init__(self, boyut: int):
+        self.boyut = boyut
+        self._yigin: List[Tuple[int, str]] = []  # (-özet, sözcük): tepede en büyük özet
+        self._sozcukler: Set[str] = set()
+
+    def ekle(self, sozcuk: str, ozet: int):
+        if sozcuk in self._sozcukler:
+            return
+        anahtar = ozet >> 64
+        if len(self._yigin) < self.boyut:
+            heapq.heappush(self._yigin, (-anahtar, sozcuk))
+            self._sozcukler.add(sozcuk)
+        elif anahtar < -self._yigin[0][0]:
+            _, cikan = heapq.heapreplace(self._yigin, (-anahtar, sozcuk))
+            self._sozcukler.discard(cikan)
+            self._sozcukler.add(sozcuk)
+
+    def sozcukler(self) -> List[str]:
+        return sorted(self._sozcukler)
+
+
+class YaklasikSayac:
+    """Belge sayımlarını sabit bellekli özet yapılarına işleyen sayaç
+
+    Belgenin kendi sayımları (ayırıcının ürettiği Counter) tam olarak alınır;
+    derlem düzeyindeki tüm bilgi sabit boyutlu yapılarda tutulur.
+    """
+
+    def __init__(self, ilk_k: int = 1000, orneklem_boyutu: int = 1000,
+                 epsilon: float = 1e-4, delta: float = 0.01, hll_duyarlik: int = 14):
+        self.ilk_k = ilk_k
+        self.frekanslar = CountMinSketch.hata_payindan(epsilon, delta)
+        self.belge_frekanslari = CountMinSketch.hata_payindan(epsilon, delta)
+        self.benzersiz = HyperLogLog(hll_duyarlik)
+        # Kapasite k'dan büyük tutulur: gerçek sayısı N / kapasite'yi aşan
+        # her sözcük izlendiği için ilk k'nın kaçırılma olasılığı küçülür
+        self.en_sik = SpaceSaving(10 * ilk_k)
+        self.orneklem = AltKOrneklem(orneklem_boyutu)
+        self.belge_sayisi = 0
+
+    def belge_ekle(self, dosya_yolu: str, frekanslar: MappingType[str, int]):
+        # İki sketch aynı boyutlarda olduğu için indeksler bir kez hesaplanır
+        frekans_satirlari = self.frekanslar.satirlar
+        belge_satirlari = self.belge_frekanslari.satirlar
+        indeksler = self.frekanslar.indeksler
+        benzersiz_ekle = self.benzersiz.ekle
+        en_sik_ekle = self.en_sik.ekle
+        orneklem_ekle = self.orneklem.ekle
+
+        for sozcuk, sayi in frekanslar.items():
+            ozet = sozcuk_ozeti(sozcuk)
+            for frekans_satiri, belge_satiri, indeks in zip(frekans_satirlari, belge_satirlari, indeksler(ozet)):
+                frekans_satiri[indeks] += sayi
+                belge_satiri[indeks] += 1
+            benzersiz_ekle(ozet)
+            en_sik_ekle(sozcuk, sayi)
+            orneklem_ekle(sozcuk, ozet)
+
+        self.frekanslar.toplam += sum(frekanslar.values())
+        self.belge_frekanslari.toplam += len(frekanslar)
+        self.belge_sayisi += 1
+
+    @property
+    def toplam_sozcuk(self) -> int:
+        return self.frekanslar.toplam
+
+    def frekans_tahmini(self, sozcuk: str) -> int:
+        return self.frekanslar.tahmin(sozcuk_ozeti(sozcuk))
+
+    def belge_frekansi_tahmini(self, sozcuk: str) -> int:
+        return self.belge_frekanslari.tahmin(sozcuk_ozeti(sozcuk))
+
+    def en_sikler(self) -> List[Tuple[str, int, int]]:
+        """En sık ilk_k sözcük: (sözcük, tahmini frekans, frekans alt sınırı)
+
+        Her iki yapı da gerçek değerin üst sınırını verdiği için tahmin
+        Space-Saving sayısı ile Count-Min tahmininin küçüğüdür; izlenen
+        sözcükler bu tahmine göre sıralanır. (Yapıya geç giren sözcüklerin
+        Space-Saving sayısı devraldığı hata yüzünden şişkindir.)
+        """
+        adaylar = [(sozcuk, min(sayi, self.frekans_tahmini(sozcuk)), sayi - hata)
+                   for sozcuk, sayi, hata in self.en_sik.en_sikler()]
+        adaylar.sort(key=lambda x: (-x[1], x[0]))
+        return adaylar[:self.ilk_k]
+
+    def hata_sinirlari(self) -> List[str]:
+        """Tahminlerin hata sınırlarını okunur satırlar olarak döndürür"""
+        return [
+            f"Frekans tahminleri gerçek değeri en fazla {self.frekanslar.hata_siniri} aşar "
+            f"(olasılık >= {self.frekanslar.guven:.3f}; N = {self.frekanslar.toplam})",
+            f"Belge frekansı tahminleri gerçek değeri en fazla {self.belge_frekanslari.hata_siniri} aşar "
+            f"(olasılık >= {self.belge_frekanslari.guven:.3f})",
+            f"Benzersiz sözcük sayısının bağıl standart hatası %{self.benzersiz.standart_hata * 100:.2f}",
+            f"En sık sözcüklerin gerçek frekansı [alt sınır, tahmin] aralığındadır; gerçek frekansı "
+            f"{self.toplam_sozcuk // self.en_sik.kapasite} değerini aşan her sözcük izlenir"
+        ]